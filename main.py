@@ -14,48 +14,11 @@ _env_file = Path(__file__).parent / ".env"
 if _env_file.exists():
     load_dotenv(_env_file)
 
-from src.cli.commands.agent import (
-    register_commands as register_agent_commands,
-)
-from src.cli.commands.discussions import (
-    register_commands as register_discussion_commands,
-)
-from src.cli.commands.extraction import (
-    register_commands as register_extraction_commands,
-)
-from src.cli.commands.extraction_batch import (
-    register_commands as register_extraction_batch_commands,
-)
-from src.cli.commands.extraction_direct import (
-    register_commands as register_extraction_direct_commands,
-)
-from src.cli.commands.extraction_queue import (
-    register_commands as register_extraction_queue_commands,
-)
-from src.cli.commands.github import (
-    register_commands as register_github_commands,
-)
-from src.cli.commands.parse import (
-    register_commands as register_parse_commands,
-)
-from src.cli.commands.pipeline import (
-    register_commands as register_pipeline_commands,
-)
-from src.cli.commands.setup import (
-    register_commands as register_setup_commands,
-)
-from src.cli.commands.sources import (
-    register_commands as register_source_commands,
-)
-from src.cli.commands.sync import (
-    register_commands as register_sync_commands,
-)
-from src.cli.commands.synthesis import (
-    register_commands as register_synthesis_commands,
-)
+from src.cli.registry import register_lazy_commands
 
 
-def _build_command_parser() -> argparse.ArgumentParser:
+def _build_command_parser(argv: Sequence[str] = ()) -> argparse.ArgumentParser:
+    """Build the CLI parser, importing only the command named in ``argv``."""
     parser = argparse.ArgumentParser(
         prog="python -m main",
         description=(
@@ -64,19 +27,7 @@ def _build_command_parser() -> argparse.ArgumentParser:
     )
     subparsers = parser.add_subparsers(dest="command", metavar="COMMAND")
     subparsers.required = True
-    register_github_commands(subparsers)
-    register_agent_commands(subparsers)
-    register_parse_commands(subparsers)
-    register_extraction_commands(subparsers)
-    register_extraction_batch_commands(subparsers)
-    register_extraction_direct_commands(subparsers)
-    register_extraction_queue_commands(subparsers)
-    register_discussion_commands(subparsers)
-    register_setup_commands(subparsers)
-    register_source_commands(subparsers)
-    register_sync_commands(subparsers)
-    register_synthesis_commands(subparsers)
-    register_pipeline_commands(subparsers)
+    register_lazy_commands(subparsers, argv)
     return parser
 
 
@@ -90,7 +41,7 @@ def _dispatch(args: argparse.Namespace) -> int:
 def main(argv: Sequence[str] | None = None) -> int:
     raw_args = list(sys.argv[1:] if argv is None else argv)
 
-    command_parser = _build_command_parser()
+    command_parser = _build_command_parser(raw_args)
     args = command_parser.parse_args(raw_args)
     return _dispatch(args)
 
@@ -6,12 +6,17 @@ import argparse
 import json
 import sys
 import time
+import uuid
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any, Sequence
 
+from src import metrics
+from src.paths import get_tool_results_root
 from src.orchestration.agent import AgentRuntime, MissionEvaluator, EvaluationResult
+from src.orchestration.memory import MissionMemory
 from src.orchestration.missions import load_mission, create_ephemeral_mission, Mission
+from src.orchestration.results import ResultStore
 from src.orchestration.monitoring import AgentMonitor
 from src.orchestration.llm import LLMPlanner
 from src.orchestration.safety import SafetyValidator
@@ -108,6 +113,27 @@ def _register_run_command(subparsers: argparse._SubParsersAction[argparse.Argume
         default="agent_metrics.db",
         help="Path to metrics database (default: agent_metrics.db)",
     )
+    parser.add_argument(
+        "--checkpoint-db",
+        default="agent_memory.db",
+        help=(
+            "Path to the mission memory database holding step checkpoints and past "
+            "executions (default: agent_memory.db)"
+        ),
+    )
+    parser.add_argument(
+        "--resume",
+        metavar="EXECUTION_ID",
+        help="Resume an interrupted execution from its checkpoint, reusing its inputs and completed steps",
+    )
+    parser.add_argument(
+        "--results-dir",
+        type=Path,
+        help=(
+            "Directory for large tool outputs the planner reads through expand_result "
+            "(default: $SPECULUM_DATA_DIR/.tool-results)"
+        ),
+    )
     parser.set_defaults(func=run_mission_cli)
 
 
@@ -459,34 +485,56 @@ def run_mission_cli(args: argparse.Namespace) -> int:
         mission = create_ephemeral_mission(goal=mission_arg)
         print(f"Created ephemeral mission with goal: {mission.goal}")
 
-    # Parse inputs
-    inputs = {}
-    for input_str in args.input:
-        if "=" not in input_str:
-            print(f"error: Invalid input format: {input_str} (expected key=value)", file=sys.stderr)
+    resume_id = args.resume
+    if resume_id:
+        # Reuse the stored inputs so auto-selected issues stay the same
+        with MissionMemory(Path(args.checkpoint_db)) as memory:
+            checkpoint = memory.load_checkpoint(resume_id)
+        if checkpoint is None:
+            print(f"error: No checkpoint found for execution {resume_id} in {args.checkpoint_db}", file=sys.stderr)
             return 1
-        key, value = input_str.split("=", 1)
-        inputs[key] = value
+        if checkpoint.mission_id != mission.id:
+            print(
+                f"error: Execution {resume_id} ran mission '{checkpoint.mission_id}', not '{mission.id}'",
+                file=sys.stderr,
+            )
+            return 1
+        if not checkpoint.resumable:
+            print(f"Execution {resume_id} already succeeded; nothing to resume.")
+            return 0
+        if args.input:
+            print("warning: --input is ignored when resuming; using the checkpoint's inputs", file=sys.stderr)
+        print(f"Resuming execution {resume_id} after {len(checkpoint.steps)} completed step(s)")
+        context = checkpoint.context()
+    else:
+        # Parse inputs
+        inputs = {}
+        for input_str in args.input:
+            if "=" not in input_str:
+                print(f"error: Invalid input format: {input_str} (expected key=value)", file=sys.stderr)
+                return 1
+            key, value = input_str.split("=", 1)
+            inputs[key] = value
 
-    try:
-        inputs, skip_mission, info_message = _prepare_agent_inputs(inputs)
-    except GitHubIssueError as exc:
-        print(f"error: {exc}", file=sys.stderr)
-        return 1
-    except ValueError as exc:
-        print(f"error: {exc}", file=sys.stderr)
-        return 1
+        try:
+            inputs, skip_mission, info_message = _prepare_agent_inputs(inputs)
+        except GitHubIssueError as exc:
+            print(f"error: {exc}", file=sys.stderr)
+            return 1
+        except ValueError as exc:
+            print(f"error: {exc}", file=sys.stderr)
+            return 1
 
-    if info_message:
-        print(info_message)
+        if info_message:
+            print(info_message)
 
-    if skip_mission:
-        return 0
-    
-    context = ExecutionContext(inputs=inputs)
+        if skip_mission:
+            return 0
+
+        context = ExecutionContext(inputs=inputs)
     
-    # Initialize components
-    registry = ToolRegistry()
+    # Initialize components; large tool outputs are kept on disk behind handles
+    registry = ToolRegistry(result_store=ResultStore(args.results_dir or get_tool_results_root()))
     
     # Register tools based on mission requirements
     from src.orchestration.toolkit import (
@@ -497,6 +545,7 @@ def run_mission_cli(args: argparse.Namespace) -> int:
         register_extraction_tools,
         register_discussion_tools,
         register_setup_tools,
+        register_result_tools,
         register_source_curator_tools,
     )
     
@@ -514,6 +563,7 @@ def run_mission_cli(args: argparse.Namespace) -> int:
     register_discussion_tools(registry)
     register_setup_tools(registry)
     register_source_curator_tools(registry)
+    register_result_tools(registry)
     
     # Choose planner based on flag
     planner_type = args.planner
@@ -525,15 +575,19 @@ def run_mission_cli(args: argparse.Namespace) -> int:
         planner_model = get_config().model
         print(f"Using configured model: {planner_model}")
 
+    # Mission memory holds step checkpoints and past executions used as examples
+    checkpoints = MissionMemory(Path(args.checkpoint_db))
     try:
-        models_client = GitHubModelsClient(model=planner_model)
+        models_client = GitHubModelsClient(model=planner_model, priority="interactive")
         planner = LLMPlanner(
             models_client=models_client,
             tool_registry=registry,
+            memory=checkpoints,
         )
         planner_model = models_client.model  # Get actual model used
         print(f"Using LLM planner with model: {models_client.model}")
     except Exception as e:
+        checkpoints.close()
         print(f"error: Failed to initialize LLM planner: {e}", file=sys.stderr)
         print("Tip: Set GITHUB_TOKEN environment variable with GitHub Models API access", file=sys.stderr)
         return 1
@@ -550,17 +604,21 @@ def run_mission_cli(args: argparse.Namespace) -> int:
     print()
     
     # Execute mission
+    execution_id = resume_id or f"{mission.id}_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:6]}"
+    print(f"Execution ID: {execution_id}")
     start_time = time.time()
     runtime = AgentRuntime(
         planner=planner,
         tools=registry,
         safety=validator,
         evaluator=evaluator,
+        checkpoints=checkpoints,
     )
     
     try:
-        outcome = runtime.execute_mission(mission, context)
+        outcome = runtime.execute_mission(mission, context, execution_id=execution_id)
         duration = time.time() - start_time
+        checkpoints.record_execution(mission.id, mission.goal, outcome)
         
         # Record metrics
         monitor = AgentMonitor(db_path=Path(args.db))
@@ -570,6 +628,7 @@ def run_mission_cli(args: argparse.Namespace) -> int:
             mission_id=mission_id,
             mission_type=mission.id,
             duration=duration,
+            step_token_usage=planner.prompt_token_usage,
         )
         monitor.close()
         
@@ -578,6 +637,16 @@ def run_mission_cli(args: argparse.Namespace) -> int:
         print(f"Mission completed: {outcome.status.value}")
         print(f"Steps executed: {len(outcome.steps)}")
         print(f"Duration: {duration:.2f}s")
+        if outcome.tool_cache:
+            print(
+                f"Read cache: {outcome.tool_cache['hits']} hit(s), "
+                f"{outcome.tool_cache['misses']} miss(es)"
+            )
+        if planner.prompt_token_usage:
+            print(
+                f"Prompt tokens: {sum(planner.prompt_token_usage)} "
+                f"over {len(planner.prompt_token_usage)} planner turn(s)"
+            )
         
         # Show step-by-step breakdown
         if outcome.steps:
@@ -614,6 +683,7 @@ def run_mission_cli(args: argparse.Namespace) -> int:
         
         transcript = {
             "mission_id": mission_id,
+            "execution_id": outcome.execution_id,
             "mission": {
                 "id": mission.id,
                 "goal": mission.goal,
@@ -641,6 +711,8 @@ def run_mission_cli(args: argparse.Namespace) -> int:
                 for step in outcome.steps
             ],
             "summary": outcome.summary,
+            "tool_cache": dict(outcome.tool_cache) if outcome.tool_cache else None,
+            "prompt_tokens": list(planner.prompt_token_usage),
         }
         
         with open(output_path, "w", encoding="utf-8") as f:
@@ -652,6 +724,11 @@ def run_mission_cli(args: argparse.Namespace) -> int:
     except Exception as e:
         duration = time.time() - start_time
         print(f"\nerror: Mission failed with exception: {e}", file=sys.stderr)
+        print(
+            f"Completed steps are checkpointed; resume with: "
+            f"agent run --mission {args.mission} --resume {execution_id}",
+            file=sys.stderr,
+        )
         
         # Record failure
         monitor = AgentMonitor(db_path=Path(args.db))
@@ -672,6 +749,9 @@ def run_mission_cli(args: argparse.Namespace) -> int:
         monitor.close()
         
         return 1
+    finally:
+        checkpoints.close()
+        metrics.export_textfile()
 
 
 def list_missions_cli(args: argparse.Namespace) -> int:
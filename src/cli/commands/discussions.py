@@ -63,6 +63,19 @@ def register_commands(
         "--output",
         help="Write sync report to file (JSON)",
     )
+    parser.add_argument(
+        "--index-cache",
+        help="Directory for persisted discussion indexes; later runs only fetch discussions updated since",
+    )
+    parser.add_argument(
+        "--sync-state",
+        help="JSON file of entity fingerprints from the last sync; unchanged entities are skipped without API calls",
+    )
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="Ignore --sync-state fingerprints and re-render every entity",
+    )
     parser.set_defaults(func=sync_discussions_cli)
 
     # list-entities command (utility)
@@ -120,16 +133,41 @@ def _ensure_category_exists(
     return None
 
 
-def _sync_single_entity(
-    entity: "AggregatedEntity",
+def _build_discussion_index(
+    category_name: str,
     category_id: str,
     token: str,
     repository: str,
+    cache_dir: str | None,
+) -> github_discussions.DiscussionIndex:
+    """Load (if cached) and refresh the title index for a category."""
+    path = Path(cache_dir) / f"{category_name.lower()}.json" if cache_dir else None
+    index = github_discussions.DiscussionIndex(
+        token=token,
+        repository=repository,
+        category_id=category_id,
+        path=path,
+    )
+    index.refresh()
+    return index
+
+
+def _sync_single_entity(
+    entity: "AggregatedEntity",
+    category_id: str,
+    repository_id: str | None,
     dry_run: bool,
-) -> dict:
+    index: github_discussions.DiscussionIndex,
+    batcher: github_discussions.MutationBatcher | None,
+) -> tuple[dict, list[github_discussions.PendingMutation]]:
     """Sync a single entity to GitHub Discussions.
     
-    Returns a dict with sync result details.
+    Looks the entity up in ``index`` rather than querying GitHub. Creates and
+    updates are queued on ``batcher`` (None in dry-run mode); the returned
+    result is final once :func:`_resolve_queued_result` has seen its
+    mutations complete.
+
+    Returns a dict with sync result details and the queued mutations.
     """
     entity_name = entity.name
     entity_type = entity.entity_type
@@ -138,26 +176,20 @@ def _sync_single_entity(
     body = build_entity_discussion_content(entity)
     
     # Check if discussion exists
-    existing = github_discussions.find_discussion_by_title(
-        token=token,
-        repository=repository,
-        title=entity_name,
-        category_id=category_id,
-    )
+    existing = index.get(entity_name)
     
     if existing is None:
         # Create new discussion
-        if dry_run:
+        if dry_run or batcher is None or repository_id is None:
             return {
                 "entity": entity_name,
                 "type": entity_type,
                 "action": "would_create",
                 "discussion_number": None,
-            }
+            }, []
         
-        discussion = github_discussions.create_discussion(
-            token=token,
-            repository=repository,
+        pending = batcher.create_discussion(
+            repository_id=repository_id,
             category_id=category_id,
             title=entity_name,
             body=body,
@@ -166,43 +198,31 @@ def _sync_single_entity(
             "entity": entity_name,
             "type": entity_type,
             "action": "created",
-            "discussion_number": discussion.number,
-            "url": discussion.url,
-        }
+            "discussion_number": None,
+        }, [pending]
     
     # Discussion exists - check if update needed
-    if existing.body.strip() == body.strip():
+    if existing.matches(body):
         return {
             "entity": entity_name,
             "type": entity_type,
             "action": "unchanged",
             "discussion_number": existing.number,
             "url": existing.url,
-        }
+        }, []
     
     # Update needed
-    if dry_run:
+    if dry_run or batcher is None:
         return {
             "entity": entity_name,
             "type": entity_type,
             "action": "would_update",
             "discussion_number": existing.number,
             "url": existing.url,
-        }
+        }, []
     
-    github_discussions.update_discussion(
-        token=token,
-        discussion_id=existing.id,
-        body=body,
-    )
-    
-    # Add changelog comment
-    changelog = f"**Updated:** {datetime.utcnow().strftime('%Y-%m-%d %H:%M UTC')}\n\nDiscussion body updated to reflect current knowledge graph state."
-    github_discussions.add_discussion_comment(
-        token=token,
-        discussion_id=existing.id,
-        body=changelog,
-    )
+    # Update body; the changelog comment follows once the update succeeded
+    pending_update = batcher.update_discussion(discussion_id=existing.id, body=body)
     
     return {
         "entity": entity_name,
@@ -210,7 +230,68 @@ def _sync_single_entity(
         "action": "updated",
         "discussion_number": existing.number,
         "url": existing.url,
-    }
+    }, [pending_update]
+
+
+def _queue_changelog_comments(
+    queued: list[tuple[dict, list[github_discussions.PendingMutation]]],
+    batcher: github_discussions.MutationBatcher,
+) -> None:
+    """Queue a changelog comment for each discussion whose update went through."""
+    changelog = f"**Updated:** {datetime.utcnow().strftime('%Y-%m-%d %H:%M UTC')}\n\nDiscussion body updated to reflect current knowledge graph state."
+    for result, mutations in queued:
+        update = mutations[0]
+        if result["action"] == "updated" and update.ok:
+            mutations.append(batcher.add_discussion_comment(discussion_id=update.result.id, body=changelog))
+
+
+def _resolve_queued_result(
+    result: dict,
+    mutations: list[github_discussions.PendingMutation],
+    index: github_discussions.DiscussionIndex,
+) -> str | None:
+    """Fill ``result`` from completed mutations; return an error message if any failed."""
+    discussion = mutations[0].result if mutations[0].ok else None
+    if discussion is not None:
+        index.record(discussion)
+        result["discussion_number"] = discussion.number
+        result["url"] = discussion.url
+    failures = [m.error or "mutation was not sent" for m in mutations if not m.ok]
+    return "; ".join(failures) if failures else None
+
+
+def _record_sync_state(
+    sync_state: github_discussions.DiscussionSyncState,
+    result: dict,
+    fingerprints: dict[str, str],
+) -> None:
+    """Remember the fingerprint an entity's discussion now reflects."""
+    fingerprint = fingerprints.get(result["entity"].lower())
+    if fingerprint is None:
+        return
+    sync_state.record(
+        result["type"],
+        result["entity"],
+        fingerprint,
+        number=result.get("discussion_number"),
+        url=result.get("url"),
+    )
+
+
+def _print_result(result: dict) -> None:
+    """Print one line for a sync result."""
+    entity_name = result["entity"]
+    action = result["action"]
+    if action == "created":
+        print(f"    ✓ Created: {entity_name} (#{result['discussion_number']})")
+    elif action == "updated":
+        print(f"    ✓ Updated: {entity_name} (#{result['discussion_number']})")
+    elif action == "unchanged":
+        print(f"    - Unchanged: {entity_name}")
+    elif action == "would_create":
+        print(f"    [dry-run] Would create: {entity_name}")
+    elif action == "would_update":
+        print(f"    [dry-run] Would update: {entity_name}")
 
 
 def sync_discussions_cli(args: argparse.Namespace) -> int:
@@ -247,24 +328,26 @@ def sync_discussions_cli(args: argparse.Namespace) -> int:
     
     # Initialize aggregator
     aggregator = _get_aggregator(knowledge_graph_path)
+    sync_state = (
+        github_discussions.DiscussionSyncState(args.sync_state, repository=repository)
+        if args.sync_state
+        else None
+    )
     
     # Track results
     results: list[dict] = []
     errors: list[dict] = []
     
+    # Creates, updates and changelog comments go out as aliased GraphQL batches;
+    # nothing is looked up on GitHub until some entity actually needs syncing
+    batcher: github_discussions.MutationBatcher | None = None
+    repository_id: str | None = None
+    
     # Process each entity type
     for entity_type in entity_types:
         category_name = "People" if entity_type == "Person" else "Organizations"
         print(f"Processing {entity_type}s (category: {category_name})...")
         
-        # Ensure category exists
-        category_id = _ensure_category_exists(category_name, token, repository)
-        if category_id is None:
-            error_msg = f"Category '{category_name}' not found. Please create it manually in repository settings."
-            print(f"  error: {error_msg}", file=sys.stderr)
-            errors.append({"entity_type": entity_type, "error": error_msg})
-            continue
-        
         # Get entities
         entities = aggregator.list_entities(entity_type=entity_type)
         
@@ -276,6 +359,55 @@ def sync_discussions_cli(args: argparse.Namespace) -> int:
         
         print(f"  Found {len(entities)} {entity_type.lower()}(s)")
         
+        # Entities whose inputs are unchanged since the last sync need no work
+        fingerprints = aggregator.entity_fingerprints(entity_type) if sync_state is not None else {}
+        if sync_state is not None and not args.full:
+            stale: list[str] = []
+            for entity_name in entities:
+                recorded = sync_state.get(entity_type, entity_name)
+                if not sync_state.is_current(entity_type, entity_name, fingerprints.get(entity_name.lower())):
+                    stale.append(entity_name)
+                    continue
+                result = {
+                    "entity": entity_name,
+                    "type": entity_type,
+                    "action": "unchanged",
+                    "discussion_number": recorded.number if recorded else None,
+                    "url": recorded.url if recorded else None,
+                }
+                results.append(result)
+                _print_result(result)
+            entities = stale
+            if not entities:
+                continue
+        
+        # Ensure category exists
+        category_id = _ensure_category_exists(category_name, token, repository)
+        if category_id is None:
+            error_msg = f"Category '{category_name}' not found. Please create it manually in repository settings."
+            print(f"  error: {error_msg}", file=sys.stderr)
+            errors.append({"entity_type": entity_type, "error": error_msg})
+            continue
+        
+        if not dry_run and batcher is None:
+            try:
+                repository_id = github_discussions.get_repository_id(token=token, repository=repository)
+            except github_discussions.GitHubDiscussionError as exc:
+                print(f"error: {exc}", file=sys.stderr)
+                return 1
+            batcher = github_discussions.MutationBatcher(token=token)
+        
+        # One paginated scan of the category serves every entity lookup
+        try:
+            index = _build_discussion_index(
+                category_name, category_id, token, repository, args.index_cache
+            )
+        except github_discussions.GitHubDiscussionError as exc:
+            print(f"  error: {exc}", file=sys.stderr)
+            errors.append({"entity_type": entity_type, "error": str(exc)})
+            continue
+        
+        queued: list[tuple[dict, list[github_discussions.PendingMutation]]] = []
         for entity_name in entities:
             entity = aggregator.get_aggregated_entity(entity_name, entity_type)
             if entity is None:
@@ -287,27 +419,14 @@ def sync_discussions_cli(args: argparse.Namespace) -> int:
                 continue
             
             try:
-                result = _sync_single_entity(
+                result, mutations = _sync_single_entity(
                     entity=entity,
                     category_id=category_id,
-                    token=token,
-                    repository=repository,
+                    repository_id=repository_id,
                     dry_run=dry_run,
+                    index=index,
+                    batcher=batcher,
                 )
-                results.append(result)
-                
-                action = result["action"]
-                if action == "created":
-                    print(f"    ✓ Created: {entity_name} (#{result['discussion_number']})")
-                elif action == "updated":
-                    print(f"    ✓ Updated: {entity_name} (#{result['discussion_number']})")
-                elif action == "unchanged":
-                    print(f"    - Unchanged: {entity_name}")
-                elif action == "would_create":
-                    print(f"    [dry-run] Would create: {entity_name}")
-                elif action == "would_update":
-                    print(f"    [dry-run] Would update: {entity_name}")
-                    
             except github_discussions.GitHubDiscussionError as exc:
                 errors.append({
                     "entity": entity_name,
@@ -315,6 +434,39 @@ def sync_discussions_cli(args: argparse.Namespace) -> int:
                     "error": str(exc),
                 })
                 print(f"    ✗ Error: {entity_name} - {exc}")
+                continue
+            
+            if mutations:
+                queued.append((result, mutations))
+            else:
+                results.append(result)
+                _print_result(result)
+                if sync_state is not None and result["action"] == "unchanged":
+                    _record_sync_state(sync_state, result, fingerprints)
+        
+        if batcher is not None:
+            batcher.flush()
+            _queue_changelog_comments(queued, batcher)
+            batcher.flush()
+        for result, mutations in queued:
+            failure = _resolve_queued_result(result, mutations, index)
+            if failure:
+                errors.append({
+                    "entity": result["entity"],
+                    "type": entity_type,
+                    "error": failure,
+                })
+                print(f"    ✗ Error: {result['entity']} - {failure}")
+                continue
+            results.append(result)
+            _print_result(result)
+            if sync_state is not None:
+                _record_sync_state(sync_state, result, fingerprints)
+        
+        if not dry_run:
+            index.save()
+            if sync_state is not None:
+                sync_state.save()
     
     # Summary
     print()
@@ -4,6 +4,7 @@
 from __future__ import annotations
 
 import argparse
+import json
 import sys
 from pathlib import Path
 
@@ -23,6 +24,14 @@ from src.knowledge.extraction import (
     process_document_profiles,
 )
 from src.knowledge.storage import KnowledgeGraphStorage
+from src.knowledge.triage import (
+    DEFAULT_ACCEPT_ABOVE,
+    DEFAULT_SKIP_BELOW,
+    assess_with_model,
+    calibrate,
+    iter_parsed_documents,
+    strip_front_matter,
+)
 from src.parsing.config import load_parsing_config
 from src.parsing.storage import ParseStorage
 
@@ -89,6 +98,53 @@ def register_commands(subparsers: argparse._SubParsersAction[argparse.ArgumentPa
     )
     parser.set_defaults(func=extract_cli, command="extract")
 
+    triage_parser = subparsers.add_parser(
+        "extract-triage",
+        description=(
+            "Run the local document triage over a parsed evidence corpus and "
+            "report how often it agrees with reference assessments."
+        ),
+        help="Calibrate heuristic document triage against a parsed corpus.",
+    )
+    triage_parser.add_argument(
+        "--root",
+        type=Path,
+        help="Parsed evidence root to scan (defaults to the parsing config output root).",
+    )
+    triage_parser.add_argument(
+        "--config",
+        type=Path,
+        help="Path to parsing configuration file.",
+    )
+    triage_parser.add_argument(
+        "--labels",
+        type=Path,
+        help="JSON file mapping checksum to reference is_substantive booleans.",
+    )
+    triage_parser.add_argument(
+        "--with-model",
+        action="store_true",
+        help="Label every document with the mini model (one call per document).",
+    )
+    triage_parser.add_argument(
+        "--skip-below",
+        type=float,
+        default=DEFAULT_SKIP_BELOW,
+        help=f"Score below which documents are skipped (default: {DEFAULT_SKIP_BELOW}).",
+    )
+    triage_parser.add_argument(
+        "--accept-above",
+        type=float,
+        default=DEFAULT_ACCEPT_ABOVE,
+        help=f"Score at or above which documents are accepted (default: {DEFAULT_ACCEPT_ABOVE}).",
+    )
+    triage_parser.add_argument(
+        "--output",
+        type=Path,
+        help="Write the full JSON report (including per-document decisions) to this path.",
+    )
+    triage_parser.set_defaults(func=extract_triage_cli, command="extract-triage")
+
 
 def extract_cli(args: argparse.Namespace) -> int:
     """Execute the extraction workflow."""
@@ -204,3 +260,79 @@ def extract_cli(args: argparse.Namespace) -> int:
 
     print(f"\nExtraction complete. Success: {success_count}, Failed: {fail_count}")
     return 1 if fail_count > 0 else 0
+
+
+def extract_triage_cli(args: argparse.Namespace) -> int:
+    """Calibrate the heuristic triage and print an agreement summary."""
+    try:
+        root = args.root or load_parsing_config(args.config).output_root
+    except (FileNotFoundError, ValueError) as exc:
+        print(f"Initialization error: {exc}", file=sys.stderr)
+        return 1
+
+    if not root.exists():
+        print(f"Error: Parsed evidence root not found: {root}", file=sys.stderr)
+        return 1
+
+    documents = list(iter_parsed_documents(root))
+    if not documents:
+        print(f"No parsed documents found under {root}.")
+        return 0
+
+    labels: dict[str, bool] = {}
+    if args.labels:
+        try:
+            payload = json.loads(args.labels.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError) as exc:
+            print(f"Error: Could not read labels file: {exc}", file=sys.stderr)
+            return 1
+        labels.update({str(key): bool(value) for key, value in payload.items()})
+
+    if args.with_model:
+        try:
+            client = GitHubModelsClient(model="gpt-4o-mini", priority="bulk")
+        except GitHubModelsError as exc:
+            print(f"Initialization error: {exc}", file=sys.stderr)
+            return 1
+        for document in documents:
+            if document.checksum in labels:
+                continue
+            try:
+                result = assess_with_model(client, strip_front_matter(document.text))
+            except (GitHubModelsError, ValueError) as exc:
+                print(f"  Model assessment failed for {document.checksum[:8]}: {exc}", file=sys.stderr)
+                continue
+            labels[document.checksum] = bool(result["is_substantive"])
+
+    report = calibrate(
+        documents,
+        labels,
+        skip_below=args.skip_below,
+        accept_above=args.accept_above,
+    )
+
+    verdicts = report["verdicts"]
+    print(f"Triaged {report['documents']} documents under {root}")
+    print(f"  skip:      {verdicts['skip']}")
+    print(f"  accept:    {verdicts['accept']}")
+    print(f"  uncertain: {verdicts['uncertain']} (sent to model)")
+    print(f"  Model calls avoided: {report['model_calls_avoided']:.1%}")
+    if report["agreement_rate"] is None:
+        print("  Agreement rate: n/a (no labelled documents decided locally)")
+    else:
+        print(
+            f"  Agreement rate: {report['agreement_rate']:.1%} "
+            f"over {report['labelled_decisions']} labelled decisions"
+        )
+        for item in report["disagreements"]:
+            print(
+                f"    {item['checksum'][:8]} {item['verdict']} (score {item['score']}) "
+                f"vs label {item['label']}: {item['source']}"
+            )
+
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+        print(f"Report written to {args.output}")
+
+    return 0
@@ -6,17 +6,21 @@ import argparse
 import logging
 import os
 import sys
-from datetime import datetime, timezone
-from typing import Any
+from pathlib import Path
 
-from src.integrations.github.models import RateLimitError
 from src.integrations.github.issues import (
     GitHubIssueError,
     resolve_repository,
     resolve_token,
 )
 from src.integrations.github.storage import get_github_storage_client
-from src.orchestration.toolkit.extraction import ExtractionToolkit
+from src.knowledge.extraction_pipeline import (
+    DEFAULT_CHECKPOINT_FILENAME,
+    DEFAULT_DOCUMENTS_IN_FLIGHT,
+    DEFAULT_LLM_CONCURRENCY,
+    ExtractionCheckpoint,
+    ExtractionPipeline,
+)
 from src.parsing.config import load_parsing_config
 from src.parsing.storage import ParseStorage, ManifestEntry
 
@@ -60,6 +64,23 @@ def register_commands(subparsers: argparse._SubParsersAction[argparse.ArgumentPa
         type=str,
         help="GitHub token. Defaults to GH_TOKEN or GITHUB_TOKEN env var.",
     )
+    run_parser.add_argument(
+        "--llm-concurrency",
+        type=int,
+        default=DEFAULT_LLM_CONCURRENCY,
+        help=f"Maximum LLM calls in flight across all documents (default: {DEFAULT_LLM_CONCURRENCY}).",
+    )
+    run_parser.add_argument(
+        "--documents-in-flight",
+        type=int,
+        default=DEFAULT_DOCUMENTS_IN_FLIGHT,
+        help=f"Maximum documents being processed at once (default: {DEFAULT_DOCUMENTS_IN_FLIGHT}).",
+    )
+    run_parser.add_argument(
+        "--checkpoint",
+        type=Path,
+        help=f"Step checkpoint file (default: <evidence root>/{DEFAULT_CHECKPOINT_FILENAME}).",
+    )
     run_parser.set_defaults(func=extraction_batch_run_cli)
     
     # extraction-batch pending command
@@ -113,33 +134,14 @@ def get_pending_documents(storage: ParseStorage, limit: int = 10) -> list[Manife
     return pending
 
 
-def _format_extraction_stats(results: dict[str, Any]) -> str:
-    """Format extraction statistics for logging."""
-    people_count = 0
-    orgs_count = 0
-    concepts_count = 0
-    assocs_count = 0
-    
-    # Extract counts from results
-    if "people" in results and isinstance(results["people"], dict):
-        people_count = results["people"].get("extracted_count", 0)
-    
-    if "organizations" in results and isinstance(results["organizations"], dict):
-        orgs_count = results["organizations"].get("extracted_count", 0)
-    
-    if "concepts" in results and isinstance(results["concepts"], dict):
-        concepts_count = results["concepts"].get("extracted_count", 0)
-    
-    if "associations" in results and isinstance(results["associations"], dict):
-        assocs_count = results["associations"].get("extracted_count", 0)
-    
-    return f"People: {people_count}, Orgs: {orgs_count}, Concepts: {concepts_count}, Assocs: {assocs_count}"
-
-
 def extract_batch(
     batch_size: int,
     repository: str,
     token: str,
+    *,
+    llm_concurrency: int = DEFAULT_LLM_CONCURRENCY,
+    documents_in_flight: int = DEFAULT_DOCUMENTS_IN_FLIGHT,
+    checkpoint_path: Path | None = None,
 ) -> int:
     """
     Process extraction for multiple documents in a single run.
@@ -148,14 +150,13 @@ def extract_batch(
     1. Query manifest for pending documents (limit to batch_size)
     2. Ensure PR branch extraction/queue exists
     3. Begin batch mode (defer commits)
-    4. For each document:
-       - Assess document quality (gpt-4o-mini)
-       - If not substantive: mark skipped, continue
-       - If substantive: extract entities (4x gpt-4o calls)
-       - Update manifest metadata
-       - Handle rate limits by breaking loop and returning exit 42
-    5. Flush all changes to PR branch in single commit
-    6. Return appropriate exit code
+    4. Run the documents through the staged extraction pipeline:
+       read → assess → entities → associations/profiles → persist,
+       with several documents in flight under a shared LLM concurrency budget
+    5. On rate limit, stop feeding new documents; finished steps are kept in
+       the checkpoint so the next run resumes mid-document
+    6. Flush all changes to PR branch in single commit
+    7. Return appropriate exit code
     
     Returns:
         EXIT_SUCCESS (0): All documents processed successfully
@@ -192,11 +193,19 @@ def extract_batch(
             logger.info("No pending documents found")
             return EXIT_SUCCESS
         
+        checkpoint_path = checkpoint_path or (config.output_root / DEFAULT_CHECKPOINT_FILENAME)
+        checkpoint = ExtractionCheckpoint(checkpoint_path)
+        
         logger.info(f"Found {len(pending_docs)} pending documents")
         for idx, doc in enumerate(pending_docs, 1):
-            logger.info(f"  {idx}. {doc.source[:80]}... ({doc.checksum[:12]})")
+            resumed = checkpoint.completed_steps(doc.checksum)
+            suffix = f" [resuming after: {', '.join(resumed)}]" if resumed else ""
+            logger.info(f"  {idx}. {doc.source[:80]}... ({doc.checksum[:12]}){suffix}")
         
-        # Initialize extraction toolkit
+        # Initialize extraction toolkit (imported here: the pending
+        # count used by workflow loops does not need it)
+        from src.orchestration.toolkit.extraction import ExtractionToolkit
+
         logger.info("Initializing extraction toolkit...")
         toolkit = ExtractionToolkit()
         logger.info("Toolkit ready (using gpt-4o for extraction, gpt-4o-mini for assessment)")
@@ -210,121 +219,45 @@ def extract_batch(
         storage.begin_batch()
         logger.info("Batch mode enabled")
         
-        # Track documents processed in this batch
-        processed_count = 0
-        skipped_count = 0
-        
-        # Process each document
-        for i, entry in enumerate(pending_docs, 1):
-            checksum = entry.checksum
-            source = entry.source
-            logger.info(f"[{i}/{len(pending_docs)}] Processing document: {source} (checksum: {checksum[:12]}...)")
-            
-            try:
-                # Step 1: Assess document quality
-                logger.info(f"  Assessing document quality...")
-                assessment = toolkit._assess_document({"checksum": checksum})
-                
-                if not isinstance(assessment, dict) or assessment.get("status") == "error":
-                    error_msg = assessment.get("message", "Unknown error") if isinstance(assessment, dict) else str(assessment)
-                    logger.error(f"  Assessment failed: {error_msg}")
-                    # Mark with error metadata but continue to next document
-                    entry.metadata["extraction_error"] = error_msg
-                    entry.metadata["extraction_last_batch_run"] = run_id
-                    storage.record_entry(entry)
-                    continue
-                
-                is_substantive = assessment.get("is_substantive", False)
-                reason = assessment.get("reason", "No reason provided")
-                confidence = assessment.get("confidence", 0.0)
-                
-                logger.info(f"  Assessment: substantive={is_substantive}, confidence={confidence:.2f}")
-                
-                if not is_substantive:
-                    # Mark as skipped
-                    logger.info(f"  Skipping non-substantive document: {reason}")
-                    entry.metadata["extraction_skipped"] = True
-                    entry.metadata["extraction_skipped_reason"] = reason
-                    entry.metadata["extraction_last_batch_run"] = run_id
-                    storage.record_entry(entry)
-                    skipped_count += 1
-                    continue
-                
-                # Step 2: Extract entities
-                logger.info(f"  Extracting entities...")
-                results = {}
-                
-                # Extract people
-                logger.info(f"    Extracting people...")
-                people_result = toolkit._extract_people({"checksum": checksum})
-                results["people"] = people_result
-                if isinstance(people_result, dict):
-                    count = people_result.get("extracted_count", 0)
-                    logger.info(f"      → {count} people extracted")
-                
-                # Extract organizations
-                logger.info(f"    Extracting organizations...")
-                orgs_result = toolkit._extract_organizations({"checksum": checksum})
-                results["organizations"] = orgs_result
-                if isinstance(orgs_result, dict):
-                    count = orgs_result.get("extracted_count", 0)
-                    logger.info(f"      → {count} organizations extracted")
-                
-                # Extract concepts
-                logger.info(f"    Extracting concepts...")
-                concepts_result = toolkit._extract_concepts({"checksum": checksum})
-                results["concepts"] = concepts_result
-                if isinstance(concepts_result, dict):
-                    count = concepts_result.get("extracted_count", 0)
-                    logger.info(f"      → {count} concepts extracted")
-                
-                # Extract associations
-                logger.info(f"    Extracting associations...")
-                assocs_result = toolkit._extract_associations({"checksum": checksum})
-                results["associations"] = assocs_result
-                if isinstance(assocs_result, dict):
-                    count = assocs_result.get("extracted_count", 0)
-                    logger.info(f"      → {count} associations extracted")
-                
-                # Step 3: Mark as complete
-                logger.info(f"  Marking extraction as complete...")
-                entry.metadata["extraction_complete"] = True
-                entry.metadata["extraction_last_batch_run"] = run_id
-                storage.record_entry(entry)
-                processed_count += 1
-                
-                # Log stats
-                stats = _format_extraction_stats(results)
-                logger.info(f"  ✓ Extraction complete: {stats}")
-                
-            except RateLimitError as exc:
-                # Rate limit hit - save progress so far and exit with code 42
-                logger.warning(f"Rate limit encountered on document {checksum[:12]}...: {exc}")
-                
-                # Record rate limit timestamp in metadata
-                entry.metadata["extraction_rate_limited_at"] = datetime.now(timezone.utc).isoformat()
-                entry.metadata["extraction_last_batch_run"] = run_id
-                storage.record_entry(entry)
-                
-                # Flush what we have so far
-                logger.info(f"Flushing {processed_count + skipped_count} document updates before exiting...")
-                logger.info("Committing pending files and manifest to GitHub...")
-                storage.flush_all()
-                logger.info("Flush complete - progress saved")
-                
-                logger.info(f"Batch processing paused due to rate limit. Processed: {processed_count}, Skipped: {skipped_count}")
-                return EXIT_RATE_LIMITED
+        pipeline = ExtractionPipeline.from_toolkit(
+            toolkit,
+            storage=storage,
+            checkpoint=checkpoint,
+            llm_concurrency=llm_concurrency,
+            documents_in_flight=documents_in_flight,
+            run_id=run_id,
+        )
+        logger.info(
+            f"Running pipeline (llm_concurrency={llm_concurrency}, "
+            f"documents_in_flight={documents_in_flight})"
+        )
+        result = pipeline.run(pending_docs)
+        logger.info(f"Structured output: {toolkit.structured_metrics.summary()}")
         
-        # Step 4: Flush all changes in single commit
-        logger.info(f"Flushing all changes ({processed_count + skipped_count} document updates)...")
+        # Flush all changes in single commit
+        logger.info(f"Flushing all changes ({result.processed + result.skipped} document updates)...")
         if github_client:
             logger.info(f"Committing to branch: {github_client.branch}")
         logger.info("Writing pending content files and manifest...")
         storage.flush_all()
         logger.info("All changes committed successfully")
         
-        logger.info(f"Batch extraction complete. Processed: {processed_count}, Skipped: {skipped_count}")
-        logger.info(f"Total entities extracted from {processed_count} documents")
+        # Finished documents are now recorded in the manifest
+        checkpoint.prune_persisted()
+        if github_client:
+            checkpoint.commit(github_client, storage._get_relative_path(checkpoint.path))
+        
+        if result.rate_limited:
+            logger.info(
+                f"Batch processing paused due to rate limit. Processed: {result.processed}, "
+                f"Skipped: {result.skipped}, Deferred: {result.deferred}"
+            )
+            return EXIT_RATE_LIMITED
+        
+        logger.info(
+            f"Batch extraction complete. Processed: {result.processed}, "
+            f"Skipped: {result.skipped}, Errors: {result.errors}"
+        )
         return EXIT_SUCCESS
         
     except GitHubIssueError as exc:
@@ -366,6 +299,9 @@ def extraction_batch_run_cli(args: argparse.Namespace) -> int:
             batch_size=args.batch_size,
             repository=repository,
             token=token,
+            llm_concurrency=args.llm_concurrency,
+            documents_in_flight=args.documents_in_flight,
+            checkpoint_path=args.checkpoint,
         )
         
     except (GitHubIssueError, ValueError) as exc:
@@ -4,10 +4,9 @@ from __future__ import annotations
 
 import argparse
 import os
-import re
 import sys
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Sequence
 
 from src.integrations.github.issues import (
     GitHubIssueError,
@@ -20,6 +19,7 @@ from src.integrations.github.issues import (
     resolve_repository,
     resolve_token,
 )
+from src.integrations.github.issue_index import IndexedIssue, IssueIndex, parse_checksum
 from src.integrations.github.search_issues import GitHubIssueSearcher, IssueSearchResult
 from src.parsing.storage import Manifest, ManifestEntry, ParseStorage
 from src.paths import get_evidence_root
@@ -70,6 +70,7 @@ def register_commands(subparsers: argparse._SubParsersAction[argparse.ArgumentPa
         type=str,
         help="Only queue the document with this checksum.",
     )
+    _add_index_arguments(queue_parser)
     queue_parser.set_defaults(func=queue_cli)
     
     # Status command - show queue status
@@ -94,6 +95,7 @@ def register_commands(subparsers: argparse._SubParsersAction[argparse.ArgumentPa
         default=None,
         help="Root directory for evidence. Defaults to evidence/.",
     )
+    _add_index_arguments(status_parser)
     status_parser.set_defaults(func=status_cli)
     
     # Pending command - list pending documents
@@ -118,8 +120,38 @@ def register_commands(subparsers: argparse._SubParsersAction[argparse.ArgumentPa
         default=None,
         help="Root directory for evidence. Defaults to evidence/.",
     )
+    _add_index_arguments(pending_parser)
     pending_parser.set_defaults(func=pending_cli)
     
+    # Index command - refresh or rebuild the local issue index
+    index_parser = sub.add_parser(
+        "index",
+        description="Refresh the local extraction-queue issue index.",
+        help="Refresh the local extraction-queue issue index.",
+    )
+    index_parser.add_argument(
+        "--repository",
+        type=str,
+        help="GitHub repository in owner/repo format. Defaults to GITHUB_REPOSITORY env var or git remote.",
+    )
+    index_parser.add_argument(
+        "--token",
+        type=str,
+        help="GitHub token. Defaults to GH_TOKEN or GITHUB_TOKEN env var.",
+    )
+    index_parser.add_argument(
+        "--index-db",
+        type=Path,
+        default=None,
+        help="Path to the issue index database. Defaults to GITHUB_ISSUE_INDEX_DB or issue_index.db.",
+    )
+    index_parser.add_argument(
+        "--rebuild",
+        action="store_true",
+        help="Discard the index and re-list every issue instead of syncing incrementally.",
+    )
+    index_parser.set_defaults(func=index_cli)
+    
     # Assign command - assign issue to Copilot
     assign_parser = sub.add_parser(
         "assign",
@@ -191,22 +223,43 @@ def register_commands(subparsers: argparse._SubParsersAction[argparse.ArgumentPa
     complete_parser.set_defaults(func=complete_cli)
 
 
+def _add_index_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the issue index options shared by queue, status and pending."""
+    parser.add_argument(
+        "--index-db",
+        type=Path,
+        default=None,
+        help="Path to the issue index database. Defaults to GITHUB_ISSUE_INDEX_DB or issue_index.db.",
+    )
+    parser.add_argument(
+        "--offline",
+        action="store_true",
+        help="Use the local issue index as-is without syncing it from GitHub first.",
+    )
+
+
 def _parse_checksum_from_issue_body(body: str | None) -> str | None:
     """Extract checksum from Issue body using marker comment.
     
     Looks for: <!-- checksum:abc123 -->
     """
-    if not body:
-        return None
-    match = re.search(r'<!-- checksum:(\w+) -->', body)
-    if match:
-        return match.group(1)
-    return None
+    return parse_checksum(body)
+
+
+def _open_issue_index(args: argparse.Namespace, repository: str, token: str) -> IssueIndex:
+    """Open the local issue index and bring it up to date unless ``--offline``."""
+    index = IssueIndex(repository=repository, token=token, db_path=args.index_db)
+    if not args.offline:
+        try:
+            index.sync()
+        except GitHubIssueError as exc:
+            print(f"Warning: Could not sync issue index, using local data: {exc}", file=sys.stderr)
+    return index
 
 
 def get_documents_needing_issues(
     manifest: Manifest,
-    existing_issues: list[IssueSearchResult],
+    existing_issues: Sequence[IssueSearchResult | IndexedIssue],
     *,
     force: bool = False,
     specific_checksum: str | None = None,
@@ -215,7 +268,8 @@ def get_documents_needing_issues(
     
     Args:
         manifest: Parse manifest with all documents.
-        existing_issues: List of existing extraction-queue issues.
+        existing_issues: Existing extraction-queue issues, either indexed
+            issues carrying a parsed checksum or search results.
         force: If True, return documents even if they have existing Issues.
         specific_checksum: If provided, only return this document.
     
@@ -226,10 +280,9 @@ def get_documents_needing_issues(
         # Build set of checksums that already have issues
         existing_checksums = set()
         for issue in existing_issues:
-            # Need to fetch full issue body to parse checksum
-            # For now, we'll use a simple heuristic: parse from title or body preview
-            # In production, we'd fetch full issue details
-            checksum = _parse_checksum_from_issue_body(issue.title)
+            # Indexed issues carry the checksum parsed from the body; search
+            # results only have the title to go on
+            checksum = getattr(issue, "checksum", None) or _parse_checksum_from_issue_body(issue.title)
             if checksum:
                 existing_checksums.add(checksum)
     else:
@@ -340,6 +393,7 @@ def queue_documents_for_extraction(
     evidence_root: Path,
     force: bool = False,
     specific_checksum: str | None = None,
+    index: IssueIndex | None = None,
 ) -> list[IssueOutcome]:
     """Create GitHub Issues for documents needing extraction.
     
@@ -349,6 +403,8 @@ def queue_documents_for_extraction(
         evidence_root: Root directory for evidence.
         force: If True, create Issues even for documents that already have them.
         specific_checksum: If provided, only queue this document.
+        index: Local issue index to check for existing issues. Falls back to
+            the search API when omitted.
     
     Returns:
         List of created IssueOutcome objects.
@@ -361,13 +417,17 @@ def queue_documents_for_extraction(
         print("No documents found in manifest.", file=sys.stderr)
         return []
     
-    # Search for existing extraction-queue issues
-    searcher = GitHubIssueSearcher(token=token, repository=repository)
-    try:
-        existing_issues = searcher.search_by_label("extraction-queue", limit=1000)
-    except GitHubIssueError as exc:
-        print(f"Warning: Could not search existing issues: {exc}", file=sys.stderr)
-        existing_issues = []
+    # Look up existing extraction-queue issues
+    existing_issues: Sequence[IssueSearchResult | IndexedIssue]
+    if index is not None:
+        existing_issues = index.issues(label="extraction-queue")
+    else:
+        searcher = GitHubIssueSearcher(token=token, repository=repository)
+        try:
+            existing_issues = searcher.search_by_label("extraction-queue", limit=1000)
+        except GitHubIssueError as exc:
+            print(f"Warning: Could not search existing issues: {exc}", file=sys.stderr)
+            existing_issues = []
     
     # Find documents needing issues
     candidates = get_documents_needing_issues(
@@ -394,6 +454,18 @@ def queue_documents_for_extraction(
                 repository=repository,
             )
             created_issues.append(outcome)
+            if index is not None:
+                index.record(
+                    IndexedIssue(
+                        number=outcome.number,
+                        title=f"Extract: {entry.metadata.get('source_name', entry.source)}",
+                        state="open",
+                        labels=("extraction-queue",),
+                        checksum=entry.checksum,
+                        url=outcome.html_url,
+                        updated_at="",
+                    )
+                )
             print(f"Created Issue #{outcome.number}: {entry.checksum[:8]}... ({entry.source})")
         except GitHubIssueError as exc:
             print(f"Failed to create issue for {entry.checksum}: {exc}", file=sys.stderr)
@@ -416,6 +488,7 @@ def queue_cli(args: argparse.Namespace) -> int:
             evidence_root=evidence_root,
             force=args.force,
             specific_checksum=args.checksum,
+            index=_open_issue_index(args, repository, token),
         )
         
         if created_issues:
@@ -440,9 +513,9 @@ def status_cli(args: argparse.Namespace) -> int:
         storage = ParseStorage(evidence_root / "parsed")
         manifest = storage.manifest()
         
-        # Search for extraction-queue issues
-        searcher = GitHubIssueSearcher(token=token, repository=repository)
-        all_issues = searcher.search_by_label("extraction-queue", limit=1000)
+        # Extraction-queue issues from the local index
+        index = _open_issue_index(args, repository, token)
+        all_issues = index.issues(label="extraction-queue")
         
         # Count by state
         open_issues = [i for i in all_issues if i.state == "open"]
@@ -479,9 +552,9 @@ def pending_cli(args: argparse.Namespace) -> int:
         storage = ParseStorage(evidence_root / "parsed")
         manifest = storage.manifest()
         
-        # Search for extraction-queue issues
-        searcher = GitHubIssueSearcher(token=token, repository=repository)
-        all_issues = searcher.search_by_label("extraction-queue", limit=1000)
+        # Extraction-queue issues from the local index
+        index = _open_issue_index(args, repository, token)
+        all_issues = index.issues(label="extraction-queue")
         
         # Find documents needing issues
         candidates = get_documents_needing_issues(manifest, all_issues, force=False)
@@ -503,6 +576,28 @@ def pending_cli(args: argparse.Namespace) -> int:
         return 1
 
 
+def index_cli(args: argparse.Namespace) -> int:
+    """Execute the index command."""
+    try:
+        repository = resolve_repository(args.repository)
+        token = resolve_token(args.token)
+        
+        index = IssueIndex(repository=repository, token=token, db_path=args.index_db)
+        if args.rebuild:
+            written = index.rebuild()
+        else:
+            written = index.sync()
+        
+        print(
+            f"Issue index {index.db_path}: {written} issue(s) updated, "
+            f"{len(index)} indexed ({index.page_requests} page request(s))."
+        )
+        return 0
+    except (GitHubIssueError, ValueError) as exc:
+        print(f"Error: {exc}", file=sys.stderr)
+        return 1
+
+
 def skip_cli(args: argparse.Namespace) -> int:
     """Execute the skip command to mark document as extraction_skipped."""
     try:
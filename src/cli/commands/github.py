@@ -41,6 +41,7 @@ def register_commands(subparsers: argparse._SubParsersAction[argparse.ArgumentPa
     register_create_command(subparsers)
     register_search_command(subparsers)
     register_pr_commands(subparsers)
+    register_benchmark_command(subparsers)
 
 
 # ========================
@@ -470,3 +471,98 @@ def approve_pr_cli(args: argparse.Namespace) -> int:
         print(f"Error approving PR: {err}", file=sys.stderr)
         return 1
 
+
+
+# ========================
+# BENCHMARK COMMAND
+# ========================
+
+def register_benchmark_command(subparsers: argparse._SubParsersAction[argparse.ArgumentParser]) -> argparse.ArgumentParser:
+    from src.integrations.github.benchmark import BENCHMARKS, DEFAULT_SCALE
+
+    parser = subparsers.add_parser(
+        "github-benchmark",
+        description=(
+            "Measure API calls, commits and wall time of pipeline operations "
+            "against a local GitHub stand-in server (no network access)."
+        ),
+        help="Benchmark GitHub-facing pipeline operations offline.",
+        prog="python -m main github-benchmark",
+    )
+    parser.add_argument(
+        "--operation",
+        action="append",
+        choices=list(BENCHMARKS),
+        help="Operation to run (repeatable). Defaults to all operations.",
+    )
+    parser.add_argument(
+        "--scale",
+        type=int,
+        default=DEFAULT_SCALE,
+        help=f"Documents or entities per operation (default: {DEFAULT_SCALE}).",
+    )
+    parser.add_argument(
+        "--latency",
+        type=float,
+        default=0.0,
+        help="Seconds of simulated latency added to every API response.",
+    )
+    parser.add_argument(
+        "--rate-limit",
+        type=int,
+        default=None,
+        help="Requests allowed per resource before the stand-in returns rate-limit errors.",
+    )
+    parser.add_argument(
+        "--rate-limit-window",
+        type=float,
+        default=3600.0,
+        help="Seconds before the --rate-limit budget resets (default: 3600).",
+    )
+    parser.add_argument(
+        "--secondary-limit-every",
+        type=int,
+        default=None,
+        help="Reject every Nth write request with a secondary rate limit.",
+    )
+    parser.add_argument(
+        "--output",
+        choices=[OUTPUT_TEXT, OUTPUT_JSON],
+        default=OUTPUT_TEXT,
+        help="Output format: human-readable table or machine-readable JSON.",
+    )
+    parser.set_defaults(func=github_benchmark_cli, command="github-benchmark")
+    return parser
+
+
+def github_benchmark_cli(args: argparse.Namespace) -> int:
+    from src.integrations.github.benchmark import run_benchmarks
+    from src.integrations.github.standin import FaultProfile
+
+    faults = FaultProfile(
+        latency=args.latency,
+        rate_limit=args.rate_limit,
+        rate_limit_window=args.rate_limit_window,
+        secondary_limit_every=args.secondary_limit_every,
+    )
+    try:
+        results = run_benchmarks(args.operation, scale=args.scale, faults=faults)
+    except Exception as exc:
+        print(f"error: {exc}", file=sys.stderr)
+        return 1
+
+    if args.output == OUTPUT_JSON:
+        print(json.dumps([result.to_dict() for result in results], indent=2))
+        return 0
+
+    print(
+        f"{'Operation':<18} {'Scale':>6} {'API calls':>10} {'Commits':>8} {'Limited':>8} "
+        f"{'Wall (s)':>9} {'Throttle (s)':>12}"
+    )
+    for result in results:
+        print(
+            f"{result.operation:<18} {result.scale:>6} {result.api_calls:>10} "
+            f"{result.commits:>8} {result.rate_limited:>8} {result.wall_time:>9.3f} "
+            f"{result.throttle_wait:>12.1f}"
+        )
+    return 0
@@ -8,6 +8,7 @@ Commands:
 - pipeline check: Detection only (no acquisition)
 - pipeline acquire: Acquisition only (for pending sources)
 - pipeline status: Show source status and next scheduled checks
+- pipeline profile: Summarize a trace file by top time sinks per run
 """
 
 from __future__ import annotations
@@ -57,6 +58,18 @@ def register_commands(subparsers: argparse._SubParsersAction[argparse.ArgumentPa
             dest="output_json",
             help="Output results in JSON format.",
         )
+        parser.add_argument(
+            "--trace",
+            type=Path,
+            metavar="FILE",
+            help="Append timing spans to this JSONL trace file (see 'pipeline profile').",
+        )
+        parser.add_argument(
+            "--metrics-file",
+            type=Path,
+            metavar="FILE",
+            help="Write run metrics to this file in Prometheus text format (default: $SPECULUM_METRICS_FILE).",
+        )
 
     # pipeline run
     run_parser = pipeline_subparsers.add_parser(
@@ -187,6 +200,67 @@ def register_commands(subparsers: argparse._SubParsersAction[argparse.ArgumentPa
     )
     status_parser.set_defaults(func=pipeline_status_cli, pipeline_command="status")
 
+    # pipeline profile
+    profile_parser = pipeline_subparsers.add_parser(
+        "profile",
+        description="Summarize a trace file: the top time sinks of each run.",
+        help="Show where pipeline and agent runs spend their time.",
+    )
+    profile_parser.add_argument(
+        "trace_file",
+        type=Path,
+        nargs="?",
+        help="JSONL trace file (default: $SPECULUM_TRACE_FILE).",
+    )
+    profile_parser.add_argument(
+        "--run",
+        dest="trace_id",
+        help="Only show the run whose trace ID starts with this value.",
+    )
+    profile_parser.add_argument(
+        "--last",
+        type=int,
+        default=5,
+        help="Number of most recent runs to show (default: 5, 0 for all).",
+    )
+    profile_parser.add_argument(
+        "--top",
+        type=int,
+        default=10,
+        help="Span names to list per run, ranked by self time (default: 10).",
+    )
+    profile_parser.add_argument(
+        "--chrome-trace",
+        type=Path,
+        metavar="FILE",
+        help="Also write the selected runs in Chrome trace format (chrome://tracing, Perfetto).",
+    )
+    profile_parser.add_argument(
+        "--json",
+        action="store_true",
+        dest="output_json",
+        help="Output in JSON format.",
+    )
+    profile_parser.set_defaults(func=pipeline_profile_cli, pipeline_command="profile")
+
+
+def _export_metrics(args: argparse.Namespace) -> None:
+    """Write the run's metrics to ``--metrics-file`` or $SPECULUM_METRICS_FILE."""
+    from src import metrics
+
+    path = metrics.export_textfile(getattr(args, "metrics_file", None))
+    if path is not None and not args.output_json:
+        print(f"Metrics written to {path}")
+
+
+def _configure_tracing(args: argparse.Namespace) -> None:
+    """Send spans to ``--trace`` when given."""
+    trace_file = getattr(args, "trace", None)
+    if trace_file is not None:
+        from src import tracing
+
+        tracing.configure(trace_file)
+
 
 def pipeline_run_cli(args: argparse.Namespace) -> int:
     """Execute the full content pipeline.
@@ -223,6 +297,8 @@ def pipeline_run_cli(args: argparse.Namespace) -> int:
         max_pages_per_crawl=args.max_pages_per_crawl,
     )
 
+    _configure_tracing(args)
+
     if not args.output_json:
         print("Starting content pipeline (mode=full)...")
         if args.dry_run:
@@ -249,6 +325,7 @@ def pipeline_run_cli(args: argparse.Namespace) -> int:
             for source, error in result.monitor.errors:
                 print(f"  - {source.name}: {error}")
 
+    _export_metrics(args)
     return 0 if not (result.monitor and result.monitor.errors) else 1
 
 
@@ -280,6 +357,8 @@ def pipeline_check_cli(args: argparse.Namespace) -> int:
         evidence_root=args.evidence_root or paths.get_evidence_root(),
     )
 
+    _configure_tracing(args)
+
     if not args.output_json:
         print("Starting content pipeline (mode=check)...")
         if args.dry_run:
@@ -308,6 +387,7 @@ def pipeline_check_cli(args: argparse.Namespace) -> int:
                 if len(result.monitor.updates_needed) > 10:
                     print(f"  ... and {len(result.monitor.updates_needed) - 10} more")
 
+    _export_metrics(args)
     return 0
 
 
@@ -339,6 +419,8 @@ def pipeline_acquire_cli(args: argparse.Namespace) -> int:
         max_pages_per_crawl=args.max_pages_per_crawl,
     )
 
+    _configure_tracing(args)
+
     if not args.output_json:
         print("Starting content pipeline (mode=acquire)...")
         if args.dry_run:
@@ -369,6 +451,7 @@ def pipeline_acquire_cli(args: argparse.Namespace) -> int:
                 for acq in result.crawler.failed:
                     print(f"  ✗ {acq.source_url}: {acq.error}")
 
+    _export_metrics(args)
     return 0 if not (result.crawler and result.crawler.failed) else 1
 
 
@@ -484,3 +567,66 @@ def pipeline_status_cli(args: argparse.Namespace) -> int:
             print("Use --json for complete listing")
 
     return 0
+
+
+def pipeline_profile_cli(args: argparse.Namespace) -> int:
+    """Summarize a trace file by the top time sinks of each run.
+    
+    A run is one root span (``pipeline.run``, ``agent.mission``) and
+    everything nested under it. Span names are ranked by self time: their
+    duration minus that of their direct children.
+    """
+    import os
+
+    from src import tracing
+
+    trace_file = args.trace_file or os.environ.get(tracing.TRACE_FILE_ENV)
+    if not trace_file:
+        print(f"No trace file given and {tracing.TRACE_FILE_ENV} is not set.", file=sys.stderr)
+        return 1
+    trace_path = Path(trace_file)
+    if not trace_path.exists():
+        print(f"Trace file not found: {trace_path}", file=sys.stderr)
+        return 1
+
+    spans = tracing.read_spans(trace_path)
+    if args.trace_id:
+        spans = [item for item in spans if str(item.get("trace_id", "")).startswith(args.trace_id)]
+    profiles = tracing.summarize(spans, top=args.top)
+    if args.last > 0:
+        profiles = profiles[-args.last:]
+
+    if args.chrome_trace:
+        selected = {profile.trace_id for profile in profiles}
+        tracing.write_chrome_trace(
+            [item for item in spans if str(item.get("trace_id")) in selected],
+            args.chrome_trace,
+        )
+
+    if args.output_json:
+        print(json.dumps([profile.to_dict() for profile in profiles], indent=2))
+        return 0
+
+    if not profiles:
+        print(f"No runs recorded in {trace_path}")
+        return 0
+
+    for profile in profiles:
+        started = datetime.fromtimestamp(profile.start, tz=timezone.utc)
+        print(
+            f"Run {profile.trace_id} ({profile.root}) started "
+            f"{started.strftime('%Y-%m-%d %H:%M:%S UTC')}: "
+            f"{profile.duration:.2f}s, {profile.span_count} spans"
+        )
+        print(f"  {'Self (s)':>10} {'Total (s)':>10} {'Count':>6} {'Max (s)':>9}  Span")
+        for stats in profile.sinks:
+            errors = f"  [{stats.errors} failed]" if stats.errors else ""
+            print(
+                f"  {stats.self_time:>10.3f} {stats.total:>10.3f} {stats.count:>6} "
+                f"{stats.max:>9.3f}  {stats.name}{errors}"
+            )
+        print()
+
+    if args.chrome_trace:
+        print(f"Chrome trace written to {args.chrome_trace}")
+    return 0
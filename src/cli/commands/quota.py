@@ -0,0 +1,72 @@
+"""CLI commands for the shared LLM quota broker."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+from pathlib import Path
+
+from src.integrations.github.quota import (
+    DEFAULT_CONFIG_PATH,
+    QUOTA_DB_ENV,
+    QuotaBroker,
+    load_budgets,
+)
+
+
+def register_commands(subparsers: argparse._SubParsersAction[argparse.ArgumentParser]) -> None:
+    """Add the llm-quota command to the main CLI parser."""
+    parser = subparsers.add_parser(
+        "llm-quota",
+        description="Inspect the cross-process LLM quota broker.",
+        help="Show per-model LLM quota utilization and waiters.",
+    )
+    parser.add_argument(
+        "--db",
+        type=Path,
+        help=f"Quota ledger path. Defaults to ${QUOTA_DB_ENV}.",
+    )
+    parser.add_argument(
+        "--config",
+        type=Path,
+        default=DEFAULT_CONFIG_PATH,
+        help="Per-model budget configuration (default: config/llm_quota.yaml).",
+    )
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Print utilization as JSON.",
+    )
+    parser.set_defaults(func=quota_status_cli)
+
+
+def quota_status_cli(args: argparse.Namespace) -> int:
+    """Print current window utilization for each model."""
+    db_path = args.db or os.environ.get(QUOTA_DB_ENV)
+    if not db_path:
+        print(f"No quota ledger configured. Pass --db or set {QUOTA_DB_ENV}.", file=sys.stderr)
+        return 1
+
+    broker = QuotaBroker(db_path, budgets=load_budgets(args.config))
+    snapshots = [snapshot.to_dict() for snapshot in broker.status()]
+
+    if args.json:
+        print(json.dumps(snapshots, indent=2))
+        return 0
+
+    if not snapshots:
+        print("No LLM requests in the current window.")
+        return 0
+
+    for snapshot in snapshots:
+        waiting = ", ".join(f"{name}={count}" for name, count in snapshot["waiting"].items())
+        print(f"{snapshot['model']}")
+        print(f"  requests:  {snapshot['rpm_used']}/{snapshot['rpm_limit']} per minute")
+        print(f"  tokens:    {snapshot['tpm_used']}/{snapshot['tpm_limit']} per minute")
+        print(f"  waiting:   {waiting}")
+        print(f"  processes: {snapshot['processes']}")
+        if snapshot["cooldown_seconds"]:
+            print(f"  cooldown:  {snapshot['cooldown_seconds']}s after rate limit")
+    return 0
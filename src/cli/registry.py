@@ -0,0 +1,127 @@
+"""Lazy registry of the top-level CLI commands.
+
+Every command is declared here with its name, help string and the module
+that implements it. Building the parser imports only the module behind the
+command being dispatched. The other commands get placeholder parsers, so
+``--help`` and "invalid choice" errors still list them. Importing all command
+modules eagerly would load trafilatura, pypdf, python-docx, jsonschema and
+the orchestration toolkit before argparse even ran.
+
+When adding a command, declare it in :data:`COMMANDS`. A test checks that the
+table matches what the modules register.
+"""
+
+from __future__ import annotations
+
+import argparse
+from dataclasses import dataclass
+from importlib import import_module
+from typing import Callable, Dict, Sequence, Tuple
+
+_COMMANDS_PACKAGE = "src.cli.commands"
+
+
+@dataclass(frozen=True)
+class CommandSpec:
+    """A top-level command and where its parser is registered.
+
+    Attributes:
+        name: Command name on the command line.
+        help: One-line help shown in the command list.
+        module: Module under ``src.cli.commands`` that implements it.
+        register: Function in ``module`` that adds the command's parser.
+            One function may register several commands.
+    """
+
+    name: str
+    help: str
+    module: str
+    register: str = "register_commands"
+
+    def load(self) -> Callable[[argparse._SubParsersAction[argparse.ArgumentParser]], object]:
+        """Import the implementing module and return its register function."""
+        return getattr(import_module(f"{_COMMANDS_PACKAGE}.{self.module}"), self.register)
+
+
+# Listed in the order they appear in ``--help``
+COMMANDS: Tuple[CommandSpec, ...] = (
+    CommandSpec("create", "Create a GitHub issue using a template.", "github", "register_create_command"),
+    CommandSpec("search", "Search GitHub issues.", "github", "register_search_command"),
+    CommandSpec("validate-pr", "Validate PR file scope against sync boundaries.", "github", "register_pr_commands"),
+    CommandSpec("enable-auto-merge", "Enable auto-merge on a pull request.", "github", "register_pr_commands"),
+    CommandSpec("approve-pr", "Approve a pull request.", "github", "register_pr_commands"),
+    CommandSpec(
+        "github-benchmark",
+        "Benchmark GitHub-facing pipeline operations offline.",
+        "github",
+        "register_benchmark_command",
+    ),
+    CommandSpec("agent", "Agent runtime operations and monitoring", "agent"),
+    CommandSpec("parse", "Parse documents into markdown artifacts.", "parse"),
+    CommandSpec("extract", "Extract entities from parsed documents.", "extraction"),
+    CommandSpec("extract-triage", "Calibrate heuristic document triage against a parsed corpus.", "extraction"),
+    CommandSpec("extraction-batch", "Batch extraction processing for multiple documents.", "extraction_batch"),
+    CommandSpec(
+        "extraction-direct",
+        "Process extraction issue directly (without Copilot agent).",
+        "extraction_direct",
+    ),
+    CommandSpec("extraction", "Manage the extraction queue.", "extraction_queue"),
+    CommandSpec("sync-discussions", "Sync knowledge graph entities to GitHub Discussions", "discussions"),
+    CommandSpec("list-entities", "List all entities in the knowledge graph", "discussions"),
+    CommandSpec(
+        "setup",
+        "Initialize the repository and start the setup workflow (run in GitHub Actions).",
+        "setup",
+    ),
+    CommandSpec("validate-setup", "Validate repository setup configuration.", "setup"),
+    CommandSpec("verify-dispatch", "Verify HMAC signature for repository dispatch payload.", "setup"),
+    CommandSpec("discover-sources", "Scan parsed documents for URLs and rank by credibility.", "sources"),
+    CommandSpec("list-sources", "Show all sources in the source registry.", "sources"),
+    CommandSpec("sync-upstream", "Sync code directories from upstream template repository.", "sync"),
+    CommandSpec("notify-downstream", "Notify downstream repositories of upstream changes.", "sync"),
+    CommandSpec("synthesis", "Manage the synthesis queue.", "synthesis"),
+    CommandSpec("pipeline", "Run the content pipeline (replaces monitor/crawler agents).", "pipeline"),
+    CommandSpec("llm-quota", "Show per-model LLM quota utilization and waiters.", "quota"),
+)
+
+COMMANDS_BY_NAME: Dict[str, CommandSpec] = {spec.name: spec for spec in COMMANDS}
+
+
+def requested_command(argv: Sequence[str]) -> CommandSpec | None:
+    """The declared command named by ``argv``, if any.
+
+    The top-level parser has no options besides ``-h``, so the command is
+    always the first argument.
+    """
+    if not argv:
+        return None
+    return COMMANDS_BY_NAME.get(argv[0])
+
+
+def register_lazy_commands(
+    subparsers: argparse._SubParsersAction[argparse.ArgumentParser],
+    argv: Sequence[str],
+) -> CommandSpec | None:
+    """Register the command named in ``argv`` fully and the rest as placeholders.
+
+    Returns the spec of the fully registered command, or ``None`` when
+    ``argv`` names no known command (argparse then prints the usage or the
+    error).
+    """
+    spec = requested_command(argv)
+    if spec is not None:
+        spec.load()(subparsers)
+    for other in COMMANDS:
+        if other.name not in subparsers.choices:
+            subparsers.add_parser(other.name, help=other.help)
+    return spec
+
+
+__all__ = [
+    "COMMANDS",
+    "COMMANDS_BY_NAME",
+    "CommandSpec",
+    "register_lazy_commands",
+    "requested_command",
+]
@@ -0,0 +1,234 @@
+"""GitHub throughput benchmarks for pipeline operations.
+
+Each benchmark drives the real storage and discussion code against a fresh
+:class:`~src.integrations.github.standin.GitHubStandIn` and reports how many
+API requests and commits the operation cost and how long it took. Latency and
+rate limits come from a :class:`~src.integrations.github.standin.FaultProfile`,
+so a change's effect on round trips shows up as wall time without touching
+github.com. Throttling and rate-limit back-off are recorded as
+``throttle_wait`` instead of being slept, so small rate limits do not stall
+a run.
+
+Operations:
+
+- ``crawl-flush``: ``ParseStorage`` persisting parsed documents in a batch
+  and flushing them to a PR branch.
+- ``extraction``: ``KnowledgeGraphStorage`` saving people, organizations and
+  concepts per document, one ``batch()`` per document.
+- ``synthesis-batch``: ``CanonicalStorage`` saving canonical entities and the
+  alias map inside one ``GitHubStorageClient.batch()``.
+- ``discussion-sync``: indexing a discussion category and creating one
+  discussion per entity through ``MutationBatcher``.
+"""
+
+from __future__ import annotations
+
+import tempfile
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Sequence
+
+from src.knowledge.canonical import AliasMap, CanonicalEntity, CanonicalStorage, ResolutionEvent
+from src.knowledge.storage import KnowledgeGraphStorage
+from src.parsing.base import ParsedDocument, ParseTarget
+from src.parsing.storage import ParseStorage
+
+from . import discussions as github_discussions
+from . import transport as github_transport
+from .standin import FaultProfile, GitHubStandIn
+from .storage import GitHubStorageClient
+
+BENCHMARK_TOKEN = "standin-token"
+DEFAULT_SCALE = 20
+
+
+@dataclass
+class BenchmarkResult:
+    """Cost of one benchmarked operation."""
+
+    operation: str
+    scale: int
+    api_calls: int
+    commits: int
+    wall_time: float
+    rate_limited: int = 0
+    throttle_wait: float = 0.0  # Seconds of throttling and back-off, recorded rather than slept
+    endpoints: dict[str, int] = field(default_factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        payload = asdict(self)
+        payload["wall_time"] = round(self.wall_time, 4)
+        payload["throttle_wait"] = round(self.throttle_wait, 4)
+        return payload
+
+
+class _SkippedTime:
+    """Clock that jumps ahead by every pause instead of sleeping through it.
+
+    Shared by the transport and the stand-in, so a throttled client sees the
+    stand-in's rate-limit window roll over just as it would after a real wait.
+    """
+
+    def __init__(self) -> None:
+        self.skipped = 0.0
+
+    def sleep(self, seconds: float) -> None:
+        self.skipped += max(seconds, 0.0)
+
+    def time(self) -> float:
+        return time.time() + self.skipped
+
+
+# =============================================================================
+# Operations
+# =============================================================================
+
+
+def _storage_client(github: GitHubStandIn) -> GitHubStorageClient:
+    return GitHubStorageClient(token=BENCHMARK_TOKEN, repository=github.repository, api_url=github.api_url)
+
+
+def _crawl_flush(github: GitHubStandIn, workdir: Path, scale: int, sleep: Callable[[float], None]) -> None:
+    storage = ParseStorage(
+        workdir / "evidence" / "parsed", github_client=_storage_client(github), project_root=workdir
+    )
+    storage.begin_batch()
+    for index in range(scale):
+        document = ParsedDocument(
+            target=ParseTarget(source=f"https://example.com/page-{index}", is_remote=True),
+            checksum=f"{index:040x}",
+            parser_name="web",
+        )
+        document.extend_segments(f"Page {index}, section {section}." for section in range(3))
+        storage.persist_document(document)
+    storage.flush_all()
+
+
+def _extraction(github: GitHubStandIn, workdir: Path, scale: int, sleep: Callable[[float], None]) -> None:
+    storage = KnowledgeGraphStorage(
+        workdir / "knowledge-graph", github_client=_storage_client(github), project_root=workdir
+    )
+    for index in range(scale):
+        checksum = f"{index:040x}"
+        with storage.batch(f"Extract entities from {checksum[:12]}"):
+            storage.save_extracted_people(checksum, [f"Person {index}", f"Person {index + 1}"])
+            storage.save_extracted_organizations(checksum, [f"Organization {index}"])
+            storage.save_extracted_concepts(checksum, [f"Concept {index}"])
+
+
+def _synthesis_batch(github: GitHubStandIn, workdir: Path, scale: int, sleep: Callable[[float], None]) -> None:
+    client = _storage_client(github)
+    storage = CanonicalStorage(workdir / "knowledge-graph" / "canonical", github_client=client, project_root=workdir)
+    now = datetime.now(timezone.utc)
+    aliases: dict[str, str] = {}
+    with client.batch("Synthesis batch"):
+        for index in range(scale):
+            canonical_id = f"person-{index}"
+            aliases[f"person {index}"] = canonical_id
+            storage.save_entity(
+                CanonicalEntity(
+                    canonical_id=canonical_id,
+                    canonical_name=f"Person {index}",
+                    entity_type="Person",
+                    aliases=[f"Person {index}"],
+                    source_checksums=[f"{index:040x}"],
+                    corroboration_score=1,
+                    first_seen=now,
+                    last_updated=now,
+                    resolution_history=[ResolutionEvent(action="created", timestamp=now, by="benchmark")],
+                )
+            )
+        storage.save_alias_map(AliasMap(version=1, last_updated=now, by_type={"Person": aliases}))
+
+
+def _discussion_sync(github: GitHubStandIn, workdir: Path, scale: int, sleep: Callable[[float], None]) -> None:
+    options = {"token": BENCHMARK_TOKEN, "api_url": github.api_url}
+    repository_id = github_discussions.get_repository_id(repository=github.repository, **options)
+    category = github_discussions.get_category_by_name(
+        repository=github.repository, category_name="People", **options
+    )
+    if category is None:  # pragma: no cover - the stand-in always has People
+        raise github_discussions.GitHubDiscussionError("People category missing")
+    index = github_discussions.DiscussionIndex(
+        repository=github.repository, category_id=category.id, **options
+    )
+    index.refresh()
+    with github_discussions.MutationBatcher(min_interval=0.0, sleep=sleep, **options) as batcher:
+        for number in range(scale):
+            title = f"Person {number}"
+            body = f"# {title}\n\nProfile of {title}."
+            existing = index.get(title)
+            if existing is None:
+                batcher.create_discussion(
+                    repository_id=repository_id, category_id=category.id, title=title, body=body
+                )
+            elif not existing.matches(body):
+                batcher.update_discussion(discussion_id=existing.id, body=body)
+
+
+BENCHMARKS: dict[str, Callable[[GitHubStandIn, Path, int, Callable[[float], None]], None]] = {
+    "crawl-flush": _crawl_flush,
+    "extraction": _extraction,
+    "synthesis-batch": _synthesis_batch,
+    "discussion-sync": _discussion_sync,
+}
+
+
+# =============================================================================
+# Runner
+# =============================================================================
+
+
+def run_benchmark(operation: str, *, scale: int = DEFAULT_SCALE, faults: FaultProfile | None = None) -> BenchmarkResult:
+    """Run one operation against a fresh stand-in and measure it.
+
+    The process-wide transport is swapped for a fresh one for the duration,
+    so connection reuse and ETag caching start cold for every operation.
+    Its throttling pauses, and the discussion batcher's back-off, are added
+    to ``throttle_wait`` and skipped on the stand-in's clock instead of
+    being slept.
+    """
+    if operation not in BENCHMARKS:
+        raise ValueError(f"Unknown benchmark {operation!r}; choose from {', '.join(BENCHMARKS)}")
+    faults = faults or FaultProfile()
+    clock = _SkippedTime()
+    previous = github_transport.get_transport()
+    github_transport.set_transport(
+        github_transport.GitHubTransport(
+            # Skipped waits cost nothing, so wait out a whole window rather than hit the limit
+            max_throttle_wait=faults.rate_limit_window,
+            sleep=clock.sleep,
+            clock=clock.time,
+        )
+    )
+    try:
+        with GitHubStandIn(faults=faults, clock=clock.time) as github, tempfile.TemporaryDirectory() as workdir:
+            started = time.perf_counter()
+            BENCHMARKS[operation](github, Path(workdir), scale, clock.sleep)
+            elapsed = time.perf_counter() - started
+            stats = github.stats()
+    finally:
+        github_transport.get_transport().close()
+        github_transport.set_transport(previous)
+    return BenchmarkResult(
+        operation=operation,
+        scale=scale,
+        api_calls=stats["requests"],
+        commits=stats["commits"],
+        wall_time=elapsed,
+        rate_limited=stats["rate_limited"],
+        throttle_wait=clock.skipped,
+        endpoints=stats["endpoints"],
+    )
+
+
+def run_benchmarks(
+    operations: Sequence[str] | None = None,
+    *,
+    scale: int = DEFAULT_SCALE,
+    faults: FaultProfile | None = None,
+) -> list[BenchmarkResult]:
+    """Run each operation (all by default) and return their results in order."""
+    return [run_benchmark(operation, scale=scale, faults=faults) for operation in operations or BENCHMARKS]
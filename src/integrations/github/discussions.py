@@ -2,22 +2,39 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
+import logging
 import os
 import subprocess
-from dataclasses import dataclass, field
-from typing import Any, Mapping, Sequence
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Iterator, Mapping, Sequence
 from urllib import error, request
 from urllib.parse import urlparse
 
+from . import transport as github_transport
+
 DEFAULT_API_URL = "https://api.github.com"
 AGENT_RESPONSE_TAG = "\n\n<!-- agent-response -->"
+DISCUSSION_PAGE_SIZE = 100  # GraphQL connection maximum
+
+logger = logging.getLogger(__name__)
 
 
 class GitHubDiscussionError(RuntimeError):
     """Raised when a GitHub Discussions API operation fails."""
 
 
+class GitHubDiscussionRateLimitError(GitHubDiscussionError):
+    """Raised when GitHub rejects a request under a primary or secondary rate limit."""
+
+    def __init__(self, message: str, retry_after: float | None = None) -> None:
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
 @dataclass(frozen=True)
 class DiscussionCategory:
     """Represents a GitHub Discussions category."""
@@ -107,14 +124,32 @@ def _graphql_endpoint(api_url: str) -> str:
     return f"{normalized}/graphql"
 
 
-def _graphql_request(
+def _retry_after(headers: Any) -> float | None:
+    """Seconds to wait according to ``Retry-After`` or the rate-limit reset header."""
+    if headers is None:
+        return None
+    retry_after = headers.get("Retry-After")
+    if retry_after:
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            return None
+    if headers.get("X-RateLimit-Remaining") == "0" and headers.get("X-RateLimit-Reset"):
+        try:
+            return max(0.0, float(headers["X-RateLimit-Reset"]) - time.time())
+        except ValueError:
+            return None
+    return None
+
+
+def _graphql_post(
     *,
     token: str,
     api_url: str,
     query: str,
     variables: Mapping[str, Any] | None = None,
 ) -> Mapping[str, Any]:
-    """Execute a GraphQL request and return the data payload."""
+    """POST a GraphQL document and return the full response (``data`` and ``errors``)."""
     payload: dict[str, Any] = {"query": query}
     if variables:
         payload["variables"] = dict(variables)
@@ -127,26 +162,51 @@ def _graphql_request(
     req.add_header("Content-Type", "application/json; charset=utf-8")
 
     try:
-        with request.urlopen(req) as response:
+        with github_transport.urlopen(req) as response:
             response_bytes = response.read()
     except error.HTTPError as exc:
         error_text = exc.read().decode("utf-8", errors="replace")
-        raise GitHubDiscussionError(
-            f"GitHub GraphQL error ({exc.code}): {error_text.strip()}"
-        ) from exc
+        message = f"GitHub GraphQL error ({exc.code}): {error_text.strip()}"
+        retry_after = _retry_after(exc.headers)
+        if exc.code == 429 or (exc.code == 403 and (retry_after is not None or "rate limit" in error_text.lower())):
+            raise GitHubDiscussionRateLimitError(message, retry_after) from exc
+        raise GitHubDiscussionError(message) from exc
     except error.URLError as exc:
         raise GitHubDiscussionError(
             f"Failed to reach GitHub GraphQL API: {exc.reason}"
         ) from exc
 
     data = json.loads(response_bytes.decode("utf-8"))
+    if not isinstance(data, Mapping):
+        raise GitHubDiscussionError("Unexpected GitHub GraphQL payload.")
+    return data
+
+
+def _format_graphql_errors(errors: Any) -> str:
+    messages = [
+        err.get("message", "Unknown GraphQL error") for err in errors or [] if isinstance(err, Mapping)
+    ]
+    return "; ".join(messages) if messages else "GitHub GraphQL reported errors."
+
+
+def _is_rate_limited(errors: Any) -> bool:
+    return any(isinstance(err, Mapping) and err.get("type") == "RATE_LIMITED" for err in errors or [])
+
+
+def _graphql_request(
+    *,
+    token: str,
+    api_url: str,
+    query: str,
+    variables: Mapping[str, Any] | None = None,
+) -> Mapping[str, Any]:
+    """Execute a GraphQL request and return the data payload."""
+    data = _graphql_post(token=token, api_url=api_url, query=query, variables=variables)
     if "errors" in data:
         errors = data.get("errors", [])
-        messages = []
-        for err in errors:
-            if isinstance(err, Mapping):
-                messages.append(err.get("message", "Unknown GraphQL error"))
-        formatted = "; ".join(messages) if messages else "GitHub GraphQL reported errors."
+        formatted = _format_graphql_errors(errors)
+        if _is_rate_limited(errors):
+            raise GitHubDiscussionRateLimitError(formatted)
         raise GitHubDiscussionError(formatted)
 
     output = data.get("data")
@@ -502,6 +562,116 @@ def search_discussions(
     return results
 
 
+def list_discussions_page(
+    *,
+    token: str,
+    repository: str,
+    category_id: str | None = None,
+    api_url: str = DEFAULT_API_URL,
+    first: int = DISCUSSION_PAGE_SIZE,
+    after: str | None = None,
+) -> tuple[list[Discussion], str | None]:
+    """Fetch one page of discussions, most recently updated first.
+
+    Returns:
+        The page and the cursor for the next one, or None on the last page.
+    """
+    owner, name = normalize_repository(repository)
+
+    query = """
+    query($owner: String!, $name: String!, $first: Int!, $after: String, $categoryId: ID) {
+      repository(owner: $owner, name: $name) {
+        discussions(first: $first, after: $after, categoryId: $categoryId, orderBy: {field: UPDATED_AT, direction: DESC}) {
+          pageInfo {
+            hasNextPage
+            endCursor
+          }
+          nodes {
+            id
+            number
+            title
+            body
+            url
+            createdAt
+            updatedAt
+            category {
+              id
+              name
+            }
+            author {
+              login
+            }
+          }
+        }
+      }
+    }
+    """
+
+    variables: dict[str, Any] = {"owner": owner, "name": name, "first": first}
+    if after:
+        variables["after"] = after
+    if category_id:
+        variables["categoryId"] = category_id
+
+    data = _graphql_request(
+        token=token,
+        api_url=api_url,
+        query=query,
+        variables=variables,
+    )
+
+    repo_data = data.get("repository")
+    if not isinstance(repo_data, Mapping):
+        raise GitHubDiscussionError(f"Repository not found: {repository}")
+
+    discussions_data = repo_data.get("discussions")
+    if not isinstance(discussions_data, Mapping):
+        return [], None
+
+    nodes = discussions_data.get("nodes", [])
+    if not isinstance(nodes, Sequence):
+        nodes = []
+    page = [Discussion.from_graphql(n) for n in nodes if isinstance(n, Mapping)]
+
+    page_info = discussions_data.get("pageInfo") or {}
+    cursor = page_info.get("endCursor") if page_info.get("hasNextPage") else None
+    return page, (str(cursor) if cursor else None)
+
+
+def iter_discussions(
+    *,
+    token: str,
+    repository: str,
+    category_id: str | None = None,
+    api_url: str = DEFAULT_API_URL,
+    updated_since: str | None = None,
+    page_size: int = DISCUSSION_PAGE_SIZE,
+) -> Iterator[Discussion]:
+    """Yield every discussion, following cursors, most recently updated first.
+
+    Args:
+        updated_since: ISO-8601 timestamp; stop at the first discussion last
+            updated before it. GraphQL has no ``updatedAt`` filter, but the
+            ``UPDATED_AT DESC`` ordering lets an incremental scan stop early.
+    """
+    cursor: str | None = None
+    while True:
+        page, cursor = list_discussions_page(
+            token=token,
+            repository=repository,
+            category_id=category_id,
+            api_url=api_url,
+            first=page_size,
+            after=cursor,
+        )
+        for discussion in page:
+            if updated_since and discussion.updated_at and discussion.updated_at < updated_since:
+                return
+            yield discussion
+        if cursor is None:
+            return
+
+
 def find_discussion_by_title(
     *,
     token: str,
@@ -510,21 +680,240 @@ def find_discussion_by_title(
     category_id: str | None = None,
     api_url: str = DEFAULT_API_URL,
 ) -> Discussion | None:
-    """Find a discussion by exact title match (case-insensitive)."""
-    discussions = list_discussions(
+    """Find a discussion by exact title match (case-insensitive).
+
+    Pages through the whole category until a match is found. Use
+    :class:`DiscussionIndex` when looking up many titles.
+    """
+    title_lower = title.lower()
+    for disc in iter_discussions(
         token=token,
         repository=repository,
         category_id=category_id,
         api_url=api_url,
-        limit=100,
-    )
-    title_lower = title.lower()
-    for disc in discussions:
+    ):
         if disc.title.lower() == title_lower:
             return disc
     return None
 
 
+# =============================================================================
+# Discussion Index
+# =============================================================================
+
+
+def body_hash(body: str) -> str:
+    """Digest of a discussion body, ignoring surrounding whitespace."""
+    return hashlib.sha256(body.strip().encode("utf-8")).hexdigest()
+
+
+@dataclass(frozen=True)
+class IndexedDiscussion:
+    """What the index keeps about a discussion: enough to diff and mutate it."""
+
+    id: str
+    number: int
+    title: str
+    url: str
+    body_hash: str
+    updated_at: str = ""
+
+    @classmethod
+    def from_discussion(cls, discussion: Discussion) -> "IndexedDiscussion":
+        return cls(
+            id=discussion.id,
+            number=discussion.number,
+            title=discussion.title,
+            url=discussion.url,
+            body_hash=body_hash(discussion.body),
+            updated_at=discussion.updated_at,
+        )
+
+    def matches(self, body: str) -> bool:
+        """Whether ``body`` is the discussion's current content."""
+        return self.body_hash == body_hash(body)
+
+
+class DiscussionIndex:
+    """Title lookup over every discussion in a category.
+
+    The first :meth:`refresh` pages through the whole category once; later
+    refreshes only fetch discussions updated since the newest ``updatedAt``
+    already seen. With ``path`` set the index is loaded from and saved to a
+    JSON file so the next run starts incremental too.
+
+    Discussions deleted on GitHub stay in a persisted index; remove the file
+    to force a full rebuild.
+    """
+
+    def __init__(
+        self,
+        *,
+        token: str,
+        repository: str,
+        category_id: str | None = None,
+        api_url: str = DEFAULT_API_URL,
+        path: Path | str | None = None,
+    ) -> None:
+        self.token = token
+        self.repository = repository
+        self.category_id = category_id
+        self.api_url = api_url
+        self.path = Path(path) if path else None
+        self.synced_at: str | None = None
+        self.page_requests = 0
+        self._entries: dict[str, IndexedDiscussion] = {}
+        if self.path is not None:
+            self._load()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, title: str) -> IndexedDiscussion | None:
+        """Look up a discussion by title (case-insensitive)."""
+        return self._entries.get(title.lower())
+
+    def record(self, discussion: Discussion) -> IndexedDiscussion:
+        """Add or replace an entry after creating or updating a discussion."""
+        entry = IndexedDiscussion.from_discussion(discussion)
+        self._entries[entry.title.lower()] = entry
+        if entry.updated_at and (self.synced_at is None or entry.updated_at > self.synced_at):
+            self.synced_at = entry.updated_at
+        return entry
+
+    def refresh(self) -> int:
+        """Bring the index up to date; returns the number of discussions fetched."""
+        updated_since = self.synced_at
+        fetched = 0
+        cursor: str | None = None
+        while True:
+            page, cursor = list_discussions_page(
+                token=self.token,
+                repository=self.repository,
+                category_id=self.category_id,
+                api_url=self.api_url,
+                after=cursor,
+            )
+            self.page_requests += 1
+            stale = False
+            for discussion in page:
+                if updated_since and discussion.updated_at and discussion.updated_at < updated_since:
+                    stale = True
+                    break
+                self.record(discussion)
+                fetched += 1
+            if stale or cursor is None:
+                break
+        logger.info(
+            "Discussion index for %s: %d fetched in %d page(s), %d indexed",
+            self.repository, fetched, self.page_requests, len(self._entries),
+        )
+        return fetched
+
+    def save(self) -> None:
+        """Write the index to ``path``; a no-op without one."""
+        if self.path is None:
+            return
+        payload = {
+            "repository": self.repository,
+            "category_id": self.category_id,
+            "synced_at": self.synced_at,
+            "entries": [asdict(entry) for entry in self._entries.values()],
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+
+    def _load(self) -> None:
+        assert self.path is not None
+        try:
+            payload = json.loads(self.path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return
+        except (OSError, json.JSONDecodeError) as exc:
+            logger.warning("Ignoring unreadable discussion index %s: %s", self.path, exc)
+            return
+        if payload.get("repository") != self.repository or payload.get("category_id") != self.category_id:
+            return  # Cached for a different category; rebuild
+        for raw in payload.get("entries", []):
+            entry = IndexedDiscussion(**raw)
+            self._entries[entry.title.lower()] = entry
+        self.synced_at = payload.get("synced_at")
+
+
+@dataclass(frozen=True)
+class SyncedEntity:
+    """What the last successful sync published for one entity."""
+
+    fingerprint: str
+    number: int | None = None
+    url: str | None = None
+
+
+class DiscussionSyncState:
+    """Content fingerprints of entities as of their last successful sync.
+
+    Keyed by entity type and lowercased name. A sync run compares each
+    entity's current fingerprint with the recorded one and skips rendering,
+    lookup and mutation entirely when they match. The file is tied to a
+    repository; state recorded for another repository is ignored.
+    """
+
+    def __init__(self, path: Path | str, *, repository: str) -> None:
+        self.path = Path(path)
+        self.repository = repository
+        self._entries: dict[str, SyncedEntity] = {}
+        self._load()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def _key(entity_type: str, name: str) -> str:
+        return f"{entity_type.lower()}:{name.lower()}"
+
+    def get(self, entity_type: str, name: str) -> SyncedEntity | None:
+        return self._entries.get(self._key(entity_type, name))
+
+    def is_current(self, entity_type: str, name: str, fingerprint: str | None) -> bool:
+        """Whether ``fingerprint`` is what was last synced for the entity."""
+        entry = self.get(entity_type, name)
+        return fingerprint is not None and entry is not None and entry.fingerprint == fingerprint
+
+    def record(
+        self,
+        entity_type: str,
+        name: str,
+        fingerprint: str,
+        *,
+        number: int | None = None,
+        url: str | None = None,
+    ) -> None:
+        self._entries[self._key(entity_type, name)] = SyncedEntity(fingerprint, number, url)
+
+    def save(self) -> None:
+        payload = {
+            "repository": self.repository,
+            "entities": {key: asdict(entry) for key, entry in sorted(self._entries.items())},
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        tmp_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+        tmp_path.replace(self.path)
+
+    def _load(self) -> None:
+        try:
+            payload = json.loads(self.path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return
+        except (OSError, json.JSONDecodeError) as exc:
+            logger.warning("Ignoring unreadable discussion sync state %s: %s", self.path, exc)
+            return
+        if payload.get("repository") != self.repository:
+            return
+        for key, raw in payload.get("entities", {}).items():
+            self._entries[key] = SyncedEntity(**raw)
+
+
 def get_discussion(
     *,
     token: str,
@@ -838,3 +1227,287 @@ def add_discussion_comment(
         raise GitHubDiscussionError("Failed to add comment: no comment returned.")
 
     return DiscussionComment.from_graphql(comment_data)
+
+
+# =============================================================================
+# Batched Mutations
+# =============================================================================
+
+
+DEFAULT_MUTATION_BATCH_SIZE = 10
+SECONDARY_RATE_LIMIT_WAIT = 60.0  # GitHub: wait at least a minute without Retry-After
+MUTATION_INTERVAL = 1.0  # GitHub: pause at least a second between mutation requests
+
+_DISCUSSION_SELECTION = """
+      discussion {
+        id
+        number
+        title
+        body
+        url
+        createdAt
+        updatedAt
+        category {
+          id
+          name
+        }
+        author {
+          login
+        }
+      }"""
+
+_COMMENT_SELECTION = """
+      comment {
+        id
+        body
+        url
+        createdAt
+        author {
+          login
+        }
+      }"""
+
+# Mutation field -> (input type, selection set, payload key, result parser)
+_MUTATIONS: dict[str, tuple[str, str, str, Callable[[Mapping[str, Any]], Any]]] = {
+    "createDiscussion": ("CreateDiscussionInput!", _DISCUSSION_SELECTION, "discussion", Discussion.from_graphql),
+    "updateDiscussion": ("UpdateDiscussionInput!", _DISCUSSION_SELECTION, "discussion", Discussion.from_graphql),
+    "addDiscussionComment": (
+        "AddDiscussionCommentInput!", _COMMENT_SELECTION, "comment", DiscussionComment.from_graphql
+    ),
+}
+
+
+@dataclass
+class PendingMutation:
+    """A queued mutation; ``result`` or ``error`` is set once its batch is sent."""
+
+    field: str
+    input: dict[str, Any]
+    result: Any = None
+    error: str | None = None
+    done: bool = False
+
+    @property
+    def ok(self) -> bool:
+        return self.done and self.error is None
+
+
+def build_mutation_document(mutations: Sequence[PendingMutation]) -> tuple[str, dict[str, Any]]:
+    """Pack mutations into one aliased document (``m0``, ``m1``, ...).
+
+    Each mutation gets its own ``$iN`` input-object variable so bodies are
+    never interpolated into the query text.
+    """
+    definitions = []
+    selections = []
+    variables: dict[str, Any] = {}
+    for position, mutation in enumerate(mutations):
+        input_type, selection, _, _ = _MUTATIONS[mutation.field]
+        definitions.append(f"$i{position}: {input_type}")
+        selections.append(f"  m{position}: {mutation.field}(input: $i{position}) {{{selection}\n  }}")
+        variables[f"i{position}"] = mutation.input
+    document = f"mutation({', '.join(definitions)}) {{\n" + "\n".join(selections) + "\n}"
+    return document, variables
+
+
+class MutationBatcher:
+    """Queue discussion mutations and send them as aliased GraphQL documents.
+
+    Up to ``batch_size`` queued mutations go out in one request; the queue
+    flushes automatically when full and on :meth:`flush`. Per-alias results
+    and errors are written back to each :class:`PendingMutation`, so one
+    failing mutation does not fail its neighbours.
+
+    Batch size adapts to GitHub's secondary rate limits: a rate-limited
+    batch is retried at half the size after the advised wait, and each
+    successful request grows the size by one back up to the configured
+    maximum. Requests are spaced ``min_interval`` seconds apart. Only
+    rate-limited mutations are retried, since GitHub rejected them before
+    running them; aliases of the same request that did run keep their
+    results, and other failures are reported, never replayed.
+    """
+
+    def __init__(
+        self,
+        *,
+        token: str,
+        api_url: str = DEFAULT_API_URL,
+        batch_size: int = DEFAULT_MUTATION_BATCH_SIZE,
+        min_interval: float = MUTATION_INTERVAL,
+        max_retries: int = 3,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1.")
+        self.token = token
+        self.api_url = api_url
+        self.max_batch_size = batch_size
+        self.batch_size = batch_size
+        self.min_interval = min_interval
+        self.max_retries = max_retries
+        self.requests = 0
+        self._sleep = sleep
+        self._last_request: float | None = None
+        self._queue: list[PendingMutation] = []
+
+    def __enter__(self) -> "MutationBatcher":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.flush()
+
+    def __len__(self) -> int:
+        return len(self._queue)
+
+    def create_discussion(
+        self, *, repository_id: str, category_id: str, title: str, body: str
+    ) -> PendingMutation:
+        """Queue ``createDiscussion``; see :func:`create_discussion`."""
+        if not category_id:
+            raise GitHubDiscussionError("Category ID is required to create a discussion.")
+        if not title:
+            raise GitHubDiscussionError("Title is required to create a discussion.")
+        if "<!-- agent-response -->" not in body:
+            body += AGENT_RESPONSE_TAG
+        return self._enqueue("createDiscussion", {
+            "repositoryId": repository_id,
+            "categoryId": category_id,
+            "title": title,
+            "body": body,
+        })
+
+    def update_discussion(
+        self, *, discussion_id: str, title: str | None = None, body: str | None = None
+    ) -> PendingMutation:
+        """Queue ``updateDiscussion``; see :func:`update_discussion`."""
+        if not discussion_id:
+            raise GitHubDiscussionError("Discussion ID is required to update.")
+        if title is None and body is None:
+            raise GitHubDiscussionError("At least one of title or body must be provided.")
+        payload: dict[str, Any] = {"discussionId": discussion_id}
+        if title is not None:
+            payload["title"] = title
+        if body is not None:
+            payload["body"] = body
+        return self._enqueue("updateDiscussion", payload)
+
+    def add_discussion_comment(self, *, discussion_id: str, body: str) -> PendingMutation:
+        """Queue ``addDiscussionComment``; see :func:`add_discussion_comment`."""
+        if not discussion_id:
+            raise GitHubDiscussionError("Discussion ID is required to add a comment.")
+        if not body:
+            raise GitHubDiscussionError("Comment body is required.")
+        if "<!-- agent-response -->" not in body:
+            body += AGENT_RESPONSE_TAG
+        return self._enqueue("addDiscussionComment", {"discussionId": discussion_id, "body": body})
+
+    def flush(self) -> list[PendingMutation]:
+        """Send everything queued; returns the mutations that were sent."""
+        sent: list[PendingMutation] = []
+        retries = 0
+        while self._queue:
+            batch = self._queue[: self.batch_size]
+            try:
+                self._send(batch)
+            except GitHubDiscussionRateLimitError as exc:
+                # Aliases that ran in this request are resolved; requeue only the rest
+                resolved = [mutation for mutation in batch if mutation.done]
+                limited = [mutation for mutation in batch if not mutation.done]
+                self._queue[: len(batch)] = limited
+                sent.extend(resolved)
+                if retries >= self.max_retries:
+                    self._fail(limited, str(exc))
+                    retries = 0
+                    del self._queue[: len(limited)]
+                    sent.extend(limited)
+                else:
+                    retries += 1
+                    self.batch_size = max(1, self.batch_size // 2)
+                    wait = exc.retry_after if exc.retry_after is not None else SECONDARY_RATE_LIMIT_WAIT
+                    logger.warning(
+                        "Discussion mutations rate limited; retrying %d in %.0fs with batch size %d",
+                        len(limited), wait, self.batch_size,
+                    )
+                    self._sleep(wait)
+                continue
+            except GitHubDiscussionError as exc:
+                self._fail(batch, str(exc))
+            else:
+                retries = 0
+                self.batch_size = min(self.max_batch_size, self.batch_size + 1)
+            del self._queue[: len(batch)]
+            sent.extend(batch)
+        return sent
+
+    def _enqueue(self, field: str, payload: dict[str, Any]) -> PendingMutation:
+        mutation = PendingMutation(field=field, input=payload)
+        self._queue.append(mutation)
+        if len(self._queue) >= self.batch_size:
+            self.flush()
+        return mutation
+
+    def _send(self, batch: Sequence[PendingMutation]) -> None:
+        """Send one aliased document and resolve each mutation in ``batch``.
+
+        Raises:
+            GitHubDiscussionRateLimitError: If GitHub rate limited the request
+                or some of its aliases. Aliases that returned data (or a
+                different error) are resolved first; only the rate-limited
+                ones are left pending.
+        """
+        if self._last_request is not None and self.min_interval > 0:
+            remaining = self.min_interval - (time.monotonic() - self._last_request)
+            if remaining > 0:
+                self._sleep(remaining)
+        document, variables = build_mutation_document(batch)
+        try:
+            response = _graphql_post(token=self.token, api_url=self.api_url, query=document, variables=variables)
+        finally:
+            self._last_request = time.monotonic()
+            self.requests += 1
+
+        errors = response.get("errors") or []
+        rate_limited = _is_rate_limited(errors)
+        data = response.get("data")
+        if not isinstance(data, Mapping):
+            if rate_limited:
+                raise GitHubDiscussionRateLimitError(_format_graphql_errors(errors))
+            raise GitHubDiscussionError(_format_graphql_errors(errors) if errors else "Unexpected GitHub GraphQL payload.")
+
+        alias_errors: dict[str, list[Any]] = {}
+        request_rate_limited = False
+        for err in errors:
+            path = err.get("path") if isinstance(err, Mapping) else None
+            if path:
+                alias_errors.setdefault(str(path[0]), []).append(err)
+            elif _is_rate_limited([err]):
+                request_rate_limited = True
+
+        limited = 0
+        for position, mutation in enumerate(batch):
+            alias = f"m{position}"
+            _, _, key, parse = _MUTATIONS[mutation.field]
+            node = data.get(alias)
+            result = node.get(key) if isinstance(node, Mapping) else None
+            own_errors = alias_errors.get(alias)
+            if result is None and (
+                _is_rate_limited(own_errors) or (request_rate_limited and own_errors is None)
+            ):
+                # Not run by GitHub; leave pending so flush() sends it again
+                limited += 1
+                continue
+            mutation.done = True
+            if own_errors:
+                mutation.error = _format_graphql_errors(own_errors)
+            elif not isinstance(result, Mapping) or not result.get("id"):
+                mutation.error = f"{mutation.field} returned no result."
+            else:
+                mutation.result = parse(result)
+        if limited:
+            raise GitHubDiscussionRateLimitError(_format_graphql_errors(errors))
+
+    @staticmethod
+    def _fail(batch: Sequence[PendingMutation], message: str) -> None:
+        for mutation in batch:
+            mutation.done = True
+            mutation.error = message
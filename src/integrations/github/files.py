@@ -3,12 +3,33 @@
 from __future__ import annotations
 
 import base64
+import hashlib
 import json
-from typing import Any
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Sequence
 from urllib import error, request
 
+from src.tracing import bind
+
+from . import transport as github_transport
 from .issues import API_VERSION, DEFAULT_API_URL, GitHubIssueError, normalize_repository
 
+logger = logging.getLogger(__name__)
+
+# Parallel blob uploads per commit_files_batch call
+DEFAULT_BLOB_WORKERS = 8
+# UTF-8 files up to this size travel inline in the tree request instead of as blobs
+INLINE_CONTENT_LIMIT = 16 * 1024
+# Tree entries and inline bytes per tree request; larger batches chain trees
+TREE_CHUNK_ENTRIES = 500
+TREE_CHUNK_BYTES = 4 * 1024 * 1024
+# Extra attempts for a request failing with a 5xx or a network error
+TRANSIENT_RETRIES = 2
+_TRANSIENT_STATUSES = frozenset({500, 502, 503, 504})
+
 
 def get_file_content(
     *,
@@ -44,7 +65,7 @@ def get_file_content(
     req.add_header("X-GitHub-Api-Version", API_VERSION)
 
     try:
-        with request.urlopen(req, timeout=30) as response:
+        with github_transport.urlopen(req, timeout=30) as response:
             data = json.loads(response.read().decode("utf-8"))
             content_b64 = data.get("content", "")
             # GitHub returns base64 with newlines, so we need to handle that
@@ -109,7 +130,7 @@ def commit_file(
         get_req.add_header("Accept", "application/vnd.github+json")
         get_req.add_header("X-GitHub-Api-Version", API_VERSION)
         
-        with request.urlopen(get_req) as response:
+        with github_transport.urlopen(get_req) as response:
             data = json.loads(response.read().decode("utf-8"))
             payload["sha"] = data["sha"]
     except error.HTTPError as exc:
@@ -126,7 +147,7 @@ def commit_file(
     req.add_header("Content-Type", "application/json; charset=utf-8")
 
     try:
-        with request.urlopen(req, timeout=30) as response:
+        with github_transport.urlopen(req, timeout=30) as response:
             data = json.loads(response.read().decode("utf-8"))
             return data
     except error.HTTPError as exc:
@@ -138,6 +159,119 @@ def commit_file(
         raise GitHubIssueError(f"Failed to reach GitHub API: {exc.reason}") from exc
 
 
+def git_blob_sha(content: bytes) -> str:
+    """The SHA-1 git assigns to a blob holding ``content``."""
+    return hashlib.sha1(b"blob %d\0" % len(content) + content).hexdigest()
+
+
+@dataclass
+class BatchCommitProgress:
+    """Work a failed :func:`commit_files_batch` call already finished.
+
+    Pass the same object when retrying the batch. Uploaded blobs are not sent
+    again, and tree building resumes after the last completed chunk as long
+    as the file list and the branch head are unchanged.
+    """
+
+    batch: str | None = None
+    base_commit: str | None = None
+    tree_sha: str | None = None
+    chunks_done: int = 0
+    blobs: set[str] = field(default_factory=set)
+
+
+@dataclass
+class _PreparedFile:
+    path: str
+    content: bytes
+    sha: str
+    inline: str | None
+
+    def tree_entry(self) -> dict[str, Any]:
+        entry: dict[str, Any] = {"path": self.path, "mode": "100644", "type": "blob"}
+        if self.inline is not None:
+            entry["content"] = self.inline
+        else:
+            entry["sha"] = self.sha
+        return entry
+
+
+def _prepare_files(files: Sequence[tuple[str, str | bytes]]) -> list[_PreparedFile]:
+    """Normalize paths, hash contents and pick inline vs blob for each file."""
+    prepared: dict[str, _PreparedFile] = {}
+    for path, content in files:
+        if path.startswith("/"):
+            path = path[1:]
+        content_bytes = content.encode("utf-8") if isinstance(content, str) else content
+        inline = None
+        if len(content_bytes) <= INLINE_CONTENT_LIMIT:
+            try:
+                inline = content_bytes.decode("utf-8")
+            except UnicodeDecodeError:
+                pass  # Binary content needs a base64 blob
+        # A path listed twice keeps its last content, as sequential commits would
+        prepared[path] = _PreparedFile(path, content_bytes, git_blob_sha(content_bytes), inline)
+    return list(prepared.values())
+
+
+def _tree_chunks(prepared: list[_PreparedFile]) -> list[list[_PreparedFile]]:
+    chunks: list[list[_PreparedFile]] = []
+    current: list[_PreparedFile] = []
+    size = 0
+    for item in prepared:
+        cost = len(item.content) if item.inline is not None else 0
+        if current and (len(current) >= TREE_CHUNK_ENTRIES or size + cost > TREE_CHUNK_BYTES):
+            chunks.append(current)
+            current, size = [], 0
+        current.append(item)
+        size += cost
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def _upload_blobs(
+    api_request: Callable[..., dict],
+    prepared: list[_PreparedFile],
+    progress: BatchCommitProgress,
+    workers: int,
+) -> int:
+    """Create each distinct blob not yet uploaded; returns how many were sent."""
+    pending: dict[str, bytes] = {}
+    for item in prepared:
+        if item.inline is None and item.sha not in progress.blobs:
+            pending.setdefault(item.sha, item.content)
+    if not pending:
+        return 0
+
+    def upload(sha: str) -> None:
+        blob = api_request(
+            "git/blobs",
+            method="POST",
+            data={"content": base64.b64encode(pending[sha]).decode("utf-8"), "encoding": "base64"},
+        )
+        if blob.get("sha") != sha:
+            raise GitHubIssueError(f"Blob SHA mismatch: expected {sha}, got {blob.get('sha')}")
+        progress.blobs.add(sha)
+
+    if workers <= 1 or len(pending) == 1:
+        for sha in pending:
+            upload(sha)
+        return len(pending)
+
+    with ThreadPoolExecutor(max_workers=min(workers, len(pending)), thread_name_prefix="github-blob") as pool:
+        run = bind(upload)
+        futures = [pool.submit(run, sha) for sha in pending]
+        try:
+            for future in futures:
+                future.result()
+        except Exception:
+            for future in futures:
+                future.cancel()
+            raise
+    return len(pending)
+
+
 def commit_files_batch(
     *,
     token: str,
@@ -146,12 +280,22 @@ def commit_files_batch(
     message: str,
     branch: str,
     api_url: str = DEFAULT_API_URL,
+    workers: int = DEFAULT_BLOB_WORKERS,
+    progress: BatchCommitProgress | None = None,
 ) -> dict[str, Any]:
     """Create or update multiple files in a single commit using the Git Trees API.
 
     This is more efficient than multiple individual commit_file calls and creates
     a cleaner git history with a single commit for all changes.
 
+    Small UTF-8 files are sent inline in the tree request. Larger or binary
+    files become blobs, uploaded once per distinct content on up to
+    ``workers`` threads. Batches over :data:`TREE_CHUNK_ENTRIES` files or
+    :data:`TREE_CHUNK_BYTES` of inline content are built as a chain of trees,
+    each based on the previous one. Requests failing with a 5xx or network
+    error are retried; after any other failure, pass ``progress`` again to
+    resume instead of starting over.
+
     Args:
         token: GitHub API token
         repository: Repository in "owner/repo" format
@@ -159,6 +303,8 @@ def commit_files_batch(
         message: Commit message
         branch: Branch to commit to
         api_url: GitHub API base URL
+        workers: Maximum concurrent blob uploads
+        progress: Progress of an earlier attempt at the same batch; updated in place
 
     Returns:
         Dictionary containing the commit details
@@ -182,63 +328,66 @@ def commit_files_batch(
     def api_request(endpoint: str, method: str = "GET", data: dict | None = None) -> dict:
         url = f"{base_url}/{endpoint}"
         body = json.dumps(data).encode("utf-8") if data else None
-        req = request.Request(url, data=body, method=method)
-        for key, value in headers.items():
-            req.add_header(key, value)
-        try:
-            with request.urlopen(req, timeout=60) as response:
-                return json.loads(response.read().decode("utf-8"))
-        except error.HTTPError as exc:
-            error_text = exc.read().decode("utf-8", errors="replace")
-            raise GitHubIssueError(
-                f"GitHub API error ({exc.code}) at {endpoint}: {error_text.strip()}"
-            ) from exc
-        except error.URLError as exc:
-            raise GitHubIssueError(f"Failed to reach GitHub API: {exc.reason}") from exc
+        attempt = 0
+        while True:
+            req = request.Request(url, data=body, method=method)
+            for key, value in headers.items():
+                req.add_header(key, value)
+            try:
+                with github_transport.urlopen(req, timeout=60) as response:
+                    return json.loads(response.read().decode("utf-8"))
+            except error.HTTPError as exc:
+                error_text = exc.read().decode("utf-8", errors="replace")
+                if exc.code in _TRANSIENT_STATUSES and attempt < TRANSIENT_RETRIES:
+                    logger.warning("GitHub %s %s failed (%s); retrying", method, endpoint, exc.code)
+                    time.sleep(2**attempt)
+                    attempt += 1
+                    continue
+                raise GitHubIssueError(
+                    f"GitHub API error ({exc.code}) at {endpoint}: {error_text.strip()}"
+                ) from exc
+            except error.URLError as exc:
+                if attempt < TRANSIENT_RETRIES:
+                    logger.warning("GitHub %s %s failed (%s); retrying", method, endpoint, exc.reason)
+                    time.sleep(2**attempt)
+                    attempt += 1
+                    continue
+                raise GitHubIssueError(f"Failed to reach GitHub API: {exc.reason}") from exc
+
+    prepared = _prepare_files(files)
+    progress = progress if progress is not None else BatchCommitProgress()
+    batch_key = hashlib.sha256(
+        "\n".join(f"{item.path}\0{item.sha}" for item in prepared).encode("utf-8")
+    ).hexdigest()
 
     # Step 1: Get the current commit SHA for the branch
     ref_data = api_request(f"git/refs/heads/{branch}")
     current_commit_sha = ref_data["object"]["sha"]
+    if progress.batch != batch_key or progress.base_commit != current_commit_sha:
+        # Trees built for other files or an older head can't be reused; blobs can
+        progress.batch = batch_key
+        progress.base_commit = current_commit_sha
+        progress.tree_sha = None
+        progress.chunks_done = 0
 
     # Step 2: Get the tree SHA for the current commit
-    commit_data = api_request(f"git/commits/{current_commit_sha}")
-    base_tree_sha = commit_data["tree"]["sha"]
-
-    # Step 3: Create blobs for each file and build tree entries
-    tree_entries = []
-    for path, content in files:
-        # Normalize path
-        if path.startswith("/"):
-            path = path[1:]
-
-        # Encode content
-        if isinstance(content, str):
-            content_bytes = content.encode("utf-8")
-        else:
-            content_bytes = content
-
-        encoded_content = base64.b64encode(content_bytes).decode("utf-8")
-
-        # Create blob
-        blob_data = api_request(
-            "git/blobs",
+    if progress.tree_sha is None:
+        commit_data = api_request(f"git/commits/{current_commit_sha}")
+        progress.tree_sha = commit_data["tree"]["sha"]
+
+    # Step 3: Create blobs for files too large or binary to send inline
+    blobs_created = _upload_blobs(api_request, prepared, progress, workers)
+
+    # Step 4: Create the new tree, chaining chunks onto the previous chunk's tree
+    tree_data: dict[str, Any] = {"sha": progress.tree_sha}
+    for chunk in _tree_chunks(prepared)[progress.chunks_done:]:
+        tree_data = api_request(
+            "git/trees",
             method="POST",
-            data={"content": encoded_content, "encoding": "base64"},
+            data={"base_tree": progress.tree_sha, "tree": [item.tree_entry() for item in chunk]},
         )
-
-        tree_entries.append({
-            "path": path,
-            "mode": "100644",  # Regular file
-            "type": "blob",
-            "sha": blob_data["sha"],
-        })
-
-    # Step 4: Create new tree with the changes
-    tree_data = api_request(
-        "git/trees",
-        method="POST",
-        data={"base_tree": base_tree_sha, "tree": tree_entries},
-    )
+        progress.tree_sha = tree_data["sha"]
+        progress.chunks_done += 1
     new_tree_sha = tree_data["sha"]
 
     # Step 5: Create new commit
@@ -295,5 +444,6 @@ def commit_files_batch(
         "commit": commit_response,
         "tree": tree_data,
         "files_count": len(files),
+        "blobs_created": blobs_created,
         "sha": new_commit_sha,
     }
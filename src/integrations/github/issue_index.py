@@ -0,0 +1,330 @@
+"""Local SQLite index of repository issues.
+
+The extraction queue needs to know which parsed documents already have an
+issue. Asking the search API on every ``status``/``pending``/``queue`` run
+costs requests proportional to every issue the repository has ever had, and
+the search API has a much tighter rate limit than the core REST API.
+
+:class:`IssueIndex` keeps a local copy of the fields the queue commands need
+(number, state, labels and the ``<!-- checksum:... -->`` marker parsed from
+the body) and refreshes it incrementally:
+
+1. The first sync pages through ``GET /repos/{owner}/{repo}/issues?state=all``.
+2. Later syncs pass ``since=<newest updated_at seen>`` so only issues touched
+   since the previous run are returned.
+3. Every page goes through the shared transport, which revalidates with
+   ``If-None-Match``; an unchanged page is a 304 and does not count against
+   the rate limit.
+
+Queries are plain SQLite lookups and never touch the network.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import re
+import sqlite3
+from contextlib import closing
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterator, Mapping, Sequence
+from urllib import error, parse, request
+
+from . import transport as github_transport
+from .issues import API_VERSION, DEFAULT_API_URL, GitHubIssueError, normalize_repository
+
+logger = logging.getLogger(__name__)
+
+ISSUE_INDEX_ENV = "GITHUB_ISSUE_INDEX_DB"
+DEFAULT_INDEX_PATH = Path("issue_index.db")
+ISSUE_PAGE_SIZE = 100
+
+_CHECKSUM_PATTERN = re.compile(r"<!-- checksum:(\w+) -->")
+
+
+def parse_checksum(body: str | None) -> str | None:
+    """Return the checksum from a ``<!-- checksum:... -->`` marker, if any."""
+
+    if not body:
+        return None
+    match = _CHECKSUM_PATTERN.search(body)
+    return match.group(1) if match else None
+
+
+def default_index_path() -> Path:
+    """Return the index location from ``GITHUB_ISSUE_INDEX_DB`` or the default."""
+
+    configured = os.environ.get(ISSUE_INDEX_ENV, "").strip()
+    return Path(configured) if configured else DEFAULT_INDEX_PATH
+
+
+# =============================================================================
+# Indexed Issues
+# =============================================================================
+
+
+@dataclass(frozen=True)
+class IndexedIssue:
+    """The subset of an issue kept in the local index."""
+
+    number: int
+    title: str
+    state: str
+    labels: tuple[str, ...]
+    checksum: str | None
+    url: str
+    updated_at: str
+
+    @classmethod
+    def from_api_payload(cls, payload: Mapping[str, object]) -> "IndexedIssue":
+        try:
+            number = int(payload["number"])  # type: ignore[arg-type]
+            labels = tuple(
+                str(label["name"]) if isinstance(label, Mapping) else str(label)
+                for label in payload.get("labels") or ()  # type: ignore[union-attr]
+            )
+        except (KeyError, TypeError, ValueError) as exc:  # pragma: no cover - protective
+            raise GitHubIssueError("Unexpected GitHub issue payload") from exc
+        return cls(
+            number=number,
+            title=str(payload.get("title", "")),
+            state=str(payload.get("state", "")),
+            labels=labels,
+            checksum=parse_checksum(payload.get("body")),  # type: ignore[arg-type]
+            url=str(payload.get("html_url") or payload.get("url") or ""),
+            updated_at=str(payload.get("updated_at", "")),
+        )
+
+    @classmethod
+    def _from_row(cls, row: sqlite3.Row) -> "IndexedIssue":
+        return cls(
+            number=row["number"],
+            title=row["title"],
+            state=row["state"],
+            labels=tuple(json.loads(row["labels"])),
+            checksum=row["checksum"],
+            url=row["url"],
+            updated_at=row["updated_at"],
+        )
+
+
+# =============================================================================
+# Index
+# =============================================================================
+
+
+class IssueIndex:
+    """SQLite-backed index of a repository's issues, keyed by checksum."""
+
+    def __init__(
+        self,
+        *,
+        repository: str,
+        token: str | None = None,
+        db_path: Path | None = None,
+        api_url: str = DEFAULT_API_URL,
+    ) -> None:
+        self._owner, self._name = normalize_repository(repository)
+        self.repository = f"{self._owner}/{self._name}"
+        self._token = token
+        self._api_url = api_url.rstrip("/")
+        self.db_path = db_path or default_index_path()
+        self.page_requests = 0
+        self._initialize_schema()
+
+    # -- Sync -----------------------------------------------------------------
+
+    @property
+    def synced_at(self) -> str | None:
+        """Newest ``updated_at`` recorded by a previous sync."""
+
+        return self._get_meta("synced_at")
+
+    def sync(self, *, full: bool = False) -> int:
+        """Fetch issues changed since the last sync and upsert them.
+
+        Args:
+            full: Ignore the stored watermark and list every issue.
+
+        Returns:
+            Number of issues written to the index.
+        """
+
+        if not self._token:
+            raise GitHubIssueError("A GitHub token is required to sync the issue index.")
+
+        since = None if full else self.synced_at
+        newest = since or ""
+        written = 0
+        with closing(self._connect()) as conn, conn:
+            for payload in self._iter_issue_payloads(since):
+                if "pull_request" in payload:
+                    continue
+                issue = IndexedIssue.from_api_payload(payload)
+                self._upsert(conn, issue)
+                newest = max(newest, issue.updated_at)
+                written += 1
+            if newest:
+                self._set_meta(conn, "synced_at", newest)
+
+        logger.info(
+            "Issue index for %s: %d issue(s) updated in %d page request(s)",
+            self.repository, written, self.page_requests,
+        )
+        return written
+
+    def rebuild(self) -> int:
+        """Drop every indexed issue and re-list the repository from scratch."""
+
+        with closing(self._connect()) as conn, conn:
+            conn.execute("DELETE FROM issues")
+            conn.execute("DELETE FROM meta WHERE key = 'synced_at'")
+        return self.sync(full=True)
+
+    def record(self, issue: IndexedIssue) -> None:
+        """Add an issue this process just created, ahead of the next sync."""
+
+        with closing(self._connect()) as conn, conn:
+            self._upsert(conn, issue)
+
+    def _iter_issue_payloads(self, since: str | None) -> Iterator[Mapping[str, object]]:
+        page = 1
+        while True:
+            params = {
+                "state": "all",
+                "sort": "updated",
+                "direction": "asc",
+                "per_page": str(ISSUE_PAGE_SIZE),
+                "page": str(page),
+            }
+            if since:
+                params["since"] = since
+            url = (
+                f"{self._api_url}/repos/{self._owner}/{self._name}/issues?"
+                f"{parse.urlencode(params)}"
+            )
+            payloads = self._get_json(url)
+            self.page_requests += 1
+            yield from payloads
+            if len(payloads) < ISSUE_PAGE_SIZE:
+                return
+            page += 1
+
+    def _get_json(self, url: str) -> Sequence[Mapping[str, object]]:
+        req = request.Request(url, method="GET")
+        req.add_header("Authorization", f"Bearer {self._token}")
+        req.add_header("Accept", "application/vnd.github+json")
+        req.add_header("X-GitHub-Api-Version", API_VERSION)
+
+        try:
+            with github_transport.urlopen(req) as response:
+                response_bytes = response.read()
+        except error.HTTPError as exc:
+            error_text = exc.read().decode("utf-8", errors="replace")
+            raise GitHubIssueError(
+                f"GitHub API error ({exc.code}): {error_text.strip()}"
+            ) from exc
+        except error.URLError as exc:
+            raise GitHubIssueError(f"Failed to reach GitHub API: {exc.reason}") from exc
+
+        payload = json.loads(response_bytes.decode("utf-8"))
+        if not isinstance(payload, list):
+            raise GitHubIssueError("Unexpected GitHub issues payload type.")
+        return payload
+
+    # -- Queries --------------------------------------------------------------
+
+    def by_checksum(self, checksum: str) -> IndexedIssue | None:
+        """Return the newest issue carrying ``checksum``, if any."""
+
+        with closing(self._connect()) as conn:
+            row = conn.execute(
+                "SELECT * FROM issues WHERE checksum = ? ORDER BY number DESC LIMIT 1",
+                (checksum,),
+            ).fetchone()
+        return IndexedIssue._from_row(row) if row else None
+
+    def issues(self, *, label: str | None = None, state: str | None = None) -> list[IndexedIssue]:
+        """Return indexed issues, optionally filtered by label and state."""
+
+        query = "SELECT * FROM issues"
+        clauses: list[str] = []
+        params: list[str] = []
+        if label:
+            clauses.append("EXISTS (SELECT 1 FROM json_each(issues.labels) WHERE value = ?)")
+            params.append(label)
+        if state:
+            clauses.append("state = ?")
+            params.append(state)
+        if clauses:
+            query += " WHERE " + " AND ".join(clauses)
+        with closing(self._connect()) as conn:
+            rows = conn.execute(query + " ORDER BY number", params).fetchall()
+        return [IndexedIssue._from_row(row) for row in rows]
+
+    def __len__(self) -> int:
+        with closing(self._connect()) as conn:
+            return conn.execute("SELECT COUNT(*) FROM issues").fetchone()[0]
+
+    # -- Storage --------------------------------------------------------------
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(str(self.db_path))
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def _initialize_schema(self) -> None:
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS issues (
+                    number INTEGER PRIMARY KEY,
+                    title TEXT NOT NULL,
+                    state TEXT NOT NULL,
+                    labels TEXT NOT NULL,
+                    checksum TEXT,
+                    url TEXT NOT NULL,
+                    updated_at TEXT NOT NULL
+                )
+                """
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_issues_checksum ON issues(checksum)")
+            conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+            stored = conn.execute("SELECT value FROM meta WHERE key = 'repository'").fetchone()
+            if stored and stored[0] != self.repository:
+                # An index built for another repository is useless here
+                logger.info("Discarding issue index built for %s", stored[0])
+                conn.execute("DELETE FROM issues")
+                conn.execute("DELETE FROM meta")
+            self._set_meta(conn, "repository", self.repository)
+
+    @staticmethod
+    def _upsert(conn: sqlite3.Connection, issue: IndexedIssue) -> None:
+        conn.execute(
+            """
+            INSERT OR REPLACE INTO issues
+                (number, title, state, labels, checksum, url, updated_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            """,
+            (
+                issue.number,
+                issue.title,
+                issue.state,
+                json.dumps(list(issue.labels)),
+                issue.checksum,
+                issue.url,
+                issue.updated_at,
+            ),
+        )
+
+    def _get_meta(self, key: str) -> str | None:
+        with closing(self._connect()) as conn:
+            row = conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    @staticmethod
+    def _set_meta(conn: sqlite3.Connection, key: str, value: str) -> None:
+        conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
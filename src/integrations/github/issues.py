@@ -11,6 +11,8 @@ from typing import Mapping, Sequence
 from urllib import error, request
 from urllib.parse import urlparse
 
+from . import transport as github_transport
+
 DEFAULT_API_URL = "https://api.github.com"
 API_VERSION = "2022-11-28"
 AGENT_RESPONSE_TAG = "\n\n<!-- agent-response -->"
@@ -155,7 +157,7 @@ def get_repository_details(
     req.add_header("X-GitHub-Api-Version", API_VERSION)
 
     try:
-        with request.urlopen(req) as response:
+        with github_transport.urlopen(req) as response:
             response_bytes = response.read()
     except error.HTTPError as exc:
         error_text = exc.read().decode("utf-8", errors="replace")
@@ -199,7 +201,7 @@ def create_issue(
     req.add_header("Content-Type", "application/json; charset=utf-8")
 
     try:
-        with request.urlopen(req) as response:
+        with github_transport.urlopen(req) as response:
             response_bytes = response.read()
     except error.HTTPError as exc:
         error_text = exc.read().decode("utf-8", errors="replace")
@@ -239,7 +241,7 @@ def _graphql_request(
     req.add_header("Content-Type", "application/json; charset=utf-8")
 
     try:
-        with request.urlopen(req) as response:
+        with github_transport.urlopen(req) as response:
             response_bytes = response.read()
     except error.HTTPError as exc:  # pragma: no cover - network failure safeguard
         error_text = exc.read().decode("utf-8", errors="replace")
@@ -284,7 +286,7 @@ def fetch_issue(
     req.add_header("X-GitHub-Api-Version", API_VERSION)
 
     try:
-        with request.urlopen(req) as response:
+        with github_transport.urlopen(req) as response:
             response_bytes = response.read()
     except error.HTTPError as exc:
         error_text = exc.read().decode("utf-8", errors="replace")
@@ -320,7 +322,7 @@ def fetch_issue_comments(
     req.add_header("X-GitHub-Api-Version", API_VERSION)
 
     try:
-        with request.urlopen(req) as response:
+        with github_transport.urlopen(req) as response:
             response_bytes = response.read()
     except error.HTTPError as exc:
         error_text = exc.read().decode("utf-8", errors="replace")
@@ -458,7 +460,7 @@ def add_labels(
     req.add_header("Content-Type", "application/json; charset=utf-8")
 
     try:
-        with request.urlopen(req) as response:
+        with github_transport.urlopen(req) as response:
             response.read()
     except error.HTTPError as exc:
         error_text = exc.read().decode("utf-8", errors="replace")
@@ -496,7 +498,7 @@ def remove_label(
     req.add_header("X-GitHub-Api-Version", API_VERSION)
 
     try:
-        with request.urlopen(req) as response:
+        with github_transport.urlopen(req) as response:
             response.read()
     except error.HTTPError as exc:
         error_text = exc.read().decode("utf-8", errors="replace")
@@ -537,7 +539,7 @@ def post_comment(
     req.add_header("Content-Type", "application/json; charset=utf-8")
 
     try:
-        with request.urlopen(req) as response:
+        with github_transport.urlopen(req) as response:
             response_bytes = response.read()
     except error.HTTPError as exc:
         error_text = exc.read().decode("utf-8", errors="replace")
@@ -581,7 +583,7 @@ def assign_issue(
     req.add_header("Content-Type", "application/json; charset=utf-8")
 
     try:
-        with request.urlopen(req) as response:
+        with github_transport.urlopen(req) as response:
             response.read()
     except error.HTTPError as exc:
         error_text = exc.read().decode("utf-8", errors="replace")
@@ -629,7 +631,7 @@ def update_issue(
     req.add_header("Content-Type", "application/json; charset=utf-8")
 
     try:
-        with request.urlopen(req) as response:
+        with github_transport.urlopen(req) as response:
             response.read()
     except error.HTTPError as exc:
         error_text = exc.read().decode("utf-8", errors="replace")
@@ -700,7 +702,7 @@ def get_repository_labels(
     req.add_header("X-GitHub-Api-Version", API_VERSION)
 
     try:
-        with request.urlopen(req) as response:
+        with github_transport.urlopen(req) as response:
             data = json.loads(response.read().decode("utf-8"))
             return [{"name": lbl["name"], "color": lbl.get("color", ""), "description": lbl.get("description", "")} for lbl in data]
     except error.HTTPError as exc:
@@ -743,7 +745,7 @@ def create_label(
     req.add_header("Content-Type", "application/json; charset=utf-8")
 
     try:
-        with request.urlopen(req) as response:
+        with github_transport.urlopen(req) as response:
             response.read()
     except error.HTTPError as exc:
         error_text = exc.read().decode("utf-8", errors="replace")
@@ -793,7 +795,7 @@ def update_label(
     req.add_header("Content-Type", "application/json; charset=utf-8")
 
     try:
-        with request.urlopen(req) as response:
+        with github_transport.urlopen(req) as response:
             response.read()
     except error.HTTPError as exc:
         error_text = exc.read().decode("utf-8", errors="replace")
@@ -878,7 +880,7 @@ def lock_issue(
         req.add_header("Content-Type", "application/json; charset=utf-8")
 
     try:
-        with request.urlopen(req) as response:
+        with github_transport.urlopen(req) as response:
             response.read()
     except error.HTTPError as exc:
         error_text = exc.read().decode("utf-8", errors="replace")
@@ -5,11 +5,27 @@ from __future__ import annotations
 import json
 import logging
 import os
+import threading
 import time
-from dataclasses import dataclass
-from typing import Any, Mapping, Sequence
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterator, Mapping, Sequence
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.util.retry import Retry
+
+from src.integrations.github.quota import (
+    DEFAULT_PRIORITY,
+    QuotaBroker,
+    QuotaGrant,
+    estimate_tokens,
+    get_default_broker,
+)
+from src.metrics import LLM_REQUEST_SECONDS, LLM_TOKENS
+from src.tracing import span
 
 logger = logging.getLogger(__name__)
 
@@ -70,6 +86,119 @@ class Usage:
     total_tokens: int
 
 
+@dataclass(frozen=True)
+class ChatCompletionDelta:
+    """An incremental piece of a streamed chat completion."""
+
+    index: int
+    content: str = ""
+    finish_reason: str | None = None
+
+
+@dataclass(frozen=True)
+class RequestTiming:
+    """Latency breakdown for a single API call.
+
+    ``connect`` is zero when the request reused a pooled keep-alive
+    connection. ``ttfb`` is the time from sending the request to receiving
+    response headers, excluding ``connect``. ``transfer`` covers reading the
+    response body.
+    """
+
+    connect: float
+    ttfb: float
+    transfer: float
+
+    @property
+    def total(self) -> float:
+        return self.connect + self.ttfb + self.transfer
+
+
+@dataclass
+class ClientMetrics:
+    """Aggregated request latency for a :class:`GitHubModelsClient`."""
+
+    requests: int = 0
+    new_connections: int = 0
+    connect_seconds: float = 0.0
+    ttfb_seconds: float = 0.0
+    transfer_seconds: float = 0.0
+    recent: deque[RequestTiming] = field(default_factory=lambda: deque(maxlen=100))
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def record(self, timing: RequestTiming) -> None:
+        with self._lock:
+            self.requests += 1
+            if timing.connect > 0:
+                self.new_connections += 1
+            self.connect_seconds += timing.connect
+            self.ttfb_seconds += timing.ttfb
+            self.transfer_seconds += timing.transfer
+            self.recent.append(timing)
+
+    def summary(self) -> dict[str, Any]:
+        """Totals and per-request averages, suitable for logging."""
+        with self._lock:
+            count = self.requests or 1
+            return {
+                "requests": self.requests,
+                "new_connections": self.new_connections,
+                "avg_connect_seconds": self.connect_seconds / count,
+                "avg_ttfb_seconds": self.ttfb_seconds / count,
+                "avg_transfer_seconds": self.transfer_seconds / count,
+            }
+
+
+# Seconds spent establishing connections on the current thread since the last
+# reset; written by the timed connection classes below.
+_connect_timer = threading.local()
+
+
+def _reset_connect_timer() -> None:
+    _connect_timer.seconds = 0.0
+
+
+def _read_connect_timer() -> float:
+    return getattr(_connect_timer, "seconds", 0.0)
+
+
+class _TimedHTTPConnection(HTTPConnection):
+    def connect(self) -> None:
+        started = time.perf_counter()
+        try:
+            super().connect()
+        finally:
+            _connect_timer.seconds = _read_connect_timer() + time.perf_counter() - started
+
+
+class _TimedHTTPSConnection(HTTPSConnection):
+    def connect(self) -> None:
+        started = time.perf_counter()
+        try:
+            super().connect()
+        finally:
+            _connect_timer.seconds = _read_connect_timer() + time.perf_counter() - started
+
+
+class _TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _TimedHTTPConnection
+
+
+class _TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _TimedHTTPSConnection
+
+
+class _TimedHTTPAdapter(HTTPAdapter):
+    """Pooled adapter whose connections report how long ``connect()`` took."""
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _TimedHTTPConnectionPool,
+            "https": _TimedHTTPSConnectionPool,
+        }
+
+
 class GitHubModelsError(Exception):
     """Error communicating with GitHub Models API."""
 
@@ -82,6 +211,14 @@ class RateLimitError(GitHubModelsError):
         self.retry_after = retry_after
 
 
+class ResponseFormatUnsupportedError(GitHubModelsError):
+    """The model rejected the requested ``response_format``."""
+
+
+# Models that accept ``response_format: {"type": "json_schema", ...}``
+STRUCTURED_OUTPUT_MODEL_PREFIXES = ("gpt-4o", "gpt-4.1", "o1", "o3", "o4")
+
+
 class GitHubModelsClient:
     """Client for GitHub Models API (OpenAI-compatible endpoint).
     
@@ -99,6 +236,12 @@ class GitHubModelsClient:
     DEFAULT_INITIAL_BACKOFF = 2.0  # seconds
     DEFAULT_MAX_BACKOFF = 120.0  # 2 minutes max wait
     DEFAULT_BACKOFF_MULTIPLIER = 2.0
+    
+    # Connection pool defaults (keep-alive connections per host)
+    DEFAULT_POOL_CONNECTIONS = 4
+    DEFAULT_POOL_MAXSIZE = 10
+    # Transport-level retries for failed connects (the request was never sent)
+    DEFAULT_CONNECT_RETRIES = 2
 
     def __init__(
         self,
@@ -113,6 +256,10 @@ class GitHubModelsClient:
         max_retries: int | None = None,
         initial_backoff: float | None = None,
         max_backoff: float | None = None,
+        session: requests.Session | None = None,
+        pool_maxsize: int | None = None,
+        quota_broker: QuotaBroker | None = None,
+        priority: str = DEFAULT_PRIORITY,
     ):
         """Initialize GitHub Models API client.
         
@@ -127,6 +274,12 @@ class GitHubModelsClient:
             max_retries: Maximum number of retry attempts for rate limits (default: 5).
             initial_backoff: Initial backoff delay in seconds (default: 2.0).
             max_backoff: Maximum backoff delay in seconds (default: 120.0).
+            session: HTTP session to send requests with. Defaults to a pooled
+                keep-alive session owned by this client.
+            pool_maxsize: Maximum pooled connections per host (default: 10).
+            quota_broker: Cross-process quota broker to acquire each request
+                from. Defaults to the broker named by ``LLM_QUOTA_DB``, if set.
+            priority: Quota priority class: "interactive", "normal" or "bulk".
         """
         self.api_key = api_key or os.environ.get("GH_TOKEN") or os.environ.get("GITHUB_TOKEN")
         if not self.api_key:
@@ -152,6 +305,52 @@ class GitHubModelsClient:
         self.max_retries = max_retries if max_retries is not None else self.DEFAULT_MAX_RETRIES
         self.initial_backoff = initial_backoff or self.DEFAULT_INITIAL_BACKOFF
         self.max_backoff = max_backoff or self.DEFAULT_MAX_BACKOFF
+        
+        self.session = session or self._build_session(pool_maxsize or self.DEFAULT_POOL_MAXSIZE)
+        self.metrics = ClientMetrics()
+        self.quota_broker = quota_broker or get_default_broker()
+        self.priority = priority
+        # Models that rejected a json_schema response_format at runtime
+        self._response_format_rejected: set[str] = set()
+
+    @classmethod
+    def _build_session(cls, pool_maxsize: int) -> requests.Session:
+        """Create a keep-alive session so repeated calls skip the TLS handshake."""
+        adapter = _TimedHTTPAdapter(
+            pool_connections=cls.DEFAULT_POOL_CONNECTIONS,
+            pool_maxsize=pool_maxsize,
+            max_retries=Retry(
+                total=cls.DEFAULT_CONNECT_RETRIES,
+                connect=cls.DEFAULT_CONNECT_RETRIES,
+                read=0,
+                status=0,
+                other=0,
+                backoff_factor=0.5,
+                allowed_methods=None,
+                raise_on_status=False,
+            ),
+        )
+        session = requests.Session()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def close(self) -> None:
+        """Release pooled connections."""
+        self.session.close()
+
+    def __enter__(self) -> "GitHubModelsClient":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def supports_response_format(self, model: str | None = None) -> bool:
+        """Whether ``model`` accepts a JSON-schema ``response_format``."""
+        name = model or self.model
+        if name in self._response_format_rejected:
+            return False
+        return name.split("/")[-1].startswith(STRUCTURED_OUTPUT_MODEL_PREFIXES)
 
     def chat_completion(
         self,
@@ -161,6 +360,7 @@ class GitHubModelsClient:
         model: str | None = None,
         max_tokens: int | None = None,
         temperature: float | None = None,
+        response_format: Mapping[str, Any] | None = None,
     ) -> ChatCompletionResponse:
         """Create a chat completion with optional function calling.
         
@@ -170,6 +370,9 @@ class GitHubModelsClient:
             model: Model to use (overrides default).
             max_tokens: Maximum tokens (overrides default).
             temperature: Sampling temperature (overrides default).
+            response_format: Structured-output constraint (e.g. a
+                ``json_schema`` format). Dropped, and remembered as
+                unsupported, if the model rejects it.
             
         Returns:
             ChatCompletionResponse with the model's response.
@@ -177,6 +380,110 @@ class GitHubModelsClient:
         Raises:
             GitHubModelsError: If the API request fails.
         """
+        url, payload, headers = self._build_request(
+            messages,
+            tools=tools,
+            model=model,
+            max_tokens=max_tokens,
+            temperature=temperature,
+        )
+        model_name = payload["model"]
+        started = time.perf_counter()
+        outcome = "error"
+        with span(f"models.{model_name}", stream=False) as current:
+            try:
+                completion: ChatCompletionResponse | None = None
+                if response_format is not None and self.supports_response_format(model_name):
+                    payload["response_format"] = dict(response_format)
+                    try:
+                        completion = self._request_with_retry(url, payload, headers)
+                    except ResponseFormatUnsupportedError as exc:
+                        logger.warning("Model %s rejected response_format; retrying without: %s", model_name, exc)
+                        self._response_format_rejected.add(model_name)
+                        payload = {key: value for key, value in payload.items() if key != "response_format"}
+                if completion is None:
+                    completion = self._request_with_retry(url, payload, headers)
+                outcome = "ok"
+            except RateLimitError:
+                outcome = "rate_limited"
+                raise
+            finally:
+                LLM_REQUEST_SECONDS.observe(time.perf_counter() - started, model=model_name, outcome=outcome)
+            if completion.usage is not None:
+                current.set(
+                    prompt_tokens=completion.usage.prompt_tokens,
+                    completion_tokens=completion.usage.completion_tokens,
+                )
+                _record_token_usage(model_name, completion.usage)
+            return completion
+
+    def stream_chat_completion(
+        self,
+        messages: Sequence[Mapping[str, Any]],
+        *,
+        tools: Sequence[Mapping[str, Any]] | None = None,
+        model: str | None = None,
+        max_tokens: int | None = None,
+        temperature: float | None = None,
+        max_chars: int | None = None,
+    ) -> ChatCompletionStream:
+        """Create a streamed (``stream=True``) chat completion.
+        
+        Rate-limit retries happen before the first byte, exactly as for
+        :meth:`chat_completion`. The returned stream yields
+        :class:`ChatCompletionDelta` objects as they arrive.
+        
+        Args:
+            messages: List of message dicts with 'role' and 'content'.
+            tools: List of tool/function definitions for function calling.
+            model: Model to use (overrides default).
+            max_tokens: Maximum tokens (overrides default).
+            temperature: Sampling temperature (overrides default).
+            max_chars: Stop reading once this much content has arrived.
+            
+        Returns:
+            ChatCompletionStream; use as a context manager or call ``close()``.
+            
+        Raises:
+            GitHubModelsError: If the API request fails.
+        """
+        url, payload, headers = self._build_request(
+            messages,
+            tools=tools,
+            model=model,
+            max_tokens=max_tokens,
+            temperature=temperature,
+        )
+        payload["stream"] = True
+        payload["stream_options"] = {"include_usage": True}
+        headers["Accept"] = "text/event-stream"
+        
+        # The span covers the request up to the first byte; reading the
+        # stream is timed by the caller
+        with span(f"models.{payload['model']}", stream=True):
+            response, connect, ttfb, grant = self._send_with_retry(url, payload, headers)
+        
+        def on_close(transfer: float) -> None:
+            self.metrics.record(RequestTiming(connect=connect, ttfb=ttfb, transfer=transfer))
+            LLM_REQUEST_SECONDS.observe(connect + ttfb + transfer, model=payload["model"], outcome="ok")
+            if stream.usage is not None:
+                _record_token_usage(payload["model"], stream.usage)
+            if grant is not None and stream.usage is not None:
+                grant.settle(stream.usage.total_tokens)
+        
+        stream = ChatCompletionStream(response, max_chars=max_chars, on_close=on_close)
+        return stream
+
+    def _build_request(
+        self,
+        messages: Sequence[Mapping[str, Any]],
+        *,
+        tools: Sequence[Mapping[str, Any]] | None,
+        model: str | None,
+        max_tokens: int | None,
+        temperature: float | None,
+    ) -> tuple[str, dict[str, Any], dict[str, str]]:
+        """Build the URL, JSON payload and headers for a completion request."""
         # Use organization-attributed endpoint if organization is set
         if self.organization:
             url = f"{self.api_url}/orgs/{self.organization}/inference/chat/completions"
@@ -200,8 +507,7 @@ class GitHubModelsClient:
             "Accept": "application/vnd.github+json",
             "X-GitHub-Api-Version": "2022-11-28",
         }
-        
-        return self._request_with_retry(url, payload, headers)
+        return url, payload, headers
 
     def _request_with_retry(
         self,
@@ -219,6 +525,42 @@ class GitHubModelsClient:
         Returns:
             ChatCompletionResponse on success.
             
+        Raises:
+            RateLimitError: If rate limit exceeded and retries exhausted.
+            GitHubModelsError: For other API errors.
+        """
+        response, connect, ttfb, grant = self._send_with_retry(url, payload, headers)
+        
+        started = time.perf_counter()
+        try:
+            try:
+                data = response.json()
+            except json.JSONDecodeError as exc:
+                raise GitHubModelsError(f"Invalid JSON response: {exc}") from exc
+        finally:
+            response.close()
+            self.metrics.record(
+                RequestTiming(connect=connect, ttfb=ttfb, transfer=time.perf_counter() - started)
+            )
+        
+        completion = self._parse_response(data)
+        if grant is not None and completion.usage is not None:
+            grant.settle(completion.usage.total_tokens)
+        return completion
+
+    def _send_with_retry(
+        self,
+        url: str,
+        payload: dict[str, Any],
+        headers: dict[str, str],
+    ) -> tuple[requests.Response, float, float, QuotaGrant | None]:
+        """Send a request, retrying on rate limits, and return once headers arrive.
+        
+        The body is left unread so callers can either load it whole or stream
+        it. Returns the response, the connect and time-to-first-byte
+        durations (seconds) of the successful attempt, and the quota grant
+        to settle once token usage is known (``None`` without a broker).
+        
         Raises:
             RateLimitError: If rate limit exceeded and retries exhausted.
             GitHubModelsError: For other API errors.
@@ -227,21 +569,29 @@ class GitHubModelsClient:
         backoff = self.initial_backoff
         
         for attempt in range(self.max_retries + 1):
+            grant = self._acquire_quota(payload)
             try:
-                response = requests.post(
+                _reset_connect_timer()
+                started = time.perf_counter()
+                response = self.session.post(
                     url,
                     json=payload,
                     headers=headers,
                     timeout=self.timeout,
+                    stream=True,
                 )
-                response.raise_for_status()
-                
+                elapsed = time.perf_counter() - started
+                connect = min(_read_connect_timer(), elapsed)
                 try:
-                    data = response.json()
-                except json.JSONDecodeError as exc:
-                    raise GitHubModelsError(f"Invalid JSON response: {exc}") from exc
+                    response.raise_for_status()
+                except requests.RequestException:
+                    # Read the (small) error body before closing the stream so
+                    # error messages and Retry-After parsing can still use it
+                    response.content
+                    response.close()
+                    raise
                 
-                return self._parse_response(data)
+                return response, connect, elapsed - connect, grant
                 
             except requests.RequestException as exc:
                 # Check if this is a rate limit error
@@ -249,6 +599,9 @@ class GitHubModelsClient:
                     if exc.response.status_code == 429:
                         retry_after = self._parse_retry_after(exc.response)
                         wait_time = retry_after if retry_after else backoff
+                        if self.quota_broker is not None:
+                            # Hold every process off this model, not just this one
+                            self.quota_broker.report_rate_limited(payload["model"], wait_time)
                         
                         # Cap wait time at max_backoff
                         wait_time = min(wait_time, self.max_backoff)
@@ -275,6 +628,13 @@ class GitHubModelsClient:
                 
                 # Non-rate-limit error - don't retry
                 error_msg = self._build_error_message(exc)
+                if (
+                    "response_format" in payload
+                    and getattr(exc, "response", None) is not None
+                    and exc.response.status_code in (400, 422)
+                    and ("response_format" in error_msg or "json_schema" in error_msg)
+                ):
+                    raise ResponseFormatUnsupportedError(error_msg) from exc
                 raise GitHubModelsError(error_msg) from exc
         
         # Should not reach here, but handle edge case
@@ -282,6 +642,16 @@ class GitHubModelsClient:
             raise GitHubModelsError(f"Request failed after retries: {last_exception}") from last_exception
         raise GitHubModelsError("Request failed unexpectedly")
 
+    def _acquire_quota(self, payload: Mapping[str, Any]) -> QuotaGrant | None:
+        """Block until the quota broker admits this request, if one is configured."""
+        if self.quota_broker is None:
+            return None
+        return self.quota_broker.acquire(
+            payload["model"],
+            estimate_tokens(payload["messages"], payload["max_tokens"]),
+            priority=self.priority,
+        )
+
     def _parse_retry_after(self, response: requests.Response) -> float | None:
         """Parse Retry-After header from response.
         
@@ -334,51 +704,230 @@ class GitHubModelsClient:
         
         for choice_data in data.get("choices", []):
             message_data = choice_data.get("message", {})
-            
-            # Parse tool calls if present
-            tool_calls = None
-            if "tool_calls" in message_data and message_data["tool_calls"]:
-                parsed_calls = []
-                for tc in message_data["tool_calls"]:
-                    parsed_calls.append(
-                        ToolCall(
-                            id=tc["id"],
-                            type=tc["type"],
-                            function=FunctionCall(
-                                name=tc["function"]["name"],
-                                arguments=tc["function"]["arguments"],
-                            ),
-                        )
-                    )
-                tool_calls = tuple(parsed_calls)
-            
-            message = ChatMessage(
-                role=message_data.get("role", "assistant"),
-                content=message_data.get("content") or "",
-                tool_calls=tool_calls,
-                tool_call_id=message_data.get("tool_call_id"),
-                name=message_data.get("name"),
-            )
-            
             choices.append(
                 Choice(
                     index=choice_data.get("index", 0),
-                    message=message,
+                    message=_parse_message(message_data),
                     finish_reason=choice_data.get("finish_reason"),
                 )
             )
         
-        usage = None
-        if "usage" in data:
-            usage = Usage(
-                prompt_tokens=data["usage"].get("prompt_tokens", 0),
-                completion_tokens=data["usage"].get("completion_tokens", 0),
-                total_tokens=data["usage"].get("total_tokens", 0),
-            )
-        
         return ChatCompletionResponse(
             id=data.get("id", ""),
             model=data.get("model", ""),
             choices=tuple(choices),
-            usage=usage,
+            usage=_parse_usage(data.get("usage")),
+        )
+
+
+def _parse_message(message_data: Mapping[str, Any]) -> ChatMessage:
+    """Build a ChatMessage from a (complete or accumulated) message mapping."""
+    # Parse tool calls if present
+    tool_calls = None
+    if "tool_calls" in message_data and message_data["tool_calls"]:
+        parsed_calls = []
+        for tc in message_data["tool_calls"]:
+            parsed_calls.append(
+                ToolCall(
+                    id=tc["id"],
+                    type=tc["type"],
+                    function=FunctionCall(
+                        name=tc["function"]["name"],
+                        arguments=tc["function"]["arguments"],
+                    ),
+                )
+            )
+        tool_calls = tuple(parsed_calls)
+    
+    return ChatMessage(
+        role=message_data.get("role", "assistant"),
+        content=message_data.get("content") or "",
+        tool_calls=tool_calls,
+        tool_call_id=message_data.get("tool_call_id"),
+        name=message_data.get("name"),
+    )
+
+
+def _record_token_usage(model: str, usage: Usage) -> None:
+    LLM_TOKENS.inc(usage.prompt_tokens, model=model, kind="prompt")
+    LLM_TOKENS.inc(usage.completion_tokens, model=model, kind="completion")
+
+
+def _parse_usage(usage_data: Mapping[str, Any] | None) -> Usage | None:
+    if not usage_data:
+        return None
+    return Usage(
+        prompt_tokens=usage_data.get("prompt_tokens", 0),
+        completion_tokens=usage_data.get("completion_tokens", 0),
+        total_tokens=usage_data.get("total_tokens", 0),
+    )
+
+
+class _CompletionAccumulator:
+    """Incrementally parses ``stream=True`` chunks into a ChatCompletionResponse.
+    
+    Each chunk is folded into per-choice buffers as it arrives, so the
+    response assembled by :meth:`build` reflects whatever has been read so
+    far - including when the caller stopped reading early.
+    """
+
+    def __init__(self) -> None:
+        self.id = ""
+        self.model = ""
+        self.usage: Usage | None = None
+        self._messages: dict[int, dict[str, Any]] = {}
+        self._finish_reasons: dict[int, str | None] = {}
+
+    def feed(self, chunk: Mapping[str, Any]) -> list[ChatCompletionDelta]:
+        """Fold one decoded chunk in and return its content deltas."""
+        self.id = chunk.get("id") or self.id
+        self.model = chunk.get("model") or self.model
+        if chunk.get("usage"):
+            self.usage = _parse_usage(chunk["usage"])
+        
+        deltas = []
+        for choice_data in chunk.get("choices") or []:
+            index = choice_data.get("index", 0)
+            delta = choice_data.get("delta") or {}
+            message = self._messages.setdefault(
+                index, {"role": "assistant", "content": "", "tool_calls": []}
+            )
+            if delta.get("role"):
+                message["role"] = delta["role"]
+            content = delta.get("content") or ""
+            message["content"] += content
+            for fragment in delta.get("tool_calls") or []:
+                self._merge_tool_call(message["tool_calls"], fragment)
+            
+            finish_reason = choice_data.get("finish_reason")
+            if finish_reason:
+                self._finish_reasons[index] = finish_reason
+            if content or finish_reason:
+                deltas.append(
+                    ChatCompletionDelta(index=index, content=content, finish_reason=finish_reason)
+                )
+        return deltas
+
+    def content(self, index: int = 0) -> str:
+        return self._messages.get(index, {}).get("content", "")
+
+    def build(self, *, finish_reason: str | None = None) -> ChatCompletionResponse:
+        """Assemble the response; ``finish_reason`` overrides unfinished choices."""
+        choices = []
+        for index in sorted(self._messages):
+            message = dict(self._messages[index])
+            message["tool_calls"] = [tc for tc in message["tool_calls"] if tc.get("id")]
+            choices.append(
+                Choice(
+                    index=index,
+                    message=_parse_message(message),
+                    finish_reason=self._finish_reasons.get(index) or finish_reason,
+                )
+            )
+        return ChatCompletionResponse(
+            id=self.id,
+            model=self.model,
+            choices=tuple(choices),
+            usage=self.usage,
         )
+
+    @staticmethod
+    def _merge_tool_call(tool_calls: list[dict[str, Any]], fragment: Mapping[str, Any]) -> None:
+        position = fragment.get("index", len(tool_calls))
+        while len(tool_calls) <= position:
+            tool_calls.append({"id": "", "type": "function", "function": {"name": "", "arguments": ""}})
+        target = tool_calls[position]
+        if fragment.get("id"):
+            target["id"] = fragment["id"]
+        if fragment.get("type"):
+            target["type"] = fragment["type"]
+        function = fragment.get("function") or {}
+        target["function"]["name"] += function.get("name") or ""
+        target["function"]["arguments"] += function.get("arguments") or ""
+
+
+class ChatCompletionStream:
+    """Iterator over the deltas of a streamed chat completion.
+    
+    Iterating yields :class:`ChatCompletionDelta` objects while the body is
+    still arriving. Callers may stop early (``close()`` or ``max_chars``) and
+    still call :meth:`response` to get what has been received so far; the
+    connection is released either way.
+    """
+
+    LENGTH_BUDGET_FINISH_REASON = "length_budget"
+
+    def __init__(
+        self,
+        response: requests.Response,
+        *,
+        max_chars: int | None = None,
+        on_close: Callable[[float], None] | None = None,
+    ) -> None:
+        self._response = response
+        self._max_chars = max_chars
+        self._on_close = on_close
+        self._accumulator = _CompletionAccumulator()
+        self._lines = response.iter_lines(decode_unicode=True)
+        self._started = time.perf_counter()
+        self._closed = False
+        self.truncated = False
+
+    @property
+    def text(self) -> str:
+        """Content received so far for the first choice."""
+        return self._accumulator.content(0)
+
+    @property
+    def usage(self) -> Usage | None:
+        """Token usage, once the final chunk has arrived."""
+        return self._accumulator.usage
+
+    def __iter__(self) -> Iterator[ChatCompletionDelta]:
+        try:
+            for line in self._lines:
+                if self._closed:
+                    break
+                if not line or not line.startswith("data:"):
+                    continue
+                data = line[len("data:"):].strip()
+                if data == "[DONE]":
+                    break
+                try:
+                    chunk = json.loads(data)
+                except json.JSONDecodeError as exc:
+                    raise GitHubModelsError(f"Invalid JSON in stream: {exc}") from exc
+                
+                yield from self._accumulator.feed(chunk)
+                
+                if self._max_chars is not None and len(self.text) >= self._max_chars:
+                    self.truncated = True
+                    break
+        except requests.RequestException as exc:
+            raise GitHubModelsError(f"GitHub Models API stream failed: {exc}") from exc
+        finally:
+            self.close()
+
+    def response(self) -> ChatCompletionResponse:
+        """Read any remaining deltas and return the assembled response."""
+        if not self._closed:
+            for _ in self:
+                pass
+        return self._accumulator.build(
+            finish_reason=self.LENGTH_BUDGET_FINISH_REASON if self.truncated else None
+        )
+
+    def close(self) -> None:
+        """Stop reading and release the connection."""
+        if self._closed:
+            return
+        self._closed = True
+        self._response.close()
+        if self._on_close is not None:
+            self._on_close(time.perf_counter() - self._started)
+
+    def __enter__(self) -> "ChatCompletionStream":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
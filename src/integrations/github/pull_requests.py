@@ -6,6 +6,7 @@ import json
 from typing import Any, Mapping
 from urllib import error, request
 
+from . import transport as github_transport
 from .issues import API_VERSION, DEFAULT_API_URL, GitHubIssueError, normalize_repository
 
 
@@ -41,7 +42,7 @@ def fetch_pull_request(
     req.add_header("X-GitHub-Api-Version", API_VERSION)
 
     try:
-        with request.urlopen(req, timeout=30) as response:
+        with github_transport.urlopen(req, timeout=30) as response:
             data = json.loads(response.read().decode("utf-8"))
             return data
     except error.HTTPError as exc:
@@ -82,7 +83,7 @@ def fetch_pull_request_files(
     req.add_header("X-GitHub-Api-Version", API_VERSION)
 
     try:
-        with request.urlopen(req, timeout=30) as response:
+        with github_transport.urlopen(req, timeout=30) as response:
             data = json.loads(response.read().decode("utf-8"))
             return data
     except error.HTTPError as exc:
@@ -187,7 +188,7 @@ def create_pr_review(
     req.add_header("Content-Type", "application/json; charset=utf-8")
 
     try:
-        with request.urlopen(req, timeout=30) as response:
+        with github_transport.urlopen(req, timeout=30) as response:
             data = json.loads(response.read().decode("utf-8"))
             return str(data.get("html_url", data.get("url", "")))
     except error.HTTPError as exc:
@@ -250,7 +251,7 @@ def merge_pull_request(
     req.add_header("Content-Type", "application/json; charset=utf-8")
 
     try:
-        with request.urlopen(req, timeout=30) as response:
+        with github_transport.urlopen(req, timeout=30) as response:
             data = json.loads(response.read().decode("utf-8"))
             return data
     except error.HTTPError as exc:
@@ -310,7 +311,7 @@ def create_pull_request(
     req.add_header("Content-Type", "application/json; charset=utf-8")
 
     try:
-        with request.urlopen(req, timeout=30) as response:
+        with github_transport.urlopen(req, timeout=30) as response:
             data = json.loads(response.read().decode("utf-8"))
             return data
     except error.HTTPError as exc:
@@ -386,7 +387,7 @@ def enable_pull_request_auto_merge(
     req.add_header("Content-Type", "application/json")
 
     try:
-        with request.urlopen(req, timeout=30) as response:
+        with github_transport.urlopen(req, timeout=30) as response:
             result = json.loads(response.read().decode())
 
             if "errors" in result:
@@ -0,0 +1,442 @@
+"""Cross-process LLM request quota broker.
+
+Extraction, synthesis, curation and agent jobs running on the same runner
+share one GitHub Models rate limit. Left alone, each ``GitHubModelsClient``
+discovers the limit independently, gets a 429, and backs off in lockstep
+with every other job. The broker coordinates them through a SQLite ledger
+that every process opens; ``BEGIN IMMEDIATE`` transactions serialize
+decisions across processes without a daemon.
+
+Each request:
+
+1. Registers as a waiter with a priority class (``interactive`` agent steps,
+   ``normal`` synthesis/curation work, ``bulk`` extraction)
+2. Waits until it is at the head of the queue - highest priority first, then
+   the process with the fewest grants in the current window (fair sharing),
+   then arrival order
+3. Is granted once the model's rolling one-minute RPM and TPM budgets have
+   room. Bulk requests may not use the headroom reserved for interactive work.
+
+After the response arrives the grant is settled with the real token count,
+and a 429 puts the whole model into a shared cooldown so other processes stop
+sending too.
+
+Enable it by pointing ``LLM_QUOTA_DB`` at a shared path; budgets come from
+``config/llm_quota.yaml`` when present.
+"""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Mapping
+
+import yaml
+
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+WINDOW_SECONDS = 60.0
+
+PRIORITY_CLASSES: dict[str, int] = {
+    "interactive": 0,
+    "normal": 1,
+    "bulk": 2,
+}
+DEFAULT_PRIORITY = "normal"
+
+# Share of each budget that bulk requests may not consume
+DEFAULT_INTERACTIVE_RESERVE = 0.2
+
+# Waiters that stop polling for this long are assumed dead
+WAITER_STALE_SECONDS = 30.0
+
+DEFAULT_POLL_INTERVAL = 0.25
+DEFAULT_CONFIG_PATH = Path("config/llm_quota.yaml")
+QUOTA_DB_ENV = "LLM_QUOTA_DB"
+
+
+class QuotaError(RuntimeError):
+    """Raised when a quota request cannot be granted."""
+
+
+@dataclass(frozen=True)
+class ModelBudget:
+    """Requests and tokens allowed per rolling minute for one model."""
+
+    rpm: int
+    tpm: int
+
+
+DEFAULT_BUDGETS: dict[str, ModelBudget] = {
+    "gpt-4o": ModelBudget(rpm=10, tpm=60000),
+    "openai/gpt-4o": ModelBudget(rpm=10, tpm=60000),
+    "gpt-4o-mini": ModelBudget(rpm=15, tpm=150000),
+    "openai/gpt-4o-mini": ModelBudget(rpm=15, tpm=150000),
+}
+FALLBACK_BUDGET = ModelBudget(rpm=10, tpm=60000)
+
+
+@dataclass(frozen=True)
+class ModelUtilization:
+    """Snapshot of one model's usage in the current window."""
+
+    model: str
+    budget: ModelBudget
+    requests: int
+    tokens: int
+    waiting: dict[str, int]
+    processes: int
+    cooldown_seconds: float
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "model": self.model,
+            "rpm_used": self.requests,
+            "rpm_limit": self.budget.rpm,
+            "tpm_used": self.tokens,
+            "tpm_limit": self.budget.tpm,
+            "waiting": dict(self.waiting),
+            "processes": self.processes,
+            "cooldown_seconds": round(self.cooldown_seconds, 1),
+        }
+
+
+class QuotaGrant:
+    """Permission for one request; settle it with the actual token usage."""
+
+    def __init__(self, broker: "QuotaBroker", grant_id: int, model: str, tokens: int) -> None:
+        self._broker = broker
+        self.id = grant_id
+        self.model = model
+        self.tokens = tokens
+
+    def settle(self, actual_tokens: int | None) -> None:
+        """Replace the estimate with the real token count from the response."""
+        if actual_tokens is None or actual_tokens == self.tokens:
+            return
+        self._broker._settle(self.id, actual_tokens)
+        self.tokens = actual_tokens
+
+
+# =============================================================================
+# Broker
+# =============================================================================
+
+
+class QuotaBroker:
+    """File-locked SQLite ledger shared by every process on a runner."""
+
+    def __init__(
+        self,
+        db_path: Path | str,
+        *,
+        budgets: Mapping[str, ModelBudget] | None = None,
+        interactive_reserve: float = DEFAULT_INTERACTIVE_RESERVE,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        process_id: str | None = None,
+    ) -> None:
+        self.db_path = Path(db_path)
+        self.budgets = dict(DEFAULT_BUDGETS)
+        self.budgets.update(budgets or {})
+        self.interactive_reserve = interactive_reserve
+        self.poll_interval = poll_interval
+        self.process_id = process_id or f"{os.uname().nodename}:{os.getpid()}"
+        self._local = threading.local()
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._initialize_schema()
+
+    @classmethod
+    def from_environment(cls, config_path: Path = DEFAULT_CONFIG_PATH) -> "QuotaBroker | None":
+        """Create a broker when ``LLM_QUOTA_DB`` is set, otherwise ``None``."""
+        db_path = os.environ.get(QUOTA_DB_ENV)
+        if not db_path:
+            return None
+        return cls(db_path, budgets=load_budgets(config_path))
+
+    def budget_for(self, model: str) -> ModelBudget:
+        return self.budgets.get(model, FALLBACK_BUDGET)
+
+    # -- public API -------------------------------------------------------
+
+    def acquire(
+        self,
+        model: str,
+        tokens: int,
+        *,
+        priority: str = DEFAULT_PRIORITY,
+        timeout: float | None = None,
+    ) -> QuotaGrant:
+        """Block until ``model`` has room for one request of ``tokens`` tokens.
+
+        Raises:
+            QuotaError: If ``timeout`` elapses first or the request can never fit.
+        """
+        if priority not in PRIORITY_CLASSES:
+            raise ValueError(f"Unknown priority class: {priority}")
+        budget = self.budget_for(model)
+        tokens = min(max(int(tokens), 1), budget.tpm)
+        rank = PRIORITY_CLASSES[priority]
+        deadline = None if timeout is None else time.time() + timeout
+
+        now = time.time()
+        with self._transaction() as conn:
+            waiter_id = conn.execute(
+                "INSERT INTO waiters (model, process_id, priority, tokens, enqueued_at, heartbeat) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (model, self.process_id, rank, tokens, now, now),
+            ).lastrowid
+
+        try:
+            while True:
+                wait = self._try_grant(waiter_id, model, tokens, rank, budget)
+                if isinstance(wait, QuotaGrant):
+                    return wait
+                if deadline is not None and time.time() + wait > deadline:
+                    raise QuotaError(f"Timed out waiting for {model} quota")
+                time.sleep(wait)
+        except BaseException:
+            with self._transaction() as conn:
+                conn.execute("DELETE FROM waiters WHERE id = ?", (waiter_id,))
+            raise
+
+    def report_rate_limited(self, model: str, retry_after: float | None) -> None:
+        """Put ``model`` into a shared cooldown after a 429."""
+        until = time.time() + (retry_after if retry_after else WINDOW_SECONDS)
+        with self._transaction() as conn:
+            conn.execute(
+                "INSERT INTO cooldowns (model, until) VALUES (?, ?) "
+                "ON CONFLICT(model) DO UPDATE SET until = MAX(until, excluded.until)",
+                (model, until),
+            )
+
+    def status(self) -> list[ModelUtilization]:
+        """Current window utilization for every model with activity."""
+        now = time.time()
+        with self._transaction() as conn:
+            self._purge(conn, now)
+            models = {
+                row[0]
+                for row in conn.execute(
+                    "SELECT model FROM grants UNION SELECT model FROM waiters "
+                    "UNION SELECT model FROM cooldowns WHERE until > ?",
+                    (now,),
+                )
+            }
+            snapshots = []
+            for model in sorted(models):
+                requests, tokens = self._window_usage(conn, model, now)
+                waiting = {name: 0 for name in PRIORITY_CLASSES}
+                for rank, count in conn.execute(
+                    "SELECT priority, COUNT(*) FROM waiters WHERE model = ? GROUP BY priority",
+                    (model,),
+                ):
+                    waiting[_priority_name(rank)] = count
+                processes = conn.execute(
+                    "SELECT COUNT(DISTINCT process_id) FROM ("
+                    "SELECT process_id FROM grants WHERE model = ? "
+                    "UNION SELECT process_id FROM waiters WHERE model = ?)",
+                    (model, model),
+                ).fetchone()[0]
+                snapshots.append(
+                    ModelUtilization(
+                        model=model,
+                        budget=self.budget_for(model),
+                        requests=requests,
+                        tokens=tokens,
+                        waiting=waiting,
+                        processes=processes,
+                        cooldown_seconds=max(0.0, self._cooldown_until(conn, model) - now),
+                    )
+                )
+        return snapshots
+
+    # -- internals --------------------------------------------------------
+
+    def _try_grant(
+        self,
+        waiter_id: int,
+        model: str,
+        tokens: int,
+        rank: int,
+        budget: ModelBudget,
+    ) -> QuotaGrant | float:
+        """Grant if this waiter is at the head and fits; else seconds to wait."""
+        now = time.time()
+        with self._transaction() as conn:
+            self._purge(conn, now)
+            conn.execute("UPDATE waiters SET heartbeat = ? WHERE id = ?", (now, waiter_id))
+
+            cooldown = self._cooldown_until(conn, model) - now
+            if cooldown > 0:
+                return min(cooldown, max(self.poll_interval, 1.0))
+
+            head = conn.execute(
+                """
+                SELECT w.id FROM waiters w
+                LEFT JOIN (
+                    SELECT process_id, COUNT(*) AS recent FROM grants
+                    WHERE model = ? GROUP BY process_id
+                ) g ON g.process_id = w.process_id
+                WHERE w.model = ?
+                ORDER BY w.priority, COALESCE(g.recent, 0), w.enqueued_at, w.id
+                LIMIT 1
+                """,
+                (model, model),
+            ).fetchone()
+            if head is None or head[0] != waiter_id:
+                return self.poll_interval
+
+            requests, used_tokens = self._window_usage(conn, model, now)
+            rpm_limit, tpm_limit = budget.rpm, budget.tpm
+            if rank >= PRIORITY_CLASSES["bulk"]:
+                rpm_limit = max(1, int(rpm_limit * (1 - self.interactive_reserve)))
+                tpm_limit = max(tokens, int(tpm_limit * (1 - self.interactive_reserve)))
+
+            if requests + 1 > rpm_limit or used_tokens + tokens > tpm_limit:
+                oldest = conn.execute(
+                    "SELECT MIN(granted_at) FROM grants WHERE model = ?", (model,)
+                ).fetchone()[0]
+                if oldest is None:
+                    return self.poll_interval
+                return max(self.poll_interval, oldest + WINDOW_SECONDS - now)
+
+            grant_id = conn.execute(
+                "INSERT INTO grants (model, process_id, priority, tokens, granted_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (model, self.process_id, rank, tokens, now),
+            ).lastrowid
+            conn.execute("DELETE FROM waiters WHERE id = ?", (waiter_id,))
+            return QuotaGrant(self, grant_id, model, tokens)
+
+    def _settle(self, grant_id: int, tokens: int) -> None:
+        with self._transaction() as conn:
+            conn.execute("UPDATE grants SET tokens = ? WHERE id = ?", (tokens, grant_id))
+
+    @staticmethod
+    def _window_usage(conn: sqlite3.Connection, model: str, now: float) -> tuple[int, int]:
+        row = conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(tokens), 0) FROM grants "
+            "WHERE model = ? AND granted_at > ?",
+            (model, now - WINDOW_SECONDS),
+        ).fetchone()
+        return int(row[0]), int(row[1])
+
+    @staticmethod
+    def _cooldown_until(conn: sqlite3.Connection, model: str) -> float:
+        row = conn.execute("SELECT until FROM cooldowns WHERE model = ?", (model,)).fetchone()
+        return float(row[0]) if row else 0.0
+
+    @staticmethod
+    def _purge(conn: sqlite3.Connection, now: float) -> None:
+        conn.execute("DELETE FROM grants WHERE granted_at <= ?", (now - WINDOW_SECONDS,))
+        conn.execute("DELETE FROM waiters WHERE heartbeat <= ?", (now - WAITER_STALE_SECONDS,))
+        conn.execute("DELETE FROM cooldowns WHERE until <= ?", (now,))
+
+    def _connection(self) -> sqlite3.Connection:
+        # One connection per thread; sqlite3 connections are not shareable
+        conn = getattr(self._local, "connection", None)
+        if conn is None:
+            conn = sqlite3.connect(str(self.db_path), timeout=30.0, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.connection = conn
+        return conn
+
+    def _transaction(self) -> "_ImmediateTransaction":
+        return _ImmediateTransaction(self._connection())
+
+    def _initialize_schema(self) -> None:
+        with self._transaction() as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS grants (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    model TEXT NOT NULL,
+                    process_id TEXT NOT NULL,
+                    priority INTEGER NOT NULL,
+                    tokens INTEGER NOT NULL,
+                    granted_at REAL NOT NULL
+                )
+                """
+            )
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS waiters (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    model TEXT NOT NULL,
+                    process_id TEXT NOT NULL,
+                    priority INTEGER NOT NULL,
+                    tokens INTEGER NOT NULL,
+                    enqueued_at REAL NOT NULL,
+                    heartbeat REAL NOT NULL
+                )
+                """
+            )
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS cooldowns (
+                    model TEXT PRIMARY KEY,
+                    until REAL NOT NULL
+                )
+                """
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_grants_model ON grants(model, granted_at)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_waiters_model ON waiters(model, priority)")
+
+
+class _ImmediateTransaction:
+    """``BEGIN IMMEDIATE`` ... ``COMMIT``: takes the database write lock up front."""
+
+    def __init__(self, conn: sqlite3.Connection) -> None:
+        self._conn = conn
+
+    def __enter__(self) -> sqlite3.Connection:
+        self._conn.execute("BEGIN IMMEDIATE")
+        return self._conn
+
+    def __exit__(self, exc_type: Any, *_: Any) -> None:
+        self._conn.execute("ROLLBACK" if exc_type else "COMMIT")
+
+
+def _priority_name(rank: int) -> str:
+    for name, value in PRIORITY_CLASSES.items():
+        if value == rank:
+            return name
+    return str(rank)
+
+
+def load_budgets(path: Path = DEFAULT_CONFIG_PATH) -> dict[str, ModelBudget]:
+    """Load per-model budgets from YAML (``models: {name: {rpm, tpm}}``)."""
+    if not path.exists():
+        return {}
+    payload = yaml.safe_load(path.read_text(encoding="utf-8")) or {}
+    budgets = {}
+    for model, values in (payload.get("models") or {}).items():
+        budgets[str(model)] = ModelBudget(rpm=int(values["rpm"]), tpm=int(values["tpm"]))
+    return budgets
+
+
+_default_broker: QuotaBroker | None = None
+_default_broker_lock = threading.Lock()
+
+
+def get_default_broker() -> QuotaBroker | None:
+    """Process-wide broker from the environment, created on first use."""
+    global _default_broker
+    if not os.environ.get(QUOTA_DB_ENV):
+        return None
+    with _default_broker_lock:
+        if _default_broker is None or str(_default_broker.db_path) != os.environ[QUOTA_DB_ENV]:
+            _default_broker = QuotaBroker.from_environment()
+        return _default_broker
+
+
+def estimate_tokens(messages: Any, max_tokens: int) -> int:
+    """Rough request size: ~4 characters per prompt token plus the completion cap."""
+    return len(str(messages)) // 4 + max_tokens
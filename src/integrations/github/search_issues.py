@@ -7,6 +7,7 @@ from dataclasses import dataclass
 from typing import Mapping, Sequence
 from urllib import error, parse, request
 
+from . import transport as github_transport
 from .issues import API_VERSION, DEFAULT_API_URL, GitHubIssueError, normalize_repository
 
 
@@ -182,7 +183,7 @@ class GitHubIssueSearcher:
         req.add_header("X-GitHub-Api-Version", API_VERSION)
 
         try:
-            with request.urlopen(req) as response:  # type: ignore[no-any-unimported]
+            with github_transport.urlopen(req) as response:  # type: ignore[no-any-unimported]
                 body = response.read().decode("utf-8")
         except error.HTTPError as exc:
             error_text = exc.read().decode("utf-8", errors="replace")
@@ -0,0 +1,964 @@
+"""Offline stand-in for the GitHub REST and GraphQL APIs.
+
+The GitHub-facing code paths (``GitHubStorageClient``, ``files``,
+``discussions``, ``search_issues``, ``issue_index`` and ``sync``) cannot be
+measured against github.com without spending real rate limit and writing to
+a real repository. :class:`GitHubStandIn` is a threaded local HTTP server
+that implements the subset of the API those modules call, backed by an
+in-memory git object store, so they can run unmodified against
+``api_url=standin.api_url``.
+
+Supported endpoints (all scoped to one ``owner/repo``):
+
+- ``GET /repos/{owner}/{repo}``
+- Git data: refs, commits, trees and blobs (``/git/...``)
+- Contents: ``GET``/``PUT /contents/{path}``
+- Issues: list, create, get, update, comments and labels
+- ``POST /pulls`` and ``GET /search/issues``
+- ``POST /graphql``: repository id, discussion categories, discussion
+  listing/lookup/comments and the ``createDiscussion``,
+  ``updateDiscussion`` and ``addDiscussionComment`` mutations (aliased or not)
+
+GraphQL documents are matched against the shapes ``discussions`` sends
+rather than parsed in general.
+
+:class:`FaultProfile` injects latency, primary rate limits (per resource, with
+the same ``X-RateLimit-*`` headers GitHub sends) and secondary rate limits on
+write requests. Every request is counted per endpoint template, so a caller
+can measure how many API calls and commits an operation costs.
+"""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import json
+import math
+import re
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Mapping
+from urllib.parse import parse_qs, unquote, urlparse
+
+from .transport import endpoint_template
+
+DEFAULT_REPOSITORY = "octo/standin"
+DEFAULT_BRANCH = "main"
+DEFAULT_CATEGORIES = ("People", "Organizations", "Concepts")
+
+_Response = tuple[int, Any, dict[str, str]]
+
+
+class StandInError(Exception):
+    """An API error response: HTTP status plus GitHub-style message."""
+
+    def __init__(self, status: int, message: str, headers: Mapping[str, str] | None = None) -> None:
+        super().__init__(message)
+        self.status = status
+        self.message = message
+        self.headers = dict(headers or {})
+
+
+# =============================================================================
+# Fault Injection
+# =============================================================================
+
+
+@dataclass
+class FaultProfile:
+    """Latency and rate limits applied to every request.
+
+    Attributes:
+        latency: Seconds added before each response.
+        rate_limit: Requests allowed per ``rate_limit_window`` for each
+            resource (``core``, ``search``, ``graphql``); ``None`` is unlimited.
+        rate_limit_window: Length of the primary rate-limit window in seconds.
+        secondary_limit_every: Reject every Nth write request (POST, PUT,
+            PATCH, DELETE and GraphQL mutations) with a secondary rate limit.
+        secondary_retry_after: ``Retry-After`` seconds sent with a secondary limit.
+    """
+
+    latency: float = 0.0
+    rate_limit: int | None = None
+    rate_limit_window: float = 3600.0
+    secondary_limit_every: int | None = None
+    secondary_retry_after: int = 1
+
+
+# =============================================================================
+# Git Object Store
+# =============================================================================
+
+
+def _git_sha(kind: str, payload: bytes) -> str:
+    return hashlib.sha1(f"{kind} {len(payload)}\0".encode() + payload).hexdigest()
+
+
+class GitObjectStore:
+    """Content-addressed blobs, flat trees, commits and branch refs.
+
+    Trees map full paths to blob SHAs, so ``base_tree`` updates and recursive
+    listings need no directory objects.
+    """
+
+    def __init__(self) -> None:
+        self.blobs: dict[str, bytes] = {}
+        self.trees: dict[str, dict[str, str]] = {}
+        self.commits: dict[str, dict[str, Any]] = {}
+        self.refs: dict[str, str] = {}
+
+    def put_blob(self, content: bytes) -> str:
+        sha = _git_sha("blob", content)
+        self.blobs[sha] = content
+        return sha
+
+    def put_tree(self, entries: Mapping[str, str]) -> str:
+        entries = dict(sorted(entries.items()))
+        sha = _git_sha("tree", json.dumps(entries).encode())
+        self.trees[sha] = entries
+        return sha
+
+    def put_commit(self, tree: str, parents: list[str], message: str) -> str:
+        if tree not in self.trees:
+            raise StandInError(422, f"Tree SHA does not exist: {tree}")
+        for parent in parents:
+            if parent not in self.commits:
+                raise StandInError(422, f"Parent SHA does not exist: {parent}")
+        stamp = _timestamp()
+        payload = json.dumps([tree, parents, message, stamp, len(self.commits)]).encode()
+        sha = _git_sha("commit", payload)
+        self.commits[sha] = {"tree": tree, "parents": parents, "message": message, "date": stamp}
+        return sha
+
+    def is_ancestor(self, ancestor: str, descendant: str) -> bool:
+        pending = [descendant]
+        seen: set[str] = set()
+        while pending:
+            sha = pending.pop()
+            if sha == ancestor:
+                return True
+            if sha in seen or sha not in self.commits:
+                continue
+            seen.add(sha)
+            pending.extend(self.commits[sha]["parents"])
+        return False
+
+    def resolve(self, ref: str) -> str | None:
+        """Return the commit SHA for a branch name or commit SHA."""
+        if ref in self.refs:
+            return self.refs[ref]
+        return ref if ref in self.commits else None
+
+    def tree_for(self, ref: str) -> dict[str, str]:
+        commit = self.resolve(ref)
+        return self.trees[self.commits[commit]["tree"]] if commit else {}
+
+    def commit_files(self, branch: str, files: Mapping[str, bytes | None], message: str) -> str:
+        """Commit ``files`` (``None`` deletes) on top of ``branch`` and advance it."""
+        parent = self.refs.get(branch)
+        entries = dict(self.tree_for(branch))
+        for path, content in files.items():
+            if content is None:
+                entries.pop(path, None)
+            else:
+                entries[path] = self.put_blob(content)
+        sha = self.put_commit(self.put_tree(entries), [parent] if parent else [], message)
+        self.refs[branch] = sha
+        return sha
+
+
+# =============================================================================
+# Server State
+# =============================================================================
+
+
+def _timestamp() -> str:
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+class StandInState:
+    """One repository's git data, issues, discussions and variables."""
+
+    def __init__(self, repository: str = DEFAULT_REPOSITORY, default_branch: str = DEFAULT_BRANCH) -> None:
+        self.repository = repository
+        self.default_branch = default_branch
+        self.node_id = "R_" + hashlib.sha1(repository.encode()).hexdigest()[:12]
+        self.git = GitObjectStore()
+        self.git.commit_files(default_branch, {"README.md": b"# Stand-in\n"}, "Initial commit")
+        self.issues: dict[int, dict[str, Any]] = {}
+        self.comments: dict[int, list[dict[str, Any]]] = {}
+        self.categories: list[dict[str, Any]] = [
+            {"id": f"DIC_{self.node_id[2:8]}_{index}", "name": name, "slug": name.lower(),
+             "description": "", "emoji": "", "isAnswerable": False}
+            for index, name in enumerate(DEFAULT_CATEGORIES)
+        ]
+        self.discussions: dict[str, dict[str, Any]] = {}
+        self.discussion_comments: dict[str, list[dict[str, Any]]] = {}
+        self.variables: dict[str, str] = {}
+        self._next_number = 1
+
+    @property
+    def html_url(self) -> str:
+        return f"https://github.com/{self.repository}"
+
+    def next_number(self) -> int:
+        number = self._next_number
+        self._next_number += 1
+        return number
+
+    def seed_files(self, files: Mapping[str, str | bytes], message: str = "Seed files") -> str:
+        """Commit ``files`` to the default branch without counting a request."""
+        encoded = {path: content.encode("utf-8") if isinstance(content, str) else content
+                   for path, content in files.items()}
+        return self.git.commit_files(self.default_branch, encoded, message)
+
+    # -- Issues ---------------------------------------------------------------
+
+    def create_issue(self, payload: Mapping[str, Any], *, pull_request: bool = False) -> dict[str, Any]:
+        number = self.next_number()
+        now = _timestamp()
+        kind = "pull" if pull_request else "issues"
+        issue = {
+            "number": number,
+            "title": str(payload.get("title", "")),
+            "body": payload.get("body"),
+            "state": "open",
+            "labels": [{"name": str(name)} for name in payload.get("labels") or []],
+            "assignee": None,
+            "assignees": [],
+            "url": f"https://api.github.com/repos/{self.repository}/issues/{number}",
+            "html_url": f"{self.html_url}/{kind}/{number}",
+            "created_at": now,
+            "updated_at": now,
+        }
+        if pull_request:
+            issue["pull_request"] = {"url": issue["url"].replace("/issues/", "/pulls/")}
+        self.issues[number] = issue
+        self.comments[number] = []
+        return issue
+
+    def issue(self, number: int) -> dict[str, Any]:
+        if number not in self.issues:
+            raise StandInError(404, "Not Found")
+        return self.issues[number]
+
+    # -- Discussions ----------------------------------------------------------
+
+    def create_discussion(self, data: Mapping[str, Any]) -> dict[str, Any]:
+        category = next((c for c in self.categories if c["id"] == data.get("categoryId")), None)
+        if category is None:
+            raise _node_error(data.get("categoryId"))
+        number = self.next_number()
+        now = _timestamp()
+        discussion = {
+            "id": f"D_{self.node_id[2:8]}_{number}",
+            "number": number,
+            "title": str(data.get("title", "")),
+            "body": str(data.get("body", "")),
+            "url": f"{self.html_url}/discussions/{number}",
+            "createdAt": now,
+            "updatedAt": now,
+            "category": {"id": category["id"], "name": category["name"]},
+            "author": {"login": "standin-bot"},
+        }
+        self.discussions[discussion["id"]] = discussion
+        self.discussion_comments[discussion["id"]] = []
+        return discussion
+
+
+# =============================================================================
+# REST Routes
+# =============================================================================
+
+
+class _Router:
+    """Dispatch ``(method, path)`` to handlers registered with regexes."""
+
+    def __init__(self) -> None:
+        self._routes: list[tuple[str, re.Pattern[str], Callable[..., Any]]] = []
+
+    def add(self, method: str, pattern: str, handler: Callable[..., Any]) -> None:
+        self._routes.append((method, re.compile(f"^{pattern}$"), handler))
+
+    def match(self, method: str, path: str) -> tuple[Callable[..., Any], dict[str, str]] | None:
+        for route_method, pattern, handler in self._routes:
+            if route_method == method:
+                match = pattern.match(path)
+                if match:
+                    return handler, match.groupdict()
+        return None
+
+
+class _RestAPI:
+    """REST handlers; each takes ``(state, query, body, **path_params)``."""
+
+    def __init__(self) -> None:
+        repo = r"/repos/(?P<owner>[^/]+)/(?P<repo>[^/]+)"
+        self.router = _Router()
+        add = self.router.add
+        add("GET", repo, self.get_repository)
+        add("GET", repo + r"/git/refs?/heads/(?P<branch>.+)", self.get_ref)
+        add("POST", repo + r"/git/refs", self.create_ref)
+        add("PATCH", repo + r"/git/refs/heads/(?P<branch>.+)", self.update_ref)
+        add("GET", repo + r"/git/commits/(?P<sha>\w+)", self.get_commit)
+        add("POST", repo + r"/git/commits", self.create_commit)
+        add("GET", repo + r"/git/trees/(?P<sha>\w+)", self.get_tree)
+        add("POST", repo + r"/git/trees", self.create_tree)
+        add("GET", repo + r"/git/blobs/(?P<sha>\w+)", self.get_blob)
+        add("POST", repo + r"/git/blobs", self.create_blob)
+        add("GET", repo + r"/contents/(?P<path>.+)", self.get_contents)
+        add("PUT", repo + r"/contents/(?P<path>.+)", self.put_contents)
+        add("GET", repo + r"/issues", self.list_issues)
+        add("POST", repo + r"/issues", self.create_issue)
+        add("GET", repo + r"/issues/(?P<number>\d+)", self.get_issue)
+        add("PATCH", repo + r"/issues/(?P<number>\d+)", self.update_issue)
+        add("GET", repo + r"/issues/(?P<number>\d+)/comments", self.list_comments)
+        add("POST", repo + r"/issues/(?P<number>\d+)/comments", self.create_comment)
+        add("POST", repo + r"/issues/(?P<number>\d+)/labels", self.add_labels)
+        add("POST", repo + r"/pulls", self.create_pull)
+        add("GET", repo + r"/actions/variables/(?P<name>[^/]+)", self.get_variable)
+        add("PATCH", repo + r"/actions/variables/(?P<name>[^/]+)", self.update_variable)
+        add("POST", repo + r"/actions/variables", self.create_variable)
+        add("GET", r"/search/issues", self.search_issues)
+
+    # -- Repository and git data ----------------------------------------------
+
+    def get_repository(self, state: StandInState, query: dict, body: Any) -> dict[str, Any]:
+        owner, name = state.repository.split("/")
+        return {
+            "id": 1,
+            "node_id": state.node_id,
+            "name": name,
+            "full_name": state.repository,
+            "owner": {"login": owner},
+            "default_branch": state.default_branch,
+            "html_url": state.html_url,
+            "private": False,
+        }
+
+    @staticmethod
+    def _ref(branch: str, sha: str) -> dict[str, Any]:
+        return {"ref": f"refs/heads/{branch}", "object": {"sha": sha, "type": "commit"}}
+
+    def get_ref(self, state: StandInState, query: dict, body: Any, branch: str) -> dict[str, Any]:
+        if branch not in state.git.refs:
+            raise StandInError(404, "Not Found")
+        return self._ref(branch, state.git.refs[branch])
+
+    def create_ref(self, state: StandInState, query: dict, body: Any) -> _Response:
+        ref = str(body.get("ref", ""))
+        if not ref.startswith("refs/heads/"):
+            raise StandInError(422, "Reference name must start with refs/heads/")
+        branch = ref[len("refs/heads/"):]
+        if branch in state.git.refs:
+            raise StandInError(422, "Reference already exists")
+        if body.get("sha") not in state.git.commits:
+            raise StandInError(422, "Object does not exist")
+        state.git.refs[branch] = body["sha"]
+        return 201, self._ref(branch, body["sha"]), {}
+
+    def update_ref(self, state: StandInState, query: dict, body: Any, branch: str) -> dict[str, Any]:
+        current = state.git.refs.get(branch)
+        if current is None:
+            raise StandInError(422, "Reference does not exist")
+        sha = body.get("sha")
+        if sha not in state.git.commits:
+            raise StandInError(422, "Object does not exist")
+        if not body.get("force") and not state.git.is_ancestor(current, sha):
+            raise StandInError(422, "Update is not a fast forward")
+        state.git.refs[branch] = sha
+        return self._ref(branch, sha)
+
+    @staticmethod
+    def _commit(state: StandInState, sha: str) -> dict[str, Any]:
+        commit = state.git.commits[sha]
+        return {
+            "sha": sha,
+            "message": commit["message"],
+            "tree": {"sha": commit["tree"]},
+            "parents": [{"sha": parent} for parent in commit["parents"]],
+            "author": {"name": "standin", "date": commit["date"]},
+        }
+
+    def get_commit(self, state: StandInState, query: dict, body: Any, sha: str) -> dict[str, Any]:
+        if sha not in state.git.commits:
+            raise StandInError(404, "Not Found")
+        return self._commit(state, sha)
+
+    def create_commit(self, state: StandInState, query: dict, body: Any) -> _Response:
+        sha = state.git.put_commit(str(body.get("tree")), list(body.get("parents") or []), str(body.get("message", "")))
+        return 201, self._commit(state, sha), {}
+
+    def get_tree(self, state: StandInState, query: dict, body: Any, sha: str) -> dict[str, Any]:
+        if sha not in state.git.trees:
+            raise StandInError(404, "Not Found")
+        entries = [
+            {"path": path, "mode": "100644", "type": "blob", "sha": blob, "size": len(state.git.blobs[blob])}
+            for path, blob in state.git.trees[sha].items()
+        ]
+        return {"sha": sha, "tree": entries, "truncated": False}
+
+    def create_tree(self, state: StandInState, query: dict, body: Any) -> _Response:
+        base = body.get("base_tree")
+        if base and base not in state.git.trees:
+            raise StandInError(422, f"Invalid base_tree: {base}")
+        entries = dict(state.git.trees[base]) if base else {}
+        for entry in body.get("tree") or []:
+            path = str(entry.get("path", "")).strip("/")
+            if "content" in entry:
+                entries[path] = state.git.put_blob(str(entry["content"]).encode("utf-8"))
+            elif entry.get("sha") is None:
+                entries.pop(path, None)
+            elif entry["sha"] in state.git.blobs:
+                entries[path] = entry["sha"]
+            else:
+                raise StandInError(422, f"Invalid sha for {path}: {entry['sha']}")
+        sha = state.git.put_tree(entries)
+        return 201, self.get_tree(state, query, None, sha), {}
+
+    def get_blob(self, state: StandInState, query: dict, body: Any, sha: str) -> dict[str, Any]:
+        if sha not in state.git.blobs:
+            raise StandInError(404, "Not Found")
+        content = state.git.blobs[sha]
+        return {"sha": sha, "size": len(content), "encoding": "base64",
+                "content": base64.b64encode(content).decode("ascii")}
+
+    def create_blob(self, state: StandInState, query: dict, body: Any) -> _Response:
+        content = str(body.get("content", ""))
+        if body.get("encoding") == "base64":
+            data = base64.b64decode(content)
+        else:
+            data = content.encode("utf-8")
+        return 201, {"sha": state.git.put_blob(data)}, {}
+
+    # -- Contents ---------------------------------------------------------------
+
+    def get_contents(self, state: StandInState, query: dict, body: Any, path: str) -> dict[str, Any]:
+        path = unquote(path)
+        ref = _first(query, "ref") or state.default_branch
+        blob = state.git.tree_for(ref).get(path)
+        if blob is None:
+            raise StandInError(404, "Not Found")
+        content = state.git.blobs[blob]
+        return {
+            "type": "file",
+            "name": path.rsplit("/", 1)[-1],
+            "path": path,
+            "sha": blob,
+            "size": len(content),
+            "encoding": "base64",
+            "content": base64.encodebytes(content).decode("ascii"),
+        }
+
+    def put_contents(self, state: StandInState, query: dict, body: Any, path: str) -> _Response:
+        path = unquote(path)
+        branch = str(body.get("branch") or state.default_branch)
+        if branch not in state.git.refs:
+            raise StandInError(404, f"Branch {branch} not found")
+        existing = state.git.tree_for(branch).get(path)
+        if existing and body.get("sha") != existing:
+            raise StandInError(409, f"{path} does not match {body.get('sha')}")
+        content = base64.b64decode(str(body.get("content", "")))
+        sha = state.git.commit_files(branch, {path: content}, str(body.get("message", "")))
+        status = 200 if existing else 201
+        return status, {
+            "content": {"path": path, "sha": state.git.tree_for(branch)[path]},
+            "commit": self._commit(state, sha),
+        }, {}
+
+    # -- Issues -----------------------------------------------------------------
+
+    def list_issues(self, state: StandInState, query: dict, body: Any) -> list[dict[str, Any]]:
+        issues = list(state.issues.values())
+        wanted_state = _first(query, "state") or "open"
+        if wanted_state != "all":
+            issues = [issue for issue in issues if issue["state"] == wanted_state]
+        labels = _first(query, "labels")
+        if labels:
+            wanted = set(labels.split(","))
+            issues = [i for i in issues if wanted <= {label["name"] for label in i["labels"]}]
+        since = _first(query, "since")
+        if since:
+            issues = [issue for issue in issues if issue["updated_at"] >= since]
+        key = "updated_at" if _first(query, "sort") == "updated" else "created_at"
+        issues.sort(key=lambda issue: (issue[key], issue["number"]),
+                    reverse=_first(query, "direction") != "asc")
+        return _paginate(issues, query)
+
+    def create_issue(self, state: StandInState, query: dict, body: Any) -> _Response:
+        if not body.get("title"):
+            raise StandInError(422, "Validation Failed: title is missing")
+        return 201, state.create_issue(body), {}
+
+    def get_issue(self, state: StandInState, query: dict, body: Any, number: str) -> dict[str, Any]:
+        return state.issue(int(number))
+
+    def update_issue(self, state: StandInState, query: dict, body: Any, number: str) -> dict[str, Any]:
+        issue = state.issue(int(number))
+        for key in ("title", "body", "state"):
+            if key in body:
+                issue[key] = body[key]
+        if "labels" in body:
+            issue["labels"] = [{"name": str(name)} for name in body["labels"]]
+        issue["updated_at"] = _timestamp()
+        return issue
+
+    def list_comments(self, state: StandInState, query: dict, body: Any, number: str) -> list[dict[str, Any]]:
+        state.issue(int(number))
+        return _paginate(state.comments[int(number)], query)
+
+    def create_comment(self, state: StandInState, query: dict, body: Any, number: str) -> _Response:
+        issue = state.issue(int(number))
+        comments = state.comments[int(number)]
+        comment = {
+            "id": len(comments) + 1,
+            "body": str(body.get("body", "")),
+            "user": {"login": "standin-bot"},
+            "created_at": _timestamp(),
+            "html_url": f"{issue['html_url']}#issuecomment-{len(comments) + 1}",
+        }
+        comments.append(comment)
+        issue["updated_at"] = comment["created_at"]
+        return 201, comment, {}
+
+    def add_labels(self, state: StandInState, query: dict, body: Any, number: str) -> list[dict[str, Any]]:
+        issue = state.issue(int(number))
+        names = body.get("labels", []) if isinstance(body, Mapping) else body
+        for name in names:
+            if all(label["name"] != name for label in issue["labels"]):
+                issue["labels"].append({"name": str(name)})
+        issue["updated_at"] = _timestamp()
+        return issue["labels"]
+
+    def create_pull(self, state: StandInState, query: dict, body: Any) -> _Response:
+        head = str(body.get("head", "")).split(":")[-1]
+        if head not in state.git.refs:
+            raise StandInError(422, f"Validation Failed: head {head} does not exist")
+        pull = state.create_issue(body, pull_request=True)
+        return 201, dict(pull, head={"ref": head}, base={"ref": body.get("base")}), {}
+
+    # -- Actions variables ------------------------------------------------------
+
+    def get_variable(self, state: StandInState, query: dict, body: Any, name: str) -> dict[str, Any]:
+        if name not in state.variables:
+            raise StandInError(404, "Not Found")
+        return {"name": name, "value": state.variables[name]}
+
+    def update_variable(self, state: StandInState, query: dict, body: Any, name: str) -> _Response:
+        if name not in state.variables:
+            raise StandInError(404, "Not Found")
+        state.variables[name] = str(body.get("value", ""))
+        return 204, None, {}
+
+    def create_variable(self, state: StandInState, query: dict, body: Any) -> _Response:
+        name = str(body.get("name", ""))
+        if name in state.variables:
+            raise StandInError(409, "Already exists")
+        state.variables[name] = str(body.get("value", ""))
+        return 201, {}, {}
+
+    def search_issues(self, state: StandInState, query: dict, body: Any) -> dict[str, Any]:
+        issues = [issue for issue in state.issues.values() if _search_matches(issue, _first(query, "q") or "")]
+        issues.sort(key=lambda issue: issue["created_at"], reverse=True)
+        return {"total_count": len(issues), "incomplete_results": False, "items": _paginate(issues, query)}
+
+
+_SEARCH_TERM = re.compile(r'(\w+):"([^"]*)"|(\w+):(\S+)|"([^"]*)"|(\S+)')
+
+
+def _search_matches(issue: Mapping[str, Any], q: str) -> bool:
+    labels = {label["name"] for label in issue["labels"]}
+    for quoted_key, quoted_value, key, value, phrase, word in _SEARCH_TERM.findall(q):
+        key, value = (quoted_key, quoted_value) if quoted_key else (key, value)
+        if key == "label" and value not in labels:
+            return False
+        if key == "is" and value in ("issue", "pr") and (value == "pr") != ("pull_request" in issue):
+            return False
+        if (key == "is" and value in ("open", "closed") or key == "state") and issue["state"] != value:
+            return False
+        if key == "no" and value == "assignee" and issue["assignee"]:
+            return False
+        if key == "assignee" and (issue["assignee"] or {}).get("login") != value:
+            return False
+        text = phrase or word
+        if text and text.lower() not in f"{issue['title']} {issue['body'] or ''}".lower():
+            return False
+    return True
+
+
+def _first(query: Mapping[str, list[str]], key: str) -> str | None:
+    values = query.get(key)
+    return values[0] if values else None
+
+
+def _paginate(items: list[Any], query: Mapping[str, list[str]]) -> list[Any]:
+    per_page = min(int(_first(query, "per_page") or 30), 100)
+    page = max(int(_first(query, "page") or 1), 1)
+    return items[(page - 1) * per_page:page * per_page]
+
+
+# =============================================================================
+# GraphQL
+# =============================================================================
+
+
+_MUTATION_FIELD = re.compile(
+    r"(?:(\w+)\s*:\s*)?(createDiscussion|updateDiscussion|addDiscussionComment)"
+    r"\s*\(\s*input\s*:\s*(\$\w+|\{[^}]*\})\s*\)"
+)
+_INLINE_ARGUMENT = re.compile(r"(\w+)\s*:\s*\$(\w+)")
+
+
+def _graphql(
+    repositories: Mapping[str, StandInState], document: str, variables: Mapping[str, Any]
+) -> dict[str, Any]:
+    """Execute one of the document shapes ``discussions`` sends."""
+    if document.lstrip().startswith("mutation"):
+        return _graphql_mutation(repositories, document, variables)
+
+    if "repository(" not in document:
+        return {"errors": [{"message": "Only repository queries are supported by the stand-in."}]}
+    state = repositories.get(f"{variables.get('owner')}/{variables.get('name')}")
+    if state is None:
+        return {
+            "data": {"repository": None},
+            "errors": [{"type": "NOT_FOUND", "path": ["repository"],
+                        "message": "Could not resolve to a Repository."}],
+        }
+
+    if "discussionCategories" in document:
+        first = int(variables.get("first", 25))
+        repository: dict[str, Any] = {"discussionCategories": {"nodes": state.categories[:first]}}
+    elif "discussion(number" in document:
+        found = next(
+            (d for d in state.discussions.values() if d["number"] == variables.get("number")), None
+        )
+        node = dict(found) if found else None
+        if node is not None and "comments(" in document:
+            comments = state.discussion_comments[node["id"]][: int(variables.get("first", 100))]
+            node["comments"] = {"nodes": comments}
+        repository = {"discussion": node}
+    elif "discussions(" in document:
+        discussions = sorted(
+            state.discussions.values(), key=lambda d: (d["updatedAt"], d["number"]), reverse=True
+        )
+        if variables.get("categoryId"):
+            discussions = [d for d in discussions if d["category"]["id"] == variables["categoryId"]]
+        offset = int(variables["after"]) if variables.get("after") else 0
+        first = int(variables.get("first", 100))
+        page = discussions[offset:offset + first]
+        has_next = offset + first < len(discussions)
+        repository = {"discussions": {
+            "nodes": page,
+            "pageInfo": {"hasNextPage": has_next, "endCursor": str(offset + first) if has_next else None},
+        }}
+    else:
+        repository = {"id": state.node_id}
+    return {"data": {"repository": repository}}
+
+
+def _graphql_mutation(
+    repositories: Mapping[str, StandInState], document: str, variables: Mapping[str, Any]
+) -> dict[str, Any]:
+    data: dict[str, Any] = {}
+    errors: list[dict[str, Any]] = []
+    for alias, field_name, argument in _MUTATION_FIELD.findall(document):
+        key = alias or field_name
+        if argument.startswith("$"):
+            payload = dict(variables.get(argument[1:]) or {})
+        else:
+            payload = {name: variables.get(var) for name, var in _INLINE_ARGUMENT.findall(argument)}
+        try:
+            data[key] = _run_mutation(repositories, field_name, payload)
+        except StandInError as exc:
+            data[key] = None
+            errors.append({"type": "NOT_FOUND", "path": [key], "message": exc.message})
+    if not data:
+        return {"errors": [{"message": "No supported mutation found in document."}]}
+    response: dict[str, Any] = {"data": data}
+    if errors:
+        response["errors"] = errors
+    return response
+
+
+def _node_error(node_id: Any) -> StandInError:
+    return StandInError(404, f"Could not resolve to a node with the global id of '{node_id}'")
+
+
+def _run_mutation(
+    repositories: Mapping[str, StandInState], field_name: str, payload: Mapping[str, Any]
+) -> dict[str, Any]:
+    if field_name == "createDiscussion":
+        state = next((s for s in repositories.values() if s.node_id == payload.get("repositoryId")), None)
+        if state is None:
+            raise _node_error(payload.get("repositoryId"))
+        return {"discussion": state.create_discussion(payload)}
+
+    discussion_id = payload.get("discussionId")
+    state = next((s for s in repositories.values() if discussion_id in s.discussions), None)
+    if state is None:
+        raise _node_error(discussion_id)
+    discussion = state.discussions[discussion_id]
+    if field_name == "updateDiscussion":
+        for key in ("title", "body"):
+            if payload.get(key) is not None:
+                discussion[key] = payload[key]
+        discussion["updatedAt"] = _timestamp()
+        return {"discussion": discussion}
+    comments = state.discussion_comments[discussion_id]
+    comment = {
+        "id": f"DC_{discussion_id[2:]}_{len(comments) + 1}",
+        "body": str(payload.get("body", "")),
+        "url": f"{discussion['url']}#discussioncomment-{len(comments) + 1}",
+        "createdAt": _timestamp(),
+        "author": {"login": "standin-bot"},
+    }
+    comments.append(comment)
+    return {"comment": comment}
+
+
+# =============================================================================
+# HTTP Server
+# =============================================================================
+
+
+_REST = _RestAPI()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True  # Headers and body go out as separate writes
+    server: "_Server"
+
+    def do_GET(self) -> None:  # noqa: N802 - http.server API
+        self._handle("GET")
+
+    def do_POST(self) -> None:  # noqa: N802 - http.server API
+        self._handle("POST")
+
+    def do_PUT(self) -> None:  # noqa: N802 - http.server API
+        self._handle("PUT")
+
+    def do_PATCH(self) -> None:  # noqa: N802 - http.server API
+        self._handle("PATCH")
+
+    def do_DELETE(self) -> None:  # noqa: N802 - http.server API
+        self._handle("DELETE")
+
+    def log_message(self, *args: Any) -> None:
+        pass
+
+    def _handle(self, method: str) -> None:
+        length = int(self.headers.get("Content-Length") or 0)
+        raw = self.rfile.read(length) if length else b""
+        status, payload, headers = self.server.standin.dispatch(
+            method, self.path, raw, self.headers.get("If-None-Match")
+        )
+        body = b"" if status in (204, 304) else json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    standin: "GitHubStandIn"
+
+
+class GitHubStandIn:
+    """Threaded local server standing in for ``api.github.com``.
+
+    ``repository`` is created up front; :meth:`add_repository` adds more (for
+    example an upstream template for ``sync``). Rate-limit windows follow
+    ``clock`` (epoch seconds), so a caller can skip ahead instead of sleeping.
+
+    Example:
+        with GitHubStandIn(faults=FaultProfile(latency=0.05)) as github:
+            commit_files_batch(token="t", repository=github.repository,
+                               files=[("a.txt", "a")], message="m",
+                               branch="main", api_url=github.api_url)
+            print(github.stats())
+    """
+
+    def __init__(
+        self,
+        *,
+        repository: str = DEFAULT_REPOSITORY,
+        faults: FaultProfile | None = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.repository = repository
+        self.faults = faults or FaultProfile()
+        self._clock = clock
+        self.repositories: dict[str, StandInState] = {}
+        self.state = self.add_repository(repository)
+        self.requests: Counter[str] = Counter()
+        self.commits = 0
+        self.rate_limited = 0
+        self._writes = 0
+        self._windows: dict[str, tuple[float, int]] = {}
+        self._lock = threading.RLock()
+        self._server = _Server((host, port), _Handler)
+        self._server.standin = self
+        self._thread: threading.Thread | None = None
+
+    @property
+    def api_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def add_repository(self, repository: str, default_branch: str = DEFAULT_BRANCH) -> StandInState:
+        state = StandInState(repository, default_branch)
+        self.repositories[repository] = state
+        return state
+
+    # -- Lifecycle --------------------------------------------------------------
+
+    def start(self) -> "GitHubStandIn":
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._server.server_close()
+
+    def __enter__(self) -> "GitHubStandIn":
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+    # -- Accounting -------------------------------------------------------------
+
+    def stats(self) -> dict[str, Any]:
+        """Requests (total and per endpoint), commits and rate-limited responses."""
+        with self._lock:
+            return {
+                "requests": sum(self.requests.values()),
+                "commits": self.commits,
+                "rate_limited": self.rate_limited,
+                "endpoints": dict(self.requests),
+            }
+
+    def reset_stats(self) -> None:
+        """Zero the counters and rate-limit windows."""
+        with self._lock:
+            self.requests.clear()
+            self.commits = 0
+            self.rate_limited = 0
+            self._writes = 0
+            self._windows.clear()
+
+    def _consume(self, resource: str, *, write: bool) -> dict[str, str]:
+        """Charge one request; raise :class:`StandInError` when over a limit."""
+        faults = self.faults
+        now = self._clock()
+        limit = faults.rate_limit if faults.rate_limit is not None else 5000
+        started, used = self._windows.get(resource, (now, 0))
+        if now - started >= faults.rate_limit_window:
+            started, used = now, 0
+        headers = {
+            "X-RateLimit-Limit": str(limit),
+            "X-RateLimit-Resource": resource,
+            "X-RateLimit-Reset": str(math.ceil(started + faults.rate_limit_window)),
+        }
+        if faults.rate_limit is not None and used >= limit:
+            self.rate_limited += 1
+            headers["X-RateLimit-Remaining"] = "0"
+            raise StandInError(403, "API rate limit exceeded", headers)
+        if write and faults.secondary_limit_every:
+            self._writes += 1
+            if self._writes % faults.secondary_limit_every == 0:
+                self.rate_limited += 1
+                headers["Retry-After"] = str(faults.secondary_retry_after)
+                raise StandInError(403, "You have exceeded a secondary rate limit.", headers)
+        used += 1
+        self._windows[resource] = (started, used)
+        headers["X-RateLimit-Remaining"] = str(max(limit - used, 0))
+        return headers
+
+    def _refund(self, resource: str) -> None:
+        # GitHub does not charge conditional requests answered with 304
+        if resource in self._windows:
+            started, used = self._windows[resource]
+            self._windows[resource] = (started, max(used - 1, 0))
+
+    # -- Dispatch ---------------------------------------------------------------
+
+    def dispatch(self, method: str, raw_path: str, raw_body: bytes, if_none_match: str | None) -> _Response:
+        """Handle one request and return ``(status, payload, headers)``."""
+        if self.faults.latency:
+            time.sleep(self.faults.latency)
+        parsed = urlparse(raw_path)
+        path = parsed.path
+        query = parse_qs(parsed.query)
+        is_graphql = path == "/graphql"
+        resource = "graphql" if is_graphql else "search" if path.startswith("/search/") else "core"
+        try:
+            body = json.loads(raw_body) if raw_body else {}
+        except ValueError:
+            return 400, {"message": "Problems parsing JSON"}, {}
+        if is_graphql:
+            write = str(body.get("query", "")).lstrip().startswith("mutation")
+        else:
+            write = method != "GET"
+        endpoint = endpoint_template(method, raw_path)
+
+        with self._lock:
+            self.requests[endpoint] += 1
+            try:
+                headers = self._consume(resource, write=write)
+            except StandInError as exc:
+                return exc.status, {"message": exc.message}, exc.headers
+            try:
+                status, payload, extra = self._route(method, path, query, body, is_graphql)
+            except StandInError as exc:
+                return exc.status, {"message": exc.message}, {**headers, **exc.headers}
+            if status < 300 and endpoint.endswith(("/git/commits", "/contents/{id}")) and write:
+                self.commits += 1
+            headers.update(extra)
+            if method == "GET" and status == 200:
+                digest = hashlib.sha1(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+                headers["ETag"] = f'"{digest}"'
+                if if_none_match == headers["ETag"]:
+                    self._refund(resource)
+                    return 304, None, headers
+        return status, payload, headers
+
+    def _route(self, method: str, path: str, query: dict, body: Any, is_graphql: bool) -> _Response:
+        if is_graphql and method == "POST":
+            return 200, _graphql(self.repositories, str(body.get("query", "")), body.get("variables") or {}), {}
+        match = _REST.router.match(method, path)
+        if match is None:
+            raise StandInError(404, "Not Found")
+        handler, params = match
+        owner, repo = params.pop("owner", None), params.pop("repo", None)
+        if owner is None:
+            # /search/issues scopes by its repo: qualifier
+            scoped = re.search(r"repo:(\S+)", _first(query, "q") or "")
+            state = self.repositories.get(scoped.group(1)) if scoped else self.state
+        else:
+            state = self.repositories.get(f"{owner}/{repo}")
+        if state is None:
+            raise StandInError(404, "Not Found")
+        result = handler(state, query, body, **params)
+        if isinstance(result, tuple):
+            return result
+        return 200, result, {}
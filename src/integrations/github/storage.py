@@ -18,20 +18,43 @@ Example:
             content=json.dumps(data, indent=2),
             message="Update source entry",
         )
+
+Write-behind:
+    Every storage class commits through ``GitHubStorageClient``. Inside
+    ``github_client.batch(message)`` (or with ``write_behind=True``) writes
+    are staged in a process-wide :class:`CommitBuffer` shared by all clients
+    for the same repository, coalesced by path, and committed with one
+    Trees-API commit per branch when the batch exits, the buffer grows past
+    its size limit, or it has waited ``max_delay`` seconds.
 """
 
 from __future__ import annotations
 
+import atexit
+import logging
 import os
+import threading
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import Any, ContextManager, Iterator
 
+from . import files as github_files
 from .files import commit_file
 from .issues import DEFAULT_API_URL
 from .sync import create_branch
 from .pull_requests import create_pull_request
 
 
+logger = logging.getLogger(__name__)
+
+# Write-behind defaults
+DEFAULT_BUFFER_MAX_FILES = 100
+DEFAULT_BUFFER_MAX_BYTES = 10 * 1024 * 1024
+DEFAULT_BUFFER_MAX_DELAY = 30.0
+WRITE_BEHIND_ENV = "GITHUB_STORAGE_WRITE_BEHIND"
+
+
 def is_github_actions() -> bool:
     """Check if currently running in GitHub Actions.
 
@@ -41,6 +64,254 @@ def is_github_actions() -> bool:
     return os.environ.get("GITHUB_ACTIONS") == "true"
 
 
+@dataclass
+class _PendingWrite:
+    content: str | bytes
+    message: str
+
+    @property
+    def size(self) -> int:
+        return len(self.content)
+
+
+class CommitBuffer:
+    """Process-wide write-behind buffer for one repository.
+
+    Writes are keyed by ``(branch, path)`` so repeated writes to a file keep
+    only the latest content. A flush commits each branch's pending files with
+    a single ``files.commit_files_batch`` call.
+
+    ``batch()`` scopes are per thread and atomic: size and time triggers wait
+    until the outermost scope exits, and an exception inside the scope
+    restores the buffer to how it was before the scope's writes.
+    """
+
+    def __init__(
+        self,
+        *,
+        token: str,
+        repository: str,
+        api_url: str,
+        max_files: int = DEFAULT_BUFFER_MAX_FILES,
+        max_bytes: int = DEFAULT_BUFFER_MAX_BYTES,
+        max_delay: float | None = DEFAULT_BUFFER_MAX_DELAY,
+    ) -> None:
+        self.token = token
+        self.repository = repository
+        self.api_url = api_url
+        self.max_files = max_files
+        self.max_bytes = max_bytes
+        self.max_delay = max_delay
+        self._pending: dict[tuple[str, str], _PendingWrite] = {}
+        self._lock = threading.RLock()
+        self._flush_lock = threading.Lock()
+        self._local = threading.local()
+        self._open_batches = 0
+        self._timer: threading.Timer | None = None
+        # Per-branch upload progress of a failed flush, so the retry resumes
+        self._progress: dict[str, github_files.BatchCommitProgress] = {}
+        self.commits = 0
+
+    # -- staging ----------------------------------------------------------
+
+    def stage(self, branch: str, path: str, content: str | bytes, message: str) -> None:
+        """Queue ``content`` for ``path`` on ``branch``, replacing earlier writes."""
+        key = (branch, path)
+        with self._lock:
+            undo = self._undo_log()
+            if undo is not None and key not in undo:
+                undo[key] = self._pending.get(key)
+            self._pending[key] = _PendingWrite(content, message)
+            if self._open_batches:
+                return
+            over_limit = self._over_limit()
+            if not over_limit:
+                self._schedule_timer()
+        if over_limit:
+            self.flush()
+
+    def pending(self, branch: str | None = None) -> dict[str, str | bytes]:
+        """Staged content by path, optionally for one branch."""
+        with self._lock:
+            return {
+                path: write.content
+                for (write_branch, path), write in self._pending.items()
+                if branch is None or write_branch == branch
+            }
+
+    def in_batch(self) -> bool:
+        return bool(getattr(self._local, "depth", 0))
+
+    @contextmanager
+    def batch(self, message: str | None = None) -> Iterator["CommitBuffer"]:
+        """Stage every write in this block and commit them together on exit."""
+        outermost = not self.in_batch()
+        if outermost:
+            self._local.undo = {}
+            self._local.message = message
+            with self._lock:
+                self._open_batches += 1
+        self._local.depth = getattr(self._local, "depth", 0) + 1
+        try:
+            yield self
+        except BaseException:
+            self._local.depth -= 1
+            if outermost:
+                self._rollback()
+            raise
+        else:
+            self._local.depth -= 1
+            if outermost:
+                message = self._local.message
+                self._local.undo = None
+                with self._lock:
+                    self._open_batches -= 1
+                    # Another thread's open batch must not be committed half-done;
+                    # the last batch to close flushes for everyone.
+                    last = self._open_batches == 0
+                if last:
+                    self.flush(message)
+
+    # -- flushing ---------------------------------------------------------
+
+    def flush(self, message: str | None = None) -> list[dict[str, Any]]:
+        """Commit everything pending, one commit per branch.
+
+        Files from a failed commit stay pending unless a newer write
+        replaced them meanwhile.
+
+        Raises:
+            GitHubIssueError: If a commit fails.
+        """
+        results = []
+        with self._flush_lock:
+            with self._lock:
+                pending, self._pending = self._pending, {}
+                self._cancel_timer()
+            by_branch: dict[str, dict[str, _PendingWrite]] = {}
+            for (branch, path), write in pending.items():
+                by_branch.setdefault(branch, {})[path] = write
+
+            remaining = list(by_branch.items())
+            try:
+                while remaining:
+                    branch, writes = remaining[0]
+                    results.append(
+                        github_files.commit_files_batch(
+                            token=self.token,
+                            repository=self.repository,
+                            files=[(path, write.content) for path, write in writes.items()],
+                            message=message or _combined_message(writes),
+                            branch=branch,
+                            api_url=self.api_url,
+                            progress=self._progress.setdefault(branch, github_files.BatchCommitProgress()),
+                        )
+                    )
+                    self._progress.pop(branch, None)
+                    self.commits += 1
+                    remaining.pop(0)
+            except Exception:
+                with self._lock:
+                    for branch, writes in remaining:
+                        for path, write in writes.items():
+                            self._pending.setdefault((branch, path), write)
+                raise
+        return results
+
+    def _flush_quietly(self) -> None:
+        try:
+            if self._pending:
+                self.flush()
+        except Exception:
+            logger.exception("Write-behind flush for %s failed", self.repository)
+
+    def _over_limit(self) -> bool:
+        return (
+            len(self._pending) >= self.max_files
+            or sum(write.size for write in self._pending.values()) >= self.max_bytes
+        )
+
+    def _undo_log(self) -> dict[tuple[str, str], _PendingWrite | None] | None:
+        return getattr(self._local, "undo", None) if self.in_batch() else None
+
+    def _rollback(self) -> None:
+        undo = self._local.undo or {}
+        self._local.undo = None
+        with self._lock:
+            for key, previous in undo.items():
+                if previous is None:
+                    self._pending.pop(key, None)
+                else:
+                    self._pending[key] = previous
+            self._open_batches -= 1
+            if not self._open_batches:
+                self._schedule_timer()
+        logger.warning("Discarded %d staged writes after an error", len(undo))
+
+    def _schedule_timer(self) -> None:
+        if self.max_delay is None or self._timer is not None or not self._pending:
+            return
+        self._timer = threading.Timer(self.max_delay, self._on_timer)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _on_timer(self) -> None:
+        with self._lock:
+            self._timer = None
+            if self._open_batches:
+                return  # The batch exit will flush
+        self._flush_quietly()
+
+    def _cancel_timer(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+
+def _combined_message(writes: dict[str, _PendingWrite]) -> str:
+    messages = list(dict.fromkeys(write.message for write in writes.values()))
+    if len(messages) == 1:
+        return messages[0]
+    body = "\n".join(f"- {message}" for message in messages[:20])
+    if len(messages) > 20:
+        body += f"\n- ... and {len(messages) - 20} more"
+    return f"Update {len(writes)} files\n\n{body}"
+
+
+_buffers: dict[tuple[str, str, str], CommitBuffer] = {}
+_buffers_lock = threading.Lock()
+
+
+def get_commit_buffer(token: str, repository: str, api_url: str = DEFAULT_API_URL) -> CommitBuffer:
+    """Return the process-wide buffer for ``repository``, creating it once."""
+    key = (api_url, repository, token)
+    with _buffers_lock:
+        buffer = _buffers.get(key)
+        if buffer is None:
+            buffer = CommitBuffer(token=token, repository=repository, api_url=api_url)
+            _buffers[key] = buffer
+        return buffer
+
+
+@atexit.register
+def flush_all_buffers() -> None:
+    """Commit anything still staged; runs at interpreter exit."""
+    with _buffers_lock:
+        buffers = list(_buffers.values())
+    for buffer in buffers:
+        buffer._flush_quietly()
+
+
+def write_batch(
+    github_client: "GitHubStorageClient | None",
+    message: str | None = None,
+) -> ContextManager[Any]:
+    """``github_client.batch(message)``, or a no-op when writing locally."""
+    if github_client is None:
+        return nullcontext()
+    return github_client.batch(message)
+
+
 class GitHubStorageClient:
     """Client for persisting files to a GitHub repository via the API.
 
@@ -52,6 +323,8 @@ class GitHubStorageClient:
         repository: Repository in "owner/repo" format.
         branch: Target branch for commits (default: "main").
         api_url: GitHub API base URL.
+        write_behind: Stage writes in the shared commit buffer even outside
+            ``batch()`` blocks.
     """
 
     def __init__(
@@ -61,6 +334,7 @@ class GitHubStorageClient:
         branch: str = "main",
         api_url: str = DEFAULT_API_URL,
         pr_branch_prefix: str = "content-acquisition",
+        write_behind: bool = False,
     ) -> None:
         """Initialize the GitHub storage client.
 
@@ -70,6 +344,7 @@ class GitHubStorageClient:
             branch: Target branch for commits.
             api_url: GitHub API base URL.
             pr_branch_prefix: Prefix for PR branch names (e.g., "content-acquisition-20251231").
+            write_behind: Buffer every write and commit on size/time triggers.
         """
         self.token = token
         self.repository = repository
@@ -78,6 +353,35 @@ class GitHubStorageClient:
         self.pr_branch_prefix = pr_branch_prefix
         self._pr_branch: str | None = None
         self._pr_number: int | None = None
+        self.write_behind = write_behind
+
+    @property
+    def buffer(self) -> CommitBuffer:
+        """The process-wide write-behind buffer for this repository."""
+        return get_commit_buffer(self.token, self.repository, self.api_url)
+
+    def batch(self, message: str | None = None) -> ContextManager[CommitBuffer]:
+        """Stage all writes in the block and commit them as one commit per branch.
+
+        Writes from any client for the same repository are included, and an
+        exception discards the block's writes instead of committing them.
+
+        Example:
+            with github_client.batch("Extract entities from abc123"):
+                kb_storage.save_extracted_people(checksum, people)
+                kb_storage.save_extracted_organizations(checksum, orgs)
+        """
+        return self.buffer.batch(message)
+
+    def flush(self) -> list[dict[str, Any]]:
+        """Commit any staged writes now."""
+        return self.buffer.flush()
+
+    def _buffering(self) -> bool:
+        return self.write_behind or self.buffer.in_batch()
+
+    def _staged_result(self, branch: str, paths: list[str]) -> dict[str, Any]:
+        return {"buffered": True, "branch": branch, "paths": paths}
 
     def commit_file(
         self,
@@ -103,6 +407,10 @@ class GitHubStorageClient:
         if path_str.startswith("/"):
             path_str = path_str[1:]
 
+        if self._buffering():
+            self.buffer.stage(self.branch, path_str, content, message)
+            return self._staged_result(self.branch, [path_str])
+
         return commit_file(
             token=self.token,
             repository=self.repository,
@@ -150,6 +458,11 @@ class GitHubStorageClient:
         if use_pr_branch:
             target_branch = self.ensure_pr_branch()
 
+        if self._buffering():
+            for path_str, content in normalized_files:
+                self.buffer.stage(target_branch, path_str, content, message)
+            return self._staged_result(target_branch, [path for path, _ in normalized_files])
+
         return commit_files_batch(
             token=self.token,
             repository=self.repository,
@@ -217,6 +530,10 @@ class GitHubStorageClient:
         if path_str.startswith("/"):
             path_str = path_str[1:]
 
+        if self._buffering():
+            self.buffer.stage(pr_branch, path_str, content, message)
+            return self._staged_result(pr_branch, [path_str])
+
         return commit_file(
             token=self.token,
             repository=self.repository,
@@ -303,6 +620,7 @@ class GitHubStorageClient:
             token=token,
             repository=repository,
             branch=branch,
+            write_behind=os.environ.get(WRITE_BEHIND_ENV, "").lower() in ("1", "true", "yes"),
         )
 
 
@@ -0,0 +1,370 @@
+"""Schema-validated JSON array output for GitHub Models completions.
+
+Extractors ask the model for a JSON array of items. This module:
+
+- builds a ``json_schema`` ``response_format`` so capable models are
+  constrained to the item schema (arrays are wrapped in ``{"items": [...]}``
+  because structured output requires an object at the root)
+- parses replies with a tolerant scanner that accepts code fences, leading
+  prose, trailing commas and truncated output, keeping every complete item
+- validates each item against the schema and re-asks the model only for the
+  items that failed (plus anything cut off by truncation)
+- counts failures, repairs and re-asks in :class:`StructuredOutputMetrics`
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import re
+import threading
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import Any, Mapping, Sequence
+
+from jsonschema import Draft7Validator
+
+from src.integrations.github.models import GitHubModelsClient, GitHubModelsError, RateLimitError
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_MAX_REASKS = 1
+
+_TRAILING_COMMA = re.compile(r",(\s*[}\]])")
+_FENCE = re.compile(r"^```[a-zA-Z]*\s*|\s*```$")
+
+
+@dataclass(frozen=True)
+class ResponseSchema:
+    """JSON schema for one item of an array-valued response.
+
+    Args:
+        name: Schema name sent to the API.
+        item_schema: JSON schema (draft 7) for a single item.
+        strict: Ask the API to enforce the schema exactly. Only valid when
+            every object in the schema lists all properties as required and
+            disallows additional properties.
+    """
+
+    name: str
+    item_schema: Mapping[str, Any]
+    strict: bool = False
+
+    def response_format(self) -> dict[str, Any]:
+        """The ``response_format`` payload for a chat completion request."""
+        return {
+            "type": "json_schema",
+            "json_schema": {
+                "name": self.name,
+                "strict": self.strict,
+                "schema": {
+                    "type": "object",
+                    "properties": {"items": {"type": "array", "items": dict(self.item_schema)}},
+                    "required": ["items"],
+                    "additionalProperties": False,
+                },
+            },
+        }
+
+    @cached_property
+    def _validator(self) -> Draft7Validator:
+        return Draft7Validator(dict(self.item_schema))
+
+    def errors(self, item: Any) -> list[str]:
+        """Validation errors for ``item``; empty when it is valid."""
+        return [
+            f"{'/'.join(str(part) for part in error.absolute_path) or '(item)'}: {error.message}"
+            for error in self._validator.iter_errors(item)
+        ]
+
+
+# =============================================================================
+# Tolerant parsing
+# =============================================================================
+
+
+@dataclass
+class ParsedItem:
+    """One element of the response array, parsed or not."""
+
+    raw: str
+    value: Any = None
+    error: str | None = None
+
+    @property
+    def parsed(self) -> bool:
+        return self.error is None
+
+
+@dataclass
+class ParsedArray:
+    """Result of parsing a (possibly malformed) JSON array reply."""
+
+    items: list[ParsedItem] = field(default_factory=list)
+    found: bool = False  # An array was located at all
+    truncated: bool = False  # The reply ended before the array closed
+    repaired: bool = False  # Fast path failed; the scanner was needed
+
+
+def parse_json_array(text: str) -> ParsedArray:
+    """Parse a JSON array, or an object wrapping one, from a model reply."""
+    content = _FENCE.sub("", text.strip()).strip()
+
+    # Fast path: well-formed output, which is what structured mode produces
+    try:
+        data = json.loads(content)
+    except json.JSONDecodeError:
+        data = None
+    else:
+        if isinstance(data, dict):
+            data = data.get("items", next((v for v in data.values() if isinstance(v, list)), None))
+        if isinstance(data, list):
+            return ParsedArray(
+                items=[ParsedItem(raw=json.dumps(value), value=value) for value in data],
+                found=True,
+            )
+
+    start = _array_start(content)
+    if start is None:
+        return ParsedArray(repaired=True)
+    return _scan_array(content, start)
+
+
+def _array_start(content: str) -> int | None:
+    items_key = content.find('"items"')
+    if content.startswith("{") and items_key != -1:
+        start = content.find("[", items_key)
+    else:
+        start = content.find("[")
+    return start if start != -1 else None
+
+
+def _scan_array(content: str, start: int) -> ParsedArray:
+    """Split the array at ``start`` into top-level elements in one pass."""
+    result = ParsedArray(found=True, repaired=True)
+    depth = 0
+    in_string = False
+    escaped = False
+    item_start = start + 1
+
+    for index in range(start + 1, len(content)):
+        char = content[index]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+            continue
+        if char == '"':
+            in_string = True
+        elif char in "[{":
+            depth += 1
+        elif char in "]}" and depth > 0:
+            depth -= 1
+        elif depth == 0 and char in ",]":
+            _append_item(result, content[item_start:index])
+            item_start = index + 1
+            if char == "]":
+                return result
+
+    result.truncated = True
+    tail = content[item_start:].strip()
+    if tail:
+        result.items.append(ParsedItem(raw=tail, error="truncated"))
+    return result
+
+
+def _append_item(result: ParsedArray, raw: str) -> None:
+    raw = raw.strip()
+    if not raw:
+        return  # Trailing comma or empty array
+    for candidate in (raw, _TRAILING_COMMA.sub(r"\1", raw)):
+        try:
+            result.items.append(ParsedItem(raw=raw, value=json.loads(candidate)))
+            return
+        except json.JSONDecodeError as exc:
+            error = str(exc)
+    result.items.append(ParsedItem(raw=raw, error=error))
+
+
+# =============================================================================
+# Metrics
+# =============================================================================
+
+
+class StructuredOutputMetrics:
+    """Thread-safe counters for structured extraction calls."""
+
+    FIELDS = (
+        "responses",
+        "constrained",
+        "parse_failures",
+        "repaired",
+        "truncated",
+        "invalid_items",
+        "reasks",
+        "recovered_items",
+        "dropped_items",
+    )
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._counts = {name: 0 for name in self.FIELDS}
+
+    def increment(self, name: str, amount: int = 1) -> None:
+        with self._lock:
+            self._counts[name] += amount
+
+    def __getitem__(self, name: str) -> int:
+        with self._lock:
+            return self._counts[name]
+
+    def summary(self) -> dict[str, int]:
+        with self._lock:
+            return dict(self._counts)
+
+
+# =============================================================================
+# Completion
+# =============================================================================
+
+
+@dataclass
+class StructuredResult:
+    """Valid items from a structured request plus what was given up on."""
+
+    items: list[Any] = field(default_factory=list)
+    rejected: list[ParsedItem] = field(default_factory=list)
+    found: bool = False
+    reasks: int = 0
+
+
+def complete_structured(
+    client: GitHubModelsClient,
+    messages: Sequence[Mapping[str, Any]],
+    schema: ResponseSchema,
+    *,
+    temperature: float,
+    max_tokens: int,
+    max_reasks: int = DEFAULT_MAX_REASKS,
+    metrics: StructuredOutputMetrics | None = None,
+) -> StructuredResult:
+    """Request an array of ``schema`` items, re-asking only for invalid ones.
+
+    Returns:
+        StructuredResult; ``found`` is False when no array could be read
+        from the first reply (including an empty ``choices`` list).
+
+    Raises:
+        RateLimitError: Propagated so batch callers can pause.
+        GitHubModelsError: If the first request fails.
+    """
+    metrics = metrics or StructuredOutputMetrics()
+    response_format = schema.response_format() if client.supports_response_format() else None
+    conversation = list(messages)
+    result = StructuredResult()
+
+    content = _request(client, conversation, response_format, temperature, max_tokens, metrics)
+    if content is None:
+        metrics.increment("parse_failures")
+        return result
+
+    pending = _collect(content, schema, result, metrics)
+    result.found = pending is not None
+    while pending is not None and (pending[0] or pending[1]) and result.reasks < max_reasks:
+        invalid, truncated = pending
+        result.reasks += 1
+        metrics.increment("reasks")
+        conversation += [
+            {"role": "assistant", "content": content},
+            {"role": "user", "content": _reask_prompt(invalid, truncated, len(result.items))},
+        ]
+        try:
+            content = _request(client, conversation, response_format, temperature, max_tokens, metrics)
+        except RateLimitError:
+            raise
+        except GitHubModelsError as exc:
+            logger.warning("Re-ask for %s items failed: %s", schema.name, exc)
+            content = None
+        if content is None:
+            break
+        before = len(result.items)
+        pending = _collect(content, schema, result, metrics)
+        metrics.increment("recovered_items", len(result.items) - before)
+        if pending is None:
+            # The correction was unreadable; keep the originally invalid items
+            pending = (invalid, False)
+            break
+
+    if pending is not None and pending[0]:
+        result.rejected = pending[0]
+        metrics.increment("dropped_items", len(pending[0]))
+    return result
+
+
+def _request(
+    client: GitHubModelsClient,
+    messages: Sequence[Mapping[str, Any]],
+    response_format: Mapping[str, Any] | None,
+    temperature: float,
+    max_tokens: int,
+    metrics: StructuredOutputMetrics,
+) -> str | None:
+    kwargs: dict[str, Any] = {"messages": messages, "temperature": temperature, "max_tokens": max_tokens}
+    if response_format is not None:
+        kwargs["response_format"] = response_format
+        metrics.increment("constrained")
+    response = client.chat_completion(**kwargs)
+    metrics.increment("responses")
+    if not response.choices:
+        return None
+    return response.choices[0].message.content or "[]"
+
+
+def _collect(
+    content: str,
+    schema: ResponseSchema,
+    result: StructuredResult,
+    metrics: StructuredOutputMetrics,
+) -> tuple[list[ParsedItem], bool] | None:
+    """Add valid items to ``result``; return (invalid items, truncated) or None if unreadable."""
+    parsed = parse_json_array(content)
+    if not parsed.found:
+        metrics.increment("parse_failures")
+        return None
+    if parsed.repaired:
+        metrics.increment("repaired")
+    if parsed.truncated:
+        metrics.increment("truncated")
+
+    invalid = []
+    for item in parsed.items:
+        if item.parsed:
+            errors = schema.errors(item.value)
+            if not errors:
+                result.items.append(item.value)
+                continue
+            item.error = "; ".join(errors)
+        invalid.append(item)
+    metrics.increment("invalid_items", len(invalid))
+    return invalid, parsed.truncated
+
+
+def _reask_prompt(invalid: list[ParsedItem], truncated: bool, accepted: int) -> str:
+    lines = []
+    if invalid:
+        lines.append(
+            "These items from your answer do not match the required schema. "
+            "Return ONLY a JSON array with corrected versions of these items:"
+        )
+        for item in invalid:
+            lines.append(f"- {item.raw[:1000]}\n  problem: {item.error}")
+    if truncated:
+        lines.append(
+            f"Your answer was cut off after {accepted} complete items. "
+            "Also include the items that should have followed, without repeating earlier ones."
+        )
+    return "\n".join(lines)
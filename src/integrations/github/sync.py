@@ -10,10 +10,14 @@ import base64
 import hashlib
 import hmac
 import json
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from typing import Any
 from urllib import error, request
 
+from src.tracing import bind
+
+from . import transport as github_transport
 from .issues import API_VERSION, DEFAULT_API_URL, GitHubIssueError, normalize_repository
 from .pull_requests import fetch_pull_request_files
 
@@ -34,6 +38,9 @@ CODE_FILES = [
     "pytest.ini",
 ]
 
+# Concurrent blob downloads/uploads when committing a sync
+DEFAULT_SYNC_WORKERS = 8
+
 # Directories to never sync (research content)
 PROTECTED_DIRECTORIES = [
     "evidence/",
@@ -138,7 +145,7 @@ def _make_request(
         req.data = json.dumps(data).encode("utf-8")
     
     try:
-        with request.urlopen(req, timeout=timeout) as response:
+        with github_transport.urlopen(req, timeout=timeout) as response:
             return json.loads(response.read().decode("utf-8"))
     except error.HTTPError as exc:
         error_text = exc.read().decode("utf-8", errors="replace")
@@ -435,13 +442,39 @@ def get_file_content(
         req = request.Request(data["download_url"])
         if token:
             req.add_header("Authorization", f"Bearer {token}")
-        with request.urlopen(req, timeout=60) as response:
+        with github_transport.urlopen(req, timeout=60) as response:
             content = response.read()
             return base64.b64encode(content).decode("utf-8")
     
     return data.get("content", "").replace("\n", "")  # GitHub adds newlines
 
 
+def get_blob_content(
+    repository: str,
+    sha: str,
+    token: str | None = None,
+    api_url: str = DEFAULT_API_URL,
+) -> str:
+    """Get the base64-encoded content of a blob by its git SHA.
+    
+    Unlike :func:`get_file_content` this needs no path or ref and works for
+    files of any size up to the 100MB blob limit.
+    
+    Args:
+        repository: Repository in "owner/repo" format
+        sha: Git blob SHA (as listed by :func:`get_repository_tree`)
+        token: GitHub API token
+        api_url: GitHub API base URL
+        
+    Returns:
+        Base64-encoded blob content
+    """
+    owner, name = normalize_repository(repository)
+    endpoint = f"{api_url}/repos/{owner}/{name}/git/blobs/{sha}"
+    data = _make_request(endpoint, token, timeout=60)
+    return data.get("content", "").replace("\n", "")
+
+
 def compare_files(
     upstream_files: list[FileInfo],
     downstream_files: list[FileInfo],
@@ -548,7 +581,9 @@ def commit_files(
     """Commit file changes to a branch.
     
     Uses the Contents API to commit files one by one, which works with
-    standard PATs and doesn't require fine-grained permissions.
+    standard PATs and doesn't require fine-grained permissions. Each file
+    costs a download, a SHA lookup and its own commit; ``sync_from_upstream``
+    uses :func:`commit_files_tree` instead.
     
     Args:
         repository: Downstream repository in "owner/repo" format
@@ -649,6 +684,105 @@ def commit_files(
     return last_commit_sha or ""
 
 
+def commit_files_tree(
+    repository: str,
+    branch: str,
+    changes: list[SyncChange],
+    upstream_repo: str,
+    token: str,
+    upstream_token: str | None = None,
+    api_url: str = DEFAULT_API_URL,
+    verbose: bool = True,
+    max_workers: int = DEFAULT_SYNC_WORKERS,
+    message: str | None = None,
+) -> str:
+    """Apply all changes to a branch as a single commit via the Git Trees API.
+    
+    Upstream blobs are fetched by SHA and re-created downstream concurrently
+    (bounded by ``max_workers``); deletions become null tree entries. One
+    tree, one commit and one ref update follow, so an 80-file sync costs
+    about 2 x 80 parallel blob calls plus 5 sequential ones instead of 240
+    sequential calls and 80 commits.
+    
+    Args:
+        repository: Downstream repository in "owner/repo" format
+        branch: Branch to commit to
+        changes: List of file changes to apply (from :func:`compare_files`)
+        upstream_repo: Upstream repository to fetch blobs from
+        token: GitHub API token for downstream repo
+        upstream_token: GitHub API token for upstream repo (if private)
+        api_url: GitHub API base URL
+        verbose: If True, print progress messages
+        max_workers: Maximum concurrent blob transfers
+        message: Commit message (defaults to a summary of the changes)
+        
+    Returns:
+        SHA of the new commit, or "" if there was nothing to commit
+    """
+    if not changes:
+        return ""
+    
+    owner, name = normalize_repository(repository)
+    base_url = f"{api_url}/repos/{owner}/{name}"
+    
+    transfers = [change for change in changes if change.action != "delete"]
+    if verbose:
+        print(f"Copying {len(transfers)} blobs from {upstream_repo} ({max_workers} workers)")
+    
+    def copy_blob(change: SyncChange) -> dict[str, Any]:
+        content = get_blob_content(upstream_repo, change.upstream_sha, upstream_token or token, api_url)
+        blob = _make_request(
+            f"{base_url}/git/blobs",
+            token,
+            method="POST",
+            data={"content": content, "encoding": "base64"},
+            timeout=60,
+        )
+        return {"path": change.path, "mode": "100644", "type": "blob", "sha": blob["sha"]}
+    
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as pool:
+        tree_entries = list(pool.map(bind(copy_blob), transfers))
+    
+    tree_entries.extend(
+        {"path": change.path, "mode": "100644", "type": "blob", "sha": None}
+        for change in changes
+        if change.action == "delete"
+    )
+    
+    ref_data = _make_request(f"{base_url}/git/ref/heads/{branch}", token)
+    parent_sha = ref_data["object"]["sha"]
+    parent_commit = _make_request(f"{base_url}/git/commits/{parent_sha}", token)
+    
+    tree = _make_request(
+        f"{base_url}/git/trees",
+        token,
+        method="POST",
+        data={"base_tree": parent_commit["tree"]["sha"], "tree": tree_entries},
+    )
+    if message is None:
+        counts = {action: sum(1 for c in changes if c.action == action) for action in ("add", "update", "delete")}
+        message = (
+            f"Sync {len(changes)} files from {upstream_repo}\n\n"
+            f"Added: {counts['add']}, updated: {counts['update']}, removed: {counts['delete']}"
+        )
+    commit = _make_request(
+        f"{base_url}/git/commits",
+        token,
+        method="POST",
+        data={"message": message, "tree": tree["sha"], "parents": [parent_sha]},
+    )
+    _make_request(
+        f"{base_url}/git/refs/heads/{branch}",
+        token,
+        method="PATCH",
+        data={"sha": commit["sha"]},
+    )
+    
+    if verbose:
+        print(f"  Committed {len(changes)} changes in {commit['sha'][:8]}")
+    return commit["sha"]
+
+
 def create_sync_pull_request(
     repository: str,
     branch: str,
@@ -846,15 +980,15 @@ def sync_from_upstream(
         if verbose:
             print("  Branch created")
         
-        # Commit changes
+        # Commit changes (one commit; unchanged files were never fetched
+        # because compare_files works on tree blob SHAs)
         if verbose:
             print(f"Committing changes to {sync_branch}...")
-        commit_files(
+        commit_sha = commit_files_tree(
             downstream_repo,
             sync_branch,
             changes,
             upstream_repo,
-            upstream_branch,
             downstream_token,
             upstream_token,
             api_url,
@@ -883,12 +1017,6 @@ def sync_from_upstream(
         # Update sync status tracking
         if track_status:
             try:
-                # Get the commit SHA from the sync branch
-                owner, name = normalize_repository(downstream_repo)
-                ref_endpoint = f"{api_url}/repos/{owner}/{name}/git/ref/heads/{sync_branch}"
-                ref_data = _make_request(ref_endpoint, downstream_token)
-                commit_sha = ref_data["object"]["sha"]
-                
                 update_sync_status(
                     downstream_repo,
                     downstream_token,
@@ -1169,7 +1297,7 @@ def discover_downstream_repos(
     req = request.Request(f"{endpoint}{params}", headers=headers)
     
     try:
-        with request.urlopen(req, timeout=30) as response:
+        with github_transport.urlopen(req, timeout=30) as response:
             data = json.loads(response.read().decode())
             repos = []
             for item in data.get("items", []):
@@ -1216,7 +1344,7 @@ def verify_satellite_trust(
     req = request.Request(endpoint, headers=headers)
     
     try:
-        with request.urlopen(req, timeout=30) as response:
+        with github_transport.urlopen(req, timeout=30) as response:
             data = json.loads(response.read().decode())
             
             # Check 1: Not a fork
@@ -1348,7 +1476,7 @@ def notify_downstream_repos(
             req.add_header('X-GitHub-Api-Version', API_VERSION)
             req.add_header('Content-Type', 'application/json')
             
-            with request.urlopen(req, timeout=30) as response:
+            with github_transport.urlopen(req, timeout=30) as response:
                 print(f"  ✓ Notified successfully")
                 results["success"] += 1
                 results["repos"].append({"repo": repo, "status": "notified"})
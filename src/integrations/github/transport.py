@@ -0,0 +1,525 @@
+"""Shared HTTP transport for the GitHub REST and GraphQL helpers.
+
+Every helper in ``src.integrations.github`` builds a ``urllib.request.Request``
+and hands it to :func:`urlopen`, a drop-in replacement for
+``urllib.request.urlopen`` (same arguments, same ``HTTPError``/``URLError``
+exceptions, a response with ``read()``) that adds:
+
+- keep-alive connections pooled per thread and host instead of a new TLS
+  handshake per call
+- conditional GETs: responses with an ``ETag`` are cached and replayed with
+  ``If-None-Match``; GitHub does not count ``304 Not Modified`` against the
+  rate limit. The cache is in memory, and also on disk when
+  ``GITHUB_HTTP_CACHE_DIR`` is set
+- ``X-RateLimit-*`` accounting per resource (core, graphql, search) with
+  proactive throttling when a bucket runs low and the current pace would
+  exhaust it before the reset
+- per-endpoint latency and error counts (:meth:`GitHubTransport.stats`),
+  also exported as ``speculum_github_*`` metrics (:mod:`src.metrics`)
+- a ``github:<endpoint>`` tracing span per request (:mod:`src.tracing`)
+"""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import http.client
+import io
+import json
+import logging
+import math
+import os
+import re
+import threading
+import time
+from dataclasses import asdict, dataclass
+from email.message import Message
+from pathlib import Path
+from typing import Any, Callable
+from urllib import error, request
+from urllib.parse import urlparse
+
+from src.metrics import GITHUB_REQUEST_SECONDS, GITHUB_REQUESTS
+from src.tracing import span
+
+logger = logging.getLogger(__name__)
+
+
+CACHE_DIR_ENV = "GITHUB_HTTP_CACHE_DIR"
+DEFAULT_THROTTLE_FRACTION = 0.1  # Share of a bucket's limit below which calls may be spaced out
+DEFAULT_MAX_THROTTLE_WAIT = 60.0
+
+# Path segments after which the rest of the URL is an identifier, not a route
+_COLLAPSE_AFTER = {"contents", "refs", "labels", "branches", "blobs", "trees", "commits", "variables"}
+_SHA = re.compile(r"^[0-9a-f]{40}$")
+
+
+@dataclass
+class RateLimitState:
+    """Last ``X-RateLimit-*`` values seen for one resource."""
+
+    limit: int
+    remaining: int
+    reset: float  # Epoch seconds
+    used: int = 0
+
+
+@dataclass
+class _Window:
+    """Requests sent in one rate-limit window, to estimate the current pace."""
+
+    reset: float
+    started: float
+    sent: int = 0
+
+
+@dataclass
+class EndpointStats:
+    """Request counts and latency for one endpoint template."""
+
+    requests: int = 0
+    errors: int = 0
+    not_modified: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+
+    def observe(self, seconds: float, *, failed: bool = False, not_modified: bool = False) -> None:
+        self.requests += 1
+        self.errors += int(failed)
+        self.not_modified += int(not_modified)
+        self.total_seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+
+    def to_dict(self) -> dict[str, Any]:
+        data = asdict(self)
+        data["mean_seconds"] = self.total_seconds / self.requests if self.requests else 0.0
+        return data
+
+
+# =============================================================================
+# Connection pooling
+# =============================================================================
+
+
+class _ConnectionPool:
+    """One persistent connection per (scheme, host) per thread."""
+
+    def __init__(self) -> None:
+        self._local = threading.local()
+
+    def _connections(self) -> dict[tuple[str, str], http.client.HTTPConnection]:
+        if not hasattr(self._local, "connections"):
+            self._local.connections = {}
+        return self._local.connections
+
+    def get(self, scheme: str, host: str, timeout: float | None) -> tuple[http.client.HTTPConnection, bool]:
+        """Return a connection and whether it was reused."""
+        connections = self._connections()
+        conn = connections.get((scheme, host))
+        reused = conn is not None and conn.sock is not None
+        if conn is None:
+            conn_class = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+            conn = conn_class(host, timeout=timeout)
+            connections[(scheme, host)] = conn
+        conn.timeout = timeout
+        if conn.sock is not None:
+            conn.sock.settimeout(timeout)
+        return conn, reused
+
+    def discard(self, scheme: str, host: str) -> None:
+        conn = self._connections().pop((scheme, host), None)
+        if conn is not None:
+            conn.close()
+
+    def close(self) -> None:
+        """Close this thread's connections."""
+        for conn in self._connections().values():
+            conn.close()
+        self._connections().clear()
+
+
+class _KeepAliveMixin:
+    """urllib handler body that sends over pooled connections."""
+
+    pool: _ConnectionPool
+
+    def _pooled_open(self, scheme: str, req: request.Request) -> http.client.HTTPResponse:
+        host = req.host
+        if not host:
+            raise error.URLError("no host given")
+        headers = {name.title(): value for name, value in req.unredirected_hdrs.items()}
+        headers.update({name.title(): value for name, value in req.headers.items()})
+        timeout = req.timeout if isinstance(req.timeout, (int, float)) else None
+
+        for attempt in range(2):
+            conn, reused = self.pool.get(scheme, host, timeout)
+            try:
+                conn.request(req.get_method(), req.selector, req.data, headers)
+                response = conn.getresponse()
+            except (http.client.RemoteDisconnected, http.client.CannotSendRequest, ConnectionResetError, BrokenPipeError) as exc:
+                # The server closed an idle keep-alive connection; retry once on a fresh one
+                self.pool.discard(scheme, host)
+                if attempt == 0 and reused:
+                    continue
+                raise error.URLError(exc) from exc
+            except OSError as exc:
+                self.pool.discard(scheme, host)
+                raise error.URLError(exc) from exc
+            break
+
+        if response.will_close:
+            # Body can still be read; the pool just must not hand this connection out again
+            self.pool._connections().pop((scheme, host), None)
+        response.url = req.get_full_url()
+        response.msg = response.reason  # type: ignore[assignment]  # urllib convention
+        return response
+
+
+class _KeepAliveHTTPSHandler(_KeepAliveMixin, request.HTTPSHandler):
+    def __init__(self, pool: _ConnectionPool) -> None:
+        super().__init__()
+        self.pool = pool
+
+    def https_open(self, req: request.Request) -> http.client.HTTPResponse:
+        return self._pooled_open("https", req)
+
+
+class _KeepAliveHTTPHandler(_KeepAliveMixin, request.HTTPHandler):
+    def __init__(self, pool: _ConnectionPool) -> None:
+        super().__init__()
+        self.pool = pool
+
+    def http_open(self, req: request.Request) -> http.client.HTTPResponse:
+        return self._pooled_open("http", req)
+
+
+# =============================================================================
+# ETag cache
+# =============================================================================
+
+
+@dataclass
+class _CacheEntry:
+    etag: str
+    body: bytes
+    content_type: str = ""
+
+
+class ETagCache:
+    """ETag and body of GET responses, in memory and optionally on disk."""
+
+    def __init__(self, directory: Path | str | None = None, max_entries: int = 2048) -> None:
+        self.directory = Path(directory) if directory else None
+        self.max_entries = max_entries
+        self._entries: dict[str, _CacheEntry] = {}
+        self._lock = threading.Lock()
+        if self.directory is not None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+
+    def get(self, key: str) -> _CacheEntry | None:
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None and self.directory is not None:
+            entry = self._read(key)
+            if entry is not None:
+                self._remember(key, entry)
+        return entry
+
+    def put(self, key: str, entry: _CacheEntry) -> None:
+        self._remember(key, entry)
+        if self.directory is not None:
+            path = self._path(key)
+            tmp = path.with_suffix(".tmp")
+            tmp.write_text(
+                json.dumps({
+                    "etag": entry.etag,
+                    "content_type": entry.content_type,
+                    "body": base64.b64encode(entry.body).decode("ascii"),
+                }),
+                encoding="utf-8",
+            )
+            os.replace(tmp, path)
+
+    def _remember(self, key: str, entry: _CacheEntry) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = entry
+            while len(self._entries) > self.max_entries:
+                self._entries.pop(next(iter(self._entries)))
+
+    def _path(self, key: str) -> Path:
+        assert self.directory is not None
+        return self.directory / f"{hashlib.sha256(key.encode('utf-8')).hexdigest()}.json"
+
+    def _read(self, key: str) -> _CacheEntry | None:
+        try:
+            raw = json.loads(self._path(key).read_text(encoding="utf-8"))
+            return _CacheEntry(
+                etag=raw["etag"],
+                body=base64.b64decode(raw["body"]),
+                content_type=raw.get("content_type", ""),
+            )
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError) as exc:
+            logger.debug("Ignoring unreadable HTTP cache entry for %s: %s", key, exc)
+            return None
+
+
+class _CachedResponse:
+    """Response object returned by :func:`urlopen`; the body is already read."""
+
+    def __init__(self, url: str, status: int, headers: Message, body: bytes) -> None:
+        self.url = url
+        self.status = status
+        self.code = status
+        self.headers = headers
+        self._body = io.BytesIO(body)
+
+    def read(self, amt: int | None = None) -> bytes:
+        return self._body.read(amt)
+
+    def getcode(self) -> int:
+        return self.status
+
+    def info(self) -> Message:
+        return self.headers
+
+    def close(self) -> None:
+        self._body.close()
+
+    def __enter__(self) -> "_CachedResponse":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+# =============================================================================
+# Transport
+# =============================================================================
+
+
+def endpoint_template(method: str, url: str) -> str:
+    """Group URLs into endpoints: ``GET /repos/{owner}/{repo}/issues/{n}``."""
+    path = urlparse(url).path
+    for prefix in ("/api/v3", "/api"):
+        if path.startswith(prefix + "/"):
+            path = path[len(prefix):]
+    segments = [segment for segment in path.split("/") if segment]
+    template: list[str] = []
+    for position, segment in enumerate(segments):
+        if segments[:1] == ["repos"] and position in (1, 2):
+            template.append("{owner}" if position == 1 else "{repo}")
+        elif template and template[-1] in _COLLAPSE_AFTER:
+            template.append("{id}")
+            break
+        elif segment.isdigit():
+            template.append("{n}")
+        elif _SHA.match(segment):
+            template.append("{sha}")
+        else:
+            template.append(segment)
+    return f"{method} /{'/'.join(template)}"
+
+
+def _resource_for(url: str) -> str:
+    path = urlparse(url).path
+    if path.endswith("/graphql"):
+        return "graphql"
+    if "/search/" in path:
+        return "search"
+    return "core"
+
+
+def _int_header(headers: Any, name: str) -> int | None:
+    value = headers.get(name) if headers is not None else None
+    if not isinstance(value, str):
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        return None
+
+
+class GitHubTransport:
+    """Pooled, caching, rate-limit-aware sender for GitHub API requests.
+
+    Args:
+        cache_dir: Directory for the on-disk ETag cache; in memory only when None.
+        throttle_fraction: When a resource's remaining quota drops below this
+            share of its limit and the current request rate would use it up
+            before the reset, requests are spaced so the rest lasts.
+        max_throttle_wait: Upper bound on a single throttling pause.
+        sleep: Injectable sleep for tests.
+        clock: Injectable wall clock (epoch seconds) for rate-limit resets.
+    """
+
+    def __init__(
+        self,
+        *,
+        cache_dir: Path | str | None = None,
+        throttle_fraction: float = DEFAULT_THROTTLE_FRACTION,
+        max_throttle_wait: float = DEFAULT_MAX_THROTTLE_WAIT,
+        sleep: Callable[[float], None] = time.sleep,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.cache = ETagCache(cache_dir)
+        self.throttle_fraction = throttle_fraction
+        self.max_throttle_wait = max_throttle_wait
+        self._sleep = sleep
+        self._clock = clock
+        self._pool = _ConnectionPool()
+        self._opener = request.build_opener(
+            _KeepAliveHTTPSHandler(self._pool), _KeepAliveHTTPHandler(self._pool)
+        )
+        self._lock = threading.Lock()
+        self._limits: dict[str, RateLimitState] = {}
+        self._windows: dict[str, _Window] = {}
+        self._stats: dict[str, EndpointStats] = {}
+
+    @classmethod
+    def from_environment(cls) -> "GitHubTransport":
+        """Create a transport using ``GITHUB_HTTP_CACHE_DIR`` for the disk cache."""
+        return cls(cache_dir=os.environ.get(CACHE_DIR_ENV) or None)
+
+    def urlopen(self, req: request.Request, timeout: float | None = None) -> _CachedResponse:
+        """Send ``req``; same contract as ``urllib.request.urlopen``."""
+        url = req.get_full_url()
+        method = req.get_method()
+        endpoint = endpoint_template(method, url)
+        with span(f"github.{endpoint}") as current:
+            self._throttle(_resource_for(url))
+
+            cache_key = None
+            cached = None
+            if method == "GET":
+                auth = req.get_header("Authorization") or ""
+                cache_key = f"{hashlib.sha256(auth.encode('utf-8')).hexdigest()[:16]} {url}"
+                cached = self.cache.get(cache_key)
+                if cached is not None and not req.has_header("If-none-match"):
+                    req.add_header("If-None-Match", cached.etag)
+
+            started = time.perf_counter()
+            try:
+                response = self._opener.open(req) if timeout is None else self._opener.open(req, timeout=timeout)
+                with response:
+                    body = response.read()
+                    status = response.status
+                    headers = response.headers
+            except error.HTTPError as exc:
+                elapsed = time.perf_counter() - started
+                self._record_rate_limit(exc.headers)
+                # Drain the body so the pooled connection can be reused
+                error_body = exc.read()
+                if exc.code == 304 and cached is not None:
+                    self._observe(endpoint, elapsed, 304, not_modified=True)
+                    current.set(status=304)
+                    return _CachedResponse(url, 200, exc.headers, cached.body)
+                self._observe(endpoint, elapsed, exc.code, failed=True)
+                current.set(status=exc.code)
+                raise error.HTTPError(url, exc.code, exc.msg, exc.headers, io.BytesIO(error_body)) from None
+            except error.URLError:
+                self._observe(endpoint, time.perf_counter() - started, "error", failed=True)
+                raise
+
+            self._observe(endpoint, time.perf_counter() - started, status)
+            current.set(status=status)
+            self._record_rate_limit(headers)
+            etag = headers.get("ETag")
+            if cache_key is not None and status == 200 and isinstance(etag, str) and etag:
+                self.cache.put(cache_key, _CacheEntry(etag=etag, body=body, content_type=headers.get("Content-Type", "")))
+            return _CachedResponse(url, status, headers, body)
+
+    def rate_limits(self) -> dict[str, RateLimitState]:
+        """Latest rate-limit state per resource."""
+        with self._lock:
+            return {name: RateLimitState(**asdict(state)) for name, state in self._limits.items()}
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """Per-endpoint request counts and latency."""
+        with self._lock:
+            return {endpoint: stats.to_dict() for endpoint, stats in sorted(self._stats.items())}
+
+    def close(self) -> None:
+        """Close the calling thread's pooled connections."""
+        self._pool.close()
+
+    def _observe(self, endpoint: str, seconds: float, status: int | str, **flags: bool) -> None:
+        with self._lock:
+            self._stats.setdefault(endpoint, EndpointStats()).observe(seconds, **flags)
+        GITHUB_REQUESTS.inc(endpoint=endpoint, status=status)
+        GITHUB_REQUEST_SECONDS.observe(seconds, endpoint=endpoint)
+
+    def _record_rate_limit(self, headers: Any) -> None:
+        remaining = _int_header(headers, "X-RateLimit-Remaining")
+        reset = _int_header(headers, "X-RateLimit-Reset")
+        if remaining is None or reset is None:
+            return
+        resource = headers.get("X-RateLimit-Resource")
+        state = RateLimitState(
+            limit=_int_header(headers, "X-RateLimit-Limit") or 0,
+            remaining=remaining,
+            reset=float(reset),
+            used=_int_header(headers, "X-RateLimit-Used") or 0,
+        )
+        name = resource if isinstance(resource, str) else "core"
+        with self._lock:
+            self._limits[name] = state
+            window = self._windows.get(name)
+            if window is None or window.reset != state.reset:
+                self._windows[name] = _Window(reset=state.reset, started=self._clock())
+
+    def _throttle(self, resource: str) -> None:
+        with self._lock:
+            window = self._windows.get(resource)
+            if window is not None:
+                window.sent += 1
+            state = self._limits.get(resource)
+            if state is None:
+                return
+            # Relative to the bucket: search allows 30 a minute, core 5000 an hour
+            threshold = max(1, math.ceil(state.limit * self.throttle_fraction))
+            if state.remaining >= threshold:
+                return
+            now = self._clock()
+            until_reset = state.reset - now
+            if until_reset <= 0:
+                return
+            remaining = state.remaining
+            if remaining > 0 and window is not None and window.reset == state.reset:
+                # Leave the pace alone while it lasts until the reset
+                elapsed = max(now - window.started, 1e-3)
+                if window.sent * until_reset / elapsed <= remaining:
+                    return
+            # Spread what is left evenly over the window; wait it out when empty
+            wait = until_reset / (remaining + 1)
+            state.remaining = max(0, remaining - 1)  # Until the response reports the real value
+        wait = min(wait, self.max_throttle_wait)
+        logger.info("GitHub %s rate limit low (%d left); pausing %.1fs", resource, remaining, wait)
+        self._sleep(wait)
+
+
+_transport: GitHubTransport | None = None
+_transport_lock = threading.Lock()
+
+
+def get_transport() -> GitHubTransport:
+    """The process-wide transport, created on first use."""
+    global _transport
+    with _transport_lock:
+        if _transport is None:
+            _transport = GitHubTransport.from_environment()
+        return _transport
+
+
+def set_transport(transport: GitHubTransport | None) -> None:
+    """Replace the process-wide transport (None recreates it on next use)."""
+    global _transport
+    with _transport_lock:
+        _transport = transport
+
+
+def urlopen(req: request.Request, timeout: float | None = None) -> _CachedResponse:
+    """Send a GitHub API request through the shared transport."""
+    return get_transport().urlopen(req, timeout=timeout)
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import hashlib
+import json
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
@@ -13,6 +15,9 @@ from src.knowledge.storage import (
     KnowledgeGraphStorage,
 )
 
+# Bump when build_entity_discussion_content changes so every entity re-renders
+DISCUSSION_CONTENT_VERSION = "1"
+
 
 @dataclass
 class AggregatedEntity:
@@ -134,6 +139,57 @@ class KnowledgeAggregator:
 
         return sorted(entities)
 
+    def entity_fingerprints(self, entity_type: str | None = None) -> dict[str, str]:
+        """Fingerprint every entity's discussion inputs in one pass over the graph.
+
+        An entity's fingerprint hashes the contents of each profile file that
+        mentions it and each association file that references it, plus
+        :data:`DISCUSSION_CONTENT_VERSION`. It changes whenever
+        :meth:`get_aggregated_entity` could return something different, so an
+        unchanged fingerprint means the rendered discussion is unchanged too.
+
+        Args:
+            entity_type: Filter by entity type, as in :meth:`list_entities`.
+
+        Returns:
+            Mapping of lowercased entity name to hex digest.
+        """
+        sources: dict[str, set[str]] = {}
+        for path in sorted(self.storage._profiles_dir.glob("*.json")):
+            raw = path.read_bytes()
+            try:
+                profiles = json.loads(raw).get("profiles", [])
+            except (json.JSONDecodeError, AttributeError):
+                continue
+            digest = hashlib.sha256(raw).hexdigest()
+            for profile in profiles:
+                name = str(profile.get("name", ""))
+                kind = str(profile.get("entity_type", ""))
+                if not name or (entity_type and kind.lower() != entity_type.lower()):
+                    continue
+                sources.setdefault(name.lower(), set()).add(digest)
+
+        for path in sorted(self.storage._associations_dir.glob("*.json")):
+            raw = path.read_bytes()
+            try:
+                associations = json.loads(raw).get("associations", [])
+            except (json.JSONDecodeError, AttributeError):
+                continue
+            digest = hashlib.sha256(raw).hexdigest()
+            for association in associations:
+                for end in (association.get("source"), association.get("target")):
+                    contributing = sources.get(str(end or "").lower())
+                    if contributing is not None:
+                        contributing.add(digest)
+
+        fingerprints: dict[str, str] = {}
+        for name, digests in sources.items():
+            hasher = hashlib.sha256(DISCUSSION_CONTENT_VERSION.encode("utf-8"))
+            for digest in sorted(digests):
+                hasher.update(digest.encode("ascii"))
+            fingerprints[name] = hasher.hexdigest()
+        return fingerprints
+
     def get_profiles_by_entity(
         self,
         name: str,
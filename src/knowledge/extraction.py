@@ -2,10 +2,15 @@
 
 from __future__ import annotations
 
-import json
 from typing import List
 
-from src.integrations.github.models import GitHubModelsClient, GitHubModelsError
+from src.integrations.github.models import GitHubModelsClient, GitHubModelsError, RateLimitError
+from src.integrations.github.structured_output import (
+    ResponseSchema,
+    StructuredOutputMetrics,
+    StructuredResult,
+    complete_structured,
+)
 from src.knowledge.storage import EntityAssociation, EntityProfile, KnowledgeGraphStorage
 from src.parsing.base import ParsedDocument
 from src.parsing.storage import ManifestEntry, ParseStorage
@@ -16,6 +21,55 @@ _MAX_CHUNK_TOKENS = 6000
 # Rough estimate: 1 token ~= 4 characters
 _CHARS_PER_TOKEN = 4
 
+_ENTITY_TYPES = ["Person", "Organization", "Concept"]
+
+# Response schemas; names and associations are strict so capable models are
+# held to them exactly, profiles carry free-form attributes so are advisory.
+NAME_SCHEMA = ResponseSchema(name="entity_names", item_schema={"type": "string"}, strict=True)
+
+ASSOCIATION_SCHEMA = ResponseSchema(
+    name="entity_associations",
+    item_schema={
+        "type": "object",
+        "properties": {
+            "source": {"type": "string"},
+            "target": {"type": "string"},
+            "source_type": {"type": "string", "enum": _ENTITY_TYPES},
+            "target_type": {"type": "string", "enum": _ENTITY_TYPES},
+            "relationship": {"type": "string"},
+            "evidence": {"type": "string"},
+            "confidence": {"type": "number"},
+        },
+        "required": [
+            "source",
+            "target",
+            "source_type",
+            "target_type",
+            "relationship",
+            "evidence",
+            "confidence",
+        ],
+        "additionalProperties": False,
+    },
+    strict=True,
+)
+
+PROFILE_SCHEMA = ResponseSchema(
+    name="entity_profiles",
+    item_schema={
+        "type": "object",
+        "properties": {
+            "name": {"type": "string", "minLength": 1},
+            "entity_type": {"type": "string", "enum": _ENTITY_TYPES},
+            "summary": {"type": "string"},
+            "attributes": {"type": "object"},
+            "mentions": {"type": "array", "items": {"type": "string"}},
+            "confidence": {"type": "number", "minimum": 0, "maximum": 1},
+        },
+        "required": ["name", "entity_type", "summary"],
+    },
+)
+
 
 class ExtractionError(RuntimeError):
     """Raised when extraction fails."""
@@ -25,8 +79,14 @@ class ExtractionError(RuntimeError):
 class BaseExtractor:
     """Base class for entity extraction using LLM."""
 
-    def __init__(self, client: GitHubModelsClient) -> None:
+    def __init__(
+        self,
+        client: GitHubModelsClient,
+        metrics: StructuredOutputMetrics | None = None,
+    ) -> None:
         self.client = client
+        # Parse failures, invalid items and re-asks; share one across extractors
+        self.metrics = metrics or StructuredOutputMetrics()
 
     def extract(self, text: str) -> List[str]:
         """Extract entities from the provided text."""
@@ -83,43 +143,34 @@ class BaseExtractor:
         
         return unique_entities
 
-    def _call_llm(self, system_prompt: str, text: str) -> List[str]:
-        """Helper to call LLM and parse JSON response."""
+    def _complete(self, system_prompt: str, text: str, schema: ResponseSchema) -> StructuredResult:
+        """Call the LLM for a JSON array of ``schema`` items."""
         messages = [
             {"role": "system", "content": system_prompt},
             {"role": "user", "content": text},
         ]
 
         try:
-            response = self.client.chat_completion(
-                messages=messages,
+            return complete_structured(
+                self.client,
+                messages,
+                schema,
                 temperature=0.1,  # Low temperature for deterministic output
                 max_tokens=2000,
+                metrics=self.metrics,
             )
-        except CopilotClientError as exc:
+        except RateLimitError:
+            # Callers pause the batch on rate limits rather than skipping the chunk
+            raise
+        except GitHubModelsError as exc:
             raise ExtractionError(f"LLM call failed: {exc}") from exc
 
-        if not response.choices:
-            raise ExtractionError("No response from LLM")
-
-        content = response.choices[0].message.content or "[]"
-        
-        # Clean up potential markdown code blocks
-        content = content.strip()
-        if content.startswith("```json"):
-            content = content[7:]
-        if content.startswith("```"):
-            content = content[3:]
-        if content.endswith("```"):
-            content = content[:-3]
-        
-        try:
-            data = json.loads(content)
-            if not isinstance(data, list):
-                raise ExtractionError("LLM did not return a JSON array")
-            return [str(item) for item in data if isinstance(item, (str, int, float))]
-        except json.JSONDecodeError as exc:
-            raise ExtractionError(f"Failed to parse LLM response as JSON: {content}") from exc
+    def _call_llm(self, system_prompt: str, text: str) -> List[str]:
+        """Helper to call LLM and parse a JSON array of names."""
+        result = self._complete(system_prompt, text, NAME_SCHEMA)
+        if not result.found:
+            raise ExtractionError("LLM did not return a JSON array")
+        return [item for item in result.items if item.strip()]
 
 
 class PersonExtractor(BaseExtractor):
@@ -235,50 +286,11 @@ class AssociationExtractor(BaseExtractor):
             "\nUse the known entities as a guide, but only extract associations explicitly supported by the text."
         )
         
-        messages = [
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": text},
-        ]
-
-        try:
-            response = self.client.chat_completion(
-                messages=messages,
-                temperature=0.1,
-                max_tokens=2000,
-            )
-        except CopilotClientError:
-            return []
-
-        if not response.choices:
-            return []
-
-        content = response.choices[0].message.content or "[]"
-        content = content.strip()
-        if content.startswith("```json"):
-            content = content[7:]
-        if content.startswith("```"):
-            content = content[3:]
-        if content.endswith("```"):
-            content = content[:-3]
-        
-        if content.endswith("```"):
-            content = content[:-3]
-        
         try:
-            data = json.loads(content)
-            if not isinstance(data, list):
-                return []
-            
-            associations = []
-            for item in data:
-                if isinstance(item, dict):
-                    try:
-                        associations.append(EntityAssociation.from_dict(item))
-                    except (KeyError, TypeError):
-                        continue
-            return associations
-        except json.JSONDecodeError:
+            result = self._complete(system_prompt, text, ASSOCIATION_SCHEMA)
+        except ExtractionError:
             return []
+        return [EntityAssociation.from_dict(item) for item in result.items]
 
     def _extract_chunked_associations(
         self, 
@@ -496,47 +508,11 @@ class ProfileExtractor(BaseExtractor):
             "If an entity is not mentioned in the text, do not include it in the output."
         )
         
-        messages = [
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": text},
-        ]
-
-        try:
-            response = self.client.chat_completion(
-                messages=messages,
-                temperature=0.1,
-                max_tokens=2000,
-            )
-        except CopilotClientError:
-            return []
-
-        if not response.choices:
-            return []
-
-        content = response.choices[0].message.content or "[]"
-        content = content.strip()
-        if content.startswith("```json"):
-            content = content[7:]
-        if content.startswith("```"):
-            content = content[3:]
-        if content.endswith("```"):
-            content = content[:-3]
-        
         try:
-            data = json.loads(content)
-            if not isinstance(data, list):
-                return []
-            
-            profiles = []
-            for item in data:
-                if isinstance(item, dict):
-                    try:
-                        profiles.append(EntityProfile.from_dict(item))
-                    except (KeyError, TypeError):
-                        continue
-            return profiles
-        except json.JSONDecodeError:
+            result = self._complete(system_prompt, text, PROFILE_SCHEMA)
+        except ExtractionError:
             return []
+        return [EntityProfile.from_dict(item) for item in result.items]
 
     def _extract_chunked_profiles(
         self, 
@@ -0,0 +1,522 @@
+"""Pipelined multi-document entity extraction.
+
+Batch extraction used to walk documents one at a time, waiting on every LLM
+call in sequence. This module runs the same work as a staged pipeline with
+bounded queues between stages, so several documents are in flight at once:
+
+1. ``read``      - load parsed content from disk (no LLM)
+2. ``assess``    - heuristic triage, mini model for uncertain documents
+3. ``entities``  - people, organizations and concepts
+4. ``relations`` - associations and profiles (need the entities as hints)
+5. ``persist``   - knowledge-graph files and manifest metadata (single thread)
+
+All LLM calls share one concurrency budget regardless of stage. Every
+completed step is written to an :class:`ExtractionCheckpoint`, so when a run
+stops on a rate limit the next run resumes each document at the first step
+it has not finished instead of starting over.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import queue
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Iterable, List
+
+from src.integrations.github.models import RateLimitError
+
+from .extraction import ExtractionError, read_document_content
+from .storage import EntityAssociation, EntityProfile
+
+if TYPE_CHECKING:
+    from src.integrations.github.storage import GitHubStorageClient
+    from src.parsing.storage import ManifestEntry, ParseStorage
+
+    from .extraction import (
+        AssociationExtractor,
+        ConceptExtractor,
+        OrganizationExtractor,
+        PersonExtractor,
+        ProfileExtractor,
+    )
+    from .storage import KnowledgeGraphStorage
+
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+# Checkpointed steps, in execution order
+STEPS: tuple[str, ...] = (
+    "assess",
+    "people",
+    "organizations",
+    "concepts",
+    "associations",
+    "profiles",
+    "persist",
+)
+
+DEFAULT_CHECKPOINT_FILENAME = "extraction-checkpoint.json"
+DEFAULT_LLM_CONCURRENCY = 2
+DEFAULT_DOCUMENTS_IN_FLIGHT = 4
+
+_CHECKPOINT_VERSION = 1
+_STOP = object()  # Queue sentinel
+
+
+# =============================================================================
+# Checkpoint
+# =============================================================================
+
+
+class ExtractionCheckpoint:
+    """Per-checksum record of completed extraction steps and their outputs.
+
+    Outputs are stored alongside the step names so a resumed run can feed
+    earlier results (e.g. people as association hints) into later steps
+    without repeating the LLM calls. Updates are thread-safe and written
+    through to disk atomically.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._documents: dict[str, dict[str, Any]] = {}
+        if self.path.exists():
+            payload = json.loads(self.path.read_text(encoding="utf-8"))
+            self._documents = payload.get("documents", {})
+
+    def completed_steps(self, checksum: str) -> list[str]:
+        with self._lock:
+            return list(self._documents.get(checksum, {}).get("steps", []))
+
+    def is_complete(self, checksum: str, step: str) -> bool:
+        return step in self.completed_steps(checksum)
+
+    def output(self, checksum: str, step: str) -> Any:
+        with self._lock:
+            return self._documents.get(checksum, {}).get("outputs", {}).get(step)
+
+    def complete_step(self, checksum: str, step: str, output: Any = None) -> None:
+        with self._lock:
+            record = self._documents.setdefault(checksum, {"steps": [], "outputs": {}})
+            if step not in record["steps"]:
+                record["steps"].append(step)
+            if output is not None:
+                record["outputs"][step] = output
+            record["updated_at"] = datetime.now(timezone.utc).isoformat()
+            self._write_locked()
+
+    def prune_persisted(self) -> int:
+        """Drop documents whose ``persist`` step completed; returns how many."""
+        with self._lock:
+            done = [c for c, r in self._documents.items() if "persist" in r.get("steps", [])]
+            for checksum in done:
+                del self._documents[checksum]
+            self._write_locked()
+            return len(done)
+
+    def to_json(self) -> str:
+        with self._lock:
+            return self._to_json_locked()
+
+    def commit(self, github_client: "GitHubStorageClient", path: str) -> None:
+        """Persist the checkpoint to the repository so a later job can resume."""
+        github_client.commit_file(
+            path=path,
+            content=self.to_json(),
+            message="Update extraction checkpoint",
+        )
+
+    def _to_json_locked(self) -> str:
+        payload = {"version": _CHECKPOINT_VERSION, "documents": self._documents}
+        return json.dumps(payload, indent=2, sort_keys=True)
+
+    def _write_locked(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(".tmp")
+        tmp_path.write_text(self._to_json_locked(), encoding="utf-8")
+        tmp_path.replace(self.path)
+
+
+# =============================================================================
+# Pipeline
+# =============================================================================
+
+
+@dataclass
+class _Job:
+    entry: "ManifestEntry"
+    text: str = ""
+    assessment: dict[str, Any] | None = None
+    people: List[str] = field(default_factory=list)
+    organizations: List[str] = field(default_factory=list)
+    concepts: List[str] = field(default_factory=list)
+    associations: List[EntityAssociation] = field(default_factory=list)
+    profiles: List[EntityProfile] = field(default_factory=list)
+    error: str | None = None
+    rate_limited: bool = False
+
+    @property
+    def checksum(self) -> str:
+        return self.entry.checksum
+
+    @property
+    def skipped(self) -> bool:
+        return bool(self.assessment) and not self.assessment.get("is_substantive", False)
+
+
+@dataclass
+class PipelineResult:
+    """Outcome of a pipeline run."""
+
+    processed: int = 0
+    skipped: int = 0
+    errors: int = 0
+    deferred: int = 0  # Documents left unfinished because of a rate limit
+    rate_limited: bool = False
+
+
+class ExtractionPipeline:
+    """Runs extraction for many documents through bounded, concurrent stages.
+
+    Args:
+        storage: Parse storage holding the manifest; updated by ``persist``.
+        kb_storage: Knowledge-graph storage for extracted entities.
+        assess: Callable ``(entry, content) -> assessment dict``.
+        person_extractor, organization_extractor, concept_extractor,
+        association_extractor, profile_extractor: Entity extractors.
+        checkpoint: Step checkpoint used to resume documents.
+        llm_concurrency: Maximum LLM calls in flight across all stages.
+        documents_in_flight: Maximum documents between ``read`` and ``persist``.
+        run_id: Identifier recorded in manifest metadata.
+    """
+
+    def __init__(
+        self,
+        *,
+        storage: "ParseStorage",
+        kb_storage: "KnowledgeGraphStorage",
+        assess: Callable[["ManifestEntry", str], dict[str, Any]],
+        person_extractor: "PersonExtractor",
+        organization_extractor: "OrganizationExtractor",
+        concept_extractor: "ConceptExtractor",
+        association_extractor: "AssociationExtractor",
+        profile_extractor: "ProfileExtractor",
+        checkpoint: ExtractionCheckpoint,
+        llm_concurrency: int = DEFAULT_LLM_CONCURRENCY,
+        documents_in_flight: int = DEFAULT_DOCUMENTS_IN_FLIGHT,
+        run_id: str = "local",
+    ) -> None:
+        if llm_concurrency < 1:
+            raise ValueError("llm_concurrency must be at least 1")
+        if documents_in_flight < 1:
+            raise ValueError("documents_in_flight must be at least 1")
+        self.storage = storage
+        self.kb_storage = kb_storage
+        self.assess = assess
+        self.person_extractor = person_extractor
+        self.organization_extractor = organization_extractor
+        self.concept_extractor = concept_extractor
+        self.association_extractor = association_extractor
+        self.profile_extractor = profile_extractor
+        self.checkpoint = checkpoint
+        self.llm_concurrency = llm_concurrency
+        self.documents_in_flight = documents_in_flight
+        self.run_id = run_id
+        self._llm_slots = threading.BoundedSemaphore(llm_concurrency)
+        self._in_flight = threading.BoundedSemaphore(documents_in_flight)
+        self._rate_limited = threading.Event()
+        # Set when persistence fails; stages pass jobs through untouched
+        self._stopping = threading.Event()
+
+    @classmethod
+    def from_toolkit(
+        cls,
+        toolkit: Any,
+        *,
+        storage: "ParseStorage",
+        checkpoint: ExtractionCheckpoint,
+        **kwargs: Any,
+    ) -> "ExtractionPipeline":
+        """Build a pipeline from an ``ExtractionToolkit``'s extractors and storage."""
+        return cls(
+            storage=storage,
+            kb_storage=toolkit.kb_storage,
+            assess=toolkit.assess_content,
+            person_extractor=toolkit.extractor,
+            organization_extractor=toolkit.org_extractor,
+            concept_extractor=toolkit.concept_extractor,
+            association_extractor=toolkit.association_extractor,
+            profile_extractor=toolkit.profile_extractor,
+            checkpoint=checkpoint,
+            **kwargs,
+        )
+
+    def run(self, entries: Iterable["ManifestEntry"]) -> PipelineResult:
+        """Process ``entries`` and return counts; stops early on a rate limit.
+
+        An error raised while persisting a document stops the feed, lets the
+        stages run dry and joins every worker before it is re-raised.
+        """
+        self._stopping.clear()
+        queue_size = self.documents_in_flight
+        read_q: queue.Queue = queue.Queue(maxsize=queue_size)
+        assess_q: queue.Queue = queue.Queue(maxsize=queue_size)
+        entities_q: queue.Queue = queue.Queue(maxsize=queue_size)
+        relations_q: queue.Queue = queue.Queue(maxsize=queue_size)
+        persist_q: queue.Queue = queue.Queue(maxsize=queue_size)
+
+        workers = self.llm_concurrency
+        threads = [
+            *self._start_stage("read", self._read, read_q, assess_q, 1),
+            *self._start_stage("assess", self._assess, assess_q, entities_q, workers),
+            *self._start_stage("entities", self._extract_entities, entities_q, relations_q, workers),
+            *self._start_stage("relations", self._extract_relations, relations_q, persist_q, workers),
+        ]
+
+        feeder = threading.Thread(
+            target=self._feed, args=(entries, read_q), name="extraction-feed", daemon=True
+        )
+        feeder.start()
+
+        result = PipelineResult()
+        try:
+            while True:
+                job = persist_q.get()
+                if job is _STOP:
+                    break
+                try:
+                    self._persist(job, result)
+                finally:
+                    self._in_flight.release()
+        except Exception:
+            # Drain so no stage stays blocked on a full queue behind us
+            self._stopping.set()
+            while persist_q.get() is not _STOP:
+                self._in_flight.release()
+            raise
+        finally:
+            feeder.join()
+            for thread in threads:
+                thread.join()
+
+        result.rate_limited = self._rate_limited.is_set()
+        return result
+
+    # -- plumbing ---------------------------------------------------------
+
+    def _feed(self, entries: Iterable["ManifestEntry"], out_q: queue.Queue) -> None:
+        try:
+            for entry in entries:
+                # Bound the documents between read and persist, not just queue depth
+                self._in_flight.acquire()
+                if self._rate_limited.is_set() or self._stopping.is_set():
+                    self._in_flight.release()
+                    break
+                out_q.put(_Job(entry=entry))
+        finally:
+            out_q.put(_STOP)
+
+    def _start_stage(
+        self,
+        name: str,
+        handler: Callable[[_Job], None],
+        in_q: queue.Queue,
+        out_q: queue.Queue,
+        count: int,
+    ) -> list[threading.Thread]:
+        remaining = [count]
+        lock = threading.Lock()
+
+        def worker() -> None:
+            while True:
+                job = in_q.get()
+                if job is _STOP:
+                    # Let sibling workers see the sentinel too; the last one out
+                    # closes the downstream queue.
+                    in_q.put(_STOP)
+                    with lock:
+                        remaining[0] -= 1
+                        last = remaining[0] == 0
+                    if last:
+                        out_q.put(_STOP)
+                    return
+                if self._stopping.is_set():
+                    pass
+                elif job.error is None and not job.rate_limited and not job.skipped:
+                    if self._rate_limited.is_set():
+                        job.rate_limited = True
+                    else:
+                        try:
+                            handler(job)
+                        except RateLimitError as exc:
+                            logger.warning(
+                                "Rate limit during %s for %s: %s", name, job.checksum[:12], exc
+                            )
+                            job.rate_limited = True
+                            self._rate_limited.set()
+                        except Exception as exc:
+                            logger.exception("Stage %s failed for %s", name, job.checksum[:12])
+                            job.error = f"{name} failed: {exc}"
+                out_q.put(job)
+
+        threads = [
+            threading.Thread(target=worker, name=f"extraction-{name}-{i}", daemon=True)
+            for i in range(count)
+        ]
+        for thread in threads:
+            thread.start()
+        return threads
+
+    def _call_llm(self, func: Callable[..., Any], *args: Any) -> Any:
+        if self._rate_limited.is_set():
+            raise RateLimitError("Pipeline paused after an earlier rate limit")
+        with self._llm_slots:
+            return func(*args)
+
+    # -- stages -----------------------------------------------------------
+
+    def _read(self, job: _Job) -> None:
+        try:
+            job.text = read_document_content(job.entry, self.storage)
+        except ExtractionError as exc:
+            job.error = str(exc)
+
+    def _assess(self, job: _Job) -> None:
+        checksum = job.checksum
+        if self.checkpoint.is_complete(checksum, "assess"):
+            job.assessment = self.checkpoint.output(checksum, "assess")
+            return
+
+        assessment = self._call_llm(self.assess, job.entry, job.text)
+        if not isinstance(assessment, dict) or assessment.get("status") == "error":
+            message = assessment.get("message", "Unknown error") if isinstance(assessment, dict) else str(assessment)
+            job.error = message
+            return
+        job.assessment = assessment
+        self.checkpoint.complete_step(checksum, "assess", assessment)
+        logger.info(
+            "  %s assessed: substantive=%s (%s)",
+            checksum[:12],
+            assessment.get("is_substantive"),
+            assessment.get("method", "model"),
+        )
+
+    def _extract_entities(self, job: _Job) -> None:
+        job.people = self._run_list_step(job, "people", self.person_extractor.extract_people)
+        job.organizations = self._run_list_step(
+            job, "organizations", self.organization_extractor.extract_organizations
+        )
+        job.concepts = self._run_list_step(job, "concepts", self.concept_extractor.extract_concepts)
+
+    def _extract_relations(self, job: _Job) -> None:
+        checksum = job.checksum
+
+        if self.checkpoint.is_complete(checksum, "associations"):
+            stored = self.checkpoint.output(checksum, "associations") or []
+            job.associations = [EntityAssociation.from_dict(item) for item in stored]
+        else:
+            job.associations = self._guarded(
+                job,
+                "associations",
+                lambda: self._call_llm(
+                    self.association_extractor.extract_associations,
+                    job.text,
+                    job.people,
+                    job.organizations,
+                    job.concepts,
+                ),
+            )
+            self.checkpoint.complete_step(
+                checksum, "associations", [a.to_dict() for a in job.associations]
+            )
+
+        if self.checkpoint.is_complete(checksum, "profiles"):
+            stored = self.checkpoint.output(checksum, "profiles") or []
+            job.profiles = [EntityProfile.from_dict(item) for item in stored]
+            return
+        entities = list(dict.fromkeys([*job.people, *job.organizations, *job.concepts]))
+        if entities:
+            job.profiles = self._guarded(
+                job,
+                "profiles",
+                lambda: self._call_llm(self.profile_extractor.extract_profiles, job.text, entities),
+            )
+        self.checkpoint.complete_step(checksum, "profiles", [p.to_dict() for p in job.profiles])
+
+    def _run_list_step(self, job: _Job, step: str, extract: Callable[[str], List[str]]) -> List[str]:
+        if self.checkpoint.is_complete(job.checksum, step):
+            return list(self.checkpoint.output(job.checksum, step) or [])
+        values = self._guarded(job, step, lambda: self._call_llm(extract, job.text))
+        self.checkpoint.complete_step(job.checksum, step, values)
+        return values
+
+    @staticmethod
+    def _guarded(job: _Job, step: str, call: Callable[[], List[Any]]) -> List[Any]:
+        """Run an extraction step; non-rate-limit failures yield no entities."""
+        try:
+            return call()
+        except ExtractionError as exc:
+            logger.warning("  %s %s extraction failed: %s", job.checksum[:12], step, exc)
+            return []
+
+    def _persist(self, job: _Job, result: PipelineResult) -> None:
+        entry = job.entry
+        checksum = job.checksum
+        entry.metadata["extraction_last_batch_run"] = self.run_id
+
+        if job.rate_limited:
+            entry.metadata["extraction_rate_limited_at"] = datetime.now(timezone.utc).isoformat()
+            self.storage.record_entry(entry)
+            result.deferred += 1
+            return
+
+        if job.error is not None:
+            logger.error("  %s failed: %s", checksum[:12], job.error)
+            entry.metadata["extraction_error"] = job.error
+            self.storage.record_entry(entry)
+            result.errors += 1
+            return
+
+        if job.skipped:
+            reason = job.assessment.get("reason", "No reason provided") if job.assessment else ""
+            logger.info("  %s skipped: %s", checksum[:12], reason)
+            entry.metadata["extraction_skipped"] = True
+            entry.metadata["extraction_skipped_reason"] = reason
+            self.storage.record_entry(entry)
+            self.checkpoint.complete_step(checksum, "persist")
+            result.skipped += 1
+            return
+
+        # One commit per document instead of one per entity file
+        with self.kb_storage.batch(f"Extract entities from {checksum[:12]}"):
+            self.kb_storage.save_extracted_people(checksum, job.people)
+            self.kb_storage.save_extracted_organizations(checksum, job.organizations)
+            self.kb_storage.save_extracted_concepts(checksum, job.concepts)
+            self.kb_storage.save_extracted_associations(checksum, job.associations)
+            if job.profiles:
+                self.kb_storage.save_extracted_profiles(checksum, job.profiles)
+
+        entry.metadata["extraction_complete"] = True
+        entry.metadata.pop("extraction_error", None)
+        entry.metadata.pop("extraction_rate_limited_at", None)
+        self.storage.record_entry(entry)
+        self.checkpoint.complete_step(checksum, "persist")
+        result.processed += 1
+        logger.info(
+            "  ✓ %s: People: %d, Orgs: %d, Concepts: %d, Assocs: %d, Profiles: %d",
+            checksum[:12],
+            len(job.people),
+            len(job.organizations),
+            len(job.concepts),
+            len(job.associations),
+            len(job.profiles),
+        )
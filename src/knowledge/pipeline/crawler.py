@@ -387,7 +387,7 @@ def run_crawler(
         CrawlerResult with acquisition outcomes.
     """
     from src import paths
-    from src.integrations.github.storage import get_github_storage_client
+    from src.integrations.github.storage import get_github_storage_client, write_batch
     
     result = CrawlerResult()
     
@@ -428,63 +428,66 @@ def run_crawler(
             ))
             continue
         
-        # Decide: single page or crawl
-        try:
-            if config.enable_crawling and source.is_crawlable:
-                max_pages = min(
-                    config.max_pages_per_crawl,
-                    config.politeness.max_domain_requests_per_run,
-                )
-                acq_result = acquire_crawl(
-                    source=source,
-                    storage=parse_storage,
-                    crawl_storage=crawl_storage,
-                    max_pages=max_pages,
-                    delay_seconds=delay,
-                    force_restart=config.force_fresh,
-                    config=config,
+        # Content files (PR branch) and the source's registry entry land
+        # together: one commit per branch instead of one per file
+        with write_batch(github_client, f"Acquire content from {source.url}"):
+            # Decide: single page or crawl
+            try:
+                if config.enable_crawling and source.is_crawlable:
+                    max_pages = min(
+                        config.max_pages_per_crawl,
+                        config.politeness.max_domain_requests_per_run,
+                    )
+                    acq_result = acquire_crawl(
+                        source=source,
+                        storage=parse_storage,
+                        crawl_storage=crawl_storage,
+                        max_pages=max_pages,
+                        delay_seconds=delay,
+                        force_restart=config.force_fresh,
+                        config=config,
+                    )
+                else:
+                    acq_result = acquire_single_page(
+                        source=source,
+                        storage=parse_storage,
+                        delay_seconds=delay,
+                        config=config,
+                    )
+            except Exception as e:
+                logger.error("Acquisition failed for %s: %s", source.url, e, exc_info=True)
+                acq_result = AcquisitionResult(
+                    source_url=source.url,
+                    success=False,
+                    error=f"{type(e).__name__}: {e}",
                 )
-            else:
-                acq_result = acquire_single_page(
-                    source=source,
-                    storage=parse_storage,
-                    delay_seconds=delay,
-                    config=config,
-                )
-        except Exception as e:
-            logger.error("Acquisition failed for %s: %s", source.url, e, exc_info=True)
-            acq_result = AcquisitionResult(
-                source_url=source.url,
-                success=False,
-                error=f"{type(e).__name__}: {e}",
-            )
         
-        scheduler.record_request(domain)
+            scheduler.record_request(domain)
         
-        if acq_result.success:
-            result.successful.append(acq_result)
-            result.pages_total += acq_result.pages_acquired
+            if acq_result.success:
+                result.successful.append(acq_result)
+                result.pages_total += acq_result.pages_acquired
             
-            # Update source metadata
-            if acq_result.content_hash:
-                source.last_content_hash = acq_result.content_hash
-            source.last_checked = datetime.now(timezone.utc)
-            source.check_failures = 0
+                # Update source metadata
+                if acq_result.content_hash:
+                    source.last_content_hash = acq_result.content_hash
+                source.last_checked = datetime.now(timezone.utc)
+                source.check_failures = 0
             
-            if source.is_crawlable:
-                source.total_pages_acquired = (
-                    source.total_pages_acquired + acq_result.pages_acquired
-                )
-                source.last_crawl_completed = datetime.now(timezone.utc)
+                if source.is_crawlable:
+                    source.total_pages_acquired = (
+                        source.total_pages_acquired + acq_result.pages_acquired
+                    )
+                    source.last_crawl_completed = datetime.now(timezone.utc)
             
-            registry.save_source(source)
-        else:
-            result.failed.append(acq_result)
+                registry.save_source(source)
+            else:
+                result.failed.append(acq_result)
             
-            # Update failure count
-            source.check_failures += 1
-            source.last_checked = datetime.now(timezone.utc)
-            registry.save_source(source)
+                # Update failure count
+                source.check_failures += 1
+                source.last_checked = datetime.now(timezone.utc)
+                registry.save_source(source)
     
     logger.info(
         "Crawler complete: %d processed, %d successful, %d failed, %d pages",
@@ -21,8 +21,9 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from src.integrations.github.storage import GitHubStorageClient
 
-from src import paths
+from src import metrics, paths
 from src.knowledge.storage import SourceRegistry
+from src.tracing import span
 
 from .config import PipelineConfig
 from .crawler import CrawlerResult, run_crawler
@@ -132,6 +133,11 @@ def run_pipeline(
     if config is None:
         config = PipelineConfig()
     
+    with span("pipeline.run", mode=config.mode, dry_run=config.dry_run):
+        return _run_pipeline(config)
+
+
+def _run_pipeline(config: PipelineConfig) -> PipelineResult:
     result = PipelineResult(mode=config.mode, dry_run=config.dry_run)
     
     logger.info(
@@ -155,13 +161,17 @@ def run_pipeline(
     
     # Phase 1: Monitor (if mode is "full" or "check")
     if config.mode in ("full", "check"):
+        from src.integrations.github.storage import write_batch
+
         logger.info("Running monitor phase...")
-        result.monitor = run_monitor(
-            registry=registry,
-            scheduler=scheduler,
-            dry_run=config.dry_run,
-            force_fresh=config.force_fresh,
-        )
+        # Every checked source's registry update goes into one commit
+        with span("pipeline.monitor"), write_batch(config.github_client, "Record source monitoring results"):
+            result.monitor = run_monitor(
+                registry=registry,
+                scheduler=scheduler,
+                dry_run=config.dry_run,
+                force_fresh=config.force_fresh,
+            )
         
         # Collect sources needing acquisition
         for source in result.monitor.initial_needed:
@@ -198,23 +208,43 @@ def run_pipeline(
             # Re-initialize scheduler for crawler phase
             crawler_scheduler = DomainScheduler(politeness=config.politeness)
             
-            result.crawler = run_crawler(
-                sources=sources_to_acquire,
-                config=config,
-                registry=registry,
-                scheduler=crawler_scheduler,
-            )
+            with span("pipeline.crawl", sources=len(sources_to_acquire)):
+                result.crawler = run_crawler(
+                    sources=sources_to_acquire,
+                    config=config,
+                    registry=registry,
+                    scheduler=crawler_scheduler,
+                )
         else:
             logger.info("No sources need acquisition, skipping crawler phase")
             result.crawler = CrawlerResult()
     
     result.completed_at = datetime.now(timezone.utc)
+    _record_run_metrics(result)
     
     logger.info("Pipeline complete:\n%s", result.summary())
     
     return result
 
 
+def _record_run_metrics(result: PipelineResult) -> None:
+    """Publish run-level gauges so trends show up across scheduled runs."""
+    if result.completed_at is None:
+        return
+    metrics.PIPELINE_RUN_SECONDS.set(result.duration_seconds, mode=result.mode)
+    metrics.PIPELINE_LAST_RUN.set(result.completed_at.timestamp(), mode=result.mode)
+    if result.monitor:
+        metrics.PIPELINE_SOURCES.set(result.monitor.sources_checked, outcome="checked")
+        metrics.PIPELINE_SOURCES.set(len(result.monitor.initial_needed), outcome="initial_needed")
+        metrics.PIPELINE_SOURCES.set(len(result.monitor.updates_needed), outcome="updates_needed")
+        metrics.PIPELINE_SOURCES.set(len(result.monitor.unchanged), outcome="unchanged")
+        metrics.PIPELINE_SOURCES.set(len(result.monitor.errors), outcome="monitor_error")
+    if result.crawler:
+        metrics.PIPELINE_SOURCES.set(len(result.crawler.successful), outcome="acquired")
+        metrics.PIPELINE_SOURCES.set(len(result.crawler.failed), outcome="acquire_failed")
+        metrics.PIPELINE_PAGES.set(result.crawler.pages_total)
+
+
 def run_check_only(
     config: PipelineConfig | None = None,
 ) -> PipelineResult:
@@ -7,7 +7,7 @@ import json
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, List
+from typing import TYPE_CHECKING, Any, ContextManager, List
 
 from src import paths
 from src.parsing import utils
@@ -197,6 +197,15 @@ class KnowledgeGraphStorage:
         self._profiles_dir = self.root / "profiles"
         utils.ensure_directory(self._profiles_dir)
 
+    def batch(self, message: str | None = None) -> ContextManager[Any]:
+        """Group writes made in the block into one GitHub commit.
+
+        A no-op when writing to the local filesystem.
+        """
+        from src.integrations.github.storage import write_batch
+
+        return write_batch(self._github_client, message)
+
     def _get_relative_path(self, path: Path) -> str:
         """Get path relative to project root for GitHub API."""
         try:
@@ -0,0 +1,501 @@
+"""Local content triage for parsed documents.
+
+Deciding whether a parsed document is worth extracting from used to cost one
+mini-model call per document. Most documents are easy to classify locally:
+navigation listings, video stubs and error pages look nothing like articles.
+This module scores a document on a handful of cheap text features and sorts
+it into one of three bands:
+
+1. ``skip``      - clearly not substantive; no model call needed
+2. ``accept``    - clearly substantive; no model call needed
+3. ``uncertain`` - ambiguous; defer to the mini model
+
+Features are computed from the document text plus an optional
+:class:`ParagraphFrequency` table built from the other documents of the same
+source, which lets repeated navigation teasers and footers count as
+boilerplate rather than unique content.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, Literal, Mapping
+from urllib.parse import urlparse
+
+if TYPE_CHECKING:
+    from src.integrations.github.models import GitHubModelsClient
+
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+# Scores below this are skipped without a model call
+DEFAULT_SKIP_BELOW = 0.35
+
+# Scores at or above this are accepted without a model call
+DEFAULT_ACCEPT_ABOVE = 0.7
+
+# A paragraph repeated in at least this share of a source's other documents
+# (and at least MIN_BOILERPLATE_REPEATS of them) is boilerplate
+BOILERPLATE_DOCUMENT_SHARE = 0.05
+MIN_BOILERPLATE_REPEATS = 3
+
+# Paragraph frequency is meaningless for tiny sources
+MIN_FREQUENCY_DOCUMENTS = 5
+
+# Characters of content sent to the mini model for uncertain documents
+MODEL_ASSESSMENT_CHARS = 3000
+
+ERROR_PHRASES: tuple[str, ...] = (
+    "404",
+    "page not found",
+    "page cannot be found",
+    "page you requested",
+    "page you are looking for",
+    "no longer available",
+    "access denied",
+    "forbidden",
+    "internal server error",
+    "service unavailable",
+    "enable javascript",
+    "javascript is disabled",
+    "are you a robot",
+    "verify you are human",
+    "something went wrong",
+)
+
+MODEL_SYSTEM_PROMPT = """You are a content assessment expert. Determine if a document contains substantive, extractable content.
+
+SKIP if the document is:
+- A navigation/menu page with only links
+- An error page (404, access denied, etc.)
+- Pure boilerplate without real content
+- A redirect or placeholder page
+- Just metadata without actual content
+
+EXTRACT if the document contains:
+- Real information about people, organizations, events, or concepts
+- Substantive text, analysis, or discussion
+- Actual content worth extracting entities from
+
+Return ONLY a JSON object with:
+{
+  "is_substantive": true/false,
+  "reason": "Brief explanation of your decision",
+  "confidence": 0.0-1.0
+}"""
+
+_FRONT_MATTER = re.compile(r"\A---\n.*?\n---\n", re.DOTALL)
+_MARKDOWN_LINK = re.compile(r"\[([^\]]*)\]\(([^)]*)\)")
+_BARE_URL = re.compile(r"https?://\S+")
+_SENTENCE_END = re.compile(r"[.!?][\"')\]]*(?:\s|$)")
+_WORD = re.compile(r"[A-Za-z][A-Za-z'’\-]*")
+_WHITESPACE = re.compile(r"\s+")
+
+Verdict = Literal["skip", "accept", "uncertain"]
+
+
+# =============================================================================
+# Data Classes
+# =============================================================================
+
+
+@dataclass(slots=True)
+class DocumentFeatures:
+    """Cheap text features used to triage a document."""
+
+    word_count: int
+    sentence_count: int
+    link_density: float  # Share of words that sit inside links or URLs
+    unique_ratio: float  # Share of characters not found in source boilerplate
+    proper_noun_density: float  # Share of non-initial words that are capitalized
+    error_phrases: list[str] = field(default_factory=list)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "word_count": self.word_count,
+            "sentence_count": self.sentence_count,
+            "link_density": round(self.link_density, 3),
+            "unique_ratio": round(self.unique_ratio, 3),
+            "proper_noun_density": round(self.proper_noun_density, 3),
+            "error_phrases": list(self.error_phrases),
+        }
+
+
+@dataclass(slots=True)
+class TriageDecision:
+    """Outcome of scoring a document."""
+
+    verdict: Verdict
+    score: float
+    reason: str
+    features: DocumentFeatures
+
+    @property
+    def is_substantive(self) -> bool | None:
+        """``True``/``False`` for decided documents, ``None`` when uncertain."""
+        if self.verdict == "accept":
+            return True
+        if self.verdict == "skip":
+            return False
+        return None
+
+    @property
+    def confidence(self) -> float:
+        """Distance from the decision boundary mapped onto 0.5-1.0."""
+        return round(0.5 + abs(self.score - 0.5), 2)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "verdict": self.verdict,
+            "score": round(self.score, 3),
+            "reason": self.reason,
+            "features": self.features.to_dict(),
+        }
+
+
+class ParagraphFrequency:
+    """Counts how many documents of a source contain each paragraph.
+
+    Paragraphs that recur across a large share of a source's documents are
+    treated as boilerplate (menus, footers, listing teasers).
+    """
+
+    def __init__(self) -> None:
+        self._counts: Counter[str] = Counter()
+        self.document_count = 0
+
+    @classmethod
+    def from_texts(cls, texts: Iterable[str]) -> "ParagraphFrequency":
+        frequency = cls()
+        for text in texts:
+            frequency.add_document(text)
+        return frequency
+
+    def add_document(self, text: str) -> None:
+        self._counts.update(set(_paragraphs(strip_front_matter(text))))
+        self.document_count += 1
+
+    def is_boilerplate(self, paragraph: str) -> bool:
+        if self.document_count < MIN_FREQUENCY_DOCUMENTS:
+            return False
+        seen = self._counts.get(_normalize_paragraph(paragraph), 0)
+        # Discount the document being scored, which is usually in the table
+        repeats = seen - 1
+        return repeats >= max(
+            MIN_BOILERPLATE_REPEATS,
+            BOILERPLATE_DOCUMENT_SHARE * self.document_count,
+        )
+
+
+# =============================================================================
+# Feature Extraction and Scoring
+# =============================================================================
+
+
+def strip_front_matter(text: str) -> str:
+    """Remove YAML front matter emitted by :mod:`src.parsing.storage`.
+
+    Multi-segment documents are concatenated, so every segment's header is
+    removed, not just the leading one.
+    """
+    chunks = re.split(r"\n{2,}(?=---\n)", text)
+    return "\n\n".join(_FRONT_MATTER.sub("", chunk, count=1) for chunk in chunks)
+
+
+def compute_features(
+    text: str,
+    paragraph_frequency: ParagraphFrequency | None = None,
+) -> DocumentFeatures:
+    """Compute triage features for a document's text."""
+    body = strip_front_matter(text)
+    paragraphs = _paragraphs(body)
+
+    link_words = 0
+    for match in _MARKDOWN_LINK.finditer(body):
+        link_words += max(1, len(_WORD.findall(match.group(1))))
+    link_words += len(_BARE_URL.findall(_MARKDOWN_LINK.sub(" ", body)))
+
+    prose = _BARE_URL.sub(" ", _MARKDOWN_LINK.sub(r"\1", body))
+    words = _WORD.findall(prose)
+    word_count = len(words)
+
+    sentence_count = sum(
+        len(_SENTENCE_END.findall(paragraph + " "))
+        for paragraph in paragraphs
+        if len(_WORD.findall(paragraph)) >= 4
+    )
+
+    total_chars = sum(len(p) for p in paragraphs)
+    if paragraph_frequency is not None and total_chars:
+        unique_chars = sum(
+            len(p) for p in paragraphs if not paragraph_frequency.is_boilerplate(p)
+        )
+        unique_ratio = unique_chars / total_chars
+    else:
+        unique_ratio = 1.0 if total_chars else 0.0
+
+    proper_nouns = 0
+    candidates = 0
+    for sentence in re.split(r"[.!?\n]+", prose):
+        sentence_words = _WORD.findall(sentence)
+        for word in sentence_words[1:]:
+            candidates += 1
+            if word[0].isupper():
+                proper_nouns += 1
+    proper_noun_density = proper_nouns / candidates if candidates else 0.0
+
+    lowered = body.lower()
+    error_phrases = [phrase for phrase in ERROR_PHRASES if phrase in lowered]
+
+    return DocumentFeatures(
+        word_count=word_count,
+        sentence_count=sentence_count,
+        link_density=link_words / word_count if word_count else 0.0,
+        unique_ratio=unique_ratio,
+        proper_noun_density=proper_noun_density,
+        error_phrases=error_phrases,
+    )
+
+
+def score_features(features: DocumentFeatures) -> float:
+    """Combine features into a 0.0-1.0 substantiveness score."""
+    if features.word_count == 0:
+        return 0.0
+
+    # Sentences and words that only repeat source boilerplate do not count
+    sentences = features.sentence_count * features.unique_ratio
+    words = features.word_count * features.unique_ratio
+
+    score = 0.0
+    # Running prose: several real sentences
+    score += 0.3 * min(sentences / 8, 1.0)
+    # Volume of text, saturating around a short article
+    score += 0.15 * min(words / 300, 1.0)
+    # Content unique to this document rather than shared source boilerplate
+    score += 0.25 * features.unique_ratio
+    # Link-heavy pages are menus and listings
+    score += 0.15 * (1.0 - min(features.link_density / 0.5, 1.0))
+    # Entities to extract; all-caps menus and entity-free text both score low
+    if 0.05 <= features.proper_noun_density <= 0.5:
+        score += 0.15
+    elif 0.0 < features.proper_noun_density < 0.05:
+        score += 0.05
+
+    # Error phrasing is only damning on short pages; articles may quote "404"
+    if features.error_phrases and features.word_count < 200:
+        score -= 0.2 * len(features.error_phrases)
+
+    return max(0.0, min(score, 1.0))
+
+
+def triage_document(
+    text: str,
+    paragraph_frequency: ParagraphFrequency | None = None,
+    *,
+    skip_below: float = DEFAULT_SKIP_BELOW,
+    accept_above: float = DEFAULT_ACCEPT_ABOVE,
+) -> TriageDecision:
+    """Score a document and place it in the skip, accept or uncertain band."""
+    features = compute_features(text, paragraph_frequency)
+    score = score_features(features)
+
+    if score < skip_below:
+        verdict: Verdict = "skip"
+    elif score >= accept_above:
+        verdict = "accept"
+    else:
+        verdict = "uncertain"
+
+    return TriageDecision(
+        verdict=verdict,
+        score=score,
+        reason=_describe(verdict, features),
+        features=features,
+    )
+
+
+def _describe(verdict: Verdict, features: DocumentFeatures) -> str:
+    summary = (
+        f"{features.word_count} words, {features.sentence_count} sentences, "
+        f"{features.unique_ratio:.0%} unique, {features.link_density:.0%} links"
+    )
+    if verdict == "skip":
+        if features.error_phrases and features.word_count < 200:
+            return f"Looks like an error page ({', '.join(features.error_phrases)}); {summary}"
+        return f"Heuristic triage: little substantive content ({summary})"
+    if verdict == "accept":
+        return f"Heuristic triage: substantive prose ({summary})"
+    return f"Heuristic triage inconclusive ({summary})"
+
+
+def _paragraphs(text: str) -> list[str]:
+    return [
+        normalized
+        for normalized in (_normalize_paragraph(line) for line in text.splitlines())
+        if normalized
+    ]
+
+
+def _normalize_paragraph(paragraph: str) -> str:
+    return _WHITESPACE.sub(" ", paragraph).strip().lower()
+
+
+# =============================================================================
+# Model Assessment
+# =============================================================================
+
+
+def assess_with_model(client: "GitHubModelsClient", text: str) -> dict[str, Any]:
+    """Ask the mini model whether ``text`` is substantive.
+
+    Returns a mapping with ``is_substantive``, ``reason`` and ``confidence``.
+    Raises ``GitHubModelsError`` (including ``RateLimitError``) on API failure
+    and ``ValueError`` when the model returns no choices.
+    """
+    messages = [
+        {"role": "system", "content": MODEL_SYSTEM_PROMPT},
+        {
+            "role": "user",
+            "content": (
+                f"Assess this document content (first {MODEL_ASSESSMENT_CHARS} chars):\n\n"
+                f"{text[:MODEL_ASSESSMENT_CHARS]}"
+            ),
+        },
+    ]
+    response = client.chat_completion(
+        messages=messages,
+        temperature=0.1,
+        max_tokens=300,
+    )
+    if not response.choices:
+        raise ValueError("No response from LLM")
+
+    result_text = (response.choices[0].message.content or "").strip()
+    try:
+        result = json.loads(result_text)
+        return {
+            "is_substantive": result.get("is_substantive", False),
+            "reason": result.get("reason", ""),
+            "confidence": result.get("confidence", 0.5),
+        }
+    except (json.JSONDecodeError, AttributeError):
+        # Fallback: look for true/false in response
+        return {
+            "is_substantive": "true" in result_text.lower(),
+            "reason": result_text,
+            "confidence": 0.7,
+        }
+
+
+# =============================================================================
+# Calibration
+# =============================================================================
+
+
+@dataclass(slots=True)
+class CorpusDocument:
+    """A parsed document read straight from an evidence directory."""
+
+    checksum: str
+    source: str
+    text: str
+
+
+def iter_parsed_documents(root: Path) -> Iterator[CorpusDocument]:
+    """Yield documents from a parsed evidence tree (``*/index.md`` + segments)."""
+    for index_path in sorted(Path(root).rglob("index.md")):
+        header = index_path.read_text(encoding="utf-8")
+        checksum = _front_matter_value(header, "checksum") or index_path.parent.name
+        source = _front_matter_value(header, "source") or ""
+        pages = sorted(p for p in index_path.parent.glob("*.md") if p.name != "index.md")
+        if not pages:
+            continue
+        text = "\n\n".join(p.read_text(encoding="utf-8") for p in pages)
+        yield CorpusDocument(checksum=checksum, source=source, text=text)
+
+
+def _front_matter_value(text: str, key: str) -> str | None:
+    match = re.search(rf"^{re.escape(key)}:\s*\"?([^\"\n]*)\"?\s*$", text, re.MULTILINE)
+    return match.group(1) if match else None
+
+
+def calibrate(
+    documents: Iterable[CorpusDocument],
+    labels: Mapping[str, bool] | None = None,
+    *,
+    skip_below: float = DEFAULT_SKIP_BELOW,
+    accept_above: float = DEFAULT_ACCEPT_ABOVE,
+) -> dict[str, Any]:
+    """Triage a corpus and measure agreement with reference labels.
+
+    ``labels`` maps checksum to the reference ``is_substantive`` decision
+    (typically the mini model's). Agreement is measured over documents the
+    heuristic decided on its own; uncertain documents would go to the model
+    anyway and so cannot disagree with it.
+    """
+    documents = list(documents)
+    labels = labels or {}
+
+    frequencies: dict[str, ParagraphFrequency] = {}
+    for document in documents:
+        host = source_host(document.source)
+        frequencies.setdefault(host, ParagraphFrequency()).add_document(document.text)
+
+    counts: Counter[str] = Counter()
+    decided_labelled = 0
+    agreed = 0
+    disagreements: list[dict[str, Any]] = []
+    decisions: list[dict[str, Any]] = []
+
+    for document in documents:
+        decision = triage_document(
+            document.text,
+            frequencies[source_host(document.source)],
+            skip_below=skip_below,
+            accept_above=accept_above,
+        )
+        counts[decision.verdict] += 1
+        decisions.append(
+            {"checksum": document.checksum, "source": document.source, **decision.to_dict()}
+        )
+
+        label = labels.get(document.checksum)
+        if label is None or decision.is_substantive is None:
+            continue
+        decided_labelled += 1
+        if decision.is_substantive == label:
+            agreed += 1
+        else:
+            disagreements.append(
+                {
+                    "checksum": document.checksum,
+                    "source": document.source,
+                    "verdict": decision.verdict,
+                    "score": round(decision.score, 3),
+                    "label": label,
+                }
+            )
+
+    total = len(documents)
+    return {
+        "documents": total,
+        "thresholds": {"skip_below": skip_below, "accept_above": accept_above},
+        "verdicts": {verdict: counts.get(verdict, 0) for verdict in ("skip", "accept", "uncertain")},
+        "model_calls_avoided": (total - counts.get("uncertain", 0)) / total if total else 0.0,
+        "labelled_decisions": decided_labelled,
+        "agreement_rate": agreed / decided_labelled if decided_labelled else None,
+        "disagreements": disagreements,
+        "decisions": decisions,
+    }
+
+
+def source_host(source: str) -> str:
+    """Group key for paragraph frequency: the source URL's host, or the source itself."""
+    parsed = urlparse(source)
+    return parsed.netloc.lower() or source
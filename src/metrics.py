@@ -0,0 +1,444 @@
+"""In-process metrics: counters, gauges and fixed-bucket histograms.
+
+Instruments live in a :class:`MetricsRegistry` and are rendered in the
+Prometheus text exposition format. At the end of a run,
+:func:`export_textfile` writes the process-wide registry to a ``.prom``
+file, for the node_exporter textfile collector or for archiving with the
+run. :class:`MetricsServer` serves the same text over HTTP for long-running
+processes such as ``AgentDeployment``. Run-level gauges such as
+``speculum_pipeline_last_run_timestamp_seconds`` make trends across
+scheduled runs visible from the scraped series alone.
+
+Instruments are declared once, at module level below, and updated where the
+work happens::
+
+    from src import metrics
+
+    metrics.LLM_TOKENS.inc(usage.prompt_tokens, model=model, kind="prompt")
+    metrics.RENDER_SECONDS.observe(elapsed, outcome="ok")
+"""
+
+from __future__ import annotations
+
+import math
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, List, Mapping, Sequence, Tuple
+
+METRICS_FILE_ENV = "SPECULUM_METRICS_FILE"
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Prometheus client defaults; suit sub-second operations
+DEFAULT_BUCKETS: Tuple[float, ...] = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SLOW_BUCKETS: Tuple[float, ...] = (0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 20.0, 30.0, 60.0, 120.0)
+
+_LabelKey = Tuple[str, ...]
+
+
+class MetricsError(ValueError):
+    """Raised for conflicting registrations or mismatched labels."""
+
+
+# =============================================================================
+# Instruments
+# =============================================================================
+
+
+class _Metric:
+    kind = "untyped"
+
+    def __init__(self, name: str, help: str, labels: Sequence[str] = ()) -> None:
+        self.name = name
+        self.help = help
+        self.label_names = tuple(labels)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Mapping[str, object]) -> _LabelKey:
+        if set(labels) != set(self.label_names):
+            raise MetricsError(
+                f"{self.name} expects labels {sorted(self.label_names)}, got {sorted(labels)}"
+            )
+        return tuple(str(labels[name]) for name in self.label_names)
+
+    def _label_text(self, key: _LabelKey, extra: Sequence[Tuple[str, str]] = ()) -> str:
+        pairs = list(zip(self.label_names, key)) + list(extra)
+        if not pairs:
+            return ""
+        return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs) + "}"
+
+    def samples(self) -> List[str]:  # pragma: no cover - overridden
+        raise NotImplementedError
+
+    def render(self) -> str:
+        lines = [f"# HELP {self.name} {_escape_help(self.help)}", f"# TYPE {self.name} {self.kind}"]
+        lines.extend(self.samples())
+        return "\n".join(lines)
+
+
+class Counter(_Metric):
+    """Monotonically increasing total, per label set."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, help: str, labels: Sequence[str] = ()) -> None:
+        super().__init__(name, help, labels)
+        self._values: Dict[_LabelKey, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: object) -> None:
+        if amount < 0:
+            raise MetricsError(f"{self.name}: counters can only increase")
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: object) -> float:
+        with self._lock:
+            return self._values.get(self._key(labels), 0.0)
+
+    def samples(self) -> List[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [f"{self.name}{self._label_text(key)} {_format(value)}" for key, value in items]
+
+
+class Gauge(_Metric):
+    """Value that can go up and down, per label set."""
+
+    kind = "gauge"
+
+    def __init__(self, name: str, help: str, labels: Sequence[str] = ()) -> None:
+        super().__init__(name, help, labels)
+        self._values: Dict[_LabelKey, float] = {}
+
+    def set(self, value: float, **labels: object) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = float(value)
+
+    def inc(self, amount: float = 1.0, **labels: object) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels: object) -> None:
+        self.inc(-amount, **labels)
+
+    def value(self, **labels: object) -> float:
+        with self._lock:
+            return self._values.get(self._key(labels), 0.0)
+
+    def samples(self) -> List[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [f"{self.name}{self._label_text(key)} {_format(value)}" for key, value in items]
+
+
+class _HistogramSeries:
+    __slots__ = ("counts", "sum", "count")
+
+    def __init__(self, buckets: int) -> None:
+        self.counts = [0] * buckets
+        self.sum = 0.0
+        self.count = 0
+
+
+class Histogram(_Metric):
+    """Distribution over fixed upper bounds, per label set."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labels: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        if "le" in labels:
+            raise MetricsError("'le' is reserved for histogram buckets")
+        bounds = tuple(sorted(float(bound) for bound in buckets if not math.isinf(bound)))
+        if not bounds:
+            raise MetricsError(f"{name} needs at least one finite bucket")
+        super().__init__(name, help, labels)
+        self.buckets = bounds
+        self._series: Dict[_LabelKey, _HistogramSeries] = {}
+
+    def observe(self, value: float, **labels: object) -> None:
+        key = self._key(labels)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = _HistogramSeries(len(self.buckets))
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series.counts[index] += 1
+                    break
+            series.sum += value
+            series.count += 1
+
+    def snapshot(self, **labels: object) -> Dict[str, object]:
+        """Cumulative bucket counts, sum and count for one label set."""
+        with self._lock:
+            series = self._series.get(self._key(labels))
+            if series is None:
+                return {"buckets": {bound: 0 for bound in self.buckets}, "sum": 0.0, "count": 0}
+            cumulative, running = {}, 0
+            for bound, count in zip(self.buckets, series.counts):
+                running += count
+                cumulative[bound] = running
+            return {"buckets": cumulative, "sum": series.sum, "count": series.count}
+
+    def samples(self) -> List[str]:
+        with self._lock:
+            items = sorted(
+                (key, (list(series.counts), series.sum, series.count)) for key, series in self._series.items()
+            )
+        lines: List[str] = []
+        for key, (counts, total, count) in items:
+            running = 0
+            for bound, bucket_count in zip(self.buckets, counts):
+                running += bucket_count
+                lines.append(f"{self.name}_bucket{self._label_text(key, [('le', _format(bound))])} {running}")
+            lines.append(f"{self.name}_bucket{self._label_text(key, [('le', '+Inf')])} {count}")
+            lines.append(f"{self.name}_sum{self._label_text(key)} {_format(total)}")
+            lines.append(f"{self.name}_count{self._label_text(key)} {count}")
+        return lines
+
+
+# =============================================================================
+# Registry and export
+# =============================================================================
+
+
+class MetricsRegistry:
+    """Named instruments; registering an existing name returns the same one."""
+
+    def __init__(self) -> None:
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def counter(self, name: str, help: str, labels: Sequence[str] = ()) -> Counter:
+        return self._register(Counter, name, help, labels)
+
+    def gauge(self, name: str, help: str, labels: Sequence[str] = ()) -> Gauge:
+        return self._register(Gauge, name, help, labels)
+
+    def histogram(
+        self,
+        name: str,
+        help: str,
+        labels: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self._register(Histogram, name, help, labels, buckets=buckets)
+
+    def get(self, name: str) -> _Metric | None:
+        with self._lock:
+            return self._metrics.get(name)
+
+    def render(self) -> str:
+        """All instruments with at least one sample, in exposition format."""
+        with self._lock:
+            metrics = sorted(self._metrics.values(), key=lambda metric: metric.name)
+        blocks = [metric.render() for metric in metrics if metric.samples()]
+        return "\n".join(blocks) + "\n" if blocks else ""
+
+    def write_textfile(self, path: Path | str) -> Path:
+        """Write :meth:`render` output atomically (write, then rename)."""
+        target = Path(path)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        temporary = target.with_name(f".{target.name}.{os.getpid()}.tmp")
+        temporary.write_text(self.render(), encoding="utf-8")
+        os.replace(temporary, target)
+        return target
+
+    def _register(self, cls: type, name: str, help: str, labels: Sequence[str], **kwargs: object):
+        with self._lock:
+            existing = self._metrics.get(name)
+            if existing is not None:
+                if type(existing) is not cls or existing.label_names != tuple(labels):
+                    raise MetricsError(f"Metric {name} is already registered with a different type or labels")
+                return existing
+            metric = cls(name, help, labels, **kwargs)
+            self._metrics[name] = metric
+            return metric
+
+
+REGISTRY = MetricsRegistry()
+
+
+def export_textfile(path: Path | str | None = None, registry: MetricsRegistry | None = None) -> Path | None:
+    """Write ``registry`` to ``path`` or ``$SPECULUM_METRICS_FILE``; no-op if neither is set."""
+    target = path or os.environ.get(METRICS_FILE_ENV)
+    if not target:
+        return None
+    return (registry or REGISTRY).write_textfile(target)
+
+
+class MetricsServer:
+    """Serves a registry at ``/metrics`` from a background thread.
+
+    Binds to localhost by default; use port 0 to pick a free port.
+    """
+
+    def __init__(self, registry: MetricsRegistry | None = None, *, host: str = "127.0.0.1", port: int = 9464) -> None:
+        source = registry or REGISTRY
+
+        class _Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:  # noqa: N802 - http.server naming
+                if self.path.split("?", 1)[0] not in ("/metrics", "/"):
+                    self.send_error(404)
+                    return
+                body = source.render().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args: object) -> None:
+                pass
+
+        self._server = ThreadingHTTPServer((host, port), _Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(
+            target=self._server.serve_forever,
+            kwargs={"poll_interval": 0.2},
+            name="metrics-http",
+            daemon=True,
+        )
+        self._thread.start()
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/metrics"
+
+    def close(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join(timeout=5)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _escape_help(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("\n", "\\n")
+
+
+def _format(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value)) if abs(value) < 1e15 else repr(float(value))
+    return repr(float(value))
+
+
+# =============================================================================
+# Pipeline, LLM, GitHub and deployment instruments
+# =============================================================================
+
+PAGES_FETCHED = REGISTRY.counter(
+    "speculum_pages_fetched_total",
+    "Remote pages fetched with browser rendering, by outcome.",
+    labels=("outcome",),
+)
+RENDER_SECONDS = REGISTRY.histogram(
+    "speculum_render_seconds",
+    "Browser rendering latency per page.",
+    labels=("outcome",),
+    buckets=SLOW_BUCKETS,
+)
+LLM_TOKENS = REGISTRY.counter(
+    "speculum_llm_tokens_total",
+    "GitHub Models tokens by model and kind (prompt or completion).",
+    labels=("model", "kind"),
+)
+LLM_REQUEST_SECONDS = REGISTRY.histogram(
+    "speculum_llm_request_seconds",
+    "GitHub Models request latency (including retries) by model and outcome.",
+    labels=("model", "outcome"),
+    buckets=SLOW_BUCKETS,
+)
+GITHUB_REQUESTS = REGISTRY.counter(
+    "speculum_github_requests_total",
+    "GitHub REST and GraphQL requests by endpoint template and status.",
+    labels=("endpoint", "status"),
+)
+GITHUB_REQUEST_SECONDS = REGISTRY.histogram(
+    "speculum_github_request_seconds",
+    "GitHub REST and GraphQL request latency by endpoint template.",
+    labels=("endpoint",),
+)
+QUEUE_DEPTH = REGISTRY.gauge(
+    "speculum_agent_queue_depth",
+    "Missions waiting in the AgentDeployment queue, by priority.",
+    labels=("priority",),
+)
+ACTIVE_MISSIONS = REGISTRY.gauge(
+    "speculum_agent_active_missions",
+    "Missions currently executing in AgentDeployment workers.",
+)
+MISSIONS = REGISTRY.counter(
+    "speculum_agent_missions_total",
+    "Finished agent missions by mission type and status.",
+    labels=("mission_type", "status"),
+)
+MISSION_SECONDS = REGISTRY.histogram(
+    "speculum_agent_mission_seconds",
+    "Agent mission execution time by mission type.",
+    labels=("mission_type",),
+    buckets=SLOW_BUCKETS,
+)
+PIPELINE_RUN_SECONDS = REGISTRY.gauge(
+    "speculum_pipeline_run_duration_seconds",
+    "Duration of the most recent content pipeline run, by mode.",
+    labels=("mode",),
+)
+PIPELINE_LAST_RUN = REGISTRY.gauge(
+    "speculum_pipeline_last_run_timestamp_seconds",
+    "Completion time (epoch seconds) of the most recent pipeline run, by mode.",
+    labels=("mode",),
+)
+PIPELINE_SOURCES = REGISTRY.gauge(
+    "speculum_pipeline_sources",
+    "Sources per outcome in the most recent pipeline run.",
+    labels=("outcome",),
+)
+PIPELINE_PAGES = REGISTRY.gauge(
+    "speculum_pipeline_pages_acquired",
+    "Pages acquired by the most recent pipeline run.",
+)
+
+
+__all__ = [
+    "ACTIVE_MISSIONS",
+    "Counter",
+    "DEFAULT_BUCKETS",
+    "GITHUB_REQUESTS",
+    "GITHUB_REQUEST_SECONDS",
+    "Gauge",
+    "Histogram",
+    "LLM_REQUEST_SECONDS",
+    "LLM_TOKENS",
+    "METRICS_FILE_ENV",
+    "MISSIONS",
+    "MISSION_SECONDS",
+    "MetricsError",
+    "MetricsRegistry",
+    "MetricsServer",
+    "PAGES_FETCHED",
+    "PIPELINE_LAST_RUN",
+    "PIPELINE_PAGES",
+    "PIPELINE_RUN_SECONDS",
+    "PIPELINE_SOURCES",
+    "QUEUE_DEPTH",
+    "REGISTRY",
+    "RENDER_SECONDS",
+    "SLOW_BUCKETS",
+    "export_textfile",
+]
@@ -4,6 +4,7 @@ from .agent import AgentRuntime, AgentRuntimeError
 from .evaluation import SimpleMissionEvaluator, TriageMissionEvaluator
 from .missions import Mission
 from .planner import Planner
+from .results import ResultStore
 from .safety import ActionRisk, ApprovalDecision, SafetyValidator
 from .toolkit import register_github_read_only_tools, register_parsing_tools
 from .tools import ToolDefinition, ToolExecution, ToolRegistry
@@ -31,6 +32,7 @@ __all__ = [
 	"MissionOutcome",
 	"MissionStatus",
 	"Planner",
+	"ResultStore",
 	"SafetyValidator",
 	"SimpleMissionEvaluator",
 	"TriageMissionEvaluator",
@@ -2,12 +2,18 @@
 
 from __future__ import annotations
 
+import json
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Protocol, Sequence
 
+from src.tracing import bind, span
+
+from .memory import MissionCheckpoint, MissionMemory, idempotency_key
 from .missions import Mission
-from .safety import SafetyValidator
-from .tools import ToolDefinition, ToolExecution, ToolRegistry, ToolRegistryError
+from .safety import ActionRisk, ApprovalDecision, SafetyValidator
+from .tools import ToolDefinition, ToolExecution, ToolRegistry, ToolRegistryError, ToolResultCache
 from .types import (
     AgentState,
     AgentStep,
@@ -43,8 +49,83 @@ class AgentRuntimeError(RuntimeError):
     """Raised when the agent encounters an unrecoverable error."""
 
 
+class _MissionCheckpointer:
+    """Appends executed steps to a mission checkpoint as they complete.
+
+    Identical mutation calls are numbered in the order this attempt issues
+    them, so the n-th call only replays the n-th recorded result and a later
+    repeat of the same call runs again.
+    """
+
+    _INTERRUPTED = (
+        "An earlier attempt started this action but stopped before recording its result; "
+        "check whether it took effect before retrying."
+    )
+
+    def __init__(self, memory: MissionMemory, checkpoint: MissionCheckpoint) -> None:
+        self._memory = memory
+        self.execution_id = checkpoint.execution_id
+        self.restored_steps = checkpoint.steps
+        self._step_count = len(checkpoint.steps)
+        # Only mutations finished by an earlier attempt are replayed
+        self._completed = dict(checkpoint.completed_mutations)
+        self._interrupted = checkpoint.interrupted_mutations
+        self._occurrences: dict[tuple[str, str], int] = {}
+        # Key of the mutation in flight; mutations run one at a time
+        self._pending_key: str | None = None
+
+    def replay(self, tool_call: ToolCall) -> ToolResult | None:
+        """Claim the next occurrence of ``tool_call``; return its result if an earlier attempt settled it."""
+        signature = (tool_call.name, json.dumps(tool_call.arguments, sort_keys=True, default=str))
+        occurrence = self._occurrences.get(signature, 0) + 1
+        self._occurrences[signature] = occurrence
+        key = idempotency_key(tool_call, occurrence)
+        if key in self._completed:
+            self._pending_key = None
+            return self._completed[key]
+        if key in self._interrupted:
+            # Outcome unknown: surface it to the planner rather than running it blindly again
+            self._pending_key = None
+            return ToolResult(success=False, output=None, error=self._INTERRUPTED)
+        self._pending_key = key
+        return None
+
+    def begin(self) -> None:
+        """Persist the intent to run the claimed mutation before its handler is called."""
+        if self._pending_key is not None:
+            self._memory.begin_checkpoint_mutation(self.execution_id, self._pending_key)
+
+    def record(self, step: AgentStep, *, mutation: bool) -> None:
+        self._step_count += 1
+        key = self._pending_key if mutation else None
+        if mutation:
+            self._pending_key = None
+        self._memory.append_checkpoint_step(self.execution_id, self._step_count, step, idempotency_key=key)
+
+    def finish(self, status: MissionStatus) -> None:
+        self._memory.finish_checkpoint(self.execution_id, status)
+
+
 class AgentRuntime:
-    """Coordinates planner reasoning, tool execution, and safety checks."""
+    """Coordinates planner reasoning, tool execution, and safety checks.
+
+    Each mission gets its own :class:`ToolResultCache`, so repeated reads
+    (``cache_scope`` tools) are answered locally until a mutation touches
+    them. Set ``cache_reads=False`` to always call the handlers.
+
+    When the planner requests several tool calls in one turn, each becomes
+    its own step. Consecutive calls that both the safety validator and the
+    tool definition rate SAFE run concurrently on up to
+    ``max_parallel_tools`` threads; every other call runs alone, in the
+    order requested, after the reads before it have finished.
+
+    With a ``checkpoints`` store, every step is persisted as it completes.
+    Passing the same ``execution_id`` to :meth:`execute_mission` later resumes
+    from the stored steps. A mutation that already succeeded with the same
+    arguments is not executed again: its recorded result is reused, once per
+    recorded occurrence. A mutation that was started but never recorded is
+    reported to the planner as interrupted instead of being re-run.
+    """
 
     def __init__(
         self,
@@ -53,30 +134,69 @@ class AgentRuntime:
         tools: ToolRegistry,
         safety: SafetyValidator,
         evaluator: MissionEvaluator,
+        cache_reads: bool = True,
+        max_parallel_tools: int = 4,
+        checkpoints: MissionMemory | None = None,
     ) -> None:
         self._planner = planner
         self._tools = tools
         self._safety = safety
         self._evaluator = evaluator
+        self._cache_reads = cache_reads
+        self._max_parallel_tools = max_parallel_tools
+        self._checkpoints = checkpoints
 
-    def execute_mission(self, mission: Mission, context: ExecutionContext) -> MissionOutcome:
-        """Run the agent loop until the mission completes or fails."""
+    @property
+    def planner(self) -> Planner:
+        return self._planner
 
-        state = AgentState(mission=mission, context=context)
-        steps: list[AgentStep] = []
+    def execute_mission(
+        self,
+        mission: Mission,
+        context: ExecutionContext,
+        *,
+        execution_id: str | None = None,
+    ) -> MissionOutcome:
+        """Run the agent loop until the mission completes or fails.
 
-        for _ in range(mission.max_steps):
-            thought = self._planner.plan_next(state)
+        Args:
+            mission: Mission to execute.
+            context: Inputs for the mission.
+            execution_id: Checkpoint to resume (or create, if unknown). A new
+                one is generated when checkpointing is enabled and none is given.
+        """
+        with span("agent.mission", mission=mission.id) as current:
+            outcome = self._run_mission(mission, context, execution_id)
+            current.set(status=outcome.status.value, steps=len(outcome.steps))
+            return outcome
+
+    def _run_mission(
+        self,
+        mission: Mission,
+        context: ExecutionContext,
+        execution_id: str | None,
+    ) -> MissionOutcome:
+        checkpoint = self._open_checkpoint(mission, context, execution_id)
+        steps = list(checkpoint.restored_steps) if checkpoint is not None else []
+        state = AgentState(mission=mission, context=context, steps=tuple(steps))
+        cache = ToolResultCache() if self._cache_reads else None
+
+        while len(steps) < mission.max_steps:
+            with span("agent.plan", step=len(steps) + 1):
+                thought = self._planner.plan_next(state)
             if thought.type is ThoughtType.FINISH:
-                return self._complete_with_evaluation(mission, steps, context, thought)
+                return self._complete_with_evaluation(mission, steps, context, thought, cache, checkpoint)
             if thought.tool_call is None:
                 raise AgentRuntimeError("Planner produced an action thought without a tool call.")
-            step, blocked_reason = self._execute_tool_thought(mission, context, thought)
-            steps.append(step)
+            turn_steps, blocked_reason = self._execute_turn(
+                mission, context, thought, cache, budget=mission.max_steps - len(steps), checkpoint=checkpoint
+            )
+            steps.extend(turn_steps)
+            for step in turn_steps:
+                state = state.with_step(step)
             if blocked_reason is not None:
                 summary = blocked_reason or "Action blocked by safety validator."
-                return MissionOutcome(status=MissionStatus.BLOCKED, steps=tuple(steps), summary=summary)
-            state = state.with_step(step)
+                return self._outcome(MissionStatus.BLOCKED, steps, summary, cache, checkpoint)
             # NOTE: Mid-loop evaluation removed to support autonomous LLM planners.
             # The planner decides when to finish via FINISH thoughts. The evaluator
             # only validates success AFTER the planner indicates completion.
@@ -84,7 +204,7 @@ class AgentRuntime:
         evaluation = self._evaluator.evaluate(mission, steps, context)
         status = MissionStatus.SUCCEEDED if evaluation.complete else MissionStatus.FAILED
         summary = evaluation.reason or "Mission reached maximum allowed steps."
-        return MissionOutcome(status=status, steps=tuple(steps), summary=summary)
+        return self._outcome(status, steps, summary, cache, checkpoint)
 
     def _complete_with_evaluation(
         self,
@@ -92,28 +212,201 @@ class AgentRuntime:
         steps: Sequence[AgentStep],
         context: ExecutionContext,
         thought: Thought,
+        cache: ToolResultCache | None = None,
+        checkpoint: _MissionCheckpointer | None = None,
     ) -> MissionOutcome:
         evaluation = self._evaluator.evaluate(mission, steps, context)
         status = MissionStatus.SUCCEEDED if evaluation.complete else MissionStatus.FAILED
         summary = evaluation.reason or thought.content
-        return MissionOutcome(status=status, steps=tuple(steps), summary=summary)
+        return self._outcome(status, steps, summary, cache, checkpoint)
+
+    def _outcome(
+        self,
+        status: MissionStatus,
+        steps: Sequence[AgentStep],
+        summary: str | None,
+        cache: ToolResultCache | None,
+        checkpoint: _MissionCheckpointer | None,
+    ) -> MissionOutcome:
+        if checkpoint is not None:
+            checkpoint.finish(status)
+        return MissionOutcome(
+            status=status,
+            steps=tuple(steps),
+            summary=summary,
+            tool_cache=cache.stats() if cache is not None else None,
+            execution_id=checkpoint.execution_id if checkpoint is not None else None,
+        )
+
+    def _open_checkpoint(
+        self, mission: Mission, context: ExecutionContext, execution_id: str | None
+    ) -> _MissionCheckpointer | None:
+        if self._checkpoints is None:
+            if execution_id is not None:
+                raise AgentRuntimeError("Resuming an execution requires a checkpoint store.")
+            return None
+        stored = self._checkpoints.start_checkpoint(execution_id or uuid.uuid4().hex, mission, context)
+        if stored.mission_id != mission.id:
+            raise AgentRuntimeError(
+                f"Checkpoint '{stored.execution_id}' belongs to mission '{stored.mission_id}', not '{mission.id}'."
+            )
+        return _MissionCheckpointer(self._checkpoints, stored)
+
+    def _record_step(self, checkpoint: _MissionCheckpointer | None, step: AgentStep) -> None:
+        if checkpoint is None:
+            return
+        tool_call = step.thought.tool_call
+        checkpoint.record(step, mutation=tool_call is not None and not self._is_read_only(tool_call))
+
+    def _execute_turn(
+        self,
+        mission: Mission,
+        context: ExecutionContext,
+        thought: Thought,
+        cache: ToolResultCache | None,
+        *,
+        budget: int,
+        checkpoint: _MissionCheckpointer | None = None,
+    ) -> tuple[list[AgentStep], str | None]:
+        """Run every tool call of ``thought`` (up to ``budget``), one step each.
+
+        Each step is checkpointed as soon as it completes.
+        """
+        calls = thought.tool_calls[:budget]
+        if len(calls) == 1:
+            step, blocked_reason = self._execute_tool_thought(mission, context, thought, cache, checkpoint)
+            self._record_step(checkpoint, step)
+            return [step], blocked_reason
+
+        steps: list[AgentStep] = []
+
+        def run_reads(group: Sequence[Thought]) -> str | None:
+            read_steps, blocked_reason = self._execute_reads(mission, context, group, cache)
+            for step in read_steps:
+                self._record_step(checkpoint, step)
+            steps.extend(read_steps)
+            return blocked_reason
+
+        reads: list[Thought] = []
+        for call in calls:
+            call_thought = Thought(content=thought.content, type=ThoughtType.ACTION, tool_call=call)
+            if self._is_read_only(call):
+                reads.append(call_thought)
+                continue
+            blocked_reason = run_reads(reads)
+            if blocked_reason is not None:
+                return steps, blocked_reason
+            reads = []
+            step, blocked_reason = self._execute_tool_thought(mission, context, call_thought, cache, checkpoint)
+            self._record_step(checkpoint, step)
+            steps.append(step)
+            if blocked_reason is not None:
+                return steps, blocked_reason
+        return steps, run_reads(reads)
+
+    def _is_read_only(self, tool_call: ToolCall) -> bool:
+        if tool_call.name not in self._tools:
+            return False
+        definition = self._tools.get_tool(tool_call.name)
+        return (
+            definition.risk_level is ActionRisk.SAFE
+            and self._safety.classify(tool_call.name) is ActionRisk.SAFE
+        )
+
+    def _execute_reads(
+        self,
+        mission: Mission,
+        context: ExecutionContext,
+        thoughts: Sequence[Thought],
+        cache: ToolResultCache | None,
+    ) -> tuple[list[AgentStep], str | None]:
+        """Run read-only tool thoughts concurrently; steps keep the requested order.
+
+        Approval, cache lookups and audit logging stay on the calling thread;
+        only the handlers run on the pool. A blocked read ends the group: the
+        reads approved before it still run, the ones after it do not.
+        """
+        steps: list[AgentStep] = []
+        if len(thoughts) <= 1 or self._max_parallel_tools <= 1:
+            for thought in thoughts:
+                step, blocked_reason = self._execute_tool_thought(mission, context, thought, cache)
+                steps.append(step)
+                if blocked_reason is not None:
+                    return steps, blocked_reason
+            return steps, None
+
+        prepared: list[tuple[Thought, ToolDefinition, ApprovalDecision, ToolResult | None]] = []
+        blocked: tuple[AgentStep, str | None] | None = None
+        for thought in thoughts:
+            tool_call = thought.tool_calls[0]
+            if not mission.is_tool_allowed(tool_call.name):
+                raise AgentRuntimeError(f"Tool '{tool_call.name}' is not permitted for mission '{mission.id}'.")
+            decision = self._safety.check_action(tool_call, mission, context)
+            if not decision.approved:
+                blocked = (self._blocked_step(thought, decision.reason), decision.reason)
+                break
+            definition = self._tools.get_tool(tool_call.name)
+            cached = cache.get(definition, tool_call.arguments) if cache is not None else None
+            prepared.append((thought, definition, decision, cached))
+
+        futures = {}
+        to_run = [(thought, definition) for thought, definition, _, cached in prepared if cached is None]
+        if to_run:
+            with ThreadPoolExecutor(
+                max_workers=min(self._max_parallel_tools, len(to_run)),
+                thread_name_prefix="agent-tool",
+            ) as pool:
+                run = bind(self._execute_tool_definition)
+                futures = {
+                    id(thought): pool.submit(run, definition, thought.tool_calls[0])
+                    for thought, definition in to_run
+                }
+
+        for thought, definition, decision, cached in prepared:
+            tool_call = thought.tool_calls[0]
+            result = cached
+            if result is None:
+                result = futures[id(thought)].result()
+                if cache is not None:
+                    cache.record(definition, tool_call.arguments, result)
+            self._safety.audit_log(
+                ToolExecution(definition=definition, arguments=tool_call.arguments, result=result, risk=decision.risk)
+            )
+            steps.append(AgentStep(thought=thought, result=result))
+        if blocked is not None:
+            steps.append(blocked[0])
+            return steps, blocked[1]
+        return steps, None
 
     def _execute_tool_thought(
         self,
         mission: Mission,
         context: ExecutionContext,
         thought: Thought,
+        cache: ToolResultCache | None = None,
+        checkpoint: _MissionCheckpointer | None = None,
     ) -> tuple[AgentStep, str | None]:
         tool_call = thought.tool_call
         if tool_call is None:  # pragma: no cover - defensive guard
             raise AgentRuntimeError("Tool execution requested without tool call data.")
         if not mission.is_tool_allowed(tool_call.name):
             raise AgentRuntimeError(f"Tool '{tool_call.name}' is not permitted for mission '{mission.id}'.")
+        if checkpoint is not None and not self._is_read_only(tool_call):
+            replayed = checkpoint.replay(tool_call)
+            if replayed is not None:
+                # Settled by an earlier attempt of this execution; do not repeat it
+                return AgentStep(thought=thought, result=replayed), None
         decision = self._safety.check_action(tool_call, mission, context)
         if not decision.approved:
             return self._blocked_step(thought, decision.reason), decision.reason
+        if checkpoint is not None and not self._is_read_only(tool_call):
+            checkpoint.begin()
         definition = self._tools.get_tool(tool_call.name)
-        result = self._execute_tool_definition(definition, tool_call)
+        result = cache.get(definition, tool_call.arguments) if cache is not None else None
+        if result is None:
+            result = self._execute_tool_definition(definition, tool_call)
+            if cache is not None:
+                cache.record(definition, tool_call.arguments, result)
         execution = ToolExecution(
             definition=definition,
             arguments=tool_call.arguments,
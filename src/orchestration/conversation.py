@@ -0,0 +1,248 @@
+"""Incremental, token-budgeted chat history for the LLM planner.
+
+The planner sends the whole mission history on every turn. Serializing each
+historical tool output again on every turn costs CPU, and resending large
+outputs in full costs prompt tokens; both grow quadratically with mission
+length. :class:`ConversationBuilder` serializes each step once and fits the
+history into a token budget by compacting older tool outputs to a preview.
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from typing import Any, Dict, List, Sequence
+
+from .types import AgentState, AgentStep
+
+# Same rough ratio the Models quota broker uses for request sizing
+CHARS_PER_TOKEN = 4
+DEFAULT_TOKEN_BUDGET = 24_000
+DEFAULT_KEEP_RECENT = 4
+DEFAULT_PREVIEW_CHARS = 400
+PROGRESS_PREVIEW_CHARS = 200
+
+
+def estimate_tokens(text: str) -> int:
+    """Approximate the prompt tokens taken by ``text``."""
+    return len(text) // CHARS_PER_TOKEN + 1
+
+
+def message_tokens(message: Dict[str, Any]) -> int:
+    """Approximate the prompt tokens taken by one chat message."""
+    tokens = estimate_tokens(str(message.get("content") or ""))
+    for call in message.get("tool_calls") or ():
+        function = call["function"]
+        tokens += estimate_tokens(function["name"]) + estimate_tokens(function["arguments"])
+    return tokens
+
+
+@dataclass(frozen=True)
+class _StepMessages:
+    """Serialized chat messages for one executed step."""
+
+    step: AgentStep
+    full: tuple[Dict[str, Any], ...]
+    full_tokens: int
+    compact: tuple[Dict[str, Any], ...]
+    compact_tokens: int
+    progress: tuple[str, ...]
+
+
+class ConversationBuilder:
+    """Builds the planner's message list, reusing per-step serialization.
+
+    Steps are serialized the first time they are seen and cached by position.
+    A new mission run (or a history that no longer matches) resets the cache.
+    When the history exceeds ``token_budget``, tool outputs older than the
+    ``keep_recent`` latest steps are cut to ``preview_chars`` characters,
+    oldest first. If that is still not enough, the oldest steps are left out
+    and replaced by a short note.
+    """
+
+    def __init__(
+        self,
+        *,
+        token_budget: int = DEFAULT_TOKEN_BUDGET,
+        keep_recent: int = DEFAULT_KEEP_RECENT,
+        preview_chars: int = DEFAULT_PREVIEW_CHARS,
+    ) -> None:
+        self._token_budget = token_budget
+        self._keep_recent = keep_recent
+        self._preview_chars = preview_chars
+        self._steps: List[_StepMessages] = []
+
+    @property
+    def token_budget(self) -> int:
+        return self._token_budget
+
+    def reset(self) -> None:
+        """Forget all cached steps."""
+        self._steps = []
+
+    def progress_lines(self, state: AgentState) -> List[str]:
+        """Short per-step progress notes for the user prompt."""
+        self._sync(state.steps)
+        return [line for cached in self._steps for line in cached.progress]
+
+    def build(
+        self,
+        system_prompt: str,
+        state: AgentState,
+        user_message: Dict[str, Any],
+    ) -> List[Dict[str, Any]]:
+        """Return the message list for the next planner call."""
+        messages: List[Dict[str, Any]] = [{"role": "system", "content": system_prompt}]
+        if not state.steps:
+            messages.append(user_message)
+            return messages
+
+        self._sync(state.steps)
+        opening = {"role": "user", "content": _opening_prompt(state)}
+        fixed = message_tokens(messages[0]) + message_tokens(opening) + message_tokens(user_message)
+        compact, omitted = self._fit(self._token_budget - fixed)
+
+        messages.append(opening)
+        if omitted:
+            messages.append({
+                "role": "user",
+                "content": (
+                    f"({omitted} earlier step(s) omitted to stay within the prompt budget; "
+                    "see the progress summary below.)"
+                ),
+            })
+        for index, cached in enumerate(self._steps):
+            if index < omitted:
+                continue
+            messages.extend(cached.compact if index < compact else cached.full)
+        messages.append(user_message)
+        return messages
+
+    # ========================================================================
+    # Internals
+    # ========================================================================
+
+    def _sync(self, steps: Sequence[AgentStep]) -> None:
+        """Serialize steps not seen yet; start over if the history diverged."""
+        if len(steps) < len(self._steps) or any(
+            cached.step is not step for cached, step in zip(self._steps, steps)
+        ):
+            self._steps = []
+        for index in range(len(self._steps), len(steps)):
+            self._steps.append(self._serialize(index + 1, steps[index]))
+
+    def _fit(self, available: int) -> tuple[int, int]:
+        """Pick how many leading steps to compact and to omit.
+
+        Returns ``(compact, omitted)``: steps before index ``compact`` use
+        their compact form, and steps before ``omitted`` are left out.
+        """
+        total = sum(cached.full_tokens for cached in self._steps)
+        limit = max(len(self._steps) - self._keep_recent, 0)
+        compact = 0
+        while total > available and compact < limit:
+            cached = self._steps[compact]
+            total -= cached.full_tokens - cached.compact_tokens
+            compact += 1
+        omitted = 0
+        while total > available and omitted < limit:
+            total -= self._steps[omitted].compact_tokens
+            omitted += 1
+        return compact, omitted
+
+    def _serialize(self, index: int, step: AgentStep) -> _StepMessages:
+        thought = step.thought
+        result = step.result
+        tool_call_id: str | None = None
+
+        if thought.tool_call:
+            tool_call_id = f"call_{index}"
+            assistant: Dict[str, Any] = {
+                "role": "assistant",
+                "tool_calls": [{
+                    "id": tool_call_id,
+                    "type": "function",
+                    "function": {
+                        "name": thought.tool_call.name,
+                        "arguments": json.dumps(thought.tool_call.arguments),
+                    },
+                }],
+            }
+            if thought.content:
+                assistant["content"] = thought.content
+        else:
+            assistant = {"role": "assistant", "content": thought.content or "Continuing mission."}
+
+        full: List[Dict[str, Any]] = [assistant]
+        compact: List[Dict[str, Any]] = [assistant]
+        tool_output: str | None = None
+        if result:
+            if result.success:
+                if result.output is not None:
+                    try:
+                        tool_output = json.dumps(result.output, default=str)
+                    except TypeError:
+                        tool_output = str(result.output)
+                else:
+                    tool_output = "Success"
+            else:
+                tool_output = result.error or "Error executing tool"
+
+            full.append(_tool_message(tool_output, tool_call_id))
+            compact.append(_tool_message(self._preview(tool_output), tool_call_id))
+
+        return _StepMessages(
+            step=step,
+            full=tuple(full),
+            full_tokens=sum(message_tokens(message) for message in full),
+            compact=tuple(compact),
+            compact_tokens=sum(message_tokens(message) for message in compact),
+            progress=_progress_lines(index, step),
+        )
+
+    def _preview(self, tool_output: str) -> str:
+        if len(tool_output) <= self._preview_chars:
+            return tool_output
+        return (
+            f"{tool_output[:self._preview_chars]}... "
+            f"[{len(tool_output) - self._preview_chars} more characters omitted]"
+        )
+
+
+def _opening_prompt(state: AgentState) -> str:
+    inputs_str = json.dumps(state.context.inputs, indent=2) if state.context.inputs else "{}"
+    return f"Begin mission. Inputs:\n{inputs_str}\n\nWhat's your first action?"
+
+
+def _tool_message(content: str, tool_call_id: str | None) -> Dict[str, Any]:
+    message: Dict[str, Any] = {"role": "tool", "content": content}
+    if tool_call_id is not None:
+        message["tool_call_id"] = tool_call_id
+    return message
+
+
+def _progress_lines(index: int, step: AgentStep) -> tuple[str, ...]:
+    thought = step.thought
+    result = step.result
+    if thought.tool_call:
+        action_desc = f"Step {index}: Called {thought.tool_call.name}"
+        if thought.content and thought.content != f"Calling {thought.tool_call.name}":
+            action_desc = f"{action_desc} ({thought.content})"
+    else:
+        action_desc = f"Step {index}: {thought.content}"
+
+    lines = [action_desc]
+    if result:
+        if result.success:
+            if result.output:
+                output = str(result.output)
+                output_preview = output[:PROGRESS_PREVIEW_CHARS]
+                if len(output) > PROGRESS_PREVIEW_CHARS:
+                    output_preview += "..."
+                lines.append(f"  Result: {output_preview}")
+            else:
+                lines.append("  Result: Success")
+        else:
+            error_msg = result.error or "Unknown error"
+            lines.append(f"  Error: {error_msg}")
+    return tuple(lines)
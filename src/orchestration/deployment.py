@@ -6,13 +6,15 @@ import json
 import signal
 import sys
 import time
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
 from pathlib import Path
-from queue import PriorityQueue, Empty
-from threading import Event, Lock
-from typing import Any, Callable, Sequence
+from threading import Condition, Event, Lock, Thread, get_ident
+from typing import Any, Callable, Deque, Mapping, Sequence
+
+from src.metrics import ACTIVE_MISSIONS, QUEUE_DEPTH, MetricsServer
 
 from .agent import AgentRuntime, MissionEvaluator
 from .missions import Mission
@@ -57,6 +59,8 @@ class CircuitBreaker:
     _state: CircuitBreakerState = field(default=CircuitBreakerState.CLOSED, init=False)
     _failure_count: int = field(default=0, init=False)
     _last_failure_time: float | None = field(default=None, init=False)
+    # Thread running the single HALF_OPEN probe, if one was admitted
+    _probe_owner: int | None = field(default=None, init=False)
     _lock: Lock = field(default_factory=Lock, init=False)
 
     @property
@@ -70,10 +74,12 @@ class CircuitBreaker:
         with self._lock:
             self._failure_count = 0
             self._state = CircuitBreakerState.CLOSED
+            self._probe_owner = None
 
     def record_failure(self) -> None:
         """Record failed execution."""
         with self._lock:
+            self._probe_owner = None
             self._failure_count += 1
             self._last_failure_time = time.time()
 
@@ -85,7 +91,11 @@ class CircuitBreaker:
                 )
 
     def can_execute(self) -> bool:
-        """Check if execution is allowed."""
+        """Check if execution is allowed.
+
+        In HALF_OPEN only one caller is admitted as the probe until its
+        outcome is recorded or it calls :meth:`release_probe`.
+        """
         with self._lock:
             if self._state == CircuitBreakerState.CLOSED:
                 return True
@@ -98,36 +108,224 @@ class CircuitBreaker:
                 elapsed = time.time() - self._last_failure_time
                 if elapsed >= self.recovery_timeout:
                     self._state = CircuitBreakerState.HALF_OPEN
+                    self._probe_owner = get_ident()
                     print("Circuit breaker HALF_OPEN - testing recovery", file=sys.stderr)
                     return True
                 return False
 
-            # HALF_OPEN state allows one test execution
+            # HALF_OPEN state allows one test execution at a time
+            if self._probe_owner is not None:
+                return False
+            self._probe_owner = get_ident()
             return True
 
+    def release_probe(self) -> None:
+        """Give back the HALF_OPEN probe slot if this thread holds it unused."""
+        with self._lock:
+            if self._probe_owner == get_ident():
+                self._probe_owner = None
+
     def reset(self) -> None:
         """Manually reset the circuit breaker."""
         with self._lock:
             self._failure_count = 0
             self._state = CircuitBreakerState.CLOSED
             self._last_failure_time = None
+            self._probe_owner = None
+
+
+DEFAULT_PRIORITY_WEIGHTS: Mapping[MissionPriority, int] = {
+    MissionPriority.CRITICAL: 8,
+    MissionPriority.HIGH: 4,
+    MissionPriority.NORMAL: 2,
+    MissionPriority.LOW: 1,
+}
+
+
+@dataclass
+class _LatencyStats:
+    """Running count, total and maximum of observed durations."""
+
+    count: int = 0
+    total: float = 0.0
+    maximum: float = 0.0
+
+    def observe(self, seconds: float) -> None:
+        self.count += 1
+        self.total += seconds
+        self.maximum = max(self.maximum, seconds)
+
+    def as_dict(self) -> dict[str, float]:
+        return {
+            "count": self.count,
+            "avg_seconds": self.total / self.count if self.count else 0.0,
+            "max_seconds": self.maximum,
+        }
+
+
+class MissionQueue:
+    """Bounded mission queue with one FIFO per priority.
+
+    ``get`` picks a priority by smooth weighted round-robin over the
+    non-empty queues, so lower priorities still progress under load. Within a
+    priority, the oldest mission whose type (``mission.id``) is below its
+    concurrency cap is taken; callers release the slot with ``task_done``.
+    ``put`` blocks while the queue is full, up to ``timeout``.
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        *,
+        weights: Mapping[MissionPriority, int] | None = None,
+        type_limits: Mapping[str, int] | None = None,
+    ) -> None:
+        self.maxsize = maxsize
+        self._weights = dict(weights or DEFAULT_PRIORITY_WEIGHTS)
+        self._type_limits = dict(type_limits or {})
+        self._queues: dict[MissionPriority, Deque[QueuedMission]] = {
+            priority: deque() for priority in MissionPriority
+        }
+        self._credit = {priority: 0 for priority in MissionPriority}
+        self._active: dict[str, int] = {}
+        self._waits = {priority: _LatencyStats() for priority in MissionPriority}
+        self._size = 0
+        self._condition = Condition()
+
+    def qsize(self) -> int:
+        with self._condition:
+            return self._size
+
+    def depths(self) -> dict[str, int]:
+        """Queued missions per priority name."""
+        with self._condition:
+            return {priority.name: len(queue) for priority, queue in self._queues.items()}
+
+    def wait_latency(self) -> dict[str, dict[str, float]]:
+        """Time missions spent queued before a worker took them, per priority."""
+        with self._condition:
+            return {priority.name: stats.as_dict() for priority, stats in self._waits.items()}
+
+    def put(self, queued: QueuedMission, timeout: float | None = 0.0) -> bool:
+        """Add a mission, waiting up to ``timeout`` seconds for room.
+
+        ``timeout=0`` rejects immediately when full; ``None`` waits
+        indefinitely. Returns False if the queue stayed full.
+        """
+        with self._condition:
+            if not self._condition.wait_for(lambda: self._size < self.maxsize, timeout=timeout):
+                return False
+            self._queues[MissionPriority(queued.priority)].append(queued)
+            self._size += 1
+            self._condition.notify_all()
+            return True
+
+    def get(self, timeout: float | None = None) -> QueuedMission | None:
+        """Take the next runnable mission, or None if none became runnable in time."""
+        with self._condition:
+            selected: list[QueuedMission] = []
+
+            def runnable() -> bool:
+                queued = self._select()
+                if queued is not None:
+                    selected.append(queued)
+                return queued is not None
+
+            if not self._condition.wait_for(runnable, timeout=timeout):
+                return None
+            queued = selected[0]
+            mission_type = queued.mission.id
+            self._active[mission_type] = self._active.get(mission_type, 0) + 1
+            self._size -= 1
+            self._waits[MissionPriority(queued.priority)].observe(max(time.time() - queued.timestamp, 0.0))
+            self._condition.notify_all()
+            return queued
+
+    def task_done(self, queued: QueuedMission) -> None:
+        """Release the concurrency slot held by a mission taken with ``get``."""
+        with self._condition:
+            mission_type = queued.mission.id
+            remaining = self._active.get(mission_type, 0) - 1
+            if remaining > 0:
+                self._active[mission_type] = remaining
+            else:
+                self._active.pop(mission_type, None)
+            self._condition.notify_all()
+
+    def _runnable_index(self, queue: Deque[QueuedMission]) -> int | None:
+        for index, queued in enumerate(queue):
+            limit = self._type_limits.get(queued.mission.id)
+            if limit is None or self._active.get(queued.mission.id, 0) < limit:
+                return index
+        return None
+
+    def _select(self) -> QueuedMission | None:
+        candidates = {}
+        for priority, queue in self._queues.items():
+            index = self._runnable_index(queue)
+            if index is not None:
+                candidates[priority] = index
+        if not candidates:
+            return None
+        total = 0
+        for priority in candidates:
+            weight = self._weights.get(priority, 1)
+            self._credit[priority] += weight
+            total += weight
+        chosen = max(candidates, key=lambda priority: (self._credit[priority], -priority.value))
+        self._credit[chosen] -= total
+        queue = self._queues[chosen]
+        queued = queue[candidates[chosen]]
+        del queue[candidates[chosen]]
+        return queued
 
 
 @dataclass
 class AgentDeployment:
-    """Manages continuous agent operation with queue and health checks."""
+    """Manages continuous agent operation with queue and health checks.
+
+    ``workers`` threads execute missions concurrently. Planners keep
+    per-mission state, so every worker beyond the first gets its own runtime
+    from ``runtime_factory``. ``type_concurrency`` caps how many missions of
+    one type (``mission.id``) run at once, and ``enqueue_timeout`` makes
+    ``enqueue_mission`` wait for room instead of rejecting immediately.
+    With ``metrics_port`` set, ``run_continuously`` serves the process
+    metrics (queue depth, active missions, mission outcomes, LLM and GitHub
+    usage) at ``http://<metrics_host>:<metrics_port>/metrics``.
+    """
 
     runtime: AgentRuntime
     monitor: AgentMonitor
     max_queue_size: int = 100
     health_check_interval: int = 60  # seconds
-    _queue: PriorityQueue = field(default_factory=PriorityQueue, init=False)
+    workers: int = 1
+    runtime_factory: Callable[[], AgentRuntime] | None = None
+    priority_weights: Mapping[MissionPriority, int] | None = None
+    type_concurrency: Mapping[str, int] = field(default_factory=dict)
+    enqueue_timeout: float | None = 0.0
+    metrics_port: int | None = None
+    metrics_host: str = "127.0.0.1"
+    _queue: MissionQueue = field(init=False)
     _circuit_breaker: CircuitBreaker = field(default_factory=CircuitBreaker, init=False)
     _shutdown_event: Event = field(default_factory=Event, init=False)
     _running: bool = field(default=False, init=False)
+    _active_count: int = field(default=0, init=False)
+    _run_latency: dict[str, _LatencyStats] = field(default_factory=dict, init=False)
+    _stats_lock: Lock = field(default_factory=Lock, init=False)
+    _monitor_lock: Lock = field(default_factory=Lock, init=False)
+    _metrics_server: MetricsServer | None = field(default=None, init=False)
 
     def __post_init__(self) -> None:
-        """Initialize shutdown signal handlers."""
+        """Create the mission queue and install shutdown signal handlers."""
+        if self.workers < 1:
+            raise ValueError("workers must be at least 1")
+        if self.workers > 1 and self.runtime_factory is None:
+            raise ValueError("runtime_factory is required when running more than one worker")
+        self._queue = MissionQueue(
+            self.max_queue_size,
+            weights=self.priority_weights,
+            type_limits=self.type_concurrency,
+        )
         signal.signal(signal.SIGTERM, self._handle_shutdown)
         signal.signal(signal.SIGINT, self._handle_shutdown)
 
@@ -142,6 +340,7 @@ class AgentDeployment:
         context: ExecutionContext,
         priority: MissionPriority = MissionPriority.NORMAL,
         mission_id: str | None = None,
+        timeout: float | None = None,
     ) -> bool:
         """Add a mission to the execution queue.
 
@@ -150,17 +349,12 @@ class AgentDeployment:
             context: Execution context
             priority: Mission priority level
             mission_id: Optional mission ID (generated if not provided)
+            timeout: Seconds to wait for room while the queue is full
+                (defaults to ``enqueue_timeout``; ``None`` there waits forever)
 
         Returns:
-            True if enqueued, False if queue is full
+            True if enqueued, False if queue stayed full
         """
-        if self._queue.qsize() >= self.max_queue_size:
-            print(
-                f"warning: Queue full ({self.max_queue_size}), mission rejected",
-                file=sys.stderr,
-            )
-            return False
-
         if mission_id is None:
             mission_id = f"{mission.id}_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}"
 
@@ -172,69 +366,100 @@ class AgentDeployment:
             mission_id=mission_id,
         )
 
-        self._queue.put(queued)
+        wait = self.enqueue_timeout if timeout is None else timeout
+        if not self._queue.put(queued, timeout=wait):
+            print(
+                f"warning: Queue full ({self.max_queue_size}), mission rejected",
+                file=sys.stderr,
+            )
+            return False
+        self._publish_queue_depths()
         return True
 
+    def _publish_queue_depths(self) -> None:
+        """Copy the per-priority queue depths into the metrics gauge."""
+        for name, depth in self._queue.depths().items():
+            QUEUE_DEPTH.set(depth, priority=name.lower())
+
     def run_continuously(self) -> None:
         """Execute missions from the queue continuously until shutdown."""
         self._running = True
         print("Agent deployment started - processing missions continuously")
         print(f"Queue size limit: {self.max_queue_size}")
+        print(f"Workers: {self.workers}")
         print(f"Health check interval: {self.health_check_interval}s")
+        if self.metrics_port is not None:
+            self._metrics_server = MetricsServer(host=self.metrics_host, port=self.metrics_port)
+            print(f"Metrics: {self._metrics_server.url}")
         print("Press Ctrl+C to initiate graceful shutdown\n")
+        self._publish_queue_depths()
+
+        threads = [
+            Thread(
+                target=self._worker_loop,
+                args=(self.runtime if index == 0 else self.runtime_factory(),),  # type: ignore[misc]
+                name=f"agent-worker-{index}",
+                daemon=True,
+            )
+            for index in range(self.workers)
+        ]
+        for thread in threads:
+            thread.start()
+
+        while not self._shutdown_event.wait(self.health_check_interval):
+            self._perform_health_check()
+
+        print("\nGraceful shutdown initiated - waiting for running missions to complete")
+        for thread in threads:
+            thread.join()
+        if self._metrics_server is not None:
+            self._metrics_server.close()
+            self._metrics_server = None
+        self._running = False
+        print("Agent deployment stopped cleanly")
 
-        last_health_check = time.time()
-
+    def _worker_loop(self, runtime: AgentRuntime) -> None:
+        """Take missions until shutdown; missions stay queued while the breaker is open."""
         while not self._shutdown_event.is_set():
-            # Periodic health check
-            if time.time() - last_health_check >= self.health_check_interval:
-                self._perform_health_check()
-                last_health_check = time.time()
-
-            # Try to get a mission from queue
-            try:
-                queued = self._queue.get(timeout=1.0)
-            except Empty:
-                continue
-
-            # Check circuit breaker
             if not self._circuit_breaker.can_execute():
-                print(
-                    f"Circuit breaker {self._circuit_breaker.state.value} - "
-                    f"requeueing mission {queued.mission_id}",
-                    file=sys.stderr,
-                )
-                # Requeue with delay
-                time.sleep(5)
-                self._queue.put(queued)
+                self._shutdown_event.wait(1.0)
                 continue
+            queued = self._queue.get(timeout=1.0)
+            if queued is None:
+                # Nothing to probe with; let another worker take the slot
+                self._circuit_breaker.release_probe()
+                continue
+            self._publish_queue_depths()
+            try:
+                self._execute_queued_mission(queued, runtime)
+            finally:
+                self._queue.task_done(queued)
 
-            # Execute mission
-            self._execute_queued_mission(queued)
-
-        print("\nGraceful shutdown initiated - waiting for current mission to complete")
-        self._running = False
-        print("Agent deployment stopped cleanly")
-
-    def _execute_queued_mission(self, queued: QueuedMission) -> None:
+    def _execute_queued_mission(self, queued: QueuedMission, runtime: AgentRuntime | None = None) -> None:
         """Execute a queued mission and handle the outcome."""
+        runtime = runtime or self.runtime
         print(f"[{datetime.utcnow().isoformat()}] Executing: {queued.mission_id}")
         print(f"  Priority: {MissionPriority(queued.priority).name}")
         print(f"  Goal: {queued.mission.goal[:80]}...")
 
         start_time = time.time()
+        with self._stats_lock:
+            self._active_count += 1
+            ACTIVE_MISSIONS.set(self._active_count)
 
         try:
-            outcome = self.runtime.execute_mission(queued.mission, queued.context)
+            outcome = runtime.execute_mission(queued.mission, queued.context)
             duration = time.time() - start_time
 
             # Record metrics
-            self.monitor.record_mission(
-                outcome=outcome,
-                mission_id=queued.mission_id,
-                mission_type=queued.mission.id,
-                duration=duration,
-            )
+            with self._monitor_lock:
+                self.monitor.record_mission(
+                    outcome=outcome,
+                    mission_id=queued.mission_id,
+                    mission_type=queued.mission.id,
+                    duration=duration,
+                    step_token_usage=runtime.planner.prompt_token_usage,
+                )
 
             # Update circuit breaker
             if outcome.status == MissionStatus.SUCCEEDED:
@@ -266,24 +491,35 @@ class AgentDeployment:
                 steps=[],
                 summary=f"Exception: {exc}",
             )
-            self.monitor.record_mission(
-                outcome=failed_outcome,
-                mission_id=queued.mission_id,
-                mission_type=queued.mission.id,
-                duration=duration,
-            )
+            with self._monitor_lock:
+                self.monitor.record_mission(
+                    outcome=failed_outcome,
+                    mission_id=queued.mission_id,
+                    mission_type=queued.mission.id,
+                    duration=duration,
+                )
+        finally:
+            with self._stats_lock:
+                self._active_count -= 1
+                ACTIVE_MISSIONS.set(self._active_count)
+                stats = self._run_latency.setdefault(queued.mission.id, _LatencyStats())
+                stats.observe(time.time() - start_time)
 
         print()  # Blank line between missions
 
     def _perform_health_check(self) -> None:
         """Perform periodic health assessment."""
-        health = self.monitor.check_health(lookback_hours=24)
+        with self._monitor_lock:
+            health = self.monitor.check_health(lookback_hours=24)
 
         print(f"[Health Check] Status: {health.status.value.upper()}")
         print(f"  Total missions (24h): {health.total_missions}")
         print(f"  Success rate: {health.success_count}/{health.total_missions}")
         print(f"  Circuit breaker: {self._circuit_breaker.state.value}")
         print(f"  Queue size: {self._queue.qsize()}/{self.max_queue_size}")
+        depths = ", ".join(f"{name.lower()}={depth}" for name, depth in self._queue.depths().items())
+        print(f"  Queue depths: {depths}")
+        print(f"  Active missions: {self._active_count}/{self.workers}")
 
         if health.status == HealthStatus.UNHEALTHY:
             print(f"  WARNING: Agent health is {health.status.value}", file=sys.stderr)
@@ -298,13 +534,25 @@ class AgentDeployment:
         Returns:
             Status information dictionary
         """
-        health = self.monitor.check_health()
+        with self._monitor_lock:
+            health = self.monitor.check_health()
+        with self._stats_lock:
+            active = self._active_count
+            run_latency = {name: stats.as_dict() for name, stats in self._run_latency.items()}
 
         return {
             "running": self._running,
             "circuit_breaker": self._circuit_breaker.state.value,
             "queue_size": self._queue.qsize(),
             "queue_capacity": self.max_queue_size,
+            "queue_depths": self._queue.depths(),
+            "workers": self.workers,
+            "active_missions": active,
+            "metrics_url": self._metrics_server.url if self._metrics_server is not None else None,
+            "latency": {
+                "queue_wait": self._queue.wait_latency(),
+                "execution": run_latency,
+            },
             "health": {
                 "status": health.status.value,
                 "total_missions": health.total_missions,
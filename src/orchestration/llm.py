@@ -7,10 +7,12 @@ from typing import TYPE_CHECKING, Any, Dict, List
 
 from src.integrations.github.models import GitHubModelsClient, GitHubModelsError
 
+from .conversation import DEFAULT_TOKEN_BUDGET, ConversationBuilder, message_tokens
 from .planner import Planner
-from .types import AgentState, Thought, ThoughtType, ToolCall
+from .types import AgentState, MissionStatus, Thought, ThoughtType, ToolCall
 
 if TYPE_CHECKING:
+    from .memory import MissionMemory
     from .tools import ToolRegistry
 
 
@@ -33,6 +35,9 @@ class LLMPlanner(Planner):
         tool_registry: ToolRegistry,
         max_tokens: int = 4000,
         temperature: float = 0.7,
+        token_budget: int = DEFAULT_TOKEN_BUDGET,
+        memory: MissionMemory | None = None,
+        few_shot_examples: int = 3,
     ):
         """Initialize LLM planner with GitHub Models client.
 
@@ -41,16 +46,34 @@ class LLMPlanner(Planner):
             tool_registry: Registry of available tools for function calling.
             max_tokens: Token limit per LLM call.
             temperature: Sampling temperature (0.0-1.0).
+            token_budget: Approximate prompt-token budget for the mission
+                history; older tool outputs are compacted to stay within it.
+            memory: Optional mission memory; the most similar successful past
+                executions are summarized in the system prompt.
+            few_shot_examples: Number of past executions to include.
         """
         self._models_client = models_client
         self._tool_registry = tool_registry
         self._max_tokens = max_tokens
         self._temperature = temperature
         self._conversation_history: List[Dict[str, Any]] = []
+        self._conversation = ConversationBuilder(token_budget=token_budget)
+        self._prompt_tokens: List[int] = []
+        self._memory = memory
+        self._few_shot_examples = few_shot_examples
+        self._examples: tuple[str, List[str]] | None = None
 
     # Maximum retries when LLM responds without tool call or explicit finish
     MAX_CLARIFICATION_RETRIES = 2
 
+    @property
+    def prompt_token_usage(self) -> tuple[int, ...]:
+        """Prompt tokens sent per planner turn in the current mission.
+
+        Uses the API's reported usage when available, otherwise an estimate.
+        """
+        return tuple(self._prompt_tokens)
+
     def plan_next(self, state: AgentState) -> Thought:
         """Use LLM to determine the next action based on mission state.
 
@@ -66,6 +89,8 @@ class LLMPlanner(Planner):
         if not state.steps:
             # New mission run detected, reset conversation memory
             self._conversation_history = []
+            self._conversation.reset()
+            self._prompt_tokens = []
 
         system_prompt = self._build_system_prompt(state)
         user_prompt = self._build_user_prompt(state)
@@ -73,15 +98,15 @@ class LLMPlanner(Planner):
 
         tools = self._tool_registry.get_openai_tool_schemas()
         if state.mission.allowed_tools is not None:
-            allowed = set(state.mission.allowed_tools)
             tools = [
                 tool
                 for tool in tools
-                if tool["function"]["name"] in allowed
+                if state.mission.is_tool_allowed(tool["function"]["name"])
             ]
 
         messages = self._build_messages(system_prompt, state, user_message)
 
+        prompt_tokens = 0
         # Retry loop for when LLM responds without a tool call or finish signal
         for attempt in range(self.MAX_CLARIFICATION_RETRIES + 1):
             try:
@@ -94,6 +119,11 @@ class LLMPlanner(Planner):
             except GitHubModelsError as exc:
                 raise LLMPlannerError(f"LLM call failed: {exc}") from exc
 
+            if response.usage is not None:
+                prompt_tokens += response.usage.prompt_tokens
+            else:
+                prompt_tokens += sum(message_tokens(message) for message in messages)
+
             try:
                 thought = self._parse_response(response, state)
                 
@@ -105,6 +135,7 @@ class LLMPlanner(Planner):
                 if len(self._conversation_history) > 40:
                     self._conversation_history = self._conversation_history[-40:]
 
+                self._prompt_tokens.append(prompt_tokens)
                 return thought
                 
             except LLMPlannerError as exc:
@@ -177,6 +208,12 @@ class LLMPlanner(Planner):
                 prompt_parts.append(f"- {criterion}")
             prompt_parts.append("")
 
+        examples = self._similar_missions(state)
+        if examples:
+            prompt_parts.append("Similar successful missions (for reference):")
+            prompt_parts.extend(examples)
+            prompt_parts.append("")
+
         prompt_parts.extend([
             f"Available Tools: {available_tools_str}",
             "",
@@ -188,6 +225,7 @@ class LLMPlanner(Planner):
             "Review all success criteria - you must complete ALL of them, not just some",
             "Take concrete actions with available tools to satisfy each criterion",
             "ALWAYS use a tool call to take action - do not just describe what you would do",
+            "When several read-only lookups do not depend on each other, request them together in one response",
         ]
 
         if can_modify_labels:
@@ -241,6 +279,26 @@ class LLMPlanner(Planner):
 
         return "\n".join(prompt_parts)
 
+    def _similar_missions(self, state: AgentState) -> List[str]:
+        """Summaries of similar successful executions, looked up once per mission."""
+        if self._memory is None or self._few_shot_examples <= 0:
+            return []
+        mission = state.mission
+        if self._examples is not None and self._examples[0] == mission.id and state.steps:
+            return self._examples[1]
+        matches = self._memory.search_similar(
+            mission.goal,
+            mission_id=mission.id,
+            status_filter=MissionStatus.SUCCEEDED,
+            limit=self._few_shot_examples,
+        )
+        lines = []
+        for match in matches:
+            tools = " -> ".join(match.tool_sequence) or "no tools"
+            lines.append(f"- {match.mission_goal}: {tools} ({match.step_count} steps)")
+        self._examples = (mission.id, lines)
+        return lines
+
     def _build_messages(
         self,
         system_prompt: str,
@@ -256,65 +314,10 @@ class LLMPlanner(Planner):
 
         Returns:
             List of messages formatted for OpenAI chat completions API.
+            Each step is serialized once per mission; older tool outputs are
+            compacted when the history exceeds the token budget.
         """
-        messages: List[Dict[str, Any]] = [{"role": "system", "content": system_prompt}]
-
-        if state.steps:
-            inputs_str = json.dumps(state.context.inputs, indent=2) if state.context.inputs else "{}"
-            messages.append({
-                "role": "user",
-                "content": f"Begin mission. Inputs:\n{inputs_str}\n\nWhat's your first action?"
-            })
-
-            for i, step in enumerate(state.steps, 1):
-                thought = step.thought
-                result = step.result
-
-                tool_call_id: str | None = None
-
-                if thought.tool_call:
-                    tool_call_id = f"call_{i}"
-                    assistant_payload: Dict[str, Any] = {
-                        "role": "assistant",
-                        "tool_calls": [{
-                            "id": tool_call_id,
-                            "type": "function",
-                            "function": {
-                                "name": thought.tool_call.name,
-                                "arguments": json.dumps(thought.tool_call.arguments),
-                            },
-                        }],
-                    }
-                    if thought.content:
-                        assistant_payload["content"] = thought.content
-                    messages.append(assistant_payload)
-                else:
-                    content = thought.content or "Continuing mission."
-                    messages.append({"role": "assistant", "content": content})
-
-                if result:
-                    if result.success:
-                        if result.output is not None:
-                            try:
-                                tool_output = json.dumps(result.output, default=str)
-                            except TypeError:
-                                tool_output = str(result.output)
-                        else:
-                            tool_output = "Success"
-                    else:
-                        tool_output = result.error or "Error executing tool"
-
-                    tool_message: Dict[str, Any] = {
-                        "role": "tool",
-                        "content": tool_output,
-                    }
-                    if tool_call_id is not None:
-                        tool_message["tool_call_id"] = tool_call_id
-                    messages.append(tool_message)
-
-        messages.append(user_message)
-
-        return messages
+        return self._conversation.build(system_prompt, state, user_message)
 
     def _build_user_prompt(self, state: AgentState) -> str:
         """Create user prompt with execution history and context."""
@@ -324,40 +327,27 @@ class LLMPlanner(Planner):
             return f"Begin mission. Inputs:\n{inputs_str}\n\nWhat's your first action?"
 
         # Subsequent steps - summarize progress
-        prompt_parts = ["Progress so far:"]
-
-        for i, step in enumerate(state.steps, 1):
-            thought = step.thought
-            result = step.result
-
-            # Describe the action taken
-            if thought.tool_call:
-                action_desc = f"Step {i}: Called {thought.tool_call.name}"
-                if thought.content and thought.content != f"Calling {thought.tool_call.name}":
-                    action_desc = f"{action_desc} ({thought.content})"
-            else:
-                action_desc = f"Step {i}: {thought.content}"
-
-            prompt_parts.append(action_desc)
-
-            # Describe the result
-            if result:
-                if result.success:
-                    if result.output:
-                        output_preview = str(result.output)[:200]
-                        if len(str(result.output)) > 200:
-                            output_preview += "..."
-                        prompt_parts.append(f"  Result: {output_preview}")
-                    else:
-                        prompt_parts.append("  Result: Success")
-                else:
-                    error_msg = result.error or "Unknown error"
-                    prompt_parts.append(f"  Error: {error_msg}")
+        prompt_parts = ["Progress so far:", *self._conversation.progress_lines(state)]
 
         prompt_parts.extend(["", "What's your next action?"])
 
         return "\n".join(prompt_parts)
 
+    def _parse_tool_call(self, function, state: AgentState) -> ToolCall:
+        """Validate one requested function call and convert it to a ToolCall."""
+        try:
+            arguments = json.loads(function.arguments)
+        except json.JSONDecodeError as exc:
+            raise LLMPlannerError(
+                f"Invalid JSON in tool arguments: {function.arguments}"
+            ) from exc
+
+        if not state.mission.is_tool_allowed(function.name):
+            raise LLMPlannerError(
+                f"Tool '{function.name}' is not allowed for this mission"
+            )
+        return ToolCall(name=function.name, arguments=arguments)
+
     def _parse_response(self, response, state: AgentState) -> Thought:
         """Convert LLM response to a Thought.
 
@@ -366,7 +356,7 @@ class LLMPlanner(Planner):
             state: Current mission state for validation.
 
         Returns:
-            Thought with either a tool call or finish signal.
+            Thought with the requested tool calls or a finish signal.
 
         Raises:
             LLMPlannerError: If response cannot be parsed or is invalid.
@@ -376,34 +366,15 @@ class LLMPlanner(Planner):
 
         message = response.choices[0].message
 
-        # Check for function/tool call
-        if message.tool_calls and len(message.tool_calls) > 0:
-            tool_call_data = message.tool_calls[0]
-            function = tool_call_data.function
-
-            # Parse arguments
-            try:
-                arguments = json.loads(function.arguments)
-            except json.JSONDecodeError as exc:
-                raise LLMPlannerError(
-                    f"Invalid JSON in tool arguments: {function.arguments}"
-                ) from exc
-
-            # Validate tool is allowed
-            if not state.mission.is_tool_allowed(function.name):
-                raise LLMPlannerError(
-                    f"Tool '{function.name}' is not allowed for this mission"
-                )
-
-            # Create thought with tool call
-            content = message.content or f"Calling {function.name}"
+        # Check for function/tool calls; independent calls may arrive together
+        if message.tool_calls:
+            calls = tuple(self._parse_tool_call(data.function, state) for data in message.tool_calls)
+            content = message.content or f"Calling {calls[0].name}"
             return Thought(
                 content=content,
                 type=ThoughtType.ACTION,
-                tool_call=ToolCall(
-                    name=function.name,
-                    arguments=arguments,
-                ),
+                tool_call=calls[0],
+                additional_tool_calls=calls[1:],
             )
 
         # No tool call - check if LLM explicitly signaled completion
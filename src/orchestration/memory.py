@@ -2,14 +2,41 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
+import math
+import re
 import sqlite3
-from dataclasses import dataclass
+from collections import Counter
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
-
-from .types import AgentStep, MissionOutcome, MissionStatus
+from typing import TYPE_CHECKING, Any, Iterable, Mapping, Sequence
+
+from .types import (
+    AgentStep,
+    ExecutionContext,
+    MissionOutcome,
+    MissionStatus,
+    Thought,
+    ThoughtType,
+    ToolCall,
+    ToolResult,
+)
+
+if TYPE_CHECKING:  # pragma: no cover - import cycle hint for type checkers
+    from .missions import Mission
+
+# Checkpoint status while a mission has not reached an outcome yet
+CHECKPOINT_RUNNING = "running"
+
+# BM25 parameters for the similarity index
+BM25_K1 = 1.2
+BM25_B = 0.75
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+_STOPWORDS = frozenset(
+    "a an and are as at be by for from has in is it its of on or that the this to was were will with".split()
+)
 
 
 @dataclass(frozen=True)
@@ -23,6 +50,134 @@ class SuccessPattern:
     average_steps: float
 
 
+@dataclass(frozen=True)
+class ExecutionSummary:
+    """Projection of a stored execution without its step payloads."""
+
+    execution_id: int
+    mission_id: str
+    mission_goal: str
+    status: MissionStatus
+    summary: str | None
+    step_count: int
+    tool_sequence: tuple[str, ...]
+    timestamp: str
+    score: float = 0.0
+
+
+@dataclass(frozen=True)
+class MissionCheckpoint:
+    """Persisted progress of one mission execution, used to resume it."""
+
+    execution_id: str
+    mission_id: str
+    mission_goal: str
+    inputs: Mapping[str, Any]
+    status: str
+    steps: tuple[AgentStep, ...] = ()
+    # Idempotency key -> recorded result of each completed mutation
+    completed_mutations: Mapping[str, ToolResult] = field(default_factory=dict)
+    # Mutations that were started but whose result was never recorded
+    interrupted_mutations: frozenset[str] = frozenset()
+
+    @property
+    def resumable(self) -> bool:
+        return self.status != MissionStatus.SUCCEEDED.value
+
+    def context(self) -> ExecutionContext:
+        return ExecutionContext(inputs=dict(self.inputs))
+
+
+def idempotency_key(tool_call: ToolCall, occurrence: int = 1) -> str:
+    """Stable key for the ``occurrence``-th identical call (tool name and canonical arguments)."""
+    payload = json.dumps(
+        {"name": tool_call.name, "arguments": tool_call.arguments, "occurrence": occurrence},
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _index_terms(goal: str, tools: Iterable[str], mission_id: str | None = None) -> Counter[str]:
+    """Terms indexed for an execution: goal words, its mission id and its tools."""
+    terms: Counter[str] = Counter(
+        token for token in _TOKEN_PATTERN.findall(goal.lower()) if token not in _STOPWORDS and len(token) > 1
+    )
+    if mission_id is not None:
+        terms[f"mission:{mission_id}"] += 1
+    terms.update(f"tool:{tool}" for tool in tools)
+    return terms
+
+
+def _tool_names(steps: Iterable[AgentStep]) -> list[str]:
+    return [step.thought.tool_call.name for step in steps if step.thought.tool_call]
+
+
+def _serialize_step(step: AgentStep) -> dict[str, Any]:
+    return {
+        "thought": {
+            "content": step.thought.content,
+            "type": step.thought.type.value,
+            "tool_call": (
+                {
+                    "name": step.thought.tool_call.name,
+                    "arguments": dict(step.thought.tool_call.arguments),
+                }
+                if step.thought.tool_call
+                else None
+            ),
+        },
+        "result": (
+            {
+                "success": step.result.success,
+                "output": step.result.output,
+                "error": step.result.error,
+            }
+            if step.result
+            else None
+        ),
+    }
+
+
+def _deserialize_result(data: Mapping[str, Any] | None) -> ToolResult | None:
+    if not data:
+        return None
+    return ToolResult(success=data["success"], output=data.get("output"), error=data.get("error"))
+
+
+def _deserialize_step(data: Mapping[str, Any]) -> AgentStep:
+    thought_data = data["thought"]
+    tool_call = None
+    if thought_data.get("tool_call"):
+        tc = thought_data["tool_call"]
+        tool_call = ToolCall(name=tc["name"], arguments=tc["arguments"])
+
+    thought = Thought(
+        content=thought_data["content"],
+        type=ThoughtType(thought_data["type"]),
+        tool_call=tool_call,
+    )
+    return AgentStep(thought=thought, result=_deserialize_result(data.get("result")))
+
+
+_SUMMARY_COLUMNS = "id, mission_id, mission_goal, status, summary, step_count, tool_sequence, timestamp"
+
+
+def _summary_from_row(row: Sequence[Any], *, score: float = 0.0) -> ExecutionSummary:
+    execution_id, mission_id, mission_goal, status, summary, step_count, tool_sequence, timestamp = row
+    return ExecutionSummary(
+        execution_id=execution_id,
+        mission_id=mission_id,
+        mission_goal=mission_goal,
+        status=MissionStatus(status),
+        summary=summary,
+        step_count=step_count,
+        tool_sequence=tuple(tool_sequence.split("->")) if tool_sequence else (),
+        timestamp=timestamp,
+        score=score,
+    )
+
+
 class MissionMemory:
     """Stores and retrieves mission execution history for learning."""
 
@@ -34,6 +189,9 @@ class MissionMemory:
         """
         self._db_path = db_path or ":memory:"
         self._conn = sqlite3.connect(str(self._db_path))
+        # Readers (e.g. a planner fetching examples) do not block the writer
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
         self._initialize_schema()
 
     def _initialize_schema(self) -> None:
@@ -89,7 +247,127 @@ class MissionMemory:
             ON execution_steps(tool_name)
         """)
 
+        # Denormalized tool sequence so pattern queries never scan the steps table
+        columns = {row[1] for row in cursor.execute("PRAGMA table_info(mission_executions)")}
+        if "tool_sequence" not in columns:
+            cursor.execute("ALTER TABLE mission_executions ADD COLUMN tool_sequence TEXT")
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_executions_pattern
+            ON mission_executions(status, mission_id, tool_sequence)
+        """)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_executions_recent
+            ON mission_executions(mission_id, timestamp)
+        """)
+
+        # BM25 similarity index over goals, mission ids and tool names
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS memory_terms (
+                term TEXT NOT NULL,
+                execution_id INTEGER NOT NULL,
+                tf INTEGER NOT NULL,
+                PRIMARY KEY (term, execution_id)
+            ) WITHOUT ROWID
+        """)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS memory_documents (
+                execution_id INTEGER PRIMARY KEY,
+                length INTEGER NOT NULL
+            )
+        """)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS memory_term_stats (
+                term TEXT PRIMARY KEY,
+                df INTEGER NOT NULL
+            ) WITHOUT ROWID
+        """)
+
+        # Resumable checkpoints, one step row appended per executed step
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS mission_checkpoints (
+                execution_id TEXT PRIMARY KEY,
+                mission_id TEXT NOT NULL,
+                mission_goal TEXT NOT NULL,
+                inputs TEXT NOT NULL,
+                status TEXT NOT NULL,
+                created_at TEXT NOT NULL,
+                updated_at TEXT NOT NULL
+            )
+        """)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS checkpoint_steps (
+                execution_id TEXT NOT NULL,
+                step_number INTEGER NOT NULL,
+                step_data TEXT NOT NULL,
+                idempotency_key TEXT,
+                PRIMARY KEY (execution_id, step_number),
+                FOREIGN KEY (execution_id) REFERENCES mission_checkpoints(execution_id)
+            )
+        """)
+        # Mutations started but not yet recorded as a step
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS checkpoint_intents (
+                execution_id TEXT NOT NULL,
+                idempotency_key TEXT NOT NULL,
+                started_at TEXT NOT NULL,
+                PRIMARY KEY (execution_id, idempotency_key)
+            )
+        """)
+
         self._conn.commit()
+        self._backfill_index()
+
+    def _backfill_index(self) -> None:
+        """Index executions recorded before the similarity index existed."""
+        cursor = self._conn.cursor()
+        cursor.execute("""
+            SELECT id, mission_id, mission_goal
+            FROM mission_executions
+            WHERE id NOT IN (SELECT execution_id FROM memory_documents)
+        """)
+        pending = cursor.fetchall()
+        for execution_id, mission_id, mission_goal in pending:
+            cursor.execute(
+                """
+                SELECT tool_name FROM execution_steps
+                WHERE execution_id = ? AND tool_name IS NOT NULL
+                ORDER BY step_number
+                """,
+                (execution_id,),
+            )
+            tools = [tool for (tool,) in cursor.fetchall()]
+            cursor.execute(
+                "UPDATE mission_executions SET tool_sequence = ? WHERE id = ?",
+                ("->".join(tools), execution_id),
+            )
+            self._index_execution(cursor, execution_id, mission_id, mission_goal, tools)
+        if pending:
+            self._conn.commit()
+
+    def _index_execution(
+        self,
+        cursor: sqlite3.Cursor,
+        execution_id: int,
+        mission_id: str,
+        mission_goal: str,
+        tools: Sequence[str],
+    ) -> None:
+        terms = _index_terms(mission_goal, tools, mission_id)
+        cursor.executemany(
+            "INSERT OR REPLACE INTO memory_terms (term, execution_id, tf) VALUES (?, ?, ?)",
+            [(term, execution_id, tf) for term, tf in terms.items()],
+        )
+        cursor.executemany(
+            """
+            INSERT INTO memory_term_stats (term, df) VALUES (?, 1)
+            ON CONFLICT(term) DO UPDATE SET df = df + 1
+            """,
+            [(term,) for term in terms],
+        )
+        cursor.execute(
+            "INSERT OR REPLACE INTO memory_documents (execution_id, length) VALUES (?, ?)",
+            (execution_id, sum(terms.values())),
+        )
 
     def record_execution(self, mission_id: str, mission_goal: str, outcome: MissionOutcome) -> int:
         """Save mission execution details.
@@ -108,41 +386,18 @@ class MissionMemory:
         execution_data = json.dumps({
             "status": outcome.status.value,
             "summary": outcome.summary,
-            "steps": [
-                {
-                    "thought": {
-                        "content": step.thought.content,
-                        "type": step.thought.type.value,
-                        "tool_call": (
-                            {
-                                "name": step.thought.tool_call.name,
-                                "arguments": dict(step.thought.tool_call.arguments),
-                            }
-                            if step.thought.tool_call
-                            else None
-                        ),
-                    },
-                    "result": (
-                        {
-                            "success": step.result.success,
-                            "output": step.result.output,
-                            "error": step.result.error,
-                        }
-                        if step.result
-                        else None
-                    ),
-                }
-                for step in outcome.steps
-            ],
+            "tool_cache": dict(outcome.tool_cache) if outcome.tool_cache else None,
+            "steps": [_serialize_step(step) for step in outcome.steps],
         })
 
         # Store main execution record
         timestamp = datetime.now(timezone.utc).isoformat()
+        tools = _tool_names(outcome.steps)
         cursor.execute(
             """
             INSERT INTO mission_executions 
-            (mission_id, mission_goal, status, summary, step_count, timestamp, execution_data)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
+            (mission_id, mission_goal, status, summary, step_count, timestamp, execution_data, tool_sequence)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
             """,
             (
                 mission_id,
@@ -152,10 +407,13 @@ class MissionMemory:
                 len(outcome.steps),
                 timestamp,
                 execution_data,
+                "->".join(tools),
             ),
         )
 
         execution_id = cursor.lastrowid
+        if execution_id is not None:
+            self._index_execution(cursor, execution_id, mission_id, mission_goal, tools)
 
         # Store individual steps for pattern analysis
         for step_number, step in enumerate(outcome.steps, start=1):
@@ -237,79 +495,162 @@ class MissionMemory:
 
         return outcomes
 
-    def extract_patterns(self, *, min_occurrences: int = 3) -> list[SuccessPattern]:
-        """Identify successful tool sequences across mission executions.
+    def list_summaries(
+        self,
+        mission_id: str | None = None,
+        *,
+        status_filter: MissionStatus | None = None,
+        limit: int = 10,
+    ) -> list[ExecutionSummary]:
+        """Recent executions as summaries, without decoding their step payloads.
 
         Args:
-            min_occurrences: Minimum number of times a pattern must occur to be reported
+            mission_id: If provided, only executions of this mission type
+            status_filter: If provided, only executions with this status
+            limit: Maximum number of results to return
 
         Returns:
-            List of identified success patterns
+            Execution summaries ordered by recency
         """
+        clauses: list[str] = []
+        params: list[Any] = []
+        if mission_id is not None:
+            clauses.append("mission_id = ?")
+            params.append(mission_id)
+        if status_filter is not None:
+            clauses.append("status = ?")
+            params.append(status_filter.value)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
         cursor = self._conn.cursor()
+        cursor.execute(
+            f"""
+            SELECT {_SUMMARY_COLUMNS}
+            FROM mission_executions
+            {where}
+            ORDER BY timestamp DESC
+            LIMIT ?
+            """,
+            (*params, limit),
+        )
+        return [_summary_from_row(row) for row in cursor.fetchall()]
+
+    def search_similar(
+        self,
+        query: str,
+        *,
+        tools: Sequence[str] = (),
+        mission_id: str | None = None,
+        status_filter: MissionStatus | None = None,
+        limit: int = 5,
+    ) -> list[ExecutionSummary]:
+        """Rank stored executions by BM25 similarity to a goal and tool list.
+
+        Scoring runs in SQLite over the term index, so only the matching
+        postings are read and no ``execution_data`` is decoded.
 
-        # Get all successful executions grouped by mission type
-        cursor.execute("""
-            SELECT 
-                me.mission_id,
-                me.id,
-                GROUP_CONCAT(es.tool_name, '->') as tool_sequence,
-                COUNT(es.id) as step_count
-            FROM mission_executions me
-            JOIN execution_steps es ON me.id = es.execution_id
-            WHERE me.status = 'succeeded' AND es.tool_name IS NOT NULL
-            GROUP BY me.mission_id, me.id
-            ORDER BY me.mission_id, me.timestamp
-        """)
+        Args:
+            query: Natural language goal to match
+            tools: Tool names whose use should count toward similarity
+            mission_id: Mission type to boost (matched as an extra term)
+            status_filter: If provided, only executions with this status
+            limit: Maximum number of results to return
 
-        # Aggregate patterns by mission type and tool sequence
-        pattern_stats: dict[tuple[str, str], dict[str, Any]] = {}
+        Returns:
+            Execution summaries with ``score`` set, best match first
+        """
+        terms = _index_terms(query, tools, mission_id)
+        if not terms:
+            return []
 
-        for mission_id, execution_id, tool_sequence, step_count in cursor.fetchall():
-            if not tool_sequence:
-                continue
+        cursor = self._conn.cursor()
+        cursor.execute("SELECT COUNT(*), AVG(length) FROM memory_documents")
+        document_count, average_length = cursor.fetchone()
+        if not document_count:
+            return []
 
-            key = (mission_id, tool_sequence)
-            if key not in pattern_stats:
-                pattern_stats[key] = {
-                    "occurrences": 0,
-                    "total_steps": 0,
-                    "executions": [],
-                }
+        placeholders = ", ".join("?" for _ in terms)
+        cursor.execute(
+            f"SELECT term, df FROM memory_term_stats WHERE term IN ({placeholders})",
+            tuple(terms),
+        )
+        weights = {
+            term: terms[term] * math.log(1 + (document_count - df + 0.5) / (df + 0.5))
+            for term, df in cursor.fetchall()
+        }
+        if not weights:
+            return []
 
-            pattern_stats[key]["occurrences"] += 1
-            pattern_stats[key]["total_steps"] += step_count
-            pattern_stats[key]["executions"].append(execution_id)
+        weight_case = " ".join("WHEN ? THEN ?" for _ in weights)
+        weight_params = [value for item in weights.items() for value in item]
+        status_clause = "AND e.status = ?" if status_filter is not None else ""
+        status_params = [status_filter.value] if status_filter is not None else []
+        cursor.execute(
+            f"""
+            WITH scores AS (
+                SELECT t.execution_id,
+                       SUM(
+                           (CASE t.term {weight_case} END) * t.tf * ({BM25_K1} + 1)
+                           / (t.tf + {BM25_K1} * (1 - {BM25_B} + {BM25_B} * d.length / ?))
+                       ) AS score
+                FROM memory_terms t
+                JOIN memory_documents d ON d.execution_id = t.execution_id
+                WHERE t.term IN ({", ".join("?" for _ in weights)})
+                GROUP BY t.execution_id
+            )
+            SELECT {_SUMMARY_COLUMNS}, scores.score
+            FROM scores
+            JOIN mission_executions e ON e.id = scores.execution_id
+            WHERE 1 = 1 {status_clause}
+            ORDER BY scores.score DESC, e.timestamp DESC
+            LIMIT ?
+            """,
+            (*weight_params, average_length or 1.0, *weights, *status_params, limit),
+        )
+        return [_summary_from_row(row[:-1], score=row[-1]) for row in cursor.fetchall()]
 
-        # Calculate success patterns
-        patterns: list[SuccessPattern] = []
+    def extract_patterns(self, *, min_occurrences: int = 3) -> list[SuccessPattern]:
+        """Identify successful tool sequences across mission executions.
 
-        for (mission_id, tool_sequence), stats in pattern_stats.items():
-            if stats["occurrences"] < min_occurrences:
-                continue
+        Args:
+            min_occurrences: Minimum number of times a pattern must occur to be reported
 
-            # Calculate success rate for this pattern
-            cursor.execute(
-                """
-                SELECT COUNT(*)
-                FROM mission_executions
-                WHERE mission_id = ?
-                """,
-                (mission_id,),
-            )
-            total_attempts = cursor.fetchone()[0]
+        Returns:
+            List of identified success patterns
+        """
+        cursor = self._conn.cursor()
 
-            success_rate = stats["occurrences"] / total_attempts if total_attempts > 0 else 0.0
-            average_steps = stats["total_steps"] / stats["occurrences"]
+        # Successful tool sequences per mission type (served by idx_executions_pattern)
+        cursor.execute("""
+            SELECT mission_id, tool_sequence, COUNT(*) AS occurrences
+            FROM mission_executions
+            WHERE status = 'succeeded' AND tool_sequence IS NOT NULL AND tool_sequence != ''
+            GROUP BY mission_id, tool_sequence
+            HAVING COUNT(*) >= ?
+        """, (min_occurrences,))
+        candidates = cursor.fetchall()
+        if not candidates:
+            return []
 
-            pattern = SuccessPattern(
-                tool_sequence=tuple(tool_sequence.split("->")),
-                mission_type=mission_id,
-                occurrence_count=stats["occurrences"],
-                success_rate=success_rate,
-                average_steps=average_steps,
+        cursor.execute("""
+            SELECT mission_id, COUNT(*)
+            FROM mission_executions
+            GROUP BY mission_id
+        """)
+        attempts = dict(cursor.fetchall())
+
+        patterns: list[SuccessPattern] = []
+        for mission_id, tool_sequence, occurrences in candidates:
+            tool_names = tuple(tool_sequence.split("->"))
+            total_attempts = attempts.get(mission_id, 0)
+            patterns.append(
+                SuccessPattern(
+                    tool_sequence=tool_names,
+                    mission_type=mission_id,
+                    occurrence_count=occurrences,
+                    success_rate=occurrences / total_attempts if total_attempts > 0 else 0.0,
+                    average_steps=float(len(tool_names)),
+                )
             )
-            patterns.append(pattern)
 
         # Sort by success rate and occurrence count
         patterns.sort(key=lambda p: (p.success_rate, p.occurrence_count), reverse=True)
@@ -362,35 +703,153 @@ class MissionMemory:
 
     def _deserialize_outcome(self, data: dict[str, Any]) -> MissionOutcome:
         """Reconstruct MissionOutcome from stored JSON data."""
-        from .types import Thought, ThoughtType, ToolCall, ToolResult
+        steps = [_deserialize_step(step_data) for step_data in data.get("steps", [])]
 
-        steps: list[AgentStep] = []
-        for step_data in data.get("steps", []):
-            thought_data = step_data["thought"]
-            tool_call = None
-            if thought_data.get("tool_call"):
-                tc = thought_data["tool_call"]
-                tool_call = ToolCall(name=tc["name"], arguments=tc["arguments"])
-
-            thought = Thought(
-                content=thought_data["content"],
-                type=ThoughtType(thought_data["type"]),
-                tool_call=tool_call,
+        return MissionOutcome(
+            status=MissionStatus(data["status"]),
+            steps=tuple(steps),
+            summary=data.get("summary"),
+        )
+
+    # ========================================================================
+    # Checkpoints
+    # ========================================================================
+
+    def start_checkpoint(
+        self, execution_id: str, mission: "Mission", context: ExecutionContext
+    ) -> MissionCheckpoint:
+        """Open the checkpoint for an execution, creating it if it is new.
+
+        Args:
+            execution_id: Identifier of this execution (the resume handle)
+            mission: Mission being executed
+            context: Execution context whose inputs are stored for resuming
+
+        Returns:
+            The checkpoint, including any steps already completed
+        """
+        timestamp = datetime.now(timezone.utc).isoformat()
+        self._conn.execute(
+            """
+            INSERT OR IGNORE INTO mission_checkpoints
+            (execution_id, mission_id, mission_goal, inputs, status, created_at, updated_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            """,
+            (
+                execution_id,
+                mission.id,
+                mission.goal,
+                json.dumps(dict(context.inputs), default=str),
+                CHECKPOINT_RUNNING,
+                timestamp,
+                timestamp,
+            ),
+        )
+        self._conn.commit()
+        checkpoint = self.load_checkpoint(execution_id)
+        if checkpoint is None:
+            raise RuntimeError(f"Failed to create checkpoint {execution_id}")
+        return checkpoint
+
+    def begin_checkpoint_mutation(self, execution_id: str, idempotency_key: str) -> None:
+        """Record that a mutation is about to run, before its handler is called.
+
+        The intent is cleared when the step with the same key is appended; one
+        still present on resume marks a mutation whose outcome is unknown.
+        """
+        self._conn.execute(
+            """
+            INSERT OR IGNORE INTO checkpoint_intents (execution_id, idempotency_key, started_at)
+            VALUES (?, ?, ?)
+            """,
+            (execution_id, idempotency_key, datetime.now(timezone.utc).isoformat()),
+        )
+        self._conn.commit()
+
+    def append_checkpoint_step(
+        self,
+        execution_id: str,
+        step_number: int,
+        step: AgentStep,
+        *,
+        idempotency_key: str | None = None,
+    ) -> None:
+        """Persist one completed step; pass ``idempotency_key`` for mutations."""
+        if idempotency_key is not None:
+            self._conn.execute(
+                "DELETE FROM checkpoint_intents WHERE execution_id = ? AND idempotency_key = ?",
+                (execution_id, idempotency_key),
             )
+        self._conn.execute(
+            """
+            INSERT OR REPLACE INTO checkpoint_steps
+            (execution_id, step_number, step_data, idempotency_key)
+            VALUES (?, ?, ?, ?)
+            """,
+            (execution_id, step_number, json.dumps(_serialize_step(step), default=str), idempotency_key),
+        )
+        self._conn.execute(
+            "UPDATE mission_checkpoints SET updated_at = ? WHERE execution_id = ?",
+            (datetime.now(timezone.utc).isoformat(), execution_id),
+        )
+        self._conn.commit()
 
-            result = None
-            if step_data.get("result"):
-                res = step_data["result"]
-                result = ToolResult(
-                    success=res["success"], output=res.get("output"), error=res.get("error")
-                )
+    def finish_checkpoint(self, execution_id: str, status: MissionStatus) -> None:
+        """Record the outcome reached by a checkpointed execution."""
+        self._conn.execute(
+            "UPDATE mission_checkpoints SET status = ?, updated_at = ? WHERE execution_id = ?",
+            (status.value, datetime.now(timezone.utc).isoformat(), execution_id),
+        )
+        self._conn.commit()
 
-            steps.append(AgentStep(thought=thought, result=result))
+    def load_checkpoint(self, execution_id: str) -> MissionCheckpoint | None:
+        """Load a checkpoint and its steps, or None if it does not exist."""
+        cursor = self._conn.cursor()
+        cursor.execute(
+            """
+            SELECT mission_id, mission_goal, inputs, status
+            FROM mission_checkpoints
+            WHERE execution_id = ?
+            """,
+            (execution_id,),
+        )
+        row = cursor.fetchone()
+        if row is None:
+            return None
+        mission_id, mission_goal, inputs, status = row
 
-        return MissionOutcome(
-            status=MissionStatus(data["status"]),
+        cursor.execute(
+            """
+            SELECT step_data, idempotency_key
+            FROM checkpoint_steps
+            WHERE execution_id = ?
+            ORDER BY step_number
+            """,
+            (execution_id,),
+        )
+        steps: list[AgentStep] = []
+        completed: dict[str, ToolResult] = {}
+        for step_data, key in cursor.fetchall():
+            step = _deserialize_step(json.loads(step_data))
+            steps.append(step)
+            if key and step.result is not None and step.result.success:
+                completed[key] = step.result
+
+        cursor.execute(
+            "SELECT idempotency_key FROM checkpoint_intents WHERE execution_id = ?",
+            (execution_id,),
+        )
+        interrupted = frozenset(key for (key,) in cursor.fetchall())
+
+        return MissionCheckpoint(
+            execution_id=execution_id,
+            mission_id=mission_id,
+            mission_goal=mission_goal,
+            inputs=json.loads(inputs),
+            status=status,
             steps=tuple(steps),
-            summary=data.get("summary"),
+            completed_mutations=completed,
+            interrupted_mutations=interrupted,
         )
 
     def clear_all(self) -> None:
@@ -398,6 +857,12 @@ class MissionMemory:
         cursor = self._conn.cursor()
         cursor.execute("DELETE FROM execution_steps")
         cursor.execute("DELETE FROM mission_executions")
+        cursor.execute("DELETE FROM checkpoint_steps")
+        cursor.execute("DELETE FROM checkpoint_intents")
+        cursor.execute("DELETE FROM mission_checkpoints")
+        cursor.execute("DELETE FROM memory_terms")
+        cursor.execute("DELETE FROM memory_documents")
+        cursor.execute("DELETE FROM memory_term_stats")
         self._conn.commit()
 
     def close(self) -> None:
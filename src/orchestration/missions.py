@@ -9,8 +9,10 @@ from typing import Any
 
 import yaml
 
+from .results import EXPAND_RESULT_TOOL
 
-IMPLICIT_ALLOWED_TOOLS = frozenset({"copilot_cli_session"})
+
+IMPLICIT_ALLOWED_TOOLS = frozenset({"copilot_cli_session", EXPAND_RESULT_TOOL})
 
 
 @dataclass(frozen=True)
@@ -1,4 +1,11 @@
-"""Monitoring and observability for the Copilot agent runtime."""
+"""Monitoring and observability for the Copilot agent runtime.
+
+Every mission is stored as a raw ``mission_metrics`` row and also added to
+per-minute and per-hour rollups in ``mission_rollups``. Health checks and
+reports sum the rollup buckets in their window, so their cost depends on the
+window length, not on how many missions ran. Raw rows older than
+``raw_retention`` are pruned; the rollups keep the aggregate history.
+"""
 
 from __future__ import annotations
 
@@ -9,7 +16,9 @@ from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
 from pathlib import Path
-from typing import Any, Sequence
+from typing import Any, Callable, Dict, Sequence
+
+from src.metrics import MISSION_SECONDS, MISSIONS
 
 from .types import MissionOutcome, MissionStatus
 
@@ -52,22 +61,81 @@ class HealthReport:
     recommendations: Sequence[str]
 
 
+# Rollup resolutions; bucket keys are ISO ``YYYY-MM-DDTHH:MM`` strings
+_MINUTE = "minute"
+_HOUR = "hour"
+_PRUNE_INTERVAL = timedelta(hours=1)
+
+
+def _minute_key(moment: datetime) -> str:
+    return moment.strftime("%Y-%m-%dT%H:%M")
+
+
+def _hour_key(moment: datetime) -> str:
+    return moment.strftime("%Y-%m-%dT%H:00")
+
+
+@dataclass
+class _RollupTotals:
+    """Summed rollup buckets for one mission type."""
+
+    total: int = 0
+    succeeded: int = 0
+    failed: int = 0
+    blocked: int = 0
+    duration_sum: float = 0.0
+    tool_calls: int = 0
+    tokens: int = 0
+    cost: float = 0.0
+
+    def add(self, other: _RollupTotals) -> None:
+        self.total += other.total
+        self.succeeded += other.succeeded
+        self.failed += other.failed
+        self.blocked += other.blocked
+        self.duration_sum += other.duration_sum
+        self.tool_calls += other.tool_calls
+        self.tokens += other.tokens
+        self.cost += other.cost
+
+
 @dataclass
 class AgentMonitor:
-    """Tracks agent performance and health metrics."""
+    """Tracks agent performance and health metrics.
+
+    Attributes:
+        db_path: SQLite database file.
+        raw_retention: How long raw per-mission rows are kept (``None`` keeps
+            them forever). ``get_recent_missions`` and the recent errors in
+            health checks read raw rows; counts and averages do not.
+        minute_retention: How long per-minute rollups are kept. Windows that
+            start earlier than this are widened to the start of their hour.
+        rollup_retention: How long per-hour rollups are kept (``None`` keeps
+            them forever).
+        clock: Returns the current UTC time; replaceable in tests.
+    """
 
     db_path: Path = field(default_factory=lambda: Path("agent_metrics.db"))
+    raw_retention: timedelta | None = timedelta(days=30)
+    minute_retention: timedelta = timedelta(days=2)
+    rollup_retention: timedelta | None = timedelta(days=400)
+    clock: Callable[[], datetime] = field(default=datetime.utcnow, repr=False)
     _connection: sqlite3.Connection | None = field(default=None, init=False, repr=False)
+    _last_prune: datetime | None = field(default=None, init=False, repr=False)
 
     def __post_init__(self) -> None:
         """Initialize database connection and schema."""
-        self._connection = sqlite3.connect(str(self.db_path))
+        # Deployment workers record missions from their own threads (serialized by the caller)
+        self._connection = sqlite3.connect(str(self.db_path), check_same_thread=False)
         self._connection.row_factory = sqlite3.Row
         self._initialize_schema()
+        self.prune()
 
     def _initialize_schema(self) -> None:
         """Create metrics tables if they don't exist."""
         cursor = self._connection.cursor()
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'mission_rollups'")
+        has_rollups = cursor.fetchone() is not None
         cursor.execute(
             """
             CREATE TABLE IF NOT EXISTS mission_metrics (
@@ -97,11 +165,69 @@ class AgentMonitor:
             ON mission_metrics(status)
             """
         )
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS step_token_usage (
+                mission_id TEXT NOT NULL,
+                step INTEGER NOT NULL,
+                prompt_tokens INTEGER NOT NULL,
+                PRIMARY KEY (mission_id, step)
+            )
+            """
+        )
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS mission_rollups (
+                resolution TEXT NOT NULL,
+                bucket TEXT NOT NULL,
+                mission_type TEXT NOT NULL,
+                total INTEGER NOT NULL DEFAULT 0,
+                succeeded INTEGER NOT NULL DEFAULT 0,
+                failed INTEGER NOT NULL DEFAULT 0,
+                blocked INTEGER NOT NULL DEFAULT 0,
+                duration_sum REAL NOT NULL DEFAULT 0,
+                tool_calls INTEGER NOT NULL DEFAULT 0,
+                tokens INTEGER NOT NULL DEFAULT 0,
+                cost REAL NOT NULL DEFAULT 0,
+                PRIMARY KEY (resolution, bucket, mission_type)
+            )
+            """
+        )
+        if not has_rollups:
+            # Databases written before rollups existed: derive them once from raw rows
+            self._backfill_rollups(cursor)
         self._connection.commit()
 
+    def _backfill_rollups(self, cursor: sqlite3.Cursor) -> None:
+        """Build both rollup resolutions from the raw ``mission_metrics`` rows."""
+        for resolution, bucket_sql in (
+            (_MINUTE, "substr(timestamp, 1, 16)"),
+            (_HOUR, "substr(timestamp, 1, 13) || ':00'"),
+        ):
+            cursor.execute(
+                f"""
+                INSERT INTO mission_rollups
+                (resolution, bucket, mission_type, total, succeeded, failed, blocked,
+                 duration_sum, tool_calls, tokens, cost)
+                SELECT ?, {bucket_sql}, mission_type, COUNT(*),
+                       SUM(status = ?), SUM(status = ?), SUM(status = ?),
+                       SUM(duration_seconds), SUM(tool_call_count),
+                       COALESCE(SUM(token_usage), 0), COALESCE(SUM(cost_estimate), 0)
+                FROM mission_metrics
+                GROUP BY 2, mission_type
+                """,
+                (
+                    resolution,
+                    MissionStatus.SUCCEEDED.value,
+                    MissionStatus.FAILED.value,
+                    MissionStatus.BLOCKED.value,
+                ),
+            )
+
     def record_mission(self, outcome: MissionOutcome, mission_id: str, mission_type: str, 
                       duration: float, token_usage: int | None = None,
-                      cost_estimate: float | None = None) -> None:
+                      cost_estimate: float | None = None,
+                      step_token_usage: Sequence[int] | None = None) -> None:
         """Log mission execution metrics.
         
         Args:
@@ -111,7 +237,15 @@ class AgentMonitor:
             duration: Execution time in seconds
             token_usage: Optional LLM token count
             cost_estimate: Optional cost in USD
+            step_token_usage: Optional prompt tokens per planner turn; also
+                sets ``token_usage`` to their sum when it is not given
         """
+        if token_usage is None and step_token_usage:
+            token_usage = sum(step_token_usage)
+
+        MISSIONS.inc(mission_type=mission_type, status=outcome.status.value)
+        MISSION_SECONDS.observe(duration, mission_type=mission_type)
+
         # Count tool calls
         tool_call_count = sum(
             1 for step in outcome.steps 
@@ -125,7 +259,7 @@ class AgentMonitor:
             duration_seconds=duration,
             step_count=len(outcome.steps),
             tool_call_count=tool_call_count,
-            timestamp=datetime.utcnow(),
+            timestamp=self.clock(),
             error_message=outcome.summary if outcome.status == MissionStatus.FAILED else None,
             token_usage=token_usage,
             cost_estimate=cost_estimate,
@@ -152,10 +286,153 @@ class AgentMonitor:
                 metrics.cost_estimate,
             ),
         )
+        if step_token_usage:
+            cursor.executemany(
+                """
+                INSERT OR REPLACE INTO step_token_usage (mission_id, step, prompt_tokens)
+                VALUES (?, ?, ?)
+                """,
+                [(mission_id, step, tokens) for step, tokens in enumerate(step_token_usage, 1)],
+            )
+        self._add_to_rollups(cursor, metrics)
         self._connection.commit()
 
+        if self._last_prune is None or metrics.timestamp - self._last_prune >= _PRUNE_INTERVAL:
+            self.prune()
+
+    def _add_to_rollups(self, cursor: sqlite3.Cursor, metrics: MissionMetrics) -> None:
+        """Add one mission to its minute and hour buckets."""
+        values = (
+            1,
+            int(metrics.status == MissionStatus.SUCCEEDED),
+            int(metrics.status == MissionStatus.FAILED),
+            int(metrics.status == MissionStatus.BLOCKED),
+            metrics.duration_seconds,
+            metrics.tool_call_count,
+            metrics.token_usage or 0,
+            metrics.cost_estimate or 0.0,
+        )
+        cursor.executemany(
+            """
+            INSERT INTO mission_rollups
+            (resolution, bucket, mission_type, total, succeeded, failed, blocked,
+             duration_sum, tool_calls, tokens, cost)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT (resolution, bucket, mission_type) DO UPDATE SET
+                total = total + excluded.total,
+                succeeded = succeeded + excluded.succeeded,
+                failed = failed + excluded.failed,
+                blocked = blocked + excluded.blocked,
+                duration_sum = duration_sum + excluded.duration_sum,
+                tool_calls = tool_calls + excluded.tool_calls,
+                tokens = tokens + excluded.tokens,
+                cost = cost + excluded.cost
+            """,
+            [
+                (_MINUTE, _minute_key(metrics.timestamp), metrics.mission_type, *values),
+                (_HOUR, _hour_key(metrics.timestamp), metrics.mission_type, *values),
+            ],
+        )
+
+    def _window_totals(self, since: datetime) -> Dict[str, _RollupTotals]:
+        """Rollup totals per mission type for missions recorded after ``since``.
+
+        Reads per-minute buckets up to the first full hour and per-hour
+        buckets after it, so at most about 60 rows plus one per hour of the
+        window are read for each mission type. The window starts at the
+        minute containing ``since``, or at its hour once minute buckets that
+        old have been pruned.
+        """
+        hour_start = since.replace(minute=0, second=0, microsecond=0)
+        if since < self.clock() - self.minute_retention:
+            minute_from = minute_to = hour_from = _hour_key(hour_start)
+        else:
+            first_full_hour = hour_start if since == hour_start else hour_start + timedelta(hours=1)
+            minute_from = _minute_key(since)
+            minute_to = hour_from = _hour_key(first_full_hour)
+
+        cursor = self._connection.cursor()
+        cursor.execute(
+            """
+            SELECT mission_type, SUM(total) AS total, SUM(succeeded) AS succeeded,
+                   SUM(failed) AS failed, SUM(blocked) AS blocked,
+                   SUM(duration_sum) AS duration_sum, SUM(tool_calls) AS tool_calls,
+                   SUM(tokens) AS tokens, SUM(cost) AS cost
+            FROM mission_rollups
+            WHERE (resolution = ? AND bucket >= ? AND bucket < ?)
+               OR (resolution = ? AND bucket >= ?)
+            GROUP BY mission_type
+            """,
+            (_MINUTE, minute_from, minute_to, _HOUR, hour_from),
+        )
+        return {
+            row["mission_type"]: _RollupTotals(
+                total=row["total"],
+                succeeded=row["succeeded"],
+                failed=row["failed"],
+                blocked=row["blocked"],
+                duration_sum=row["duration_sum"],
+                tool_calls=row["tool_calls"],
+                tokens=row["tokens"],
+                cost=row["cost"],
+            )
+            for row in cursor.fetchall()
+        }
+
+    def prune(self) -> dict[str, int]:
+        """Delete raw rows and rollup buckets past their retention.
+
+        Runs when the monitor opens and at most hourly from
+        ``record_mission``.
+
+        Returns:
+            Number of rows deleted per table
+        """
+        now = self.clock()
+        deleted = {"mission_metrics": 0, "step_token_usage": 0, "mission_rollups": 0}
+        cursor = self._connection.cursor()
+        if self.raw_retention is not None:
+            cutoff = (now - self.raw_retention).isoformat()
+            cursor.execute(
+                """
+                DELETE FROM step_token_usage WHERE mission_id IN
+                (SELECT mission_id FROM mission_metrics WHERE timestamp < ?)
+                """,
+                (cutoff,),
+            )
+            deleted["step_token_usage"] = cursor.rowcount
+            cursor.execute("DELETE FROM mission_metrics WHERE timestamp < ?", (cutoff,))
+            deleted["mission_metrics"] = cursor.rowcount
+        cursor.execute(
+            "DELETE FROM mission_rollups WHERE resolution = ? AND bucket < ?",
+            (_MINUTE, _minute_key(now - self.minute_retention)),
+        )
+        deleted["mission_rollups"] = cursor.rowcount
+        if self.rollup_retention is not None:
+            cursor.execute(
+                "DELETE FROM mission_rollups WHERE resolution = ? AND bucket < ?",
+                (_HOUR, _hour_key(now - self.rollup_retention)),
+            )
+            deleted["mission_rollups"] += cursor.rowcount
+        self._connection.commit()
+        self._last_prune = now
+        return deleted
+
+    def get_step_token_usage(self, mission_id: str) -> list[int]:
+        """Prompt tokens per planner turn recorded for a mission, in order."""
+        cursor = self._connection.cursor()
+        cursor.execute(
+            "SELECT prompt_tokens FROM step_token_usage WHERE mission_id = ? ORDER BY step",
+            (mission_id,),
+        )
+        return [row["prompt_tokens"] for row in cursor.fetchall()]
+
     def check_health(self, lookback_hours: int = 24) -> HealthReport:
         """Assess agent health based on recent performance.
+
+        Counts and the average duration come from the rollup buckets, so the
+        window starts at minute (or, past ``minute_retention``, hour)
+        resolution.
         
         Args:
             lookback_hours: How many hours of history to analyze
@@ -163,22 +440,13 @@ class AgentMonitor:
         Returns:
             Health assessment report
         """
-        cutoff = datetime.utcnow() - timedelta(hours=lookback_hours)
-        
-        cursor = self._connection.cursor()
-        cursor.execute(
-            """
-            SELECT status, duration_seconds, error_message
-            FROM mission_metrics
-            WHERE timestamp > ?
-            ORDER BY timestamp DESC
-            """,
-            (cutoff.isoformat(),),
-        )
-        
-        rows = cursor.fetchall()
-        
-        if not rows:
+        cutoff = self.clock() - timedelta(hours=lookback_hours)
+
+        window = _RollupTotals()
+        for totals in self._window_totals(cutoff).values():
+            window.add(totals)
+
+        if not window.total:
             return HealthReport(
                 status=HealthStatus.HEALTHY,
                 total_missions=0,
@@ -189,22 +457,32 @@ class AgentMonitor:
                 recent_errors=[],
                 recommendations=["No recent mission executions"],
             )
-        
-        success_count = sum(1 for row in rows if row["status"] == MissionStatus.SUCCEEDED.value)
-        failure_count = sum(1 for row in rows if row["status"] == MissionStatus.FAILED.value)
-        blocked_count = sum(1 for row in rows if row["status"] == MissionStatus.BLOCKED.value)
-        
-        avg_duration = sum(row["duration_seconds"] for row in rows) / len(rows)
-        
-        # Collect recent errors
+
+        success_count = window.succeeded
+        failure_count = window.failed
+        blocked_count = window.blocked
+        avg_duration = window.duration_sum / window.total
+
+        # Collect recent errors from the last 5 missions
+        cursor = self._connection.cursor()
+        cursor.execute(
+            """
+            SELECT error_message
+            FROM mission_metrics
+            WHERE timestamp > ?
+            ORDER BY timestamp DESC
+            LIMIT 5
+            """,
+            (cutoff.isoformat(),),
+        )
         recent_errors = [
             row["error_message"]
-            for row in rows[:5]  # Last 5 missions
+            for row in cursor.fetchall()
             if row["error_message"] is not None
         ]
-        
+
         # Calculate health status
-        total = len(rows)
+        total = window.total
         success_rate = success_count / total if total > 0 else 0.0
         
         if success_rate >= 0.9 and failure_count < 3:
@@ -245,70 +523,42 @@ class AgentMonitor:
         Returns:
             Report data as dictionary
         """
-        cutoff = datetime.utcnow() - period
-        
-        cursor = self._connection.cursor()
-        cursor.execute(
-            """
-            SELECT 
-                COUNT(*) as total,
-                AVG(duration_seconds) as avg_duration,
-                SUM(CASE WHEN status = ? THEN 1 ELSE 0 END) as successes,
-                SUM(CASE WHEN status = ? THEN 1 ELSE 0 END) as failures,
-                SUM(CASE WHEN status = ? THEN 1 ELSE 0 END) as blocked,
-                SUM(tool_call_count) as total_tool_calls,
-                SUM(token_usage) as total_tokens,
-                SUM(cost_estimate) as total_cost
-            FROM mission_metrics
-            WHERE timestamp > ?
-            """,
-            (
-                MissionStatus.SUCCEEDED.value,
-                MissionStatus.FAILED.value,
-                MissionStatus.BLOCKED.value,
-                cutoff.isoformat(),
-            ),
-        )
-        
-        row = cursor.fetchone()
-        
-        # Get mission type breakdown
-        cursor.execute(
-            """
-            SELECT mission_type, COUNT(*) as count
-            FROM mission_metrics
-            WHERE timestamp > ?
-            GROUP BY mission_type
-            ORDER BY count DESC
-            """,
-            (cutoff.isoformat(),),
-        )
-        
-        mission_breakdown = {row["mission_type"]: row["count"] for row in cursor.fetchall()}
-        
-        total = row["total"] or 0
-        
+        now = self.clock()
+        cutoff = now - period
+
+        by_type = self._window_totals(cutoff)
+        window = _RollupTotals()
+        for totals in by_type.values():
+            window.add(totals)
+
+        mission_breakdown = {
+            mission_type: totals.total
+            for mission_type, totals in sorted(by_type.items(), key=lambda item: item[1].total, reverse=True)
+        }
+
+        total = window.total
+
         return {
             "period": {
                 "start": cutoff.isoformat(),
-                "end": datetime.utcnow().isoformat(),
+                "end": now.isoformat(),
                 "days": period.days,
             },
             "summary": {
                 "total_missions": total,
-                "success_rate": (row["successes"] / total * 100) if total > 0 else 0.0,
-                "failure_rate": (row["failures"] / total * 100) if total > 0 else 0.0,
-                "blocked_rate": (row["blocked"] / total * 100) if total > 0 else 0.0,
+                "success_rate": (window.succeeded / total * 100) if total > 0 else 0.0,
+                "failure_rate": (window.failed / total * 100) if total > 0 else 0.0,
+                "blocked_rate": (window.blocked / total * 100) if total > 0 else 0.0,
             },
             "performance": {
-                "avg_duration_seconds": row["avg_duration"] or 0.0,
-                "total_tool_calls": row["total_tool_calls"] or 0,
-                "avg_tool_calls_per_mission": (row["total_tool_calls"] / total) if total > 0 else 0.0,
+                "avg_duration_seconds": (window.duration_sum / total) if total > 0 else 0.0,
+                "total_tool_calls": window.tool_calls,
+                "avg_tool_calls_per_mission": (window.tool_calls / total) if total > 0 else 0.0,
             },
             "costs": {
-                "total_tokens": row["total_tokens"] or 0,
-                "total_cost_usd": row["total_cost"] or 0.0,
-                "avg_cost_per_mission": (row["total_cost"] / total) if total > 0 and row["total_cost"] else 0.0,
+                "total_tokens": window.tokens,
+                "total_cost_usd": round(window.cost, 6),
+                "avg_cost_per_mission": (window.cost / total) if total > 0 and window.cost else 0.0,
             },
             "mission_types": mission_breakdown,
         }
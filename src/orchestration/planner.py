@@ -33,5 +33,10 @@ class Planner:
         """Produce the next thought for the agent to execute."""
         raise NotImplementedError
 
+    @property
+    def prompt_token_usage(self) -> tuple[int, ...]:
+        """Prompt tokens sent per turn in the current mission (empty if not tracked)."""
+        return ()
+
 
 
@@ -0,0 +1,268 @@
+"""Content-addressed storage for large tool outputs.
+
+Tools such as ``list_pending_entities``, ``get_source_associations`` and the
+discussion readers return payloads that grow with the knowledge graph. Once
+serialized, such a payload is sent to the LLM on every planner turn and
+stored in ``MissionMemory.execution_steps.result_output``. A
+:class:`ResultStore` attached to the :class:`~.tools.ToolRegistry` keeps any
+output above ``inline_chars`` on disk instead, keyed by the SHA-256 of its
+canonical JSON. The tool result then carries only a compact summary and a
+``res-...`` handle. The ``expand_result`` tool reads slices of the stored
+payload back on demand, so prompt size, memory and SQLite row sizes stay
+bounded however large the graph gets.
+
+Example::
+
+    store = ResultStore(paths.get_tool_results_root())
+    registry = ToolRegistry(result_store=store)
+    register_result_tools(registry)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List
+
+RESULT_HANDLE_PREFIX = "res-"
+EXPAND_RESULT_TOOL = "expand_result"
+
+DEFAULT_INLINE_CHARS = 4_000
+DEFAULT_PAGE_SIZE = 20
+DEFAULT_PREVIEW_ITEMS = 3
+_SUMMARY_KEYS = 20
+_SHORT_TEXT_CHARS = 80
+_HANDLE_HEX_CHARS = 20
+
+
+class ResultStoreError(RuntimeError):
+    """Raised when a handle or path does not resolve to a stored value."""
+
+
+def _canonical_json(payload: Any) -> str:
+    return json.dumps(payload, sort_keys=True, default=str, separators=(",", ":"))
+
+
+# =============================================================================
+# Summaries
+# =============================================================================
+
+
+def _shape(value: Any) -> Any:
+    """One-line description of a value: short scalars as-is, containers by size."""
+    if isinstance(value, dict):
+        return f"object({len(value)} keys)"
+    if isinstance(value, (list, tuple)):
+        return f"list({len(value)} items)"
+    if isinstance(value, str) and len(value) > _SHORT_TEXT_CHARS:
+        return f"{value[:_SHORT_TEXT_CHARS]}... ({len(value)} chars)"
+    return value
+
+
+def _brief(item: Any) -> Any:
+    """Preview of one list item; objects keep their keys with shortened values."""
+    if isinstance(item, dict):
+        keys = list(item)[:_SUMMARY_KEYS]
+        return {key: _shape(item[key]) for key in keys}
+    return _shape(item)
+
+
+def summarize_payload(payload: Any, *, preview_items: int = DEFAULT_PREVIEW_ITEMS) -> Dict[str, Any]:
+    """Describe a payload's structure with a few sample items.
+
+    Lists report their length and the first ``preview_items`` entries.
+    Objects report each key's shape, with a preview for list-valued keys.
+    Text reports its length and first characters.
+    """
+    if isinstance(payload, dict):
+        keys = list(payload)
+        summary: Dict[str, Any] = {"type": "object", "keys": {}}
+        for key in keys[:_SUMMARY_KEYS]:
+            value = payload[key]
+            summary["keys"][key] = _shape(value)
+            if isinstance(value, (list, tuple)) and value:
+                summary.setdefault("previews", {})[key] = [_brief(item) for item in value[:preview_items]]
+        if len(keys) > _SUMMARY_KEYS:
+            summary["more_keys"] = len(keys) - _SUMMARY_KEYS
+        return summary
+    if isinstance(payload, (list, tuple)):
+        return {
+            "type": "list",
+            "length": len(payload),
+            "preview": [_brief(item) for item in payload[:preview_items]],
+        }
+    text = payload if isinstance(payload, str) else str(payload)
+    return {"type": "text", "length": len(text), "preview": text[:_SHORT_TEXT_CHARS * 4]}
+
+
+# =============================================================================
+# Store
+# =============================================================================
+
+
+class ResultStore:
+    """Keeps large tool outputs on disk under content-derived handles.
+
+    Identical payloads share one file, so repeated reads of an unchanged
+    listing cost no extra space. Files are written atomically and never
+    modified, which makes the store safe to share between workers.
+    """
+
+    def __init__(
+        self,
+        root: Path | str,
+        *,
+        inline_chars: int = DEFAULT_INLINE_CHARS,
+        preview_items: int = DEFAULT_PREVIEW_ITEMS,
+    ) -> None:
+        self._root = Path(root)
+        self._inline_chars = inline_chars
+        self._preview_items = preview_items
+
+    @property
+    def root(self) -> Path:
+        return self._root
+
+    @property
+    def inline_chars(self) -> int:
+        return self._inline_chars
+
+    def _path(self, handle: str) -> Path:
+        digest = handle[len(RESULT_HANDLE_PREFIX):]
+        if not handle.startswith(RESULT_HANDLE_PREFIX) or len(digest) != _HANDLE_HEX_CHARS or not all(
+            char in "0123456789abcdef" for char in digest
+        ):
+            raise ResultStoreError(f"Not a result handle: {handle!r}")
+        return self._root / digest[:2] / f"{digest}.json"
+
+    def put(self, payload: Any) -> str:
+        """Store ``payload`` (if not already stored) and return its handle."""
+        serialized = _canonical_json(payload)
+        handle = RESULT_HANDLE_PREFIX + hashlib.sha256(serialized.encode("utf-8")).hexdigest()[:_HANDLE_HEX_CHARS]
+        path = self._path(handle)
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, temp_name = tempfile.mkstemp(dir=path.parent, prefix=".tmp-", suffix=".json")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as handle_file:
+                    handle_file.write(serialized)
+                os.replace(temp_name, path)
+            except BaseException:
+                Path(temp_name).unlink(missing_ok=True)
+                raise
+        return handle
+
+    def load(self, handle: str) -> Any:
+        """Return the payload stored under ``handle``."""
+        path = self._path(handle)
+        try:
+            return json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError as exc:
+            raise ResultStoreError(f"Unknown result handle: {handle}") from exc
+
+    def __contains__(self, handle: str) -> bool:
+        try:
+            return self._path(handle).exists()
+        except ResultStoreError:
+            return False
+
+    def offload(self, output: Any) -> Any:
+        """Return ``output`` unchanged if small, else a summary and a handle."""
+        if output is None or isinstance(output, (bool, int, float)):
+            return output
+        size = len(json.dumps(output, default=str))
+        if size <= self._inline_chars:
+            return output
+        handle = self.put(output)
+        summary = summarize_payload(output, preview_items=self._preview_items)
+        if len(json.dumps(summary, default=str)) > self._inline_chars:
+            # Wide items make even the previews large; keep only the shape
+            summary.pop("previews", None)
+            summary.pop("preview", None)
+        return {
+            "result_handle": handle,
+            "size_chars": size,
+            "summary": summary,
+            "note": (
+                f"Full output stored out of line. Call {EXPAND_RESULT_TOOL} with "
+                f"handle '{handle}' (and optionally a path such as 'items' or 'items.3') "
+                "to read it page by page."
+            ),
+        }
+
+    def expand(
+        self,
+        handle: str,
+        path: str = "",
+        offset: int = 0,
+        limit: int = DEFAULT_PAGE_SIZE,
+    ) -> Dict[str, Any]:
+        """Return one page of the value at ``path`` inside a stored payload.
+
+        ``path`` is a dot-separated list of object keys and list indexes
+        (``"associations.12.target"``). Lists and objects are paged by
+        ``offset`` and at most ``limit`` items, fewer if the page would exceed
+        ``inline_chars``; text is paged by characters in pages of
+        ``inline_chars``. Items too large for one page are themselves
+        summarised, with the path that expands them.
+        """
+        value = self.load(handle)
+        for segment in [part for part in path.split(".") if part]:
+            value = _step(value, segment, path)
+
+        page: Dict[str, Any] = {"handle": handle, "path": path, "offset": offset}
+        if isinstance(value, (list, dict)):
+            entries = list(value.items()) if isinstance(value, dict) else list(enumerate(value))
+            fitted: List[tuple[Any, Any]] = []
+            used = 0
+            for key, item in entries[offset:offset + limit]:
+                item = self._fit_item(item, path, key)
+                size = len(json.dumps(item, default=str))
+                # Keep the page itself within the inline budget (always at least one item)
+                if fitted and used + size > self._inline_chars:
+                    break
+                fitted.append((key, item))
+                used += size
+            page["total"] = len(entries)
+            page["items"] = dict(fitted) if isinstance(value, dict) else [item for _, item in fitted]
+            end = offset + len(fitted)
+        elif isinstance(value, str):
+            page["total"] = len(value)
+            page["text"] = value[offset:offset + self._inline_chars]
+            end = offset + len(page["text"])
+        else:
+            page["total"] = 1
+            page["value"] = value
+            end = 1
+        page["next_offset"] = end if end < page["total"] else None
+        return page
+
+    def _fit_item(self, item: Any, path: str, key: Any) -> Any:
+        if len(json.dumps(item, default=str)) <= self._inline_chars:
+            return item
+        child = f"{path}.{key}" if path else str(key)
+        return {"summary": summarize_payload(item, preview_items=self._preview_items), "expand_path": child}
+
+
+def _step(value: Any, segment: str, path: str) -> Any:
+    if isinstance(value, dict):
+        if segment in value:
+            return value[segment]
+    elif isinstance(value, list) and segment.lstrip("-").isdigit():
+        index = int(segment)
+        if -len(value) <= index < len(value):
+            return value[index]
+    raise ResultStoreError(f"Path '{path}' does not exist in the stored result (failed at '{segment}')")
+
+
+__all__ = [
+    "DEFAULT_INLINE_CHARS",
+    "EXPAND_RESULT_TOOL",
+    "RESULT_HANDLE_PREFIX",
+    "ResultStore",
+    "ResultStoreError",
+    "summarize_payload",
+]
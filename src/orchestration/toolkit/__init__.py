@@ -10,6 +10,7 @@ from .github import (
 from .parsing import register_parsing_tools
 from .extraction import register_extraction_tools
 from .discussion_tools import register_all_discussion_tools as register_discussion_tools
+from .results import register_result_tools
 from .setup import register_setup_tools
 from .source_curator import register_source_curator_tools
 
@@ -20,6 +21,7 @@ __all__ = [
 	"register_parsing_tools",
     "register_extraction_tools",
     "register_discussion_tools",
+    "register_result_tools",
     "register_setup_tools",
     "register_source_curator_tools",
 ]
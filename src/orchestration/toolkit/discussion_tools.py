@@ -41,6 +41,7 @@ def register_discussion_read_tools(registry: ToolRegistry) -> None:
             },
             handler=_list_discussion_categories_handler,
             risk_level=ActionRisk.SAFE,
+            cache_scope="discussions",
         )
     )
 
@@ -70,6 +71,7 @@ def register_discussion_read_tools(registry: ToolRegistry) -> None:
             },
             handler=_get_category_by_name_handler,
             risk_level=ActionRisk.SAFE,
+            cache_scope="discussions",
         )
     )
 
@@ -103,6 +105,7 @@ def register_discussion_read_tools(registry: ToolRegistry) -> None:
             },
             handler=_find_discussion_by_title_handler,
             risk_level=ActionRisk.SAFE,
+            cache_scope="discussions",
         )
     )
 
@@ -132,6 +135,7 @@ def register_discussion_read_tools(registry: ToolRegistry) -> None:
             },
             handler=_get_discussion_handler,
             risk_level=ActionRisk.SAFE,
+            cache_scope="discussions",
         )
     )
 
@@ -166,6 +170,7 @@ def register_discussion_read_tools(registry: ToolRegistry) -> None:
             },
             handler=_list_discussions_handler,
             risk_level=ActionRisk.SAFE,
+            cache_scope="discussions",
         )
     )
 
@@ -208,6 +213,7 @@ def register_discussion_mutation_tools(registry: ToolRegistry) -> None:
             },
             handler=_create_discussion_handler,
             risk_level=ActionRisk.REVIEW,
+            cache_scope="discussions",
         )
     )
 
@@ -241,6 +247,7 @@ def register_discussion_mutation_tools(registry: ToolRegistry) -> None:
             },
             handler=_update_discussion_handler,
             risk_level=ActionRisk.REVIEW,
+            cache_scope="discussions",
         )
     )
 
@@ -271,6 +278,7 @@ def register_discussion_mutation_tools(registry: ToolRegistry) -> None:
             },
             handler=_add_discussion_comment_handler,
             risk_level=ActionRisk.REVIEW,
+            cache_scope="discussions",
         )
     )
 
@@ -6,10 +6,11 @@ from __future__ import annotations
 from datetime import datetime, timezone
 from typing import Any, Mapping
 
-from src.integrations.github.models import GitHubModelsClient
+from src.integrations.github.models import GitHubModelsClient, RateLimitError
 from src.integrations.github.issues import resolve_repository, resolve_token
 from src.integrations.github.pull_requests import create_pull_request
 from src.integrations.github.storage import commit_file
+from src.integrations.github.structured_output import StructuredOutputMetrics
 from src.knowledge.storage import KnowledgeGraphStorage
 from src.orchestration.tools import ToolDefinition
 from src.parsing.config import load_parsing_config
@@ -24,8 +25,17 @@ from src.knowledge.extraction import (
     process_document_profiles,
     process_document_concepts,
     process_document_associations,
+    read_document_content,
+    ExtractionError,
 )
-from src.parsing.storage import ParseStorage
+from src.knowledge.triage import (
+    ParagraphFrequency,
+    assess_with_model,
+    source_host,
+    strip_front_matter,
+    triage_document,
+)
+from src.parsing.storage import ManifestEntry, ParseStorage
 from src.orchestration.tools import ToolRegistry
 from src.paths import get_knowledge_graph_root
 
@@ -53,16 +63,21 @@ class ExtractionToolkit:
         
         # Client will be initialized on first use or we can try now
         # Ideally we share the client but for now we create a new one
-        self.client = GitHubModelsClient()
+        self.client = GitHubModelsClient(priority="bulk")
         
         # Create a mini model client for simple tasks (cheaper)
-        self.mini_client = GitHubModelsClient(model="gpt-4o-mini")
+        self.mini_client = GitHubModelsClient(model="gpt-4o-mini", priority="bulk")
+        
+        # Parse/validation failures and re-asks across all extractors
+        self.structured_metrics = StructuredOutputMetrics()
+        self.extractor = PersonExtractor(self.client, self.structured_metrics)
+        self.org_extractor = OrganizationExtractor(self.client, self.structured_metrics)
+        self.profile_extractor = ProfileExtractor(self.client, self.structured_metrics)
+        self.concept_extractor = ConceptExtractor(self.client, self.structured_metrics)
+        self.association_extractor = AssociationExtractor(self.client, self.structured_metrics)
         
-        self.extractor = PersonExtractor(self.client)
-        self.org_extractor = OrganizationExtractor(self.client)
-        self.profile_extractor = ProfileExtractor(self.client)
-        self.concept_extractor = ConceptExtractor(self.client)
-        self.association_extractor = AssociationExtractor(self.client)
+        # Per-host paragraph counts for boilerplate detection in triage
+        self._paragraph_frequencies: dict[str, ParagraphFrequency] = {}
 
     def get_tools(self) -> list[ToolDefinition]:
         return [
@@ -241,6 +256,8 @@ class ExtractionToolkit:
                 "extracted_count": len(people),
                 "people": people,
             }
+        except RateLimitError:
+            raise
         except Exception as exc:
             return f"Error during extraction: {exc}"
 
@@ -266,6 +283,8 @@ class ExtractionToolkit:
                 "extracted_count": len(organizations),
                 "organizations": organizations,
             }
+        except RateLimitError:
+            raise
         except Exception as exc:
             return f"Error during extraction: {exc}"
 
@@ -291,11 +310,17 @@ class ExtractionToolkit:
                 "extracted_count": len(profiles),
                 "profiles": [p.to_dict() for p in profiles],
             }
+        except RateLimitError:
+            raise
         except Exception as exc:
             return f"Error during extraction: {exc}"
 
     def _assess_document(self, args: Mapping[str, Any]) -> Any:
-        """Use LLM (mini model) to assess if document has substantive content."""
+        """Assess if document has substantive content.
+
+        Clear negatives and clear positives are decided by local heuristics;
+        only documents in the uncertain middle band go to the mini model.
+        """
         checksum = args["checksum"]
         
         entry = self.storage.manifest().get(checksum)
@@ -307,78 +332,69 @@ class ExtractionToolkit:
 
         try:
             # Read the parsed content using the extraction helper
-            from src.knowledge.extraction import read_document_content
             content = read_document_content(entry, self.storage)
-            if not content or len(content.strip()) < 50:
-                return {
-                    "status": "skip",
-                    "is_substantive": False,
-                    "reason": "Document content too short or empty",
-                    "confidence": 1.0,
-                }
-            
-            # Use mini model for cheap assessment
-            system_prompt = """You are a content assessment expert. Determine if a document contains substantive, extractable content.
-
-SKIP if the document is:
-- A navigation/menu page with only links
-- An error page (404, access denied, etc.)
-- Pure boilerplate without real content
-- A redirect or placeholder page
-- Just metadata without actual content
-
-EXTRACT if the document contains:
-- Real information about people, organizations, events, or concepts
-- Substantive text, analysis, or discussion
-- Actual content worth extracting entities from
+            return self.assess_content(entry, content)
+        except RateLimitError:
+            raise
+        except Exception as exc:
+            return {"status": "error", "message": f"Assessment failed: {exc}"}
 
-Return ONLY a JSON object with:
-{
-  "is_substantive": true/false,
-  "reason": "Brief explanation of your decision",
-  "confidence": 0.0-1.0
-}"""
+    def assess_content(self, entry: ManifestEntry, content: str) -> dict[str, Any]:
+        """Assess already-loaded document content (see ``_assess_document``).
+        
+        Raises:
+            RateLimitError: If the mini model is rate limited.
+        """
+        if not content or len(content.strip()) < 50:
+            return {
+                "status": "skip",
+                "is_substantive": False,
+                "reason": "Document content too short or empty",
+                "confidence": 1.0,
+            }
+        
+        decision = triage_document(content, self._paragraph_frequency(entry))
+        if decision.verdict == "skip":
+            return {
+                "status": "skip",
+                "is_substantive": False,
+                "reason": decision.reason,
+                "confidence": decision.confidence,
+                "method": "heuristic",
+            }
+        if decision.verdict == "accept":
+            return {
+                "status": "success",
+                "is_substantive": True,
+                "reason": decision.reason,
+                "confidence": decision.confidence,
+                "method": "heuristic",
+            }
+        
+        # Uncertain band: use mini model for cheap assessment
+        try:
+            result = assess_with_model(self.mini_client, strip_front_matter(content))
+        except ValueError as exc:
+            return {"status": "error", "message": str(exc)}
+        return {"status": "success", **result, "method": "model"}
 
-            user_prompt = f"Assess this document content (first 3000 chars):\n\n{content[:3000]}"
-            
-            messages = [
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt},
-            ]
-            
-            response = self.mini_client.chat_completion(
-                messages=messages,
-                temperature=0.1,
-                max_tokens=300,
-            )
-            
-            if not response.choices:
-                return {"status": "error", "message": "No response from LLM"}
-            
-            result_text = response.choices[0].message.content.strip()
-            
-            # Parse JSON response
-            import json
+    def _paragraph_frequency(self, entry: ManifestEntry) -> ParagraphFrequency:
+        """Paragraph frequency table for the entry's source host, built once per host."""
+        host = source_host(entry.source)
+        frequency = self._paragraph_frequencies.get(host)
+        if frequency is not None:
+            return frequency
+        
+        frequency = ParagraphFrequency()
+        for other in self.storage.manifest().entries.values():
+            if other.status != "completed" or source_host(other.source) != host:
+                continue
             try:
-                result = json.loads(result_text)
-                return {
-                    "status": "success",
-                    "is_substantive": result.get("is_substantive", False),
-                    "reason": result.get("reason", ""),
-                    "confidence": result.get("confidence", 0.5),
-                }
-            except json.JSONDecodeError:
-                # Fallback: look for true/false in response
-                is_substantive = "true" in result_text.lower()
-                return {
-                    "status": "success",
-                    "is_substantive": is_substantive,
-                    "reason": result_text,
-                    "confidence": 0.7,
-                }
-                
-        except Exception as exc:
-            return {"status": "error", "message": f"Assessment failed: {exc}"}
+                frequency.add_document(read_document_content(other, self.storage))
+            except ExtractionError:
+                continue
+        self._paragraph_frequencies[host] = frequency
+        return frequency
 
     def _extract_concepts(self, args: Mapping[str, Any]) -> Any:
         """Extract concepts from document."""
@@ -403,6 +419,8 @@ Return ONLY a JSON object with:
                 "extracted_count": len(concepts),
                 "concepts": concepts,
             }
+        except RateLimitError:
+            raise
         except Exception as exc:
             return f"Error during extraction: {exc}"
 
@@ -429,6 +447,8 @@ Return ONLY a JSON object with:
                 "extracted_count": len(associations),
                 "associations": [a.to_dict() for a in associations],
             }
+        except RateLimitError:
+            raise
         except Exception as exc:
             return f"Error during extraction: {exc}"
 
@@ -42,6 +42,7 @@ def register_github_read_only_tools(registry: ToolRegistry) -> None:
             },
             handler=_get_issue_details_handler,
             risk_level=ActionRisk.SAFE,
+            cache_scope="issues",
         )
     )
 
@@ -71,6 +72,7 @@ def register_github_read_only_tools(registry: ToolRegistry) -> None:
             },
             handler=_get_issue_comments_handler,
             risk_level=ActionRisk.SAFE,
+            cache_scope="issues",
         )
     )
 
@@ -110,6 +112,7 @@ def register_github_read_only_tools(registry: ToolRegistry) -> None:
             },
             handler=_search_issues_by_label_handler,
             risk_level=ActionRisk.SAFE,
+            cache_scope="issues",
         )
     )
 
@@ -148,6 +151,7 @@ def register_github_read_only_tools(registry: ToolRegistry) -> None:
             },
             handler=_search_issues_assigned_handler,
             risk_level=ActionRisk.SAFE,
+            cache_scope="issues",
         )
     )
 
@@ -181,6 +185,7 @@ def register_github_read_only_tools(registry: ToolRegistry) -> None:
             },
             handler=_get_ready_for_copilot_issue_handler,
             risk_level=ActionRisk.SAFE,
+            cache_scope="issues",
         )
     )
 
@@ -511,6 +516,7 @@ def register_github_pr_tools(registry: ToolRegistry) -> None:
             },
             handler=lambda args: _get_pr_details_handler(args, github_prs),
             risk_level=ActionRisk.SAFE,
+            cache_scope="pulls",
         )
     )
 
@@ -540,6 +546,7 @@ def register_github_pr_tools(registry: ToolRegistry) -> None:
             },
             handler=lambda args: _get_pr_files_handler(args, github_prs),
             risk_level=ActionRisk.SAFE,
+            cache_scope="pulls",
         )
     )
 
@@ -621,6 +628,7 @@ def register_github_mutation_tools(registry: ToolRegistry) -> None:
             },
             handler=_add_label_handler,
             risk_level=ActionRisk.REVIEW,
+            cache_scope="issues",
         )
     )
 
@@ -655,6 +663,7 @@ def register_github_mutation_tools(registry: ToolRegistry) -> None:
             },
             handler=_remove_label_handler,
             risk_level=ActionRisk.REVIEW,
+            cache_scope="issues",
         )
     )
 
@@ -689,6 +698,7 @@ def register_github_mutation_tools(registry: ToolRegistry) -> None:
             },
             handler=_post_comment_handler,
             risk_level=ActionRisk.REVIEW,
+            cache_scope="issues",
         )
     )
 
@@ -724,6 +734,7 @@ def register_github_mutation_tools(registry: ToolRegistry) -> None:
             },
             handler=_assign_issue_handler,
             risk_level=ActionRisk.REVIEW,
+            cache_scope="issues",
         )
     )
 
@@ -759,6 +770,7 @@ def register_github_mutation_tools(registry: ToolRegistry) -> None:
             },
             handler=_assign_issue_to_copilot_handler,
             risk_level=ActionRisk.REVIEW,
+            cache_scope="issues",
         )
     )
 
@@ -792,6 +804,7 @@ def register_github_mutation_tools(registry: ToolRegistry) -> None:
             },
             handler=_update_issue_body_handler,
             risk_level=ActionRisk.REVIEW,
+            cache_scope="issues",
         )
     )
 
@@ -825,6 +838,7 @@ def register_github_mutation_tools(registry: ToolRegistry) -> None:
             },
             handler=_close_issue_handler,
             risk_level=ActionRisk.DESTRUCTIVE,
+            cache_scope="issues",
         )
     )
 
@@ -859,6 +873,7 @@ def register_github_mutation_tools(registry: ToolRegistry) -> None:
             },
             handler=_lock_issue_handler,
             risk_level=ActionRisk.DESTRUCTIVE,
+            cache_scope="issues",
         )
     )
 
@@ -892,6 +907,7 @@ def register_github_mutation_tools(registry: ToolRegistry) -> None:
             },
             handler=_approve_pr_handler,
             risk_level=ActionRisk.REVIEW,
+            cache_scope="pulls",
         )
     )
 
@@ -1023,6 +1039,7 @@ def register_github_mutation_tools(registry: ToolRegistry) -> None:
             },
             handler=_read_file_content_handler,
             risk_level=ActionRisk.SAFE,
+            cache_scope="files",
         )
     )
 
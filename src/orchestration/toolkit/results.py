@@ -0,0 +1,75 @@
+"""Tool for reading large tool outputs kept in the registry's result store."""
+
+from __future__ import annotations
+
+from typing import Any, Mapping
+
+from ..results import DEFAULT_PAGE_SIZE, EXPAND_RESULT_TOOL, ResultStore, ResultStoreError
+from ..safety import ActionRisk
+from ..tools import ToolDefinition, ToolRegistry, ToolRegistryError
+from ..types import ToolResult
+
+MAX_PAGE_SIZE = 100
+
+
+def register_result_tools(registry: ToolRegistry) -> None:
+    """Register ``expand_result`` for the registry's result store."""
+
+    store = registry.result_store
+    if store is None:
+        raise ToolRegistryError("register_result_tools requires a ToolRegistry with a result_store.")
+
+    registry.register_tool(
+        ToolDefinition(
+            name=EXPAND_RESULT_TOOL,
+            description=(
+                "Read part of a large tool output that was replaced by a summary and a "
+                "result_handle. Returns one page of the list, object or text at 'path'; "
+                "call again with 'next_offset' for the following page."
+            ),
+            parameters={
+                "type": "object",
+                "properties": {
+                    "handle": {
+                        "type": "string",
+                        "description": "The result_handle from the summarized output (res-...).",
+                    },
+                    "path": {
+                        "type": "string",
+                        "description": (
+                            "Dot-separated keys and list indexes inside the output, e.g. "
+                            "'pending' or 'associations.12'. Empty for the top level."
+                        ),
+                    },
+                    "offset": {
+                        "type": "integer",
+                        "minimum": 0,
+                        "description": "First item (or character, for text) to return. Defaults to 0.",
+                    },
+                    "limit": {
+                        "type": "integer",
+                        "minimum": 1,
+                        "maximum": MAX_PAGE_SIZE,
+                        "description": f"Maximum items per page. Defaults to {DEFAULT_PAGE_SIZE}.",
+                    },
+                },
+                "required": ["handle"],
+                "additionalProperties": False,
+            },
+            handler=lambda args: _expand_result_handler(store, args),
+            risk_level=ActionRisk.SAFE,
+        )
+    )
+
+
+def _expand_result_handler(store: ResultStore, args: Mapping[str, Any]) -> ToolResult:
+    try:
+        page = store.expand(
+            args["handle"],
+            path=args.get("path") or "",
+            offset=args.get("offset", 0),
+            limit=args.get("limit", DEFAULT_PAGE_SIZE),
+        )
+    except ResultStoreError as exc:
+        return ToolResult(success=False, output=None, error=str(exc))
+    return ToolResult(success=True, output=page, error=None)
@@ -51,6 +51,7 @@ def _register_read_tools(registry: ToolRegistry) -> None:
             },
             handler=_get_source_handler,
             risk_level=ActionRisk.SAFE,
+            cache_scope="sources",
         )
     )
 
@@ -81,6 +82,7 @@ def _register_read_tools(registry: ToolRegistry) -> None:
             },
             handler=_list_sources_handler,
             risk_level=ActionRisk.SAFE,
+            cache_scope="sources",
         )
     )
 
@@ -236,6 +238,7 @@ def _register_write_tools(registry: ToolRegistry) -> None:
             },
             handler=_register_source_handler,
             risk_level=ActionRisk.REVIEW,
+            cache_scope="sources",
         )
     )
 
@@ -269,6 +272,7 @@ def _register_write_tools(registry: ToolRegistry) -> None:
             },
             handler=_update_source_status_handler,
             risk_level=ActionRisk.REVIEW,
+            cache_scope="sources",
         )
     )
 
@@ -7,11 +7,15 @@ before execution to ensure parameter correctness.
 
 from __future__ import annotations
 
+import json
 from dataclasses import dataclass
 from typing import Any, Callable, Dict, Iterable, Mapping
 
 from jsonschema import Draft7Validator, ValidationError
 
+from src.tracing import span
+
+from .results import EXPAND_RESULT_TOOL, ResultStore
 from .safety import ActionRisk
 from .types import ToolResult
 
@@ -31,6 +35,10 @@ class ToolDefinition:
     parameters: Mapping[str, Any]
     handler: Handler
     risk_level: ActionRisk = ActionRisk.SAFE
+    # Resource family the tool reads or mutates ("issues", "discussions", ...).
+    # SAFE tools with a scope are cached per mission; other tools with a scope
+    # invalidate that family. Non-SAFE tools without one invalidate everything.
+    cache_scope: str | None = None
 
 
 @dataclass(frozen=True)
@@ -44,11 +52,22 @@ class ToolExecution:
 
 
 class ToolRegistry:
-    """Registry storing all available tools for the agent."""
+    """Registry storing all available tools for the agent.
 
-    def __init__(self) -> None:
+    With a ``result_store``, successful outputs larger than the store's
+    ``inline_chars`` are replaced by a summary and a handle (see
+    :mod:`.results`); register the ``expand_result`` tool with
+    ``register_result_tools`` so the planner can read them back.
+    """
+
+    def __init__(self, result_store: ResultStore | None = None) -> None:
         self._tools: Dict[str, ToolDefinition] = {}
         self._validators: Dict[str, Draft7Validator] = {}
+        self._result_store = result_store
+
+    @property
+    def result_store(self) -> ResultStore | None:
+        return self._result_store
 
     def register_tool(self, tool: ToolDefinition) -> None:
         """Register a new tool with the registry."""
@@ -125,17 +144,129 @@ class ToolRegistry:
                 message = self._validation_error_message(definition.name, exc)
                 return ToolResult(success=False, output=None, error=message)
         try:
-            raw_result = definition.handler(payload)
+            with span(f"tool.{definition.name}") as current:
+                raw_result = definition.handler(payload)
+                if isinstance(raw_result, ToolResult):
+                    current.set(success=raw_result.success)
         except Exception as exc:  # pragma: no cover - tool handler surface
             raise ToolRegistryError(
                 f"Execution of tool '{definition.name}' failed."
             ) from exc
         if isinstance(raw_result, ToolResult):
-            return raw_result
-        return ToolResult(success=True, output=raw_result, error=None)
+            result = raw_result
+        else:
+            result = ToolResult(success=True, output=raw_result, error=None)
+        if self._result_store is not None and result.success and definition.name != EXPAND_RESULT_TOOL:
+            output = self._result_store.offload(result.output)
+            if output is not result.output:
+                result = ToolResult(success=True, output=output, error=result.error)
+        return result
 
     def __contains__(self, tool_name: str) -> bool:
         return tool_name in self._tools
 
     def __iter__(self):  # type: ignore[override]
         return iter(self._tools.values())
+
+
+# Arguments that identify what a tool call reads or changes. A cached read
+# survives a mutation only when one of these provably differs between them.
+CACHE_IDENTITY_ARGUMENTS = (
+    "repository",
+    "issue_number",
+    "pr_number",
+    "discussion_number",
+    "discussion_id",
+    "title",
+    "path",
+    "url",
+    "source_url",
+    "kb_root",
+)
+
+
+@dataclass
+class _CachedRead:
+    scope: str
+    identity: Dict[str, Any]
+    result: ToolResult
+
+
+class ToolResultCache:
+    """Read-through cache of tool results for a single mission.
+
+    Successful results of SAFE tools that declare a ``cache_scope`` are
+    keyed by tool name and normalized arguments. Running any other tool
+    drops the cached reads it could have changed, so the planner never sees
+    data older than its own writes.
+    """
+
+    def __init__(self) -> None:
+        self._entries: Dict[str, _CachedRead] = {}
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def _arguments(arguments: Mapping[str, Any]) -> Dict[str, Any]:
+        return {key: value for key, value in arguments.items() if value is not None}
+
+    @classmethod
+    def _key(cls, name: str, arguments: Mapping[str, Any]) -> str:
+        normalized = json.dumps(cls._arguments(arguments), sort_keys=True, default=str)
+        return f"{name}:{normalized}"
+
+    @classmethod
+    def _identity(cls, arguments: Mapping[str, Any]) -> Dict[str, Any]:
+        normalized = cls._arguments(arguments)
+        return {key: normalized[key] for key in CACHE_IDENTITY_ARGUMENTS if key in normalized}
+
+    @staticmethod
+    def is_cacheable(definition: ToolDefinition) -> bool:
+        return definition.cache_scope is not None and definition.risk_level is ActionRisk.SAFE
+
+    def get(self, definition: ToolDefinition, arguments: Mapping[str, Any]) -> ToolResult | None:
+        """Return the cached result for a read, counting the hit or miss."""
+        if not self.is_cacheable(definition):
+            return None
+        entry = self._entries.get(self._key(definition.name, arguments))
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry.result
+
+    def record(self, definition: ToolDefinition, arguments: Mapping[str, Any], result: ToolResult) -> None:
+        """Cache a read's result, or invalidate what a mutation may have changed."""
+        if definition.risk_level is ActionRisk.SAFE:
+            # Unscoped reads are not cached and change nothing
+            if definition.cache_scope is not None and result.success:
+                self._entries[self._key(definition.name, arguments)] = _CachedRead(
+                    scope=definition.cache_scope,
+                    identity=self._identity(arguments),
+                    result=result,
+                )
+            return
+        self._invalidate(definition.cache_scope, self._identity(arguments))
+
+    def _invalidate(self, scope: str | None, identity: Mapping[str, Any]) -> None:
+        stale = [
+            key
+            for key, entry in self._entries.items()
+            if (scope is None or entry.scope == scope)
+            and not any(
+                key_name in identity and identity[key_name] != value
+                for key_name, value in entry.identity.items()
+            )
+        ]
+        for key in stale:
+            del self._entries[key]
+        self.invalidations += len(stale)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "invalidations": self.invalidations,
+            "entries": len(self._entries),
+        }
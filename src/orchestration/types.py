@@ -40,6 +40,15 @@ class Thought:
     content: str
     type: ThoughtType
     tool_call: ToolCall | None = None
+    # Further calls the planner requested in the same turn, after ``tool_call``
+    additional_tool_calls: tuple[ToolCall, ...] = ()
+
+    @property
+    def tool_calls(self) -> tuple[ToolCall, ...]:
+        """Every tool call in this thought, in the order the planner gave them."""
+        if self.tool_call is None:
+            return ()
+        return (self.tool_call, *self.additional_tool_calls)
 
 
 @dataclass(frozen=True)
@@ -66,6 +75,9 @@ class MissionOutcome:
     status: MissionStatus
     steps: Sequence[AgentStep]
     summary: str | None = None
+    tool_cache: Mapping[str, int] | None = None
+    # Checkpoint handle for ``agent run --resume`` when checkpointing is enabled
+    execution_id: str | None = None
 
 
 @dataclass(frozen=True)
@@ -5,20 +5,18 @@ from __future__ import annotations
 from dataclasses import dataclass
 from pathlib import Path
 from datetime import datetime
-from typing import Any, Iterable, Iterator, Sequence
-
-from docx import Document as load_docx
-from docx.document import Document as DocxDocument
-from docx.opc.exceptions import PackageNotFoundError
-from docx.oxml.ns import qn
-from docx.table import Table as DocxTable
-from docx.text.paragraph import Paragraph as DocxParagraph
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, Sequence
 
 from . import utils
 from .base import ParsedDocument, ParseTarget, ParserError
 from .markdown import document_to_markdown
 from .registry import registry
 
+if TYPE_CHECKING:
+    from docx.document import Document as DocxDocument
+    from docx.table import Table as DocxTable
+    from docx.text.paragraph import Paragraph as DocxParagraph
+
 
 @dataclass(slots=True)
 class DocxParser:
@@ -47,6 +45,12 @@ class DocxParser:
         checksum = utils.sha256_path(path)
         document = ParsedDocument(target=target, checksum=checksum, parser_name=self.name)
 
+        # Imported on first use to keep CLI startup fast
+        from docx import Document as load_docx
+        from docx.opc.exceptions import PackageNotFoundError
+        from docx.table import Table as DocxTable
+        from docx.text.paragraph import Paragraph as DocxParagraph
+
         try:
             docx_document = load_docx(str(path))
         except (PackageNotFoundError, ValueError, OSError) as exc:
@@ -105,6 +109,9 @@ class DocxParser:
 
 def _iter_document_blocks(doc: DocxDocument) -> Iterator[DocxParagraph | DocxTable]:
     """Yield block-level elements preserving document order."""
+    from docx.oxml.ns import qn
+    from docx.table import Table as DocxTable
+    from docx.text.paragraph import Paragraph as DocxParagraph
 
     body = doc.element.body
     for child in body.iterchildren():
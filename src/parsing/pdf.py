@@ -5,16 +5,16 @@ from __future__ import annotations
 import re
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
-
-from pypdf import PdfReader
-from pypdf.errors import PdfReadError
+from typing import TYPE_CHECKING, Any
 
 from . import utils
 from .base import ParsedDocument, ParseTarget, ParserError
 from .markdown import document_to_markdown
 from .registry import registry
 
+if TYPE_CHECKING:
+    from pypdf import PdfReader
+
 
 @dataclass(slots=True)
 class PdfParser:
@@ -42,6 +42,10 @@ class PdfParser:
         checksum = utils.sha256_path(path)
         document = ParsedDocument(target=target, checksum=checksum, parser_name=self.name)
 
+        # Imported on first use to keep CLI startup fast
+        from pypdf import PdfReader
+        from pypdf.errors import PdfReadError
+
         try:
             reader = PdfReader(str(path))
         except PdfReadError as exc:  # pragma: no cover - library-specific failure path
@@ -11,6 +11,8 @@ import logging
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Literal
 
+from src.tracing import span, traced
+
 if TYPE_CHECKING:
     from playwright.sync_api import Page
 
@@ -56,6 +58,7 @@ def is_playwright_available() -> bool:
         return False
 
 
+@traced("parsing.render_page")
 def render_page(
     url: str,
     *,
@@ -226,10 +229,11 @@ def render_and_extract_text(
     
     rendered = render_page(url, user_agent=user_agent, headless=headless, timeout=timeout)
     
-    extracted = trafilatura.extract(
-        rendered.html,
-        url=rendered.final_url,
-    )
+    with span("parsing.trafilatura_extract", url=rendered.final_url):
+        extracted = trafilatura.extract(
+            rendered.html,
+            url=rendered.final_url,
+        )
     
     return extracted or "", rendered
 
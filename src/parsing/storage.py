@@ -8,6 +8,8 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
+from src.tracing import traced
+
 from . import utils
 from .base import ParsedDocument
 from .markdown import document_to_markdown
@@ -197,6 +199,7 @@ class ParseStorage:
         if not self._defer_manifest_writes:
             self._write_manifest()
 
+    @traced("parsing.persist_document")
     def persist_document(self, document: ParsedDocument) -> ManifestEntry:
         """Write the document to disk and record a manifest entry."""
 
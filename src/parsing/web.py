@@ -3,16 +3,14 @@
 from __future__ import annotations
 
 import logging
+import time
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Callable
 
-import trafilatura
-try:  # pragma: no cover - optional dependency fallback
-    from bs4 import BeautifulSoup
-except ImportError:  # pragma: no cover - executed only if dependency missing
-    BeautifulSoup = None
+from src.metrics import PAGES_FETCHED, RENDER_SECONDS
+from src.tracing import span
 
 from . import utils
 from .base import ParsedDocument, ParseTarget, ParserError
@@ -83,6 +81,7 @@ class WebParser:
         
         logger.info("Fetching %s with browser rendering", target.source)
         
+        started = time.perf_counter()
         try:
             rendered = render_page(
                 target.source,
@@ -91,7 +90,11 @@ class WebParser:
                 timeout=self.timeout,
             )
         except RenderingError as e:
+            RENDER_SECONDS.observe(time.perf_counter() - started, outcome="error")
+            PAGES_FETCHED.inc(outcome="error")
             raise ParserError(f"Failed to fetch URL '{target.source}': {e}") from e
+        RENDER_SECONDS.observe(time.perf_counter() - started, outcome="ok")
+        PAGES_FETCHED.inc(outcome="ok")
         
         document_target = ParseTarget(
             source=target.source,
@@ -151,11 +154,14 @@ class WebParser:
         return document
 
     def _populate_segments(self, document: ParsedDocument, html: str, target: ParseTarget) -> None:
+        import trafilatura  # Imported on first use to keep CLI startup fast
+
         normalized_html = _rewrite_key_value_tables(html)
-        extracted = trafilatura.extract(
-            normalized_html,
-            url=target.source if target.is_remote else None,
-        )
+        with span("parsing.trafilatura_extract", url=target.source):
+            extracted = trafilatura.extract(
+                normalized_html,
+                url=target.source if target.is_remote else None,
+            )
         if not extracted:
             document.warnings.append("No extractable text found in HTML content")
             return
@@ -205,7 +211,9 @@ def _sleep(seconds: float) -> None:
 
 
 def _rewrite_key_value_tables(html: str) -> str:
-    if BeautifulSoup is None:
+    try:
+        from bs4 import BeautifulSoup
+    except ImportError:  # pragma: no cover - executed only if dependency missing
         return html
 
     soup = BeautifulSoup(html, "html.parser")
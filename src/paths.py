@@ -27,6 +27,10 @@ def get_reports_root() -> Path:
     """Get the root directory for report files."""
     return get_data_root() / "reports"
 
+def get_tool_results_root() -> Path:
+    """Get the root directory for large agent tool outputs kept out of line."""
+    return get_data_root() / ".tool-results"
+
 def get_config_file() -> Path:
     """Get the path to the project configuration file."""
     return Path("config/manifest.json")
@@ -0,0 +1,408 @@
+"""Lightweight timing spans for the pipeline, GitHub calls and agent tools.
+
+Spans nest through a :mod:`contextvars` variable, so the current span follows
+the code that opened it, including into worker threads started with
+:func:`bind`. Finished spans are appended to a JSONL trace file, one object
+per line. Tracing is off (and a span costs one attribute lookup) until a trace
+file is configured with :func:`configure` or the ``SPECULUM_TRACE_FILE``
+environment variable.
+
+Example::
+
+    with span("parsing.persist_document", source=url) as current:
+        entry = storage.persist_document(document)
+        current.set(segments=len(document.segments))
+
+A trace file can be summarised with :func:`summarize` (``pipeline profile``)
+or converted with :func:`to_chrome_trace` for ``chrome://tracing`` and
+Perfetto.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import functools
+import itertools
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, TypeVar
+
+logger = logging.getLogger(__name__)
+
+TRACE_FILE_ENV = "SPECULUM_TRACE_FILE"
+
+_T = TypeVar("_T")
+
+
+# =============================================================================
+# Spans
+# =============================================================================
+
+
+@dataclass
+class Span:
+    """One timed operation.
+
+    Attributes:
+        name: Operation name; the profile groups spans by it.
+        trace_id: Shared by every span under the same root span (one run).
+        span_id: Identifier of this span within the process.
+        parent_id: ``span_id`` of the enclosing span, if any.
+        start: Wall-clock start time (epoch seconds).
+        duration: Elapsed seconds, set when the span ends.
+        attributes: Extra key/value details (JSON-serialisable).
+        error: Exception type name if the span ended by raising.
+    """
+
+    name: str
+    trace_id: str
+    span_id: str
+    parent_id: str | None
+    start: float
+    duration: float = 0.0
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    error: str | None = None
+
+    def set(self, **attributes: Any) -> None:
+        """Add or replace attributes while the span is open."""
+        self.attributes.update(attributes)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "start": self.start,
+            "duration": self.duration,
+            "thread": threading.current_thread().name,
+            "pid": os.getpid(),
+            "attributes": self.attributes,
+            "error": self.error,
+        }
+
+
+class _NoopSpan:
+    """Stand-in yielded while tracing is disabled."""
+
+    def set(self, **attributes: Any) -> None:
+        pass
+
+
+_NOOP_SPAN = _NoopSpan()
+_current: contextvars.ContextVar[Span | None] = contextvars.ContextVar("speculum_span", default=None)
+_span_ids = itertools.count(1)
+
+
+# =============================================================================
+# Tracer
+# =============================================================================
+
+
+class Tracer:
+    """Appends finished spans to a JSONL file (thread-safe)."""
+
+    def __init__(self, path: Path | str | None = None) -> None:
+        self._path = Path(path) if path else None
+        self._lock = threading.Lock()
+        self._handle: Any = None
+
+    @property
+    def enabled(self) -> bool:
+        return self._path is not None
+
+    @property
+    def path(self) -> Path | None:
+        return self._path
+
+    def record(self, finished: Span) -> None:
+        """Write one finished span."""
+        if self._path is None:
+            return
+        line = json.dumps(finished.to_dict(), default=str)
+        with self._lock:
+            try:
+                if self._handle is None:
+                    self._path.parent.mkdir(parents=True, exist_ok=True)
+                    self._handle = self._path.open("a", encoding="utf-8")
+                self._handle.write(line + "\n")
+                self._handle.flush()
+            except OSError as exc:
+                logger.warning("Disabling tracing; cannot write %s: %s", self._path, exc)
+                self._path = None
+
+    def close(self) -> None:
+        with self._lock:
+            if self._handle is not None:
+                self._handle.close()
+                self._handle = None
+
+
+_tracer: Tracer | None = None
+_tracer_lock = threading.Lock()
+
+
+def get_tracer() -> Tracer:
+    """The process-wide tracer; reads ``SPECULUM_TRACE_FILE`` on first use."""
+    global _tracer
+    if _tracer is None:
+        with _tracer_lock:
+            if _tracer is None:
+                _tracer = Tracer(os.environ.get(TRACE_FILE_ENV) or None)
+    return _tracer
+
+
+def configure(path: Path | str | None) -> Tracer:
+    """Send spans to ``path`` (``None`` turns tracing off)."""
+    global _tracer
+    with _tracer_lock:
+        if _tracer is not None:
+            _tracer.close()
+        _tracer = Tracer(path)
+        return _tracer
+
+
+# =============================================================================
+# Span API
+# =============================================================================
+
+
+@contextmanager
+def span(name: str, **attributes: Any) -> Iterator[Any]:
+    """Time the enclosed block as a child of the current span.
+
+    ``name`` is ``<area>.<operation>``, e.g. ``pipeline.crawl`` or
+    ``github.GET /repos/{owner}/{repo}``; the area is the Chrome trace
+    category. Yields the open :class:`Span` (or a no-op stand-in when tracing
+    is off); call ``set(...)`` on it to attach results known only at the end.
+    """
+    tracer = get_tracer()
+    if not tracer.enabled:
+        yield _NOOP_SPAN
+        return
+
+    parent = _current.get()
+    opened = Span(
+        name=name,
+        trace_id=parent.trace_id if parent is not None else uuid.uuid4().hex[:16],
+        span_id=f"{os.getpid():x}-{next(_span_ids):x}",
+        parent_id=parent.span_id if parent is not None else None,
+        start=time.time(),
+        attributes=dict(attributes),
+    )
+    token = _current.set(opened)
+    started = time.perf_counter()
+    try:
+        yield opened
+    except BaseException as exc:
+        opened.error = type(exc).__name__
+        raise
+    finally:
+        opened.duration = time.perf_counter() - started
+        _current.reset(token)
+        tracer.record(opened)
+
+
+def traced(name: str) -> Callable[[Callable[..., _T]], Callable[..., _T]]:
+    """Decorator form of :func:`span`."""
+
+    def decorator(fn: Callable[..., _T]) -> Callable[..., _T]:
+        @functools.wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> _T:
+            with span(name):
+                return fn(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def current_span() -> Span | None:
+    """The innermost open span in this context, if any."""
+    return _current.get()
+
+
+def bind(fn: Callable[..., _T]) -> Callable[..., _T]:
+    """Wrap ``fn`` so calls from worker threads nest under the current span."""
+    context = contextvars.copy_context()
+
+    @functools.wraps(fn)
+    def run(*args: Any, **kwargs: Any) -> _T:
+        # A Context cannot be entered by two threads at once; copy per call
+        return context.copy().run(fn, *args, **kwargs)
+
+    return run
+
+
+# =============================================================================
+# Reading and summarising traces
+# =============================================================================
+
+
+def read_spans(path: Path | str) -> List[Dict[str, Any]]:
+    """Load the spans recorded in a JSONL trace file, skipping bad lines."""
+    spans: List[Dict[str, Any]] = []
+    with Path(path).open("r", encoding="utf-8") as handle:
+        for number, line in enumerate(handle, start=1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                spans.append(json.loads(line))
+            except json.JSONDecodeError:
+                logger.warning("Skipping malformed trace line %d in %s", number, path)
+    return spans
+
+
+@dataclass
+class SpanStats:
+    """Aggregate timings for all spans with one name within a run."""
+
+    name: str
+    count: int = 0
+    total: float = 0.0
+    self_time: float = 0.0
+    max: float = 0.0
+    errors: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "count": self.count,
+            "total_seconds": round(self.total, 6),
+            "self_seconds": round(self.self_time, 6),
+            "max_seconds": round(self.max, 6),
+            "errors": self.errors,
+        }
+
+
+@dataclass
+class RunProfile:
+    """Where the time went in one trace (one root span and its children)."""
+
+    trace_id: str
+    root: str
+    start: float
+    duration: float
+    span_count: int
+    sinks: List[SpanStats]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "trace_id": self.trace_id,
+            "root": self.root,
+            "start": self.start,
+            "duration_seconds": round(self.duration, 6),
+            "span_count": self.span_count,
+            "sinks": [stats.to_dict() for stats in self.sinks],
+        }
+
+
+def summarize(spans: Iterable[Mapping[str, Any]], *, top: int = 10) -> List[RunProfile]:
+    """Group spans by run and rank span names by self time.
+
+    Self time is a span's duration minus the time of its direct children, so
+    a slow ``pipeline.run`` does not hide the GitHub call that made it slow.
+    Runs are returned oldest first.
+    """
+    by_trace: Dict[str, List[Mapping[str, Any]]] = {}
+    for item in spans:
+        by_trace.setdefault(str(item.get("trace_id")), []).append(item)
+
+    profiles: List[RunProfile] = []
+    for trace_id, members in by_trace.items():
+        child_time: Dict[str, float] = {}
+        for item in members:
+            parent = item.get("parent_id")
+            if parent is not None:
+                child_time[parent] = child_time.get(parent, 0.0) + float(item.get("duration") or 0.0)
+
+        stats: Dict[str, SpanStats] = {}
+        for item in members:
+            duration = float(item.get("duration") or 0.0)
+            entry = stats.setdefault(item["name"], SpanStats(name=item["name"]))
+            entry.count += 1
+            entry.total += duration
+            entry.self_time += max(duration - child_time.get(item.get("span_id"), 0.0), 0.0)
+            entry.max = max(entry.max, duration)
+            if item.get("error"):
+                entry.errors += 1
+
+        roots = [item for item in members if item.get("parent_id") is None] or members
+        root = max(roots, key=lambda item: float(item.get("duration") or 0.0))
+        start = min(float(item.get("start") or 0.0) for item in members)
+        end = max(float(item.get("start") or 0.0) + float(item.get("duration") or 0.0) for item in members)
+        ranked = sorted(stats.values(), key=lambda entry: entry.self_time, reverse=True)
+        profiles.append(
+            RunProfile(
+                trace_id=trace_id,
+                root=root["name"],
+                start=start,
+                duration=end - start,
+                span_count=len(members),
+                sinks=ranked[:top],
+            )
+        )
+    profiles.sort(key=lambda profile: profile.start)
+    return profiles
+
+
+def to_chrome_trace(spans: Iterable[Mapping[str, Any]]) -> Dict[str, Any]:
+    """Convert spans to the Chrome trace-event format (complete events)."""
+    events: List[Dict[str, Any]] = []
+    threads: Dict[tuple[int, str], int] = {}
+    for item in spans:
+        pid = int(item.get("pid") or 0)
+        thread = str(item.get("thread") or "main")
+        tid = threads.setdefault((pid, thread), len(threads) + 1)
+        args = dict(item.get("attributes") or {})
+        args["trace_id"] = item.get("trace_id")
+        if item.get("error"):
+            args["error"] = item["error"]
+        events.append({
+            "name": item["name"],
+            "cat": str(item["name"]).split(".", 1)[0],
+            "ph": "X",
+            "ts": float(item.get("start") or 0.0) * 1_000_000,
+            "dur": float(item.get("duration") or 0.0) * 1_000_000,
+            "pid": pid,
+            "tid": tid,
+            "args": args,
+        })
+    for (pid, thread), tid in threads.items():
+        events.append({"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": thread}})
+    return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+
+def write_chrome_trace(spans: Iterable[Mapping[str, Any]], path: Path | str) -> Path:
+    """Write :func:`to_chrome_trace` output to ``path``."""
+    target = Path(path)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    target.write_text(json.dumps(to_chrome_trace(spans)), encoding="utf-8")
+    return target
+
+
+__all__ = [
+    "RunProfile",
+    "Span",
+    "SpanStats",
+    "TRACE_FILE_ENV",
+    "Tracer",
+    "bind",
+    "configure",
+    "current_span",
+    "get_tracer",
+    "read_spans",
+    "span",
+    "summarize",
+    "to_chrome_trace",
+    "traced",
+    "write_chrome_trace",
+]
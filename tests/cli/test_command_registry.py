@@ -0,0 +1,119 @@
+"""Tests for the lazy top-level command registry and CLI startup cost."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from src.cli.registry import COMMANDS, register_lazy_commands
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+# Modules only commands that parse, extract or plan should pay for
+HEAVY_MODULES = ("trafilatura", "bs4", "pypdf", "docx", "jsonschema", "src.orchestration")
+
+# Wall-clock budget for ``import main`` plus building the parser, best of
+# three runs. Importing every command module eagerly took well over this.
+STARTUP_BUDGET_SECONDS = 0.5
+
+_PROBE = """
+import json, sys, time
+started = time.perf_counter()
+import main
+main._build_command_parser(sys.argv[1:])
+elapsed = time.perf_counter() - started
+print(json.dumps({
+    "seconds": elapsed,
+    "modules": sorted(name for name in sys.modules if name.split(".")[0] in {"src", "trafilatura", "bs4", "pypdf", "docx", "jsonschema"}),
+}))
+"""
+
+
+def _probe(*argv: str) -> dict:
+    completed = subprocess.run(
+        [sys.executable, "-c", _PROBE, *argv],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(completed.stdout)
+
+
+def _loaded(modules: list[str], name: str) -> bool:
+    return any(module == name or module.startswith(f"{name}.") for module in modules)
+
+
+def test_declared_commands_match_registered_parsers() -> None:
+    """The table must list what each register function adds, with the same help."""
+    for register in {(spec.module, spec.register) for spec in COMMANDS}:
+        declared = {spec.name: spec.help for spec in COMMANDS if (spec.module, spec.register) == register}
+        parser = argparse.ArgumentParser()
+        subparsers = parser.add_subparsers()
+        next(spec for spec in COMMANDS if (spec.module, spec.register) == register).load()(subparsers)
+
+        registered = {action.dest: action.help for action in subparsers._choices_actions}
+        assert registered == declared, register
+
+
+def test_only_requested_command_is_registered_fully() -> None:
+    parser = argparse.ArgumentParser()
+    subparsers = parser.add_subparsers(dest="command")
+
+    spec = register_lazy_commands(subparsers, ["pipeline", "status"])
+
+    assert spec is not None and spec.module == "pipeline"
+    assert list(subparsers.choices)[0] == "pipeline"
+    assert set(subparsers.choices) == {spec.name for spec in COMMANDS}
+    args = parser.parse_args(["pipeline", "status", "--json"])
+    assert args.output_json is True and callable(args.func)
+
+
+def test_help_lists_every_command(capsys: pytest.CaptureFixture[str]) -> None:
+    parser = argparse.ArgumentParser()
+    subparsers = parser.add_subparsers(dest="command")
+
+    assert register_lazy_commands(subparsers, ["--help"]) is None
+    parser.print_help()
+
+    output = capsys.readouterr().out
+    for spec in COMMANDS:
+        assert spec.name in output
+
+
+def test_unknown_command_is_rejected() -> None:
+    import main
+
+    with pytest.raises(SystemExit):
+        main.main(["no-such-command"])
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        ("--help",),
+        ("pipeline", "status"),
+        ("extraction-batch", "pending", "--count-only"),
+        ("llm-quota",),
+        ("create",),
+    ],
+)
+def test_quick_commands_do_not_import_heavy_dependencies(argv: tuple[str, ...]) -> None:
+    modules = _probe(*argv)["modules"]
+
+    loaded_commands = {name for name in modules if name.startswith("src.cli.commands.")}
+    assert len(loaded_commands) <= 1
+    for heavy in HEAVY_MODULES:
+        if heavy == "jsonschema" and argv[0] == "extraction-batch":
+            continue  # Pulled in by the extraction pipeline's structured output
+        assert not _loaded(modules, heavy), f"{' '.join(argv)} imported {heavy}"
+
+
+def test_startup_time_budget() -> None:
+    seconds = min(_probe("pipeline", "status")["seconds"] for _ in range(3))
+    assert seconds < STARTUP_BUDGET_SECONDS, f"CLI startup took {seconds:.3f}s"
@@ -10,13 +10,63 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+from src.knowledge.storage import EntityProfile, KnowledgeGraphStorage
 from src.cli.commands.discussions import (
     list_entities_cli,
     sync_discussions_cli,
     _resolve_entity_types,
     _get_aggregator,
 )
-from src.integrations.github.discussions import GitHubDiscussionError
+from src.integrations.github.discussions import (
+    Discussion,
+    DiscussionIndex,
+    DiscussionSyncState,
+    GitHubDiscussionError,
+    MutationBatcher,
+)
+
+
+def _index(*discussions: Discussion) -> DiscussionIndex:
+    """A pre-populated discussion index that never calls the API."""
+    index = DiscussionIndex(token="token", repository="test/repo", category_id="DIC_cat123")
+    for discussion in discussions:
+        index.record(discussion)
+    index.refresh = MagicMock(return_value=0)  # type: ignore[method-assign]
+    return index
+
+
+class _DirectBatcher(MutationBatcher):
+    """A mutation batcher that resolves each mutation through the patched module."""
+
+    FIELDS = {"categoryId": "category_id", "discussionId": "discussion_id", "title": "title", "body": "body"}
+
+    def __init__(self, module: MagicMock) -> None:
+        super().__init__(token="token", min_interval=0)
+        self.module = module
+
+    def _send(self, batch: Any) -> None:
+        handlers = {
+            "createDiscussion": self.module.create_discussion,
+            "updateDiscussion": self.module.update_discussion,
+            "addDiscussionComment": self.module.add_discussion_comment,
+        }
+        for mutation in batch:
+            kwargs = {self.FIELDS[k]: v for k, v in mutation.input.items() if k in self.FIELDS}
+            mutation.done = True
+            try:
+                mutation.result = handlers[mutation.field](token="token", **kwargs)
+            except GitHubDiscussionError as exc:
+                mutation.error = str(exc)
+
+
+def _discussion(body: str, number: int = 42) -> Discussion:
+    return Discussion(
+        id=f"D_{number}",
+        number=number,
+        title="Niccolo Machiavelli",
+        body=body,
+        url=f"https://github.com/test/repo/discussions/{number}",
+    )
 
 
 class TestResolveEntityTypes:
@@ -174,7 +224,8 @@ class TestSyncDiscussionsCli:
         mock_discussions.get_category_by_name.return_value = category
         
         # No existing discussion
-        mock_discussions.find_discussion_by_title.return_value = None
+        mock_discussions.DiscussionIndex.return_value = _index()
+        mock_discussions.MutationBatcher.return_value = _DirectBatcher(mock_discussions)
         
         args = MagicMock()
         args.repository = "test/repo"
@@ -184,6 +235,8 @@ class TestSyncDiscussionsCli:
         args.entity_name = None
         args.dry_run = True
         args.output = None
+        args.index_cache = None
+        args.sync_state = None
         
         result = sync_discussions_cli(args)
         
@@ -217,12 +270,11 @@ class TestSyncDiscussionsCli:
         mock_discussions.get_category_by_name.return_value = category
         
         # No existing discussion
-        mock_discussions.find_discussion_by_title.return_value = None
+        mock_discussions.DiscussionIndex.return_value = _index()
+        mock_discussions.MutationBatcher.return_value = _DirectBatcher(mock_discussions)
         
         # Create returns discussion
-        created = MagicMock()
-        created.number = 42
-        created.url = "https://github.com/test/repo/discussions/42"
+        created = _discussion("# Test Content")
         mock_discussions.create_discussion.return_value = created
         
         args = MagicMock()
@@ -233,6 +285,8 @@ class TestSyncDiscussionsCli:
         args.entity_name = None
         args.dry_run = False
         args.output = None
+        args.index_cache = None
+        args.sync_state = None
         
         result = sync_discussions_cli(args)
         
@@ -264,12 +318,10 @@ class TestSyncDiscussionsCli:
         mock_discussions.get_category_by_name.return_value = category
         
         # Existing discussion with different body
-        existing = MagicMock()
-        existing.id = "D_existing"
-        existing.number = 42
-        existing.url = "https://github.com/test/repo/discussions/42"
-        existing.body = "old content"
-        mock_discussions.find_discussion_by_title.return_value = existing
+        existing = _discussion("old content")
+        mock_discussions.DiscussionIndex.return_value = _index(existing)
+        mock_discussions.MutationBatcher.return_value = _DirectBatcher(mock_discussions)
+        mock_discussions.update_discussion.return_value = _discussion("# New Content")
         
         args = MagicMock()
         args.repository = "test/repo"
@@ -279,6 +331,8 @@ class TestSyncDiscussionsCli:
         args.entity_name = None
         args.dry_run = False
         args.output = None
+        args.index_cache = None
+        args.sync_state = None
         
         result = sync_discussions_cli(args)
         
@@ -288,6 +342,47 @@ class TestSyncDiscussionsCli:
         mock_discussions.update_discussion.assert_called_once()
         mock_discussions.add_discussion_comment.assert_called_once()
 
+    @patch("src.cli.commands.discussions.build_entity_discussion_content")
+    @patch("src.cli.commands.discussions.github_discussions")
+    @patch("src.cli.commands.discussions._get_aggregator")
+    def test_sync_skips_changelog_comment_when_update_fails(
+        self,
+        mock_get_aggregator: MagicMock,
+        mock_discussions: MagicMock,
+        mock_build_content: MagicMock,
+        mock_aggregator: MagicMock,
+        capsys: pytest.CaptureFixture[str],
+    ) -> None:
+        mock_get_aggregator.return_value = mock_aggregator
+        mock_discussions.resolve_repository.return_value = "test/repo"
+        mock_discussions.resolve_token.return_value = "token"
+        mock_discussions.GitHubDiscussionError = GitHubDiscussionError
+        mock_build_content.return_value = "# New Content"
+        category = MagicMock()
+        category.id = "DIC_cat123"
+        mock_discussions.get_category_by_name.return_value = category
+        mock_discussions.DiscussionIndex.return_value = _index(_discussion("old content"))
+        mock_discussions.MutationBatcher.return_value = _DirectBatcher(mock_discussions)
+        mock_discussions.update_discussion.side_effect = GitHubDiscussionError("Resource not accessible")
+
+        args = MagicMock()
+        args.repository = "test/repo"
+        args.token = "token"
+        args.knowledge_graph = "knowledge-graph"
+        args.entity_type = "Person"
+        args.entity_name = None
+        args.dry_run = False
+        args.output = None
+        args.index_cache = None
+        args.sync_state = None
+
+        sync_discussions_cli(args)
+
+        captured = capsys.readouterr()
+        assert "Resource not accessible" in captured.out
+        assert "✓ Updated" not in captured.out
+        mock_discussions.add_discussion_comment.assert_not_called()
+
     @patch("src.cli.commands.discussions.build_entity_discussion_content")
     @patch("src.cli.commands.discussions.github_discussions")
     @patch("src.cli.commands.discussions._get_aggregator")
@@ -313,12 +408,9 @@ class TestSyncDiscussionsCli:
         mock_discussions.get_category_by_name.return_value = category
         
         # Existing discussion with same body
-        existing = MagicMock()
-        existing.id = "D_existing"
-        existing.number = 42
-        existing.url = "https://github.com/test/repo/discussions/42"
-        existing.body = expected_body
-        mock_discussions.find_discussion_by_title.return_value = existing
+        existing = _discussion(expected_body)
+        mock_discussions.DiscussionIndex.return_value = _index(existing)
+        mock_discussions.MutationBatcher.return_value = _DirectBatcher(mock_discussions)
         
         args = MagicMock()
         args.repository = "test/repo"
@@ -328,6 +420,8 @@ class TestSyncDiscussionsCli:
         args.entity_name = None
         args.dry_run = False
         args.output = None
+        args.index_cache = None
+        args.sync_state = None
         
         result = sync_discussions_cli(args)
         
@@ -354,6 +448,8 @@ class TestSyncDiscussionsCli:
         args.entity_name = None
         args.dry_run = False
         args.output = None
+        args.index_cache = None
+        args.sync_state = None
         
         result = sync_discussions_cli(args)
         
@@ -385,6 +481,8 @@ class TestSyncDiscussionsCli:
         args.entity_name = None
         args.dry_run = False
         args.output = None
+        args.index_cache = None
+        args.sync_state = None
         
         result = sync_discussions_cli(args)
         
@@ -413,11 +511,10 @@ class TestSyncDiscussionsCli:
         category = MagicMock()
         category.id = "DIC_cat123"
         mock_discussions.get_category_by_name.return_value = category
-        mock_discussions.find_discussion_by_title.return_value = None
+        mock_discussions.DiscussionIndex.return_value = _index()
+        mock_discussions.MutationBatcher.return_value = _DirectBatcher(mock_discussions)
         
-        created = MagicMock()
-        created.number = 42
-        created.url = "https://github.com/test/repo/discussions/42"
+        created = _discussion("# Test Content")
         mock_discussions.create_discussion.return_value = created
         
         output_path = tmp_path / "report.json"
@@ -430,6 +527,8 @@ class TestSyncDiscussionsCli:
         args.entity_name = None
         args.dry_run = False
         args.output = str(output_path)
+        args.index_cache = None
+        args.sync_state = None
         
         result = sync_discussions_cli(args)
         
@@ -465,11 +564,10 @@ class TestSyncDiscussionsCli:
         category = MagicMock()
         category.id = "DIC_cat123"
         mock_discussions.get_category_by_name.return_value = category
-        mock_discussions.find_discussion_by_title.return_value = None
+        mock_discussions.DiscussionIndex.return_value = _index()
+        mock_discussions.MutationBatcher.return_value = _DirectBatcher(mock_discussions)
         
-        created = MagicMock()
-        created.number = 42
-        created.url = "https://github.com/test/repo/discussions/42"
+        created = _discussion("# Test Content")
         mock_discussions.create_discussion.return_value = created
         
         args = MagicMock()
@@ -480,6 +578,8 @@ class TestSyncDiscussionsCli:
         args.entity_name = "Niccolo Machiavelli"  # Only sync this one
         args.dry_run = False
         args.output = None
+        args.index_cache = None
+        args.sync_state = None
         
         result = sync_discussions_cli(args)
         
@@ -488,6 +588,63 @@ class TestSyncDiscussionsCli:
         assert mock_discussions.create_discussion.call_count == 1
 
 
+    @patch("src.cli.commands.discussions.github_discussions")
+    def test_sync_state_skips_unchanged_entities_without_api_calls(
+        self,
+        mock_discussions: MagicMock,
+        tmp_path: Path,
+        capsys: pytest.CaptureFixture[str],
+    ) -> None:
+        storage = KnowledgeGraphStorage(root=tmp_path / "kg")
+        storage.save_extracted_profiles(
+            "checksum1", [EntityProfile(name="Niccolo Machiavelli", entity_type="Person", summary="s")]
+        )
+        mock_discussions.resolve_repository.return_value = "test/repo"
+        mock_discussions.resolve_token.return_value = "token"
+        mock_discussions.GitHubDiscussionError = GitHubDiscussionError
+        mock_discussions.DiscussionSyncState = DiscussionSyncState
+        category = MagicMock()
+        category.id = "DIC_cat123"
+        mock_discussions.get_category_by_name.return_value = category
+        mock_discussions.DiscussionIndex.return_value = _index()
+        mock_discussions.MutationBatcher.return_value = _DirectBatcher(mock_discussions)
+        mock_discussions.create_discussion.return_value = _discussion("body", number=7)
+        
+        args = argparse.Namespace(
+            repository="test/repo",
+            token="token",
+            knowledge_graph=str(tmp_path / "kg"),
+            entity_type="Person",
+            entity_name=None,
+            dry_run=False,
+            output=None,
+            index_cache=None,
+            sync_state=str(tmp_path / "sync-state.json"),
+            full=False,
+        )
+        
+        assert sync_discussions_cli(args) == 0
+        assert "Created" in capsys.readouterr().out
+        
+        mock_discussions.reset_mock()
+        with patch("src.cli.commands.discussions.build_entity_discussion_content") as mock_build:
+            assert sync_discussions_cli(args) == 0
+        mock_build.assert_not_called()
+        mock_discussions.get_repository_id.assert_not_called()
+        mock_discussions.get_category_by_name.assert_not_called()
+        mock_discussions.DiscussionIndex.assert_not_called()
+        assert "Unchanged: Niccolo Machiavelli" in capsys.readouterr().out
+        
+        # New evidence for the entity changes its fingerprint
+        storage.save_extracted_profiles(
+            "checksum2", [EntityProfile(name="Niccolo Machiavelli", entity_type="Person", summary="t")]
+        )
+        mock_discussions.DiscussionIndex.return_value = _index(_discussion("old", number=7))
+        mock_discussions.update_discussion.return_value = _discussion("new", number=7)
+        assert sync_discussions_cli(args) == 0
+        assert "Updated: Niccolo Machiavelli" in capsys.readouterr().out
+
+
 class TestCliIntegration:
     def test_main_py_includes_discussion_commands(self) -> None:
         """Verify discussion commands are registered in main."""
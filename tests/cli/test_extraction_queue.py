@@ -14,6 +14,7 @@ from src.cli.commands.extraction_queue import (
     get_documents_needing_issues,
     queue_documents_for_extraction,
 )
+from src.integrations.github.issue_index import IndexedIssue, IssueIndex
 from src.integrations.github.issues import IssueOutcome
 from src.integrations.github.search_issues import IssueSearchResult
 from src.parsing.storage import Manifest, ManifestEntry
@@ -375,6 +376,49 @@ class TestQueueDocumentsForExtraction:
         assert len(result) == 0
         mock_create.assert_not_called()
 
+    @patch("src.cli.commands.extraction_queue.ParseStorage")
+    @patch("src.cli.commands.extraction_queue.GitHubIssueSearcher")
+    @patch("src.cli.commands.extraction_queue._create_extraction_issue")
+    def test_queue_uses_local_index(
+        self, mock_create, mock_searcher_class, mock_storage_class, tmp_path
+    ):
+        """Should consult the issue index instead of searching, and record new issues."""
+        manifest = Manifest(
+            entries={
+                checksum: ManifestEntry(
+                    source=f"doc-{checksum}",
+                    checksum=checksum,
+                    parser="pdf",
+                    artifact_path=f"path/to/{checksum}",
+                    processed_at=datetime.now(timezone.utc),
+                    status="completed",
+                )
+                for checksum in ("checksum1", "checksum2")
+            }
+        )
+        mock_storage_class.return_value.manifest.return_value = manifest
+        mock_create.return_value = IssueOutcome(
+            number=7,
+            url="https://api.github.com/repos/owner/repo/issues/7",
+            html_url="https://github.com/owner/repo/issues/7",
+        )
+        index = IssueIndex(repository="owner/repo", db_path=tmp_path / "index.db")
+        index.record(
+            IndexedIssue(1, "Extract: doc", "closed", ("extraction-queue",), "checksum1", "u", "")
+        )
+
+        result = queue_documents_for_extraction(
+            repository="owner/repo",
+            token="fake-token",
+            evidence_root=Path("/fake/evidence"),
+            index=index,
+        )
+
+        assert [outcome.number for outcome in result] == [7]
+        assert mock_create.call_args.args[0].checksum == "checksum2"
+        mock_searcher_class.assert_not_called()
+        assert index.by_checksum("checksum2").number == 7
+
 
 class TestSkipCommand:
     """Test the skip CLI command."""
@@ -14,7 +14,9 @@ from src.cli.commands.pipeline import (
     pipeline_check_cli,
     pipeline_acquire_cli,
     pipeline_status_cli,
+    pipeline_profile_cli,
 )
+from src import tracing
 
 
 # =============================================================================
@@ -304,11 +306,92 @@ class TestPipelineStatusCli:
         assert "sources" in output
 
 
+class TestPipelineProfileCli:
+    """Tests for tracing a run and profiling the trace file."""
+    
+    @pytest.fixture(autouse=True)
+    def reset_tracer(self):
+        yield
+        tracing.configure(None)
+    
+    def test_traced_run_is_profiled(self, parser, tmp_path, capsys):
+        """A --trace run should show up as one profiled run."""
+        (tmp_path / "kb").mkdir()
+        trace_file = tmp_path / "trace.jsonl"
+        args = parser.parse_args([
+            "pipeline", "check", "--dry-run", "--json",
+            "--kb-root", str(tmp_path / "kb"),
+            "--trace", str(trace_file),
+        ])
+        assert args.func(args) == 0
+        capsys.readouterr()
+        
+        chrome = tmp_path / "chrome.json"
+        args = parser.parse_args([
+            "pipeline", "profile", str(trace_file), "--chrome-trace", str(chrome),
+        ])
+        assert pipeline_profile_cli(args) == 0
+        
+        output = capsys.readouterr().out
+        assert "(pipeline.run)" in output
+        assert "pipeline.monitor" in output
+        events = json.loads(chrome.read_text())["traceEvents"]
+        assert {"pipeline.run", "pipeline.monitor"} <= {event["name"] for event in events}
+    
+    def test_json_output_and_run_filter(self, parser, tmp_path, capsys):
+        """--run should select a single trace by ID prefix."""
+        trace_file = tmp_path / "trace.jsonl"
+        tracing.configure(trace_file)
+        for _ in range(2):
+            with tracing.span("agent.mission"):
+                with tracing.span("tool.lookup"):
+                    pass
+        tracing.configure(None)
+        trace_id = tracing.read_spans(trace_file)[-1]["trace_id"]
+        
+        args = parser.parse_args(["pipeline", "profile", str(trace_file), "--run", trace_id[:6], "--json"])
+        assert pipeline_profile_cli(args) == 0
+        
+        (profile,) = json.loads(capsys.readouterr().out)
+        assert profile["trace_id"] == trace_id
+        assert profile["root"] == "agent.mission"
+        assert {sink["name"] for sink in profile["sinks"]} == {"agent.mission", "tool.lookup"}
+    
+    def test_missing_trace_file(self, parser, tmp_path, monkeypatch, capsys):
+        """Should fail clearly without a trace file."""
+        monkeypatch.delenv(tracing.TRACE_FILE_ENV, raising=False)
+        assert pipeline_profile_cli(parser.parse_args(["pipeline", "profile"])) == 1
+        args = parser.parse_args(["pipeline", "profile", str(tmp_path / "none.jsonl")])
+        assert pipeline_profile_cli(args) == 1
+        assert "not found" in capsys.readouterr().err
+
+
 # =============================================================================
 # Integration-style tests
 # =============================================================================
 
 
+class TestPipelineMetricsExport:
+    """Tests for writing run metrics with --metrics-file."""
+    
+    def test_check_writes_prometheus_textfile(self, parser, tmp_path, capsys):
+        """A run should leave a textfile with the run-level gauges."""
+        (tmp_path / "kb").mkdir()
+        metrics_file = tmp_path / "textfile" / "pipeline.prom"
+        args = parser.parse_args([
+            "pipeline", "check", "--dry-run",
+            "--kb-root", str(tmp_path / "kb"),
+            "--metrics-file", str(metrics_file),
+        ])
+        
+        assert args.func(args) == 0
+        
+        assert f"Metrics written to {metrics_file}" in capsys.readouterr().out
+        text = metrics_file.read_text()
+        assert 'speculum_pipeline_last_run_timestamp_seconds{mode="check"}' in text
+        assert 'speculum_pipeline_sources{outcome="checked"} 0' in text
+
+
 class TestPipelineCliIntegration:
     """Integration tests for the pipeline CLI."""
     
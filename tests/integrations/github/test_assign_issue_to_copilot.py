@@ -62,7 +62,7 @@ def test_assign_issue_to_copilot_success(monkeypatch: pytest.MonkeyPatch) -> Non
             }
         )
 
-    monkeypatch.setattr("urllib.request.urlopen", fake_urlopen)
+    monkeypatch.setattr("src.integrations.github.transport.urlopen", fake_urlopen)
 
     assign_issue_to_copilot(token="token", repository="octo-org/octo-repo", issue_number=42)
 
@@ -89,7 +89,7 @@ def test_assign_issue_to_copilot_missing_agent(monkeypatch: pytest.MonkeyPatch)
             )
         pytest.fail("Secondary mutation should not be called when agent is missing")
 
-    monkeypatch.setattr("urllib.request.urlopen", fake_urlopen)
+    monkeypatch.setattr("src.integrations.github.transport.urlopen", fake_urlopen)
 
     with pytest.raises(GitHubIssueError, match="Copilot coding agent is not enabled"):
         assign_issue_to_copilot(token="token", repository="octo-org/octo-repo", issue_number=1)
@@ -129,7 +129,7 @@ def test_assign_issue_to_copilot_ghe_endpoint(monkeypatch: pytest.MonkeyPatch) -
             }
         )
 
-    monkeypatch.setattr("urllib.request.urlopen", fake_urlopen)
+    monkeypatch.setattr("src.integrations.github.transport.urlopen", fake_urlopen)
 
     assign_issue_to_copilot(
         token="token",
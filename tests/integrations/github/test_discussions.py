@@ -5,6 +5,7 @@ from __future__ import annotations
 import json
 from typing import Any, Mapping
 from unittest.mock import MagicMock, patch
+from urllib import error
 
 import pytest
 
@@ -13,7 +14,11 @@ from src.integrations.github.discussions import (
     Discussion,
     DiscussionCategory,
     DiscussionComment,
+    DiscussionIndex,
+    DiscussionSyncState,
     GitHubDiscussionError,
+    MutationBatcher,
+    PendingMutation,
     add_discussion_comment,
     create_discussion,
     find_discussion_by_title,
@@ -247,7 +252,7 @@ def _mock_graphql_response(data: Mapping[str, Any]) -> MagicMock:
 
 
 class TestGetRepositoryId:
-    @patch("src.integrations.github.discussions.request.urlopen")
+    @patch("src.integrations.github.discussions.github_transport.urlopen")
     def test_success(
         self,
         mock_urlopen: MagicMock,
@@ -260,7 +265,7 @@ class TestGetRepositoryId:
         result = get_repository_id(token=mock_token, repository=mock_repository)
         assert result == "R_abc123"
 
-    @patch("src.integrations.github.discussions.request.urlopen")
+    @patch("src.integrations.github.discussions.github_transport.urlopen")
     def test_not_found(
         self,
         mock_urlopen: MagicMock,
@@ -273,7 +278,7 @@ class TestGetRepositoryId:
 
 
 class TestListDiscussionCategories:
-    @patch("src.integrations.github.discussions.request.urlopen")
+    @patch("src.integrations.github.discussions.github_transport.urlopen")
     def test_success(
         self,
         mock_urlopen: MagicMock,
@@ -292,7 +297,7 @@ class TestListDiscussionCategories:
         assert len(result) == 1
         assert result[0].name == "People"
 
-    @patch("src.integrations.github.discussions.request.urlopen")
+    @patch("src.integrations.github.discussions.github_transport.urlopen")
     def test_empty(
         self,
         mock_urlopen: MagicMock,
@@ -309,7 +314,7 @@ class TestListDiscussionCategories:
 
 
 class TestGetCategoryByName:
-    @patch("src.integrations.github.discussions.request.urlopen")
+    @patch("src.integrations.github.discussions.github_transport.urlopen")
     def test_found(
         self,
         mock_urlopen: MagicMock,
@@ -332,7 +337,7 @@ class TestGetCategoryByName:
         assert result is not None
         assert result.name == "People"
 
-    @patch("src.integrations.github.discussions.request.urlopen")
+    @patch("src.integrations.github.discussions.github_transport.urlopen")
     def test_not_found(
         self,
         mock_urlopen: MagicMock,
@@ -356,7 +361,7 @@ class TestGetCategoryByName:
 
 
 class TestListDiscussions:
-    @patch("src.integrations.github.discussions.request.urlopen")
+    @patch("src.integrations.github.discussions.github_transport.urlopen")
     def test_success(
         self,
         mock_urlopen: MagicMock,
@@ -377,7 +382,7 @@ class TestListDiscussions:
 
 
 class TestSearchDiscussions:
-    @patch("src.integrations.github.discussions.request.urlopen")
+    @patch("src.integrations.github.discussions.github_transport.urlopen")
     def test_finds_by_title(
         self,
         mock_urlopen: MagicMock,
@@ -400,7 +405,7 @@ class TestSearchDiscussions:
         assert len(result) == 1
         assert result[0].title == "Niccolo Machiavelli"
 
-    @patch("src.integrations.github.discussions.request.urlopen")
+    @patch("src.integrations.github.discussions.github_transport.urlopen")
     def test_no_match(
         self,
         mock_urlopen: MagicMock,
@@ -424,7 +429,7 @@ class TestSearchDiscussions:
 
 
 class TestFindDiscussionByTitle:
-    @patch("src.integrations.github.discussions.request.urlopen")
+    @patch("src.integrations.github.discussions.github_transport.urlopen")
     def test_found_exact_match(
         self,
         mock_urlopen: MagicMock,
@@ -447,7 +452,7 @@ class TestFindDiscussionByTitle:
         assert result is not None
         assert result.number == 42
 
-    @patch("src.integrations.github.discussions.request.urlopen")
+    @patch("src.integrations.github.discussions.github_transport.urlopen")
     def test_not_found(
         self,
         mock_urlopen: MagicMock,
@@ -470,8 +475,124 @@ class TestFindDiscussionByTitle:
         assert result is None
 
 
+def _page(
+    data: Mapping[str, Any], titles: list[str], updated: list[str], cursor: str | None
+) -> MagicMock:
+    nodes = [
+        dict(data, id=f"D_{title}", title=title, body=f"body of {title}", updatedAt=stamp)
+        for title, stamp in zip(titles, updated)
+    ]
+    return _mock_graphql_response({
+        "repository": {
+            "discussions": {
+                "pageInfo": {"hasNextPage": cursor is not None, "endCursor": cursor},
+                "nodes": nodes,
+            }
+        }
+    })
+
+
+def _variables(mock_urlopen: MagicMock, call: int) -> dict[str, Any]:
+    return json.loads(mock_urlopen.call_args_list[call].args[0].data)["variables"]
+
+
+class TestFindDiscussionByTitlePagination:
+    @patch("src.integrations.github.discussions.github_transport.urlopen")
+    def test_follows_cursor_past_first_page(
+        self,
+        mock_urlopen: MagicMock,
+        mock_token: str,
+        mock_repository: str,
+        sample_discussion_data: dict[str, Any],
+    ) -> None:
+        mock_urlopen.side_effect = [
+            _page(sample_discussion_data, ["A", "B"], ["2025-02-02", "2025-02-01"], "c1"),
+            _page(sample_discussion_data, ["C"], ["2025-01-01"], None),
+        ]
+        result = find_discussion_by_title(token=mock_token, repository=mock_repository, title="c")
+        assert result is not None and result.id == "D_C"
+        assert _variables(mock_urlopen, 1)["after"] == "c1"
+
+
+class TestDiscussionIndex:
+    @patch("src.integrations.github.discussions.github_transport.urlopen")
+    def test_full_then_incremental_refresh(
+        self,
+        mock_urlopen: MagicMock,
+        mock_token: str,
+        mock_repository: str,
+        sample_discussion_data: dict[str, Any],
+    ) -> None:
+        mock_urlopen.side_effect = [
+            _page(sample_discussion_data, ["A", "B"], ["2025-02-02", "2025-02-01"], "c1"),
+            _page(sample_discussion_data, ["C"], ["2025-01-01"], None),
+            # Incremental: stops at the first discussion older than the last sync
+            _page(sample_discussion_data, ["B", "A"], ["2025-03-01", "2025-02-01"], "c2"),
+        ]
+        index = DiscussionIndex(token=mock_token, repository=mock_repository, category_id="DIC_1")
+
+        assert index.refresh() == 3
+        assert len(index) == 3
+        assert index.get("c").id == "D_C"
+        assert index.synced_at == "2025-02-02"
+
+        assert index.refresh() == 1
+        assert index.page_requests == 3
+        assert index.get("B").updated_at == "2025-03-01"
+        assert _variables(mock_urlopen, 2)["categoryId"] == "DIC_1"
+
+    def test_body_hash_comparison(self, mock_token: str, mock_repository: str) -> None:
+        index = DiscussionIndex(token=mock_token, repository=mock_repository)
+        entry = index.record(Discussion(id="D_1", number=1, title="A", body="text\n", url=""))
+        assert entry.matches("  text")
+        assert not entry.matches("other")
+        assert index.get("a") == entry
+
+    @patch("src.integrations.github.discussions.github_transport.urlopen")
+    def test_persisted_index_refreshes_incrementally(
+        self,
+        mock_urlopen: MagicMock,
+        mock_token: str,
+        mock_repository: str,
+        sample_discussion_data: dict[str, Any],
+        tmp_path: Any,
+    ) -> None:
+        path = tmp_path / "people.json"
+        first = DiscussionIndex(token=mock_token, repository=mock_repository, path=path)
+        first.record(Discussion(id="D_A", number=1, title="A", body="a", url="", updated_at="2025-02-01"))
+        first.save()
+
+        mock_urlopen.return_value = _page(sample_discussion_data, ["A"], ["2025-01-01"], "more")
+        second = DiscussionIndex(token=mock_token, repository=mock_repository, path=path)
+
+        assert second.get("A") is not None
+        assert second.refresh() == 0
+        assert mock_urlopen.call_count == 1
+
+        other_category = DiscussionIndex(
+            token=mock_token, repository=mock_repository, category_id="DIC_other", path=path
+        )
+        assert len(other_category) == 0
+
+
+class TestDiscussionSyncState:
+    def test_round_trip_and_repository_scoping(self, tmp_path: Any) -> None:
+        path = tmp_path / "sync-state.json"
+        state = DiscussionSyncState(path, repository="owner/repo")
+        state.record("Person", "Niccolo Machiavelli", "abc", number=7, url="https://x/7")
+        state.save()
+
+        reloaded = DiscussionSyncState(path, repository="owner/repo")
+        assert reloaded.is_current("Person", "niccolo machiavelli", "abc")
+        assert not reloaded.is_current("Person", "Niccolo Machiavelli", "def")
+        assert not reloaded.is_current("Organization", "Niccolo Machiavelli", "abc")
+        assert reloaded.get("Person", "Niccolo Machiavelli").number == 7  # type: ignore[union-attr]
+
+        assert len(DiscussionSyncState(path, repository="owner/other")) == 0
+
+
 class TestGetDiscussion:
-    @patch("src.integrations.github.discussions.request.urlopen")
+    @patch("src.integrations.github.discussions.github_transport.urlopen")
     def test_success(
         self,
         mock_urlopen: MagicMock,
@@ -502,7 +623,7 @@ class TestGetDiscussion:
 
 
 class TestCreateDiscussion:
-    @patch("src.integrations.github.discussions.request.urlopen")
+    @patch("src.integrations.github.discussions.github_transport.urlopen")
     def test_success(
         self,
         mock_urlopen: MagicMock,
@@ -548,7 +669,7 @@ class TestCreateDiscussion:
 
 
 class TestUpdateDiscussion:
-    @patch("src.integrations.github.discussions.request.urlopen")
+    @patch("src.integrations.github.discussions.github_transport.urlopen")
     def test_update_body(
         self,
         mock_urlopen: MagicMock,
@@ -565,7 +686,7 @@ class TestUpdateDiscussion:
         )
         assert result.id == "D_xyz789"
 
-    @patch("src.integrations.github.discussions.request.urlopen")
+    @patch("src.integrations.github.discussions.github_transport.urlopen")
     def test_update_title_and_body(
         self,
         mock_urlopen: MagicMock,
@@ -593,7 +714,7 @@ class TestUpdateDiscussion:
 
 
 class TestListDiscussionComments:
-    @patch("src.integrations.github.discussions.request.urlopen")
+    @patch("src.integrations.github.discussions.github_transport.urlopen")
     def test_success(
         self,
         mock_urlopen: MagicMock,
@@ -628,7 +749,7 @@ class TestListDiscussionComments:
 
 
 class TestAddDiscussionComment:
-    @patch("src.integrations.github.discussions.request.urlopen")
+    @patch("src.integrations.github.discussions.github_transport.urlopen")
     def test_success(
         self,
         mock_urlopen: MagicMock,
@@ -652,3 +773,177 @@ class TestAddDiscussionComment:
     def test_missing_body(self, mock_token: str) -> None:
         with pytest.raises(GitHubDiscussionError, match="Comment body is required"):
             add_discussion_comment(token=mock_token, discussion_id="D_123", body="")
+
+
+# =============================================================================
+# Batched Mutation Tests
+# =============================================================================
+
+
+def _mock_raw_response(payload: Mapping[str, Any]) -> MagicMock:
+    response = MagicMock()
+    response.read.return_value = json.dumps(payload).encode("utf-8")
+    response.__enter__ = MagicMock(return_value=response)
+    response.__exit__ = MagicMock(return_value=False)
+    return response
+
+
+def _secondary_rate_limit() -> error.HTTPError:
+    body = MagicMock()
+    body.read.return_value = b'{"message": "You have exceeded a secondary rate limit."}'
+    return error.HTTPError(
+        "https://api.github.com/graphql", 403, "Forbidden", {"Retry-After": "7"}, body
+    )
+
+
+class TestMutationBatcher:
+    @patch("src.integrations.github.discussions.github_transport.urlopen")
+    def test_packs_mutations_into_one_aliased_request(
+        self,
+        mock_urlopen: MagicMock,
+        mock_token: str,
+        sample_discussion_data: dict[str, Any],
+        sample_comment_data: dict[str, Any],
+    ) -> None:
+        mock_urlopen.return_value = _mock_raw_response({
+            "data": {
+                "m0": {"discussion": sample_discussion_data},
+                "m1": None,
+                "m2": {"comment": sample_comment_data},
+            },
+            "errors": [{"message": "Could not resolve to a node", "path": ["m1"]}],
+        })
+        batcher = MutationBatcher(token=mock_token, min_interval=0)
+
+        update = batcher.update_discussion(discussion_id="D_1", body="new body")
+        missing = batcher.update_discussion(discussion_id="D_gone", body="x")
+        comment = batcher.add_discussion_comment(discussion_id="D_1", body="changelog")
+        assert not update.done
+        batcher.flush()
+
+        assert mock_urlopen.call_count == 1
+        sent = json.loads(mock_urlopen.call_args.args[0].data)
+        assert "m0: updateDiscussion(input: $i0)" in sent["query"]
+        assert "$i2: AddDiscussionCommentInput!" in sent["query"]
+        assert sent["variables"]["i1"] == {"discussionId": "D_gone", "body": "x"}
+        assert sent["variables"]["i2"]["body"].endswith("<!-- agent-response -->")
+
+        assert update.ok and update.result.number == 42
+        assert missing.error == "Could not resolve to a node"
+        assert comment.ok and comment.result.id == "DC_comment123"
+
+    @patch("src.integrations.github.discussions.github_transport.urlopen")
+    def test_flushes_when_queue_is_full(
+        self, mock_urlopen: MagicMock, mock_token: str, sample_discussion_data: dict[str, Any]
+    ) -> None:
+        mock_urlopen.return_value = _mock_raw_response({
+            "data": {"m0": {"discussion": sample_discussion_data}, "m1": {"discussion": sample_discussion_data}},
+        })
+        batcher = MutationBatcher(token=mock_token, batch_size=2, min_interval=0)
+
+        first = batcher.update_discussion(discussion_id="D_1", body="a")
+        batcher.update_discussion(discussion_id="D_2", body="b")
+
+        assert first.ok
+        assert len(batcher) == 0
+        assert batcher.requests == 1
+
+    @patch("src.integrations.github.discussions.github_transport.urlopen")
+    def test_secondary_rate_limit_halves_batch_and_retries(
+        self, mock_urlopen: MagicMock, mock_token: str, sample_discussion_data: dict[str, Any]
+    ) -> None:
+        ok = {"discussion": sample_discussion_data}
+        mock_urlopen.side_effect = [
+            _secondary_rate_limit(),
+            _mock_raw_response({"data": {"m0": ok, "m1": ok}}),
+            _mock_raw_response({"data": {"m0": ok, "m1": ok, "m2": ok}}),
+        ]
+        sleep = MagicMock()
+        batcher = MutationBatcher(token=mock_token, batch_size=4, min_interval=0, sleep=sleep)
+        pending = [batcher.update_discussion(discussion_id=f"D_{i}", body="x") for i in range(3)]
+
+        batcher.flush()
+
+        sleep.assert_called_once_with(7.0)
+        assert all(mutation.ok for mutation in pending)
+        assert mock_urlopen.call_count == 3
+        assert batcher.batch_size == 4  # Grew back after two successful requests
+
+    @patch("src.integrations.github.discussions.github_transport.urlopen")
+    def test_gives_up_after_max_retries(self, mock_urlopen: MagicMock, mock_token: str) -> None:
+        mock_urlopen.side_effect = lambda *args, **kwargs: (_ for _ in ()).throw(_secondary_rate_limit())
+        batcher = MutationBatcher(token=mock_token, min_interval=0, max_retries=2, sleep=MagicMock())
+        pending = batcher.add_discussion_comment(discussion_id="D_1", body="hi")
+
+        batcher.flush()
+
+        assert mock_urlopen.call_count == 3
+        assert pending.done and "secondary rate limit" in pending.error
+
+    @patch("src.integrations.github.discussions.github_transport.urlopen")
+    def test_only_rate_limited_aliases_are_resent(
+        self,
+        mock_urlopen: MagicMock,
+        mock_token: str,
+        sample_discussion_data: dict[str, Any],
+        sample_comment_data: dict[str, Any],
+    ) -> None:
+        mock_urlopen.side_effect = [
+            _mock_raw_response({
+                "data": {"m0": {"discussion": sample_discussion_data}, "m1": None},
+                "errors": [{"type": "RATE_LIMITED", "message": "was submitted too quickly", "path": ["m1"]}],
+            }),
+            _mock_raw_response({"data": {"m0": {"comment": sample_comment_data}}}),
+        ]
+        batcher = MutationBatcher(token=mock_token, min_interval=0, sleep=MagicMock())
+        created = batcher.create_discussion(repository_id="R_1", category_id="C_1", title="T", body="B")
+        comment = batcher.add_discussion_comment(discussion_id="D_1", body="hi")
+
+        sent = batcher.flush()
+
+        assert created.ok and comment.ok
+        assert len(sent) == 2
+        retried = json.loads(mock_urlopen.call_args.args[0].data)
+        assert "createDiscussion" not in retried["query"]
+        assert "m0: addDiscussionComment" in retried["query"]
+
+    @patch("src.integrations.github.discussions.github_transport.urlopen")
+    def test_retry_budget_resets_after_a_failed_batch(
+        self, mock_urlopen: MagicMock, mock_token: str, sample_comment_data: dict[str, Any]
+    ) -> None:
+        mock_urlopen.side_effect = [
+            _secondary_rate_limit(),
+            _secondary_rate_limit(),
+            _secondary_rate_limit(),
+            _mock_raw_response({"data": {"m0": {"comment": sample_comment_data}}}),
+        ]
+        batcher = MutationBatcher(token=mock_token, batch_size=1, min_interval=0, max_retries=1, sleep=MagicMock())
+        batcher._queue.extend([  # noqa: SLF001 - queue without auto-flushing
+            PendingMutation(field="addDiscussionComment", input={"discussionId": "D_1", "body": "a"}),
+            PendingMutation(field="addDiscussionComment", input={"discussionId": "D_2", "body": "b"}),
+        ])
+
+        first, second = batcher.flush()
+
+        assert "secondary rate limit" in first.error
+        assert second.ok
+
+    @patch("src.integrations.github.discussions.github_transport.urlopen")
+    def test_other_failures_are_not_replayed(self, mock_urlopen: MagicMock, mock_token: str) -> None:
+        body = MagicMock()
+        body.read.return_value = b"Bad Gateway"
+        mock_urlopen.side_effect = error.HTTPError("https://api.github.com/graphql", 502, "Bad Gateway", {}, body)
+        batcher = MutationBatcher(token=mock_token, min_interval=0)
+        pending = batcher.create_discussion(repository_id="R_1", category_id="C_1", title="T", body="B")
+
+        batcher.flush()
+
+        assert mock_urlopen.call_count == 1
+        assert "502" in pending.error
+
+    def test_validates_inputs(self, mock_token: str) -> None:
+        batcher = MutationBatcher(token=mock_token)
+        with pytest.raises(GitHubDiscussionError):
+            batcher.update_discussion(discussion_id="D_1")
+        with pytest.raises(GitHubDiscussionError):
+            batcher.create_discussion(repository_id="R_1", category_id="", title="T", body="B")
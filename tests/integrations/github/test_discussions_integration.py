@@ -18,12 +18,47 @@ from src.integrations.github.discussions import (
     Discussion,
     DiscussionCategory,
     DiscussionComment,
+    DiscussionIndex,
     GitHubDiscussionError,
+    MutationBatcher,
 )
 from src.knowledge.aggregation import KnowledgeAggregator, AggregatedEntity
 from src.knowledge.storage import KnowledgeGraphStorage
 
 
+def _index(*discussions: Discussion) -> DiscussionIndex:
+    """A pre-populated discussion index that never calls the API."""
+    index = DiscussionIndex(token="token", repository="test/repo")
+    for discussion in discussions:
+        index.record(discussion)
+    index.refresh = MagicMock(return_value=0)  # type: ignore[method-assign]
+    return index
+
+
+class _DirectBatcher(MutationBatcher):
+    """A mutation batcher that resolves each mutation through the patched module."""
+
+    FIELDS = {"categoryId": "category_id", "discussionId": "discussion_id", "title": "title", "body": "body"}
+
+    def __init__(self, module: MagicMock) -> None:
+        super().__init__(token="token", min_interval=0)
+        self.module = module
+
+    def _send(self, batch: Any) -> None:
+        handlers = {
+            "createDiscussion": self.module.create_discussion,
+            "updateDiscussion": self.module.update_discussion,
+            "addDiscussionComment": self.module.add_discussion_comment,
+        }
+        for mutation in batch:
+            kwargs = {self.FIELDS[k]: v for k, v in mutation.input.items() if k in self.FIELDS}
+            mutation.done = True
+            try:
+                mutation.result = handlers[mutation.field](token="token", **kwargs)
+            except GitHubDiscussionError as exc:
+                mutation.error = str(exc)
+
+
 class TestIdempotentSync:
     """Test that sync operations are idempotent (safe to run multiple times)."""
 
@@ -115,7 +150,8 @@ class TestIdempotentSync:
             category_id=people_category.id,
             category_name=people_category.name,
         )
-        mock_discussions.find_discussion_by_title.return_value = None
+        mock_discussions.DiscussionIndex.return_value = _index()
+        mock_discussions.MutationBatcher.return_value = _DirectBatcher(mock_discussions)
         mock_discussions.create_discussion.return_value = created_discussion
         
         args = MagicMock()
@@ -126,6 +162,7 @@ class TestIdempotentSync:
         args.entity_name = None
         args.dry_run = False
         args.output = None
+        args.index_cache = None
         
         # First sync - should create
         result1 = sync_discussions_cli(args)
@@ -161,7 +198,9 @@ class TestIdempotentSync:
             category_id=people_category.id,
             category_name=people_category.name,
         )
-        mock_discussions.find_discussion_by_title.return_value = existing_discussion
+        mock_discussions.DiscussionIndex.return_value = _index(existing_discussion)
+        mock_discussions.MutationBatcher.return_value = _DirectBatcher(mock_discussions)
+        mock_discussions.update_discussion.return_value = existing_discussion
         
         # Second sync - should skip (unchanged)
         result2 = sync_discussions_cli(args)
@@ -201,7 +240,9 @@ class TestIdempotentSync:
             category_id=people_category.id,
             category_name=people_category.name,
         )
-        mock_discussions.find_discussion_by_title.return_value = existing_discussion
+        mock_discussions.DiscussionIndex.return_value = _index(existing_discussion)
+        mock_discussions.MutationBatcher.return_value = _DirectBatcher(mock_discussions)
+        mock_discussions.update_discussion.return_value = existing_discussion
         
         args = MagicMock()
         args.repository = "test/repo"
@@ -211,6 +252,7 @@ class TestIdempotentSync:
         args.entity_name = None
         args.dry_run = False
         args.output = None
+        args.index_cache = None
         
         result = sync_discussions_cli(args)
         
@@ -277,7 +319,8 @@ class TestDryRunMode:
             description=""
         )
         mock_discussions.get_category_by_name.return_value = people_category
-        mock_discussions.find_discussion_by_title.return_value = None
+        mock_discussions.DiscussionIndex.return_value = _index()
+        mock_discussions.MutationBatcher.return_value = _DirectBatcher(mock_discussions)
         
         args = MagicMock()
         args.repository = "test/repo"
@@ -287,6 +330,7 @@ class TestDryRunMode:
         args.entity_name = None
         args.dry_run = True
         args.output = None
+        args.index_cache = None
         
         result = sync_discussions_cli(args)
         
@@ -327,7 +371,8 @@ class TestDryRunMode:
             category_id=people_category.id,
             category_name=people_category.name,
         )
-        mock_discussions.find_discussion_by_title.return_value = existing
+        mock_discussions.DiscussionIndex.return_value = _index(existing)
+        mock_discussions.MutationBatcher.return_value = _DirectBatcher(mock_discussions)
         
         args = MagicMock()
         args.repository = "test/repo"
@@ -337,6 +382,7 @@ class TestDryRunMode:
         args.entity_name = None
         args.dry_run = True
         args.output = None
+        args.index_cache = None
         
         result = sync_discussions_cli(args)
         
@@ -428,7 +474,8 @@ class TestReportGeneration:
             return None
         
         mock_discussions.get_category_by_name.side_effect = get_category
-        mock_discussions.find_discussion_by_title.return_value = None
+        mock_discussions.DiscussionIndex.return_value = _index()
+        mock_discussions.MutationBatcher.return_value = _DirectBatcher(mock_discussions)
         
         # Create returns sequential discussions
         call_count = [0]
@@ -457,6 +504,7 @@ class TestReportGeneration:
         args.entity_name = None
         args.dry_run = False
         args.output = str(report_path)
+        args.index_cache = None
         
         result = sync_discussions_cli(args)
         
@@ -511,30 +559,27 @@ class TestReportGeneration:
         # Person One: doesn't exist (create)
         # Person Two: exists with same content (unchanged)
         # Org One: exists with different content (update)
-        def find_disc(token: str, repository: str, title: str, category_id: str) -> Discussion | None:
-            if title == "Person Two":
-                return Discussion(
-                    id="D_existing1",
-                    number=10,
-                    title="Person Two",
-                    body=person_two_body,
-                    url="https://github.com/test/repo/discussions/10",
-                    category_id=people_category.id,
-                    category_name=people_category.name,
-                )
-            elif title == "Org One":
-                return Discussion(
-                    id="D_existing2",
-                    number=20,
-                    title="Org One",
-                    body="Old org content",
-                    url="https://github.com/test/repo/discussions/20",
-                    category_id=orgs_category.id,
-                    category_name=orgs_category.name,
-                )
-            return None
-        
-        mock_discussions.find_discussion_by_title.side_effect = find_disc
+        person_two_discussion = Discussion(
+            id="D_existing1",
+            number=10,
+            title="Person Two",
+            body=person_two_body,
+            url="https://github.com/test/repo/discussions/10",
+            category_id=people_category.id,
+            category_name=people_category.name,
+        )
+        org_one_discussion = Discussion(
+            id="D_existing2",
+            number=20,
+            title="Org One",
+            body="Old org content",
+            url="https://github.com/test/repo/discussions/20",
+            category_id=orgs_category.id,
+            category_name=orgs_category.name,
+        )
+        mock_discussions.DiscussionIndex.return_value = _index(person_two_discussion, org_one_discussion)
+        mock_discussions.MutationBatcher.return_value = _DirectBatcher(mock_discussions)
+        mock_discussions.update_discussion.return_value = org_one_discussion
         
         mock_discussions.create_discussion.return_value = Discussion(
             id="D_new",
@@ -556,6 +601,7 @@ class TestReportGeneration:
         args.entity_name = None
         args.dry_run = False
         args.output = str(report_path)
+        args.index_cache = None
         
         result = sync_discussions_cli(args)
         
@@ -671,7 +717,8 @@ class TestErrorRecovery:
             id="DIC_people", name="People", slug="people", description=""
         )
         mock_discussions.get_category_by_name.return_value = people_category
-        mock_discussions.find_discussion_by_title.return_value = None
+        mock_discussions.DiscussionIndex.return_value = _index()
+        mock_discussions.MutationBatcher.return_value = _DirectBatcher(mock_discussions)
         mock_discussions.create_discussion.side_effect = GitHubDiscussionError("API rate limit")
         
         args = MagicMock()
@@ -682,6 +729,7 @@ class TestErrorRecovery:
         args.entity_name = None
         args.dry_run = False
         args.output = None
+        args.index_cache = None
         
         result = sync_discussions_cli(args)
         
@@ -711,6 +759,7 @@ class TestErrorRecovery:
         args.entity_name = None
         args.dry_run = False
         args.output = None
+        args.index_cache = None
         
         result = sync_discussions_cli(args)
         
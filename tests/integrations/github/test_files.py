@@ -0,0 +1,137 @@
+"""Tests for GitHub file helpers, run against the local GitHub stand-in."""
+
+from __future__ import annotations
+
+import io
+import subprocess
+from typing import Any, Iterator
+from urllib import error
+
+import pytest
+
+from src.integrations.github import files, transport
+from src.integrations.github.issues import GitHubIssueError
+from src.integrations.github.standin import GitHubStandIn
+
+TOKEN = "t"
+BLOBS = "POST /repos/{owner}/{repo}/git/blobs"
+TREES = "POST /repos/{owner}/{repo}/git/trees"
+
+
+@pytest.fixture(autouse=True)
+def fresh_transport() -> Iterator[None]:
+    transport.set_transport(transport.GitHubTransport())
+    yield
+    transport.get_transport().close()
+    transport.set_transport(None)
+
+
+@pytest.fixture
+def github() -> Iterator[GitHubStandIn]:
+    with GitHubStandIn() as server:
+        yield server
+
+
+def _commit(github: GitHubStandIn, batch: list[tuple[str, str | bytes]], **kwargs: Any) -> dict[str, Any]:
+    return files.commit_files_batch(
+        token=TOKEN,
+        repository=github.repository,
+        files=batch,
+        message="m",
+        branch="main",
+        api_url=github.api_url,
+        **kwargs,
+    )
+
+
+def _fail_nth(monkeypatch: pytest.MonkeyPatch, endpoint: str, n: int, status: int) -> None:
+    """Make the ``n``-th request to ``endpoint`` fail with ``status``."""
+    real = files.github_transport.urlopen
+    seen = {"count": 0}
+
+    def urlopen(req: Any, timeout: float | None = None) -> Any:
+        if transport.endpoint_template(req.get_method(), req.get_full_url()) == endpoint:
+            seen["count"] += 1
+            if seen["count"] == n:
+                raise error.HTTPError(req.get_full_url(), status, "boom", {}, io.BytesIO(b"{}"))  # type: ignore[arg-type]
+        return real(req, timeout=timeout)
+
+    monkeypatch.setattr(files.github_transport, "urlopen", urlopen)
+
+
+def test_git_blob_sha_matches_git() -> None:
+    expected = subprocess.run(
+        ["git", "hash-object", "--stdin"], input=b"hello\n", capture_output=True, check=True
+    ).stdout.decode().strip()
+    assert files.git_blob_sha(b"hello\n") == expected
+
+
+def test_small_text_inline_and_duplicate_blobs_uploaded_once(github: GitHubStandIn) -> None:
+    large = "x" * (files.INLINE_CONTENT_LIMIT + 1)
+    result = _commit(
+        github,
+        [("small.md", "hi"), ("a/large.md", large), ("b/large.md", large), ("bin.dat", b"\xff\x00")],
+    )
+
+    assert result["blobs_created"] == 2
+    assert github.stats()["endpoints"][BLOBS] == 2
+    tree = github.state.git.tree_for("main")
+    assert tree["a/large.md"] == tree["b/large.md"] == files.git_blob_sha(large.encode())
+    assert github.state.git.blobs[tree["small.md"]] == b"hi"
+    assert github.state.git.blobs[tree["bin.dat"]] == b"\xff\x00"
+
+
+def test_large_batches_chain_trees(github: GitHubStandIn, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(files, "TREE_CHUNK_ENTRIES", 2)
+    _commit(github, [(f"f{n}.txt", str(n)) for n in range(5)])
+
+    stats = github.stats()
+    assert stats["endpoints"][TREES] == 3
+    assert stats["commits"] == 1
+    assert {f"f{n}.txt" for n in range(5)} <= set(github.state.git.tree_for("main"))
+
+
+def test_failed_batch_resumes_from_progress(github: GitHubStandIn, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(files, "TREE_CHUNK_ENTRIES", 2)
+    monkeypatch.setattr(files, "INLINE_CONTENT_LIMIT", 0)
+    batch: list[tuple[str, str | bytes]] = [(f"f{n}.txt", f"content {n}") for n in range(5)]
+    _fail_nth(monkeypatch, TREES, 2, 422)
+
+    progress = files.BatchCommitProgress()
+    with pytest.raises(GitHubIssueError, match="422"):
+        _commit(github, batch, progress=progress)
+    assert progress.chunks_done == 1
+    assert len(progress.blobs) == 5
+
+    _commit(github, batch, progress=progress)
+
+    stats = github.stats()
+    assert stats["endpoints"][BLOBS] == 5  # Not uploaded again
+    assert stats["endpoints"][TREES] == 3  # The first chunk is not rebuilt
+    assert stats["commits"] == 1
+    assert github.state.git.blobs[github.state.git.tree_for("main")["f4.txt"]] == b"content 4"
+
+
+def test_progress_is_discarded_when_branch_moves(github: GitHubStandIn, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(files, "TREE_CHUNK_ENTRIES", 1)
+    _fail_nth(monkeypatch, TREES, 2, 422)
+    progress = files.BatchCommitProgress()
+    with pytest.raises(GitHubIssueError):
+        _commit(github, [("a.txt", "a"), ("b.txt", "b")], progress=progress)
+
+    _commit(github, [("other.txt", "o")])
+    _commit(github, [("a.txt", "a"), ("b.txt", "b")], progress=progress)
+
+    tree = github.state.git.tree_for("main")
+    assert {"a.txt", "b.txt", "other.txt"} <= set(tree)
+
+
+def test_transient_errors_are_retried(github: GitHubStandIn, monkeypatch: pytest.MonkeyPatch) -> None:
+    sleeps: list[float] = []
+    monkeypatch.setattr(files.time, "sleep", sleeps.append)
+    _fail_nth(monkeypatch, TREES, 1, 502)
+
+    _commit(github, [("a.txt", "a")])
+
+    assert sleeps == [1]
+    assert github.stats()["commits"] == 1
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import json
 import os
+import threading
 from unittest import mock
 
 import pytest
@@ -257,3 +258,152 @@ class TestGitHubStorageClientCommitFilesBatch:
             assert call_kwargs["message"] == "Batch update"
             assert call_kwargs["branch"] == "main"
             assert result["files_count"] == 2
+
+
+class TestCommitBuffer:
+    """Tests for the process-wide write-behind buffer."""
+
+    @pytest.fixture(autouse=True)
+    def isolated_buffers(self):
+        from src.integrations.github import storage
+
+        storage._buffers.clear()
+        yield
+        storage._buffers.clear()
+
+    @pytest.fixture
+    def mock_batch(self):
+        with mock.patch("src.integrations.github.files.commit_files_batch") as mock_batch:
+            mock_batch.return_value = {"sha": "abc123"}
+            yield mock_batch
+
+    def test_batch_coalesces_into_one_commit(self, mock_batch):
+        client = GitHubStorageClient(token="t", repository="owner/repo")
+        other = GitHubStorageClient(token="t", repository="owner/repo")
+
+        with mock.patch("src.integrations.github.storage.commit_file") as mock_commit:
+            with client.batch("Extract entities from abc"):
+                client.commit_file("kb/people/abc.json", "v1", "people")
+                other.commit_file("kb/orgs/abc.json", "orgs", "orgs")
+                client.commit_file("/kb/people/abc.json", "v2", "people again")
+                assert mock_batch.call_count == 0
+
+        mock_commit.assert_not_called()
+        mock_batch.assert_called_once()
+        kwargs = mock_batch.call_args.kwargs
+        assert dict(kwargs["files"]) == {"kb/people/abc.json": "v2", "kb/orgs/abc.json": "orgs"}
+        assert kwargs["message"] == "Extract entities from abc"
+        assert kwargs["branch"] == "main"
+
+    def test_exception_discards_batch_writes(self, mock_batch):
+        client = GitHubStorageClient(token="t", repository="owner/repo", write_behind=True)
+        client.commit_file("a.json", "kept", "a")
+
+        with pytest.raises(RuntimeError):
+            with client.batch():
+                client.commit_file("a.json", "overwritten", "a")
+                client.commit_file("b.json", "new", "b")
+                raise RuntimeError("boom")
+
+        assert client.buffer.pending() == {"a.json": "kept"}
+        mock_batch.assert_not_called()
+
+    def test_nested_batches_commit_once(self, mock_batch):
+        client = GitHubStorageClient(token="t", repository="owner/repo")
+
+        with client.batch("outer"):
+            client.commit_file("a.json", "a", "a")
+            with client.batch("inner"):
+                client.commit_file("b.json", "b", "b")
+            assert mock_batch.call_count == 0
+
+        mock_batch.assert_called_once()
+        assert mock_batch.call_args.kwargs["message"] == "outer"
+
+    def test_size_trigger_flushes(self, mock_batch):
+        client = GitHubStorageClient(token="t", repository="owner/repo", write_behind=True)
+        client.buffer.max_files = 2
+
+        client.commit_file("a.json", "a", "a")
+        assert mock_batch.call_count == 0
+        client.commit_file("b.json", "b", "b")
+
+        mock_batch.assert_called_once()
+        assert "a\n" in mock_batch.call_args.kwargs["message"]
+        assert client.buffer.pending() == {}
+
+    def test_time_trigger_flushes(self, mock_batch):
+        client = GitHubStorageClient(token="t", repository="owner/repo", write_behind=True)
+        client.buffer.max_delay = 0.05
+
+        client.commit_file("a.json", "a", "a")
+
+        for _ in range(100):
+            if mock_batch.called:
+                break
+            threading.Event().wait(0.01)
+        mock_batch.assert_called_once()
+
+    def test_pr_branch_writes_commit_separately(self, mock_batch):
+        client = GitHubStorageClient(token="t", repository="owner/repo")
+        client._pr_branch = "content-acquisition-1"
+
+        with client.batch():
+            client.commit_file("a.json", "a", "a")
+            client.commit_to_pr_branch("b.json", "b", "b")
+            client.commit_files_batch([("c.json", "c")], "c", use_pr_branch=True)
+
+        branches = {call.kwargs["branch"]: dict(call.kwargs["files"]) for call in mock_batch.call_args_list}
+        assert branches == {
+            "main": {"a.json": "a"},
+            "content-acquisition-1": {"b.json": "b", "c.json": "c"},
+        }
+
+    def test_failed_flush_keeps_writes_pending(self, mock_batch):
+        mock_batch.side_effect = RuntimeError("API down")
+        client = GitHubStorageClient(token="t", repository="owner/repo", write_behind=True)
+        client.commit_file("a.json", "a", "a")
+
+        with pytest.raises(RuntimeError):
+            client.flush()
+
+        assert client.buffer.pending() == {"a.json": "a"}
+
+    def test_retried_flush_resumes_upload_progress(self, mock_batch):
+        mock_batch.side_effect = [RuntimeError("API down"), {"sha": "abc123"}, {"sha": "def456"}]
+        client = GitHubStorageClient(token="t", repository="owner/repo", write_behind=True)
+        client.commit_file("a.json", "a", "a")
+
+        with pytest.raises(RuntimeError):
+            client.flush()
+        client.flush()
+        client.commit_file("b.json", "b", "b")
+        client.flush()
+
+        first, retry, later = (call.kwargs["progress"] for call in mock_batch.call_args_list)
+        assert retry is first
+        assert later is not first
+
+    def test_write_behind_from_environment(self):
+        env = {
+            "GITHUB_ACTIONS": "true",
+            "GITHUB_TOKEN": "t",
+            "GITHUB_REPOSITORY": "owner/repo",
+            "GITHUB_STORAGE_WRITE_BEHIND": "1",
+        }
+        with mock.patch.dict(os.environ, env, clear=True):
+            assert GitHubStorageClient.from_environment().write_behind is True
+
+    def test_knowledge_storage_batch(self, mock_batch, tmp_path):
+        from src.knowledge.storage import KnowledgeGraphStorage
+
+        client = GitHubStorageClient(token="t", repository="owner/repo")
+        kb = KnowledgeGraphStorage(tmp_path / "kb", github_client=client, project_root=tmp_path)
+
+        with kb.batch("Extract entities from abc"):
+            kb.save_extracted_people("abc", ["Jane Doe"])
+            kb.save_extracted_organizations("abc", ["Acme"])
+            kb.save_extracted_concepts("abc", ["leadership"])
+
+        mock_batch.assert_called_once()
+        assert len(mock_batch.call_args.kwargs["files"]) == 3
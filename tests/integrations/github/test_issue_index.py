@@ -0,0 +1,143 @@
+"""Tests for the local SQLite issue index."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from urllib import parse
+
+import pytest
+
+from src.integrations.github import issue_index
+from src.integrations.github.issue_index import IndexedIssue, IssueIndex, parse_checksum
+from src.integrations.github.issues import GitHubIssueError
+
+
+class DummyResponse:
+    def __init__(self, payload: object):
+        self._payload = payload
+
+    def read(self) -> bytes:
+        return json.dumps(self._payload).encode("utf-8")
+
+    def __enter__(self) -> "DummyResponse":
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        return None
+
+
+def _issue(number: int, *, checksum: str | None = None, state: str = "open",
+           labels: tuple[str, ...] = ("extraction-queue",), updated_at: str = "2026-01-01T00:00:00Z",
+           ) -> dict[str, object]:
+    body = f"Body\n<!-- checksum:{checksum} -->" if checksum else "Body"
+    return {
+        "number": number,
+        "title": f"Extract: doc{number}",
+        "state": state,
+        "labels": [{"name": label} for label in labels],
+        "body": body,
+        "html_url": f"https://github.com/o/r/issues/{number}",
+        "updated_at": updated_at,
+    }
+
+
+class FakeAPI:
+    """Serves queued issue pages and records the query of every request."""
+
+    def __init__(self) -> None:
+        self.pages: list[list[dict[str, object]]] = []
+        self.queries: list[dict[str, list[str]]] = []
+
+    def urlopen(self, req: object) -> DummyResponse:
+        self.queries.append(parse.parse_qs(parse.urlparse(req.full_url).query))
+        return DummyResponse(self.pages.pop(0) if self.pages else [])
+
+
+@pytest.fixture
+def api(monkeypatch: pytest.MonkeyPatch) -> FakeAPI:
+    fake = FakeAPI()
+    monkeypatch.setattr(issue_index.github_transport, "urlopen", fake.urlopen)
+    monkeypatch.setattr(issue_index, "ISSUE_PAGE_SIZE", 2)
+    return fake
+
+
+def _index(tmp_path: Path, repository: str = "o/r") -> IssueIndex:
+    return IssueIndex(repository=repository, token="t", db_path=tmp_path / "index.db")
+
+
+def test_parse_checksum() -> None:
+    assert parse_checksum("x <!-- checksum:abc123 --> y") == "abc123"
+    assert parse_checksum("no marker") is None
+    assert parse_checksum(None) is None
+
+
+def test_full_sync_pages_and_skips_pull_requests(tmp_path: Path, api: FakeAPI) -> None:
+    pull_request = dict(_issue(3), pull_request={"url": "..."})
+    api.pages.extend([
+        [_issue(1, checksum="aaa"), _issue(2, checksum="bbb", state="closed")],
+        [pull_request],
+    ])
+    index = _index(tmp_path)
+
+    assert index.sync() == 2
+    assert [query["page"] for query in api.queries] == [["1"], ["2"]]
+    assert "since" not in api.queries[0]
+    assert index.page_requests == 2
+    assert index.by_checksum("bbb") == IndexedIssue(
+        number=2,
+        title="Extract: doc2",
+        state="closed",
+        labels=("extraction-queue",),
+        checksum="bbb",
+        url="https://github.com/o/r/issues/2",
+        updated_at="2026-01-01T00:00:00Z",
+    )
+    assert len(index) == 2
+
+
+def test_incremental_sync_uses_watermark(tmp_path: Path, api: FakeAPI) -> None:
+    api.pages.append([_issue(1, checksum="aaa", updated_at="2026-02-01T00:00:00Z")])
+    _index(tmp_path).sync()
+
+    api.pages.append([_issue(1, checksum="aaa", state="closed", updated_at="2026-03-01T00:00:00Z")])
+    index = _index(tmp_path)
+    assert index.sync() == 1
+
+    assert api.queries[-1]["since"] == ["2026-02-01T00:00:00Z"]
+    assert index.synced_at == "2026-03-01T00:00:00Z"
+    assert index.by_checksum("aaa").state == "closed"  # type: ignore[union-attr]
+
+
+def test_queries_filter_by_label_and_state(tmp_path: Path, api: FakeAPI) -> None:
+    api.pages.append([
+        _issue(1, checksum="aaa"),
+        _issue(2, labels=("synthesis-batch", "copilot"), state="closed"),
+    ])
+    index = _index(tmp_path)
+    index.sync()
+
+    assert [i.number for i in index.issues(label="extraction-queue")] == [1]
+    assert [i.number for i in index.issues(state="closed")] == [2]
+    assert index.issues(label="copilot", state="open") == []
+
+
+def test_rebuild_discards_stale_rows(tmp_path: Path, api: FakeAPI) -> None:
+    index = _index(tmp_path)
+    index.record(IndexedIssue(9, "Gone", "open", (), "zzz", "u", ""))
+    api.pages.append([_issue(1, checksum="aaa")])
+
+    assert index.rebuild() == 1
+    assert index.by_checksum("zzz") is None
+    assert "since" not in api.queries[-1]
+
+
+def test_index_for_other_repository_is_discarded(tmp_path: Path) -> None:
+    _index(tmp_path).record(IndexedIssue(1, "t", "open", (), "aaa", "u", ""))
+    assert len(_index(tmp_path, repository="o/other")) == 0
+
+
+def test_sync_requires_token(tmp_path: Path) -> None:
+    index = IssueIndex(repository="o/r", db_path=tmp_path / "index.db")
+    with pytest.raises(GitHubIssueError):
+        index.sync()
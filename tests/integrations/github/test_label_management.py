@@ -55,7 +55,7 @@ class TestLabelInfo:
 class TestGetRepositoryLabels:
     """Tests for get_repository_labels function."""
 
-    @patch("src.integrations.github.issues.request.urlopen")
+    @patch("src.integrations.github.issues.github_transport.urlopen")
     def test_returns_label_list(self, mock_urlopen):
         """Should return a list of label dictionaries."""
         mock_response = MagicMock()
@@ -76,7 +76,7 @@ class TestGetRepositoryLabels:
         assert result[0]["name"] == "bug"
         assert result[1]["name"] == "enhancement"
 
-    @patch("src.integrations.github.issues.request.urlopen")
+    @patch("src.integrations.github.issues.github_transport.urlopen")
     def test_handles_empty_list(self, mock_urlopen):
         """Should handle repository with no labels."""
         mock_response = MagicMock()
@@ -101,7 +101,7 @@ class TestGetRepositoryLabels:
 class TestCreateLabel:
     """Tests for create_label function."""
 
-    @patch("src.integrations.github.issues.request.urlopen")
+    @patch("src.integrations.github.issues.github_transport.urlopen")
     def test_creates_label(self, mock_urlopen):
         """Should create a label with correct parameters."""
         mock_response = MagicMock()
@@ -144,7 +144,7 @@ class TestCreateLabel:
                 color="",
             )
 
-    @patch("src.integrations.github.issues.request.urlopen")
+    @patch("src.integrations.github.issues.github_transport.urlopen")
     def test_strips_hash_from_color(self, mock_urlopen):
         """Should strip # prefix from color."""
         mock_response = MagicMock()
@@ -3,12 +3,16 @@
 from __future__ import annotations
 
 import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from unittest.mock import MagicMock, patch, call
 
 import pytest
 
 from src.integrations.github.models import (
+    ChatCompletionDelta,
     ChatCompletionResponse,
+    ChatCompletionStream,
     ChatMessage,
     Choice,
     GitHubModelsClient,
@@ -86,7 +90,7 @@ def test_chat_completion_simple_message():
         },
     }
     
-    with patch("requests.post") as mock_post:
+    with patch("requests.Session.post") as mock_post:
         mock_post.return_value.json.return_value = mock_response
         mock_post.return_value.raise_for_status = MagicMock()
         
@@ -130,7 +134,7 @@ def test_chat_completion_with_tool_call():
         ],
     }
     
-    with patch("requests.post") as mock_post:
+    with patch("requests.Session.post") as mock_post:
         mock_post.return_value.json.return_value = mock_response
         mock_post.return_value.raise_for_status = MagicMock()
         
@@ -166,7 +170,7 @@ def test_chat_completion_with_tool_call():
 
 def test_chat_completion_sends_correct_payload():
     """GitHubModelsClient sends properly formatted request."""
-    with patch("requests.post") as mock_post:
+    with patch("requests.Session.post") as mock_post:
         mock_post.return_value.json.return_value = {
             "id": "test",
             "model": "gpt-4o-mini",
@@ -208,7 +212,7 @@ def test_chat_completion_handles_http_error():
     """GitHubModelsClient raises error on HTTP failure."""
     import requests
     
-    with patch("requests.post") as mock_post:
+    with patch("requests.Session.post") as mock_post:
         mock_response = MagicMock()
         mock_response.raise_for_status.side_effect = requests.RequestException("HTTP 401")
         mock_post.return_value = mock_response
@@ -221,7 +225,7 @@ def test_chat_completion_handles_http_error():
 
 def test_chat_completion_handles_json_decode_error():
     """GitHubModelsClient raises error on invalid JSON response."""
-    with patch("requests.post") as mock_post:
+    with patch("requests.Session.post") as mock_post:
         mock_response = MagicMock()
         mock_response.raise_for_status = MagicMock()
         mock_response.json.side_effect = json.JSONDecodeError("bad", "", 0)
@@ -311,7 +315,7 @@ def test_rate_limit_retry_success_after_one_retry():
     success_response.json.return_value = mock_response_success
     success_response.raise_for_status = MagicMock()
     
-    with patch("requests.post") as mock_post, patch("time.sleep") as mock_sleep:
+    with patch("requests.Session.post") as mock_post, patch("time.sleep") as mock_sleep:
         mock_post.side_effect = [rate_limit_response, success_response]
         
         client = GitHubModelsClient(api_key="test", max_retries=3, initial_backoff=1.0)
@@ -334,7 +338,7 @@ def test_rate_limit_exhausted_retries():
         "429 Too Many Requests", response=rate_limit_response
     )
     
-    with patch("requests.post") as mock_post, patch("time.sleep"):
+    with patch("requests.Session.post") as mock_post, patch("time.sleep"):
         mock_post.return_value = rate_limit_response
         
         client = GitHubModelsClient(api_key="test", max_retries=2, initial_backoff=0.1)
@@ -368,7 +372,7 @@ def test_rate_limit_exponential_backoff():
     success_response.json.return_value = mock_response_success
     success_response.raise_for_status = MagicMock()
     
-    with patch("requests.post") as mock_post, patch("time.sleep") as mock_sleep:
+    with patch("requests.Session.post") as mock_post, patch("time.sleep") as mock_sleep:
         # Fail twice, succeed on third
         mock_post.side_effect = [rate_limit_response, rate_limit_response, success_response]
         
@@ -405,7 +409,7 @@ def test_rate_limit_respects_retry_after_header():
     success_response.json.return_value = mock_response_success
     success_response.raise_for_status = MagicMock()
     
-    with patch("requests.post") as mock_post, patch("time.sleep") as mock_sleep:
+    with patch("requests.Session.post") as mock_post, patch("time.sleep") as mock_sleep:
         mock_post.side_effect = [rate_limit_response, success_response]
         
         client = GitHubModelsClient(api_key="test", max_retries=2, initial_backoff=2.0)
@@ -437,7 +441,7 @@ def test_rate_limit_caps_wait_at_max_backoff():
     success_response.json.return_value = mock_response_success
     success_response.raise_for_status = MagicMock()
     
-    with patch("requests.post") as mock_post, patch("time.sleep") as mock_sleep:
+    with patch("requests.Session.post") as mock_post, patch("time.sleep") as mock_sleep:
         mock_post.side_effect = [rate_limit_response, success_response]
         
         # max_backoff of 60 seconds
@@ -473,7 +477,7 @@ def test_rate_limit_parses_wait_from_message():
     success_response.json.return_value = mock_response_success
     success_response.raise_for_status = MagicMock()
     
-    with patch("requests.post") as mock_post, patch("time.sleep") as mock_sleep:
+    with patch("requests.Session.post") as mock_post, patch("time.sleep") as mock_sleep:
         mock_post.side_effect = [rate_limit_response, success_response]
         
         client = GitHubModelsClient(api_key="test", max_retries=2)
@@ -495,7 +499,7 @@ def test_non_rate_limit_error_not_retried():
         "500 Internal Server Error", response=error_response
     )
     
-    with patch("requests.post") as mock_post, patch("time.sleep") as mock_sleep:
+    with patch("requests.Session.post") as mock_post, patch("time.sleep") as mock_sleep:
         mock_post.return_value = error_response
         
         client = GitHubModelsClient(api_key="test", max_retries=3)
@@ -520,7 +524,7 @@ def test_rate_limit_error_has_retry_after():
         "429 Too Many Requests", response=rate_limit_response
     )
     
-    with patch("requests.post") as mock_post, patch("time.sleep"):
+    with patch("requests.Session.post") as mock_post, patch("time.sleep"):
         mock_post.return_value = rate_limit_response
         
         client = GitHubModelsClient(api_key="test", max_retries=0)
@@ -529,3 +533,298 @@ def test_rate_limit_error_has_retry_after():
             client.chat_completion([{"role": "user", "content": "test"}])
         
         assert exc_info.value.retry_after == 30.0
+
+
+def _sse_response(chunks: list[dict]) -> MagicMock:
+    """Mock a streamed response emitting ``chunks`` as server-sent events."""
+    lines = []
+    for chunk in chunks:
+        lines.append(f"data: {json.dumps(chunk)}")
+        lines.append("")
+    lines.append("data: [DONE]")
+    response = MagicMock()
+    response.raise_for_status = MagicMock()
+    response.iter_lines.return_value = iter(lines)
+    return response
+
+
+def _content_chunk(content: str, finish_reason: str | None = None) -> dict:
+    return {
+        "id": "chatcmpl-stream",
+        "model": "gpt-4o-mini",
+        "choices": [{"index": 0, "delta": {"content": content}, "finish_reason": finish_reason}],
+    }
+
+
+def test_client_owns_pooled_session():
+    """GitHubModelsClient sends every call through one pooled session."""
+    client = GitHubModelsClient(api_key="test", pool_maxsize=3)
+    
+    adapter = client.session.get_adapter("https://models.github.ai")
+    assert adapter._pool_maxsize == 3
+    
+    with patch.object(client.session, "post") as mock_post:
+        mock_post.return_value.json.return_value = {"id": "x", "choices": []}
+        mock_post.return_value.raise_for_status = MagicMock()
+        client.chat_completion([{"role": "user", "content": "a"}])
+        client.chat_completion([{"role": "user", "content": "b"}])
+    
+    assert mock_post.call_count == 2
+    assert all(c.kwargs["stream"] is True for c in mock_post.call_args_list)
+
+
+def test_keep_alive_reuses_connection_and_records_timing():
+    """Second call reuses the pooled connection, so it records no connect time."""
+    body = json.dumps({
+        "id": "local",
+        "model": "gpt-4o-mini",
+        "choices": [{"index": 0, "message": {"role": "assistant", "content": "ok"}}],
+    }).encode()
+    
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        
+        def do_POST(self):
+            self.rfile.read(int(self.headers["Content-Length"]))
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        
+        def log_message(self, *args):
+            pass
+    
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        client = GitHubModelsClient(
+            api_key="test",
+            api_url=f"http://127.0.0.1:{server.server_address[1]}",
+            organization="",
+        )
+        for _ in range(3):
+            response = client.chat_completion([{"role": "user", "content": "hi"}])
+            assert response.choices[0].message.content == "ok"
+        client.close()
+    finally:
+        server.shutdown()
+        server.server_close()
+    
+    summary = client.metrics.summary()
+    assert summary["requests"] == 3
+    assert summary["new_connections"] == 1
+    first, second, _ = client.metrics.recent
+    assert first.connect > 0
+    assert second.connect == 0
+    assert all(t.ttfb >= 0 and t.transfer >= 0 for t in client.metrics.recent)
+
+
+def test_stream_chat_completion_yields_deltas():
+    """Streamed completions yield content deltas and assemble a response."""
+    chunks = [
+        {"id": "chatcmpl-stream", "model": "gpt-4o-mini",
+         "choices": [{"index": 0, "delta": {"role": "assistant"}, "finish_reason": None}]},
+        _content_chunk('{"a": '),
+        _content_chunk("1}", finish_reason="stop"),
+        {"id": "chatcmpl-stream", "choices": [],
+         "usage": {"prompt_tokens": 5, "completion_tokens": 3, "total_tokens": 8}},
+    ]
+    
+    with patch("requests.Session.post") as mock_post:
+        mock_post.return_value = _sse_response(chunks)
+        client = GitHubModelsClient(api_key="test")
+        
+        with client.stream_chat_completion([{"role": "user", "content": "hi"}]) as stream:
+            deltas = list(stream)
+            response = stream.response()
+    
+    payload = mock_post.call_args.kwargs["json"]
+    assert payload["stream"] is True
+    assert deltas == [
+        ChatCompletionDelta(index=0, content='{"a": '),
+        ChatCompletionDelta(index=0, content="1}", finish_reason="stop"),
+    ]
+    assert response.id == "chatcmpl-stream"
+    assert response.choices[0].message.content == '{"a": 1}'
+    assert response.choices[0].finish_reason == "stop"
+    assert response.usage.total_tokens == 8
+    assert client.metrics.requests == 1
+
+
+def test_stream_stops_at_length_budget():
+    """Reading stops once max_chars of content has arrived."""
+    chunks = [_content_chunk("abcd"), _content_chunk("efgh"), _content_chunk("ijkl")]
+    
+    with patch("requests.Session.post") as mock_post:
+        mock_response = _sse_response(chunks)
+        mock_post.return_value = mock_response
+        client = GitHubModelsClient(api_key="test")
+        
+        stream = client.stream_chat_completion([{"role": "user", "content": "hi"}], max_chars=6)
+        response = stream.response()
+    
+    assert stream.truncated
+    assert stream.text == "abcdefgh"
+    assert response.choices[0].finish_reason == ChatCompletionStream.LENGTH_BUDGET_FINISH_REASON
+    mock_response.close.assert_called_once()
+
+
+def test_stream_assembles_tool_call_fragments():
+    """Tool call name and arguments streamed in pieces are concatenated."""
+    def tool_chunk(fragment: dict) -> dict:
+        return {"id": "s", "model": "m",
+                "choices": [{"index": 0, "delta": {"tool_calls": [fragment]}, "finish_reason": None}]}
+    
+    chunks = [
+        tool_chunk({"index": 0, "id": "call_1", "type": "function",
+                    "function": {"name": "get_issue", "arguments": ""}}),
+        tool_chunk({"index": 0, "function": {"arguments": '{"issue_'}}),
+        tool_chunk({"index": 0, "function": {"arguments": 'number": 7}'}}),
+    ]
+    
+    with patch("requests.Session.post") as mock_post:
+        mock_post.return_value = _sse_response(chunks)
+        client = GitHubModelsClient(api_key="test")
+        response = client.stream_chat_completion([{"role": "user", "content": "hi"}]).response()
+    
+    tool_call = response.choices[0].message.tool_calls[0]
+    assert tool_call.id == "call_1"
+    assert tool_call.function.name == "get_issue"
+    assert json.loads(tool_call.function.arguments) == {"issue_number": 7}
+
+
+def test_stream_retries_rate_limit_before_first_byte():
+    """A 429 on the streaming request is retried like a regular completion."""
+    import requests
+    
+    rate_limit_response = MagicMock()
+    rate_limit_response.status_code = 429
+    rate_limit_response.headers = {"Retry-After": "1"}
+    rate_limit_response.raise_for_status.side_effect = requests.HTTPError(
+        "429 Too Many Requests", response=rate_limit_response
+    )
+    
+    with patch("requests.Session.post") as mock_post, patch("time.sleep") as mock_sleep:
+        mock_post.side_effect = [rate_limit_response, _sse_response([_content_chunk("ok", "stop")])]
+        client = GitHubModelsClient(api_key="test")
+        response = client.stream_chat_completion([{"role": "user", "content": "hi"}]).response()
+    
+    assert response.choices[0].message.content == "ok"
+    mock_sleep.assert_called_once_with(1.0)
+
+
+def test_response_format_sent_for_supported_model():
+    """Structured-output constraints are passed through for capable models."""
+    response_format = {"type": "json_schema", "json_schema": {"name": "x", "schema": {}}}
+    with patch("requests.Session.post") as mock_post:
+        mock_post.return_value.json.return_value = {"id": "r", "model": "gpt-4o", "choices": []}
+        client = GitHubModelsClient(api_key="test", model="gpt-4o")
+
+        client.chat_completion([{"role": "user", "content": "test"}], response_format=response_format)
+
+        assert mock_post.call_args.kwargs["json"]["response_format"] == response_format
+
+
+def test_response_format_dropped_for_unsupported_model():
+    """Models without structured output never receive response_format."""
+    with patch("requests.Session.post") as mock_post:
+        mock_post.return_value.json.return_value = {"id": "r", "model": "m", "choices": []}
+        client = GitHubModelsClient(api_key="test", model="meta/llama-3-8b")
+
+        assert not client.supports_response_format()
+        client.chat_completion([{"role": "user", "content": "test"}], response_format={"type": "json_schema"})
+
+        assert "response_format" not in mock_post.call_args.kwargs["json"]
+
+
+def test_rejected_response_format_falls_back_and_is_remembered():
+    """A 400 about response_format retries once without it and sticks."""
+    import requests
+
+    rejected = MagicMock()
+    rejected.status_code = 400
+    rejected.json.return_value = {"error": "response_format json_schema is not supported"}
+    rejected.raise_for_status.side_effect = requests.HTTPError("400", response=rejected)
+    accepted = MagicMock()
+    accepted.json.return_value = {"id": "r", "model": "gpt-4o", "choices": []}
+
+    with patch("requests.Session.post") as mock_post:
+        mock_post.side_effect = [rejected, accepted, accepted]
+        client = GitHubModelsClient(api_key="test", model="gpt-4o")
+        messages = [{"role": "user", "content": "test"}]
+
+        client.chat_completion(messages, response_format={"type": "json_schema"})
+        client.chat_completion(messages, response_format={"type": "json_schema"})
+
+        sent = [c.kwargs["json"] for c in mock_post.call_args_list]
+        assert "response_format" in sent[0]
+        assert "response_format" not in sent[1]
+        assert "response_format" not in sent[2]
+        assert not client.supports_response_format()
+
+
+class _ScriptedModelsServer:
+    """Local HTTP server replying to POSTs with queued (status, JSON body) pairs."""
+
+    def __init__(self, replies):
+        self.replies = list(replies)
+        self.payloads = []
+        owner = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_POST(self):
+                owner.payloads.append(json.loads(self.rfile.read(int(self.headers["Content-Length"]))))
+                status, reply = owner.replies.pop(0)
+                body = json.dumps(reply).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        self.url = f"http://127.0.0.1:{self._server.server_address[1]}"
+
+    def close(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+def test_api_error_detail_is_read_from_the_response_body():
+    """Error details come from the real (streamed) body, not just the status line."""
+    server = _ScriptedModelsServer([
+        (400, {"error": {"code": "invalid_request", "message": "max_tokens is too large"}}),
+    ])
+    try:
+        client = GitHubModelsClient(api_key="test", api_url=server.url, organization="")
+        with pytest.raises(GitHubModelsError, match="max_tokens is too large"):
+            client.chat_completion([{"role": "user", "content": "hi"}])
+        client.close()
+    finally:
+        server.close()
+
+
+def test_response_format_rejection_in_real_body_triggers_fallback():
+    """A live 400 naming response_format retries without it."""
+    server = _ScriptedModelsServer([
+        (400, {"error": {"code": "unsupported", "message": "response_format json_schema is not supported"}}),
+        (200, {"id": "r", "model": "gpt-4o", "choices": []}),
+    ])
+    try:
+        client = GitHubModelsClient(api_key="test", api_url=server.url, organization="", model="gpt-4o")
+        client.chat_completion([{"role": "user", "content": "test"}], response_format={"type": "json_schema"})
+        client.close()
+    finally:
+        server.close()
+
+    assert "response_format" in server.payloads[0]
+    assert "response_format" not in server.payloads[1]
+    assert not client.supports_response_format()
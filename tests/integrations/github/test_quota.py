@@ -0,0 +1,180 @@
+"""Tests for the cross-process LLM quota broker."""
+
+import multiprocessing
+import threading
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+import requests
+
+from src.integrations.github.models import GitHubModelsClient
+from src.integrations.github.quota import (
+    ModelBudget,
+    QuotaBroker,
+    QuotaError,
+    load_budgets,
+)
+
+
+def _broker(tmp_path, process_id="p1", **budgets):
+    return QuotaBroker(
+        tmp_path / "quota.db",
+        budgets={name: ModelBudget(*values) for name, values in budgets.items()},
+        poll_interval=0.01,
+        process_id=process_id,
+    )
+
+
+def _acquire_in_process(db_path, count, results):
+    broker = QuotaBroker(db_path, budgets={"m": ModelBudget(rpm=5, tpm=10000)}, poll_interval=0.01)
+    granted = 0
+    for _ in range(count):
+        try:
+            broker.acquire("m", 10, timeout=0.5)
+            granted += 1
+        except QuotaError:
+            pass
+    results.put(granted)
+
+
+class TestQuotaBroker:
+    def test_grants_until_rpm_exhausted(self, tmp_path):
+        broker = _broker(tmp_path, m=(2, 10000))
+
+        broker.acquire("m", 10)
+        broker.acquire("m", 10)
+
+        with pytest.raises(QuotaError):
+            broker.acquire("m", 10, timeout=0.05)
+
+    def test_tokens_budget_and_settle(self, tmp_path):
+        broker = _broker(tmp_path, m=(100, 1000))
+
+        grant = broker.acquire("m", 900)
+        with pytest.raises(QuotaError):
+            broker.acquire("m", 200, timeout=0.05)
+
+        grant.settle(100)
+        broker.acquire("m", 200, timeout=0.05)
+        assert broker.status()[0].tokens == 300
+
+    def test_bulk_cannot_use_interactive_reserve(self, tmp_path):
+        broker = _broker(tmp_path, m=(5, 10000))
+
+        for _ in range(4):
+            broker.acquire("m", 10, priority="bulk")
+        with pytest.raises(QuotaError):
+            broker.acquire("m", 10, priority="bulk", timeout=0.05)
+
+        broker.acquire("m", 10, priority="interactive", timeout=0.05)
+
+    def test_interactive_waiter_goes_first(self, tmp_path):
+        broker = _broker(tmp_path, m=(1, 10000))
+        broker.acquire("m", 10)
+        order = []
+
+        def take(priority):
+            broker.acquire("m", 10, priority=priority, timeout=5)
+            order.append(priority)
+
+        # Free the window after both waiters are queued
+        with patch("src.integrations.github.quota.WINDOW_SECONDS", 0.3):
+            bulk = threading.Thread(target=take, args=("bulk",))
+            bulk.start()
+            time.sleep(0.05)
+            interactive = threading.Thread(target=take, args=("interactive",))
+            interactive.start()
+            interactive.join()
+            bulk.join()
+
+        assert order == ["interactive", "bulk"]
+
+    def test_rate_limit_cooldown_is_shared(self, tmp_path):
+        first = _broker(tmp_path, process_id="a", m=(100, 10000))
+        second = _broker(tmp_path, process_id="b", m=(100, 10000))
+
+        first.report_rate_limited("m", 30)
+
+        with pytest.raises(QuotaError):
+            second.acquire("m", 10, timeout=0.05)
+        assert second.status()[0].cooldown_seconds > 25
+
+    def test_status_reports_usage(self, tmp_path):
+        broker = _broker(tmp_path, m=(10, 10000))
+        broker.acquire("m", 50)
+
+        (snapshot,) = broker.status()
+
+        assert snapshot.to_dict()["rpm_used"] == 1
+        assert snapshot.to_dict()["tpm_used"] == 50
+        assert snapshot.processes == 1
+        assert snapshot.waiting == {"interactive": 0, "normal": 0, "bulk": 0}
+
+    def test_budget_is_shared_across_processes(self, tmp_path):
+        db_path = tmp_path / "quota.db"
+        QuotaBroker(db_path)
+        results = multiprocessing.Queue()
+        workers = [
+            multiprocessing.Process(target=_acquire_in_process, args=(db_path, 4, results))
+            for _ in range(3)
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join(timeout=30)
+
+        assert sum(results.get(timeout=5) for _ in workers) == 5
+
+    def test_load_budgets(self, tmp_path):
+        config = tmp_path / "llm_quota.yaml"
+        config.write_text("models:\n  gpt-4o:\n    rpm: 3\n    tpm: 900\n")
+
+        assert load_budgets(config) == {"gpt-4o": ModelBudget(rpm=3, tpm=900)}
+        assert load_budgets(tmp_path / "missing.yaml") == {}
+
+
+class TestClientIntegration:
+    def test_client_acquires_and_settles(self, tmp_path):
+        broker = _broker(tmp_path, **{"gpt-4o": (10, 100000)})
+        client = GitHubModelsClient(api_key="token", quota_broker=broker, priority="bulk")
+        response = Mock()
+        response.json.return_value = {
+            "id": "r",
+            "model": "gpt-4o",
+            "choices": [{"index": 0, "message": {"role": "assistant", "content": "ok"}}],
+            "usage": {"prompt_tokens": 5, "completion_tokens": 2, "total_tokens": 7},
+        }
+
+        with patch.object(client.session, "post", return_value=response):
+            client.chat_completion([{"role": "user", "content": "hi"}])
+
+        assert broker.status()[0].tokens == 7
+
+    def test_429_sets_shared_cooldown(self, tmp_path):
+        broker = _broker(tmp_path, **{"gpt-4o": (10, 100000)})
+        client = GitHubModelsClient(
+            api_key="token", quota_broker=broker, max_retries=0
+        )
+        rate_limited = Mock(status_code=429, headers={"Retry-After": "20"}, text="")
+        error = requests.HTTPError(response=rate_limited)
+        response = Mock()
+        response.raise_for_status.side_effect = error
+
+        with patch.object(client.session, "post", return_value=response):
+            with pytest.raises(Exception):
+                client.chat_completion([{"role": "user", "content": "hi"}])
+
+        assert broker.status()[0].cooldown_seconds > 15
+
+    def test_broker_from_environment(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("LLM_QUOTA_DB", str(tmp_path / "env.db"))
+
+        client = GitHubModelsClient(api_key="token")
+
+        assert client.quota_broker is not None
+        assert client.quota_broker.db_path == tmp_path / "env.db"
+
+    def test_no_broker_by_default(self, monkeypatch):
+        monkeypatch.delenv("LLM_QUOTA_DB", raising=False)
+        assert GitHubModelsClient(api_key="token").quota_broker is None
@@ -53,7 +53,7 @@ def test_search_assigned_defaults_to_unassigned(monkeypatch: pytest.MonkeyPatch)
         captured_urls.append(req.full_url)  # type: ignore[attr-defined]
         return DummyResponse(make_payload())
 
-    monkeypatch.setattr(search_issues.request, "urlopen", fake_urlopen)
+    monkeypatch.setattr(search_issues.github_transport, "urlopen", fake_urlopen)
 
     searcher = GitHubIssueSearcher(token="token", repository="octocat/hello-world")
     results = searcher.search_assigned()
@@ -72,7 +72,7 @@ def test_search_assigned_with_user(monkeypatch: pytest.MonkeyPatch) -> None:
         captured_urls.append(req.full_url)  # type: ignore[attr-defined]
         return DummyResponse(make_payload())
 
-    monkeypatch.setattr(search_issues.request, "urlopen", fake_urlopen)
+    monkeypatch.setattr(search_issues.github_transport, "urlopen", fake_urlopen)
 
     searcher = GitHubIssueSearcher(token="token", repository="octocat/hello-world")
     searcher.search_assigned("octocat", limit=10)
@@ -96,7 +96,7 @@ def test_search_by_label(monkeypatch: pytest.MonkeyPatch) -> None:
         captured_urls.append(req.full_url)  # type: ignore[attr-defined]
         return DummyResponse(make_payload(2))
 
-    monkeypatch.setattr(search_issues.request, "urlopen", fake_urlopen)
+    monkeypatch.setattr(search_issues.github_transport, "urlopen", fake_urlopen)
 
     searcher = GitHubIssueSearcher(token="token", repository="octocat/hello-world")
     results = searcher.search_by_label("bug", limit=200)
@@ -115,7 +115,7 @@ def test_search_unlabeled(monkeypatch: pytest.MonkeyPatch) -> None:
         captured_urls.append(req.full_url)  # type: ignore[attr-defined]
         return DummyResponse(make_payload(3))
 
-    monkeypatch.setattr(search_issues.request, "urlopen", fake_urlopen)
+    monkeypatch.setattr(search_issues.github_transport, "urlopen", fake_urlopen)
 
     searcher = GitHubIssueSearcher(token="token", repository="octocat/hello-world")
     results = searcher.search_unlabeled(limit=5, order="asc")
@@ -139,7 +139,7 @@ def test_search_http_error(monkeypatch: pytest.MonkeyPatch) -> None:
             fp=io.BytesIO(b"failure"),
         )
 
-    monkeypatch.setattr(search_issues.request, "urlopen", fake_urlopen)
+    monkeypatch.setattr(search_issues.github_transport, "urlopen", fake_urlopen)
 
     searcher = GitHubIssueSearcher(token="token", repository="octocat/hello-world")
 
@@ -161,7 +161,7 @@ def test_search_by_body_content(monkeypatch: pytest.MonkeyPatch) -> None:
         captured_urls.append(req.full_url)  # type: ignore[attr-defined]
         return DummyResponse(make_payload(1))
 
-    monkeypatch.setattr(search_issues.request, "urlopen", fake_urlopen)
+    monkeypatch.setattr(search_issues.github_transport, "urlopen", fake_urlopen)
 
     searcher = GitHubIssueSearcher(token="token", repository="octocat/hello-world")
     results = searcher.search_by_body_content("monitor-initial:abc123", limit=5)
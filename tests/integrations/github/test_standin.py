@@ -0,0 +1,218 @@
+"""Tests for the offline GitHub stand-in server and benchmarks."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from pathlib import Path
+from typing import Iterator
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.cli.commands.github import register_benchmark_command
+from src.integrations.github import discussions, files, transport
+from src.integrations.github.benchmark import BENCHMARKS, run_benchmarks
+from src.integrations.github.issue_index import IssueIndex
+from src.integrations.github.issues import GitHubIssueError, create_issue
+from src.integrations.github.search_issues import GitHubIssueSearcher
+from src.integrations.github.standin import FaultProfile, GitHubStandIn
+from src.integrations.github.sync import sync_from_upstream
+
+TOKEN = "t"
+
+
+@pytest.fixture(autouse=True)
+def fresh_transport() -> Iterator[None]:
+    transport.set_transport(transport.GitHubTransport())
+    yield
+    transport.get_transport().close()
+    transport.set_transport(None)
+
+
+@pytest.fixture
+def github() -> Iterator[GitHubStandIn]:
+    with GitHubStandIn() as server:
+        yield server
+
+
+def test_commit_files_batch_lands_one_commit(github: GitHubStandIn) -> None:
+    files.commit_files_batch(
+        token=TOKEN,
+        repository=github.repository,
+        files=[("kg/a.json", "{}"), ("/kg/b.json", b"[]")],
+        message="Add entities",
+        branch="main",
+        api_url=github.api_url,
+    )
+
+    content, _ = files.get_file_content(
+        token=TOKEN, repository=github.repository, path="kg/b.json", api_url=github.api_url
+    )
+    stats = github.stats()
+    assert content == "[]"
+    assert stats["commits"] == 1
+    assert stats["endpoints"]["POST /repos/{owner}/{repo}/git/trees"] == 1
+    assert set(github.state.git.tree_for("main")) == {"README.md", "kg/a.json", "kg/b.json"}
+
+
+def test_contents_api_requires_current_sha(github: GitHubStandIn) -> None:
+    for content in ("one", "two"):
+        files.commit_file(
+            token=TOKEN, repository=github.repository, path="a.txt", content=content,
+            message="m", branch="main", api_url=github.api_url,
+        )
+    assert files.get_file_content(
+        token=TOKEN, repository=github.repository, path="a.txt", api_url=github.api_url
+    )[0] == "two"
+    assert github.stats()["commits"] == 2
+
+
+def test_unchanged_get_is_not_modified(github: GitHubStandIn) -> None:
+    for _ in range(2):
+        files.get_file_content(
+            token=TOKEN, repository=github.repository, path="README.md", api_url=github.api_url
+        )
+    stats = transport.get_transport().stats()["GET /repos/{owner}/{repo}/contents/{id}"]
+    assert stats["not_modified"] == 1
+
+
+def test_discussions_round_trip_with_batched_mutations(github: GitHubStandIn) -> None:
+    options = {"token": TOKEN, "api_url": github.api_url}
+    repository_id = discussions.get_repository_id(repository=github.repository, **options)
+    category = discussions.get_category_by_name(
+        repository=github.repository, category_name="People", **options
+    )
+    assert category is not None
+
+    with discussions.MutationBatcher(min_interval=0, **options) as batcher:
+        created = [
+            batcher.create_discussion(
+                repository_id=repository_id, category_id=category.id, title=f"P{n}", body="b"
+            )
+            for n in range(3)
+        ]
+        missing = batcher.update_discussion(discussion_id="D_missing", body="x")
+
+    assert all(mutation.ok for mutation in created)
+    assert "D_missing" in (missing.error or "")
+    assert github.stats()["endpoints"]["POST /graphql"] == 3  # id, category, one batch
+
+    index = discussions.DiscussionIndex(
+        repository=github.repository, category_id=category.id, **options
+    )
+    index.refresh()
+    assert index.get("p1") is not None
+
+
+def test_issue_search_and_index(github: GitHubStandIn, tmp_path: Path) -> None:
+    create_issue(
+        token=TOKEN, repository=github.repository, title="Extract: doc",
+        body="<!-- checksum:abc -->", labels=["extraction-queue"], api_url=github.api_url,
+    )
+    create_issue(token=TOKEN, repository=github.repository, title="Other", body="", api_url=github.api_url)
+
+    searcher = GitHubIssueSearcher(token=TOKEN, repository=github.repository, api_url=github.api_url)
+    assert [issue.title for issue in searcher.search_by_label("extraction-queue")] == ["Extract: doc"]
+
+    index = IssueIndex(
+        repository=github.repository, token=TOKEN, db_path=tmp_path / "i.db", api_url=github.api_url
+    )
+    assert index.sync() == 2
+    assert index.by_checksum("abc").number == 1  # type: ignore[union-attr]
+
+
+def test_sync_from_upstream(github: GitHubStandIn) -> None:
+    upstream = github.add_repository("template/upstream")
+    upstream.seed_files({"src/app.py": "print('new')\n", "main.py": "main"})
+    github.state.seed_files({"src/app.py": "print('old')\n"})
+
+    result = sync_from_upstream(
+        github.repository, upstream.repository, TOKEN,
+        api_url=github.api_url, force_sync=True, verbose=False,
+    )
+
+    assert result.error is None
+    assert result.pr_number is not None
+    synced = github.state.git.tree_for(result.branch_name or "")
+    assert synced["src/app.py"] == upstream.git.tree_for("main")["src/app.py"]
+    assert github.stats()["commits"] == 1
+
+
+def test_primary_rate_limit(github: GitHubStandIn) -> None:
+    github.faults = FaultProfile(rate_limit=1)
+    pauses: list[float] = []
+    transport.set_transport(transport.GitHubTransport(sleep=pauses.append))
+    searcher = GitHubIssueSearcher(token=TOKEN, repository=github.repository, api_url=github.api_url)
+    searcher.search_by_label("x")
+    with pytest.raises(GitHubIssueError, match="403"):
+        searcher.search_by_label("x")
+    assert pauses  # The transport saw the exhausted quota and paced itself
+    assert github.stats()["rate_limited"] == 1
+
+
+def test_secondary_limit_is_retried_by_batcher(github: GitHubStandIn) -> None:
+    options = {"token": TOKEN, "api_url": github.api_url}
+    repository_id = discussions.get_repository_id(repository=github.repository, **options)
+    category = discussions.get_category_by_name(
+        repository=github.repository, category_name="People", **options
+    )
+    github.faults = FaultProfile(secondary_limit_every=1, secondary_retry_after=7)
+    sleep = MagicMock(side_effect=lambda _: setattr(github, "faults", FaultProfile()))
+
+    batcher = discussions.MutationBatcher(min_interval=0, sleep=sleep, **options)
+    mutation = batcher.create_discussion(
+        repository_id=repository_id, category_id=category.id, title="T", body="b"  # type: ignore[union-attr]
+    )
+    batcher.flush()
+
+    sleep.assert_called_once_with(7.0)
+    assert mutation.ok
+    assert github.stats()["rate_limited"] == 1
+
+
+def test_latency_is_injected(github: GitHubStandIn) -> None:
+    github.faults = FaultProfile(latency=0.05)
+    started = time.perf_counter()
+    files.get_file_content(token=TOKEN, repository=github.repository, path="README.md", api_url=github.api_url)
+    assert time.perf_counter() - started >= 0.05
+
+
+def test_benchmarks_report_calls_and_commits() -> None:
+    results = run_benchmarks(scale=2)
+
+    assert [result.operation for result in results] == list(BENCHMARKS)
+    by_operation = {result.operation: result for result in results}
+    assert by_operation["extraction"].commits == 2  # One batch() per document
+    assert by_operation["synthesis-batch"].commits == 1
+    assert all(result.api_calls > 0 for result in results)
+
+
+def test_benchmark_rate_limit_is_skipped_not_slept() -> None:
+    faults = FaultProfile(rate_limit=3, rate_limit_window=3600)
+    started = time.perf_counter()
+    results = run_benchmarks(["extraction", "synthesis-batch"], scale=3, faults=faults)
+
+    assert time.perf_counter() - started < 30
+    extraction, synthesis = results
+    assert extraction.commits == 3
+    assert extraction.rate_limited == 0  # The transport waited out each window instead
+    # 15 requests at 3 per window: four full windows skipped
+    assert extraction.throttle_wait == pytest.approx(4 * 3600, abs=5)
+    assert synthesis.throttle_wait > 0
+    assert extraction.to_dict()["throttle_wait"] == round(extraction.throttle_wait, 4)
+
+
+def test_benchmark_cli_accepts_a_rate_limit_window(capsys: pytest.CaptureFixture[str]) -> None:
+    parser = argparse.ArgumentParser()
+    register_benchmark_command(parser.add_subparsers())
+    args = parser.parse_args(
+        ["github-benchmark", "--operation", "synthesis-batch", "--scale", "4",
+         "--rate-limit", "2", "--rate-limit-window", "60", "--output", "json"]
+    )
+
+    assert args.func(args) == 0
+    (result,) = json.loads(capsys.readouterr().out)
+    assert result["rate_limited"] == 0
+    assert result["throttle_wait"] == pytest.approx(120, abs=5)  # 5 requests, 2 per minute
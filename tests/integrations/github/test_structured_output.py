@@ -0,0 +1,211 @@
+"""Tests for schema-validated structured output parsing."""
+
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.integrations.github.models import (
+    ChatCompletionResponse,
+    ChatMessage,
+    Choice,
+    GitHubModelsClient,
+    RateLimitError,
+)
+from src.integrations.github.structured_output import (
+    ResponseSchema,
+    StructuredOutputMetrics,
+    complete_structured,
+    parse_json_array,
+)
+from src.knowledge.extraction import ASSOCIATION_SCHEMA, PROFILE_SCHEMA, AssociationExtractor
+
+
+ASSOCIATION = {
+    "source": "Alice Smith",
+    "target": "Acme Corp",
+    "source_type": "Person",
+    "target_type": "Organization",
+    "relationship": "CEO of",
+    "evidence": "Alice Smith is the CEO of Acme Corp.",
+    "confidence": 0.9,
+}
+
+
+def _response(content: str) -> ChatCompletionResponse:
+    return ChatCompletionResponse(
+        id="resp",
+        model="gpt-4o",
+        choices=(Choice(index=0, message=ChatMessage(role="assistant", content=content)),),
+    )
+
+
+@pytest.fixture
+def client():
+    client = MagicMock(spec=GitHubModelsClient)
+    client.supports_response_format.return_value = True
+    return client
+
+
+class TestParseJsonArray:
+    def test_fast_path_for_wrapped_array(self):
+        parsed = parse_json_array(json.dumps({"items": ["a", "b"]}))
+        assert [item.value for item in parsed.items] == ["a", "b"]
+        assert not parsed.repaired
+
+    def test_code_fence_and_prose(self):
+        parsed = parse_json_array('Here you go:\n```json\n["a", "b"]\n```')
+        assert [item.value for item in parsed.items] == ["a", "b"]
+
+    def test_trailing_commas(self):
+        parsed = parse_json_array('[{"a": 1,}, {"b": [1, 2,],},]')
+        assert [item.value for item in parsed.items] == [{"a": 1}, {"b": [1, 2]}]
+        assert parsed.repaired
+
+    def test_truncated_output_keeps_complete_items(self):
+        parsed = parse_json_array('{"items": [{"name": "A, B"}, {"name": "C"}, {"name": "D')
+        assert parsed.truncated
+        assert [item.value for item in parsed.items[:2]] == [{"name": "A, B"}, {"name": "C"}]
+        assert parsed.items[2].error == "truncated"
+
+    def test_brackets_inside_strings(self):
+        parsed = parse_json_array('garbage [ "x ] y", "z \\" ]" ] trailing')
+        assert [item.value for item in parsed.items] == ["x ] y", 'z " ]']
+
+    def test_malformed_item_is_isolated(self):
+        parsed = parse_json_array('[{"a": 1}, {a: 2}, {"c": 3}]')
+        assert [item.parsed for item in parsed.items] == [True, False, True]
+
+    def test_no_array(self):
+        assert not parse_json_array("Not JSON").found
+
+
+class TestSchemas:
+    def test_association_schema(self):
+        assert ASSOCIATION_SCHEMA.errors(ASSOCIATION) == []
+        invalid = dict(ASSOCIATION, source_type="Team")
+        del invalid["evidence"]
+        errors = ASSOCIATION_SCHEMA.errors(invalid)
+        assert len(errors) == 2
+        assert any("source_type" in error for error in errors)
+
+    def test_profile_schema(self):
+        profile = {"name": "Alice", "entity_type": "Person", "summary": "CEO", "attributes": {"age": 50}}
+        assert PROFILE_SCHEMA.errors(profile) == []
+        assert PROFILE_SCHEMA.errors({"name": "Alice", "entity_type": "Person"})
+
+    def test_response_format_wraps_array(self):
+        response_format = ASSOCIATION_SCHEMA.response_format()
+        schema = response_format["json_schema"]["schema"]
+        assert response_format["type"] == "json_schema"
+        assert response_format["json_schema"]["strict"] is True
+        assert schema["properties"]["items"]["items"]["required"]
+
+
+class TestCompleteStructured:
+    def test_valid_response_needs_no_reask(self, client):
+        client.chat_completion.return_value = _response(json.dumps({"items": [ASSOCIATION]}))
+        metrics = StructuredOutputMetrics()
+
+        result = complete_structured(
+            client, [], ASSOCIATION_SCHEMA, temperature=0.1, max_tokens=100, metrics=metrics
+        )
+
+        assert result.items == [ASSOCIATION]
+        assert client.chat_completion.call_count == 1
+        assert client.chat_completion.call_args.kwargs["response_format"]["type"] == "json_schema"
+        assert metrics["constrained"] == 1
+        assert metrics["reasks"] == 0
+
+    def test_reasks_only_for_invalid_items(self, client):
+        invalid = dict(ASSOCIATION, source="Bob", confidence="high")
+        fixed = dict(ASSOCIATION, source="Bob", confidence=0.7)
+        client.chat_completion.side_effect = [
+            _response(json.dumps([ASSOCIATION, invalid])),
+            _response(json.dumps([fixed])),
+        ]
+        metrics = StructuredOutputMetrics()
+
+        result = complete_structured(
+            client, [{"role": "user", "content": "text"}], ASSOCIATION_SCHEMA,
+            temperature=0.1, max_tokens=100, metrics=metrics,
+        )
+
+        assert result.items == [ASSOCIATION, fixed]
+        reask = client.chat_completion.call_args.kwargs["messages"][-1]["content"]
+        assert '"Bob"' in reask and "confidence" in reask
+        assert reask.count("{") == 1
+        assert metrics.summary()["invalid_items"] == 1
+        assert metrics["reasks"] == 1
+        assert metrics["recovered_items"] == 1
+        assert metrics["dropped_items"] == 0
+
+    def test_truncation_asks_for_remaining_items(self, client):
+        client.chat_completion.side_effect = [
+            _response('["Alice", "Bob", "Car'),
+            _response('["Carol", "Dave"]'),
+        ]
+
+        result = complete_structured(
+            client, [], ResponseSchema("names", {"type": "string"}), temperature=0.1, max_tokens=10
+        )
+
+        assert result.items == ["Alice", "Bob", "Carol", "Dave"]
+        assert "cut off after 2" in client.chat_completion.call_args.kwargs["messages"][-1]["content"]
+
+    def test_items_still_invalid_are_dropped(self, client):
+        invalid = dict(ASSOCIATION, target_type="Team")
+        client.chat_completion.return_value = _response(json.dumps([invalid]))
+        metrics = StructuredOutputMetrics()
+
+        result = complete_structured(
+            client, [], ASSOCIATION_SCHEMA, temperature=0.1, max_tokens=100, metrics=metrics
+        )
+
+        assert result.items == []
+        assert len(result.rejected) == 1
+        assert client.chat_completion.call_count == 2
+        assert metrics["dropped_items"] == 1
+
+    def test_unparseable_response_is_not_reasked(self, client):
+        client.chat_completion.return_value = _response("I could not find any.")
+        metrics = StructuredOutputMetrics()
+
+        result = complete_structured(
+            client, [], ASSOCIATION_SCHEMA, temperature=0.1, max_tokens=100, metrics=metrics
+        )
+
+        assert not result.found
+        assert client.chat_completion.call_count == 1
+        assert metrics["parse_failures"] == 1
+
+    def test_rate_limit_on_reask_propagates(self, client):
+        client.chat_completion.side_effect = [
+            _response(json.dumps([dict(ASSOCIATION, confidence="x")])),
+            RateLimitError("429"),
+        ]
+
+        with pytest.raises(RateLimitError):
+            complete_structured(client, [], ASSOCIATION_SCHEMA, temperature=0.1, max_tokens=100)
+
+    def test_unsupported_model_gets_no_response_format(self, client):
+        client.supports_response_format.return_value = False
+        client.chat_completion.return_value = _response("[]")
+
+        complete_structured(client, [], ASSOCIATION_SCHEMA, temperature=0.1, max_tokens=100)
+
+        assert "response_format" not in client.chat_completion.call_args.kwargs
+
+
+def test_association_extractor_recovers_invalid_item(client):
+    invalid = dict(ASSOCIATION, source="Bob", source_type="person")
+    client.chat_completion.side_effect = [
+        _response(json.dumps([ASSOCIATION, invalid])),
+        _response(json.dumps([dict(invalid, source_type="Person")])),
+    ]
+    extractor = AssociationExtractor(client)
+
+    associations = extractor.extract_associations("Alice Smith is the CEO of Acme Corp.")
+
+    assert [association.source for association in associations] == ["Alice Smith", "Bob"]
+    assert extractor.metrics["recovered_items"] == 1
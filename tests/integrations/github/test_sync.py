@@ -18,6 +18,7 @@ from src.integrations.github.sync import (
     SyncStatus,
     SyncError,
     ValidationResult,
+    commit_files_tree,
     compare_files,
     configure_upstream_variable,
     discover_downstream_repos,
@@ -489,6 +490,79 @@ class TestGetRepositoryTree:
             assert mock_request.call_count == 3
 
 
+# =============================================================================
+# Commit Files Tree Tests
+# =============================================================================
+
+
+class TestCommitFilesTree:
+    """Tests for the single-commit Trees-API sync path."""
+
+    @staticmethod
+    def _fake_api(calls: list[tuple[str, str, Any]]):
+        def fake(endpoint, token=None, method="GET", data=None, timeout=30):
+            calls.append((method, endpoint, data))
+            if "/git/blobs/" in endpoint:
+                sha = endpoint.rsplit("/", 1)[1]
+                return {"content": f"Y29udGVudC0{sha}\n"}
+            if endpoint.endswith("/git/blobs"):
+                return {"sha": "new-" + data["content"][-4:]}
+            if "/git/ref/heads/" in endpoint:
+                return {"object": {"sha": "head"}}
+            if "/git/commits/" in endpoint:
+                return {"sha": "head", "tree": {"sha": "base-tree"}}
+            if endpoint.endswith("/git/trees"):
+                return {"sha": "new-tree"}
+            if endpoint.endswith("/git/commits"):
+                return {"sha": "new-commit-sha"}
+            if "/git/refs/heads/" in endpoint:
+                return {"object": {"sha": "new-commit-sha"}}
+            raise AssertionError(endpoint)
+        return fake
+
+    def test_single_commit_for_all_changes(self, mock_token):
+        calls: list[tuple[str, str, Any]] = []
+        changes = [
+            SyncChange(path="src/a.py", action="add", upstream_sha="up01"),
+            SyncChange(path="src/b.py", action="update", upstream_sha="up02", downstream_sha="old"),
+            SyncChange(path="src/c.py", action="delete", downstream_sha="gone"),
+        ]
+
+        with patch("src.integrations.github.sync._make_request", side_effect=self._fake_api(calls)):
+            sha = commit_files_tree(
+                "owner/down", "sync/upstream-1", changes, "owner/up", mock_token, verbose=False
+            )
+
+        assert sha == "new-commit-sha"
+        fetched = sorted(endpoint for method, endpoint, _ in calls if "/git/blobs/" in endpoint)
+        assert fetched == [
+            "https://api.github.com/repos/owner/up/git/blobs/up01",
+            "https://api.github.com/repos/owner/up/git/blobs/up02",
+        ]
+        uploads = [data for method, endpoint, data in calls if endpoint.endswith("/git/blobs")]
+        assert all("\n" not in data["content"] for data in uploads)
+        assert len(uploads) == 2
+
+        (tree_data,) = [data for _, endpoint, data in calls if endpoint.endswith("/git/trees")]
+        assert tree_data["base_tree"] == "base-tree"
+        entries = {entry["path"]: entry["sha"] for entry in tree_data["tree"]}
+        assert entries["src/c.py"] is None
+        assert entries["src/a.py"].startswith("new-")
+
+        commits = [data for method, endpoint, data in calls if endpoint.endswith("/git/commits")]
+        assert len(commits) == 1
+        assert commits[0]["parents"] == ["head"]
+        (ref_update,) = [data for method, endpoint, data in calls if method == "PATCH"]
+        assert ref_update == {"sha": "new-commit-sha"}
+        # No Contents API calls at all
+        assert not any("/contents/" in endpoint for _, endpoint, _ in calls)
+
+    def test_no_changes_makes_no_calls(self, mock_token):
+        with patch("src.integrations.github.sync._make_request") as mock_request:
+            assert commit_files_tree("o/d", "b", [], "o/u", mock_token, verbose=False) == ""
+            mock_request.assert_not_called()
+
+
 # =============================================================================
 # Constants Tests
 # =============================================================================
@@ -816,7 +890,7 @@ class TestNotifyDownstreamRepos:
     
     @patch('src.integrations.github.sync.verify_satellite_trust')
     @patch('src.integrations.github.sync.discover_downstream_repos')
-    @patch('src.integrations.github.sync.request.urlopen')
+    @patch('src.integrations.github.sync.github_transport.urlopen')
     @patch('builtins.print')
     def test_successful_notification(
         self, mock_print, mock_urlopen, mock_discover, mock_verify, mock_token
@@ -925,7 +999,7 @@ class TestNotifyDownstreamRepos:
     
     @patch('src.integrations.github.sync.verify_satellite_trust')
     @patch('src.integrations.github.sync.discover_downstream_repos')
-    @patch('src.integrations.github.sync.request.urlopen')
+    @patch('src.integrations.github.sync.github_transport.urlopen')
     @patch('builtins.print')
     def test_dispatch_api_error(
         self, mock_print, mock_urlopen, mock_discover, mock_verify, mock_token
@@ -985,7 +1059,7 @@ class TestNotifyDownstreamRepos:
     
     @patch('src.integrations.github.sync.verify_satellite_trust')
     @patch('src.integrations.github.sync.discover_downstream_repos')
-    @patch('src.integrations.github.sync.request.urlopen')
+    @patch('src.integrations.github.sync.github_transport.urlopen')
     @patch('builtins.print')
     def test_includes_release_tag(
         self, mock_print, mock_urlopen, mock_discover, mock_verify, mock_token
@@ -1092,7 +1166,7 @@ class TestVerifyDispatchSignature:
 class TestDiscoverDownstreamRepos:
     """Tests for topic-based repository discovery."""
     
-    @patch('src.integrations.github.sync.request.urlopen')
+    @patch('src.integrations.github.sync.github_transport.urlopen')
     def test_discovers_repos_with_topic(self, mock_urlopen, mock_token):
         """Should discover repos with specified topic in org."""
         from src.integrations.github.sync import discover_downstream_repos
@@ -1122,7 +1196,7 @@ class TestDiscoverDownstreamRepos:
         assert "topic:speculum-downstream" in call_args.full_url
         assert "org:test-org" in call_args.full_url
     
-    @patch('src.integrations.github.sync.request.urlopen')
+    @patch('src.integrations.github.sync.github_transport.urlopen')
     def test_custom_topic(self, mock_urlopen, mock_token):
         """Should search for custom topic."""
         from src.integrations.github.sync import discover_downstream_repos
@@ -1139,7 +1213,7 @@ class TestDiscoverDownstreamRepos:
         call_args = mock_urlopen.call_args[0][0]
         assert "topic:custom-topic" in call_args.full_url
     
-    @patch('src.integrations.github.sync.request.urlopen')
+    @patch('src.integrations.github.sync.github_transport.urlopen')
     def test_api_error(self, mock_urlopen, mock_token):
         """Should raise SyncError on API failure."""
         from src.integrations.github.sync import discover_downstream_repos, SyncError
@@ -1161,7 +1235,7 @@ class TestDiscoverDownstreamRepos:
 class TestVerifySatelliteTrust:
     """Tests for satellite repository trust verification."""
     
-    @patch('src.integrations.github.sync.request.urlopen')
+    @patch('src.integrations.github.sync.github_transport.urlopen')
     def test_trusted_repo(self, mock_urlopen, mock_token):
         """Should verify valid satellite repo."""
         from src.integrations.github.sync import verify_satellite_trust
@@ -1187,7 +1261,7 @@ class TestVerifySatelliteTrust:
         assert is_trusted is True
         assert "passed" in reason.lower()
     
-    @patch('src.integrations.github.sync.request.urlopen')
+    @patch('src.integrations.github.sync.github_transport.urlopen')
     def test_fork_rejected(self, mock_urlopen, mock_token):
         """Should reject repositories that are forks."""
         from src.integrations.github.sync import verify_satellite_trust
@@ -1210,7 +1284,7 @@ class TestVerifySatelliteTrust:
         assert is_trusted is False
         assert "fork" in reason.lower()
     
-    @patch('src.integrations.github.sync.request.urlopen')
+    @patch('src.integrations.github.sync.github_transport.urlopen')
     def test_template_mismatch_rejected(self, mock_urlopen, mock_token):
         """Should reject repos with wrong template."""
         from src.integrations.github.sync import verify_satellite_trust
@@ -1233,7 +1307,7 @@ class TestVerifySatelliteTrust:
         assert is_trusted is False
         assert "mismatch" in reason.lower()
     
-    @patch('src.integrations.github.sync.request.urlopen')
+    @patch('src.integrations.github.sync.github_transport.urlopen')
     def test_missing_topic_rejected(self, mock_urlopen, mock_token):
         """Should reject repos without required topic."""
         from src.integrations.github.sync import verify_satellite_trust
@@ -1256,7 +1330,7 @@ class TestVerifySatelliteTrust:
         assert is_trusted is False
         assert "topic" in reason.lower()
     
-    @patch('src.integrations.github.sync.request.urlopen')
+    @patch('src.integrations.github.sync.github_transport.urlopen')
     def test_no_template_rejected(self, mock_urlopen, mock_token):
         """Should reject repos not created from template."""
         from src.integrations.github.sync import verify_satellite_trust
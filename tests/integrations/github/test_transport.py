@@ -0,0 +1,231 @@
+"""Tests for the shared GitHub HTTP transport."""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Iterator
+from unittest.mock import MagicMock
+from urllib import error, request
+
+import pytest
+
+from src import metrics, tracing
+from src.integrations.github.transport import GitHubTransport, endpoint_template
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # Keep-alive
+    server: "_Server"
+
+    def do_GET(self) -> None:  # noqa: N802 - http.server API
+        self.server.requests.append((self.path, self.client_address[1], self.headers.get("If-None-Match")))
+        if self.path == "/missing":
+            self._reply(404, b'{"message": "Not Found"}')
+        elif self.headers.get("If-None-Match") == '"v1"':
+            self._reply(304, b"", {"ETag": '"v1"'})
+        else:
+            self._reply(200, json.dumps({"path": self.path}).encode(), {"ETag": '"v1"'})
+
+    def do_POST(self) -> None:  # noqa: N802 - http.server API
+        length = int(self.headers.get("Content-Length", 0))
+        body = self.rfile.read(length)
+        self.server.requests.append((self.path, self.client_address[1], None))
+        self._reply(200, body)
+
+    def _reply(self, status: int, body: bytes, headers: dict[str, str] | None = None) -> None:
+        self.send_response(status)
+        for name, value in {**self.server.extra_headers, **(headers or {})}.items():
+            self.send_header(name, value)
+        if status != 304:
+            self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if status != 304:
+            self.wfile.write(body)
+
+    def log_message(self, *args: Any) -> None:
+        pass
+
+
+class _Server(ThreadingHTTPServer):
+    requests: list[tuple[str, int, str | None]]
+    extra_headers: dict[str, str]
+
+
+@pytest.fixture
+def server() -> Iterator[_Server]:
+    srv = _Server(("127.0.0.1", 0), _Handler)
+    srv.requests = []
+    srv.extra_headers = {}
+    thread = threading.Thread(target=srv.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+    thread.start()
+    yield srv
+    srv.shutdown()
+    srv.server_close()
+
+
+def _url(server: _Server, path: str) -> str:
+    return f"http://127.0.0.1:{server.server_address[1]}{path}"
+
+
+def _get(transport: GitHubTransport, url: str, token: str = "t") -> Any:
+    req = request.Request(url)
+    req.add_header("Authorization", f"Bearer {token}")
+    with transport.urlopen(req, timeout=5) as response:
+        return json.loads(response.read())
+
+
+def test_connections_are_reused(server: _Server) -> None:
+    transport = GitHubTransport()
+    for path in ("/a", "/b"):
+        _get(transport, _url(server, path))
+    req = request.Request(_url(server, "/graphql"), data=b'{"q": 1}', method="POST")
+    with transport.urlopen(req, timeout=5) as response:
+        assert json.loads(response.read()) == {"q": 1}
+
+    assert len({port for _, port, _ in server.requests}) == 1
+
+
+def test_etag_revalidation_replays_cached_body(server: _Server) -> None:
+    transport = GitHubTransport()
+    first = _get(transport, _url(server, "/repos/o/r/issues/1"))
+    second = _get(transport, _url(server, "/repos/o/r/issues/1"))
+
+    assert first == second == {"path": "/repos/o/r/issues/1"}
+    assert [etag for _, _, etag in server.requests] == [None, '"v1"']
+    stats = transport.stats()["GET /repos/{owner}/{repo}/issues/{n}"]
+    assert stats["requests"] == 2
+    assert stats["not_modified"] == 1
+
+
+def test_cache_is_keyed_by_token(server: _Server) -> None:
+    transport = GitHubTransport()
+    _get(transport, _url(server, "/x"), token="a")
+    _get(transport, _url(server, "/x"), token="b")
+    assert [etag for _, _, etag in server.requests] == [None, None]
+
+
+def test_disk_cache_survives_new_transport(server: _Server, tmp_path: Any) -> None:
+    _get(GitHubTransport(cache_dir=tmp_path), _url(server, "/x"))
+    assert _get(GitHubTransport(cache_dir=tmp_path), _url(server, "/x")) == {"path": "/x"}
+    assert server.requests[-1][2] == '"v1"'
+
+
+def test_http_errors_keep_urllib_contract(server: _Server) -> None:
+    transport = GitHubTransport()
+    with pytest.raises(error.HTTPError) as exc_info:
+        _get(transport, _url(server, "/missing"))
+    assert exc_info.value.code == 404
+    assert b"Not Found" in exc_info.value.read()
+    # The connection is still usable after an error response
+    assert _get(transport, _url(server, "/ok")) == {"path": "/ok"}
+    assert transport.stats()["GET /missing"]["errors"] == 1
+
+
+def test_requests_are_traced_per_endpoint(server: _Server, tmp_path: Any) -> None:
+    trace_file = tmp_path / "trace.jsonl"
+    tracing.configure(trace_file)
+    try:
+        transport = GitHubTransport()
+        _get(transport, _url(server, "/repos/o/r/issues/1"))
+        with pytest.raises(error.HTTPError):
+            _get(transport, _url(server, "/missing"))
+    finally:
+        tracing.configure(None)
+
+    ok, missing = tracing.read_spans(trace_file)
+    assert ok["name"] == "github.GET /repos/{owner}/{repo}/issues/{n}"
+    assert ok["attributes"] == {"status": 200}
+    assert (missing["attributes"], missing["error"]) == ({"status": 404}, "HTTPError")
+
+
+def test_requests_are_counted_per_endpoint_and_status(server: _Server) -> None:
+    endpoint = "GET /repos/{owner}/{repo}/pulls/{n}"
+    ok_before = metrics.GITHUB_REQUESTS.value(endpoint=endpoint, status="200")
+    count_before = metrics.GITHUB_REQUEST_SECONDS.snapshot(endpoint=endpoint)["count"]
+
+    transport = GitHubTransport()
+    _get(transport, _url(server, "/repos/o/r/pulls/1"))
+
+    assert metrics.GITHUB_REQUESTS.value(endpoint=endpoint, status="200") == ok_before + 1
+    assert metrics.GITHUB_REQUEST_SECONDS.snapshot(endpoint=endpoint)["count"] == count_before + 1
+
+
+def test_low_rate_limit_throttles_next_request(server: _Server) -> None:
+    reset = int(time.time()) + 100
+    server.extra_headers = {
+        "X-RateLimit-Limit": "5000",
+        "X-RateLimit-Remaining": "4",
+        "X-RateLimit-Reset": str(reset),
+        "X-RateLimit-Resource": "core",
+    }
+    sleep = MagicMock()
+    transport = GitHubTransport(sleep=sleep, max_throttle_wait=30)
+
+    _get(transport, _url(server, "/a"))
+    sleep.assert_not_called()
+    assert transport.rate_limits()["core"].remaining == 4
+
+    _get(transport, _url(server, "/b"))
+    waited = sleep.call_args.args[0]
+    assert 15 < waited <= 20  # ~100s spread over 5 remaining requests
+
+
+def _rate_limit_headers(limit: int, remaining: int, reset_in: int, resource: str = "core") -> dict[str, str]:
+    return {
+        "X-RateLimit-Limit": str(limit),
+        "X-RateLimit-Remaining": str(remaining),
+        "X-RateLimit-Reset": str(int(time.time()) + reset_in),
+        "X-RateLimit-Resource": resource,
+    }
+
+
+def test_search_bucket_is_not_throttled_while_it_has_headroom(server: _Server) -> None:
+    # Search allows 30 requests a minute; 25 left is plenty
+    server.extra_headers = _rate_limit_headers(30, 25, 60, resource="search")
+    sleep = MagicMock()
+    transport = GitHubTransport(sleep=sleep)
+
+    for n in range(5):
+        _get(transport, _url(server, f"/search/issues?q={n}"))
+
+    sleep.assert_not_called()
+
+
+def test_small_bucket_is_throttled_only_when_nearly_empty(server: _Server) -> None:
+    server.extra_headers = _rate_limit_headers(20, 19, 3600)
+    sleep = MagicMock()
+    transport = GitHubTransport(sleep=sleep, max_throttle_wait=30)
+    for path in ("/a", "/b", "/c"):
+        _get(transport, _url(server, path))
+    sleep.assert_not_called()
+
+    server.extra_headers = _rate_limit_headers(20, 1, 3600)
+    _get(transport, _url(server, "/d"))
+    _get(transport, _url(server, "/e"))
+    assert sleep.call_args.args[0] == 30  # Capped at max_throttle_wait
+
+
+def test_low_rate_limit_is_not_throttled_at_a_sustainable_pace(server: _Server) -> None:
+    server.extra_headers = _rate_limit_headers(5000, 40, 100)
+    sleep = MagicMock()
+    transport = GitHubTransport(sleep=sleep)
+    _get(transport, _url(server, "/a"))
+
+    # Two requests in the last five minutes would not use up 40 in 100s
+    transport._windows["core"].started -= 300
+    _get(transport, _url(server, "/b"))
+
+    sleep.assert_not_called()
+
+
+def test_endpoint_template() -> None:
+    assert endpoint_template("GET", "https://api.github.com/repos/o/r/issues/12/comments") == (
+        "GET /repos/{owner}/{repo}/issues/{n}/comments"
+    )
+    assert endpoint_template("PUT", "https://api.github.com/repos/o/r/contents/a/b.json?ref=x") == (
+        "PUT /repos/{owner}/{repo}/contents/{id}"
+    )
+    assert endpoint_template("POST", "https://ghe.example.com/api/graphql") == "POST /graphql"
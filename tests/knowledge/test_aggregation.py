@@ -330,6 +330,23 @@ class TestKnowledgeAggregator:
         entity = aggregator.get_aggregated_entity("Unknown Person")
         assert entity is None
 
+    def test_entity_fingerprints_track_contributing_files(
+        self,
+        populated_knowledge_graph: KnowledgeGraphStorage,
+        sample_association: EntityAssociation,
+    ) -> None:
+        aggregator = KnowledgeAggregator(populated_knowledge_graph)
+        before = aggregator.entity_fingerprints("Person")
+        assert set(before) == {"niccolo machiavelli", "francesco sforza"}
+        assert aggregator.entity_fingerprints("Organization") == {}
+        assert aggregator.entity_fingerprints("Person") == before
+
+        # A new association touches Machiavelli only
+        populated_knowledge_graph.save_extracted_associations("checksum_source_2", [sample_association])
+        after = aggregator.entity_fingerprints("Person")
+        assert after["niccolo machiavelli"] != before["niccolo machiavelli"]
+        assert after["francesco sforza"] == before["francesco sforza"]
+
 
 # =============================================================================
 # Markdown Generation Tests
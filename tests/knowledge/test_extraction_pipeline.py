@@ -0,0 +1,233 @@
+"""Tests for the pipelined batch extraction."""
+
+import json
+import threading
+import time
+from datetime import datetime, timezone
+from unittest.mock import Mock
+
+import pytest
+
+from src.integrations.github.models import RateLimitError
+from src.knowledge.extraction import (
+    AssociationExtractor,
+    ConceptExtractor,
+    OrganizationExtractor,
+    PersonExtractor,
+    ProfileExtractor,
+)
+from src.knowledge.extraction_pipeline import ExtractionCheckpoint, ExtractionPipeline
+from src.knowledge.storage import EntityAssociation, EntityProfile, KnowledgeGraphStorage
+from src.parsing.storage import ManifestEntry, ParseStorage
+
+
+@pytest.fixture
+def storage(tmp_path):
+    storage = ParseStorage(tmp_path / "parsed")
+    for index in range(4):
+        checksum = f"doc{index}"
+        artifact = storage.root / f"{checksum}.md"
+        artifact.write_text(f"Document {index} mentions Jane Doe and Acme Corp.", encoding="utf-8")
+        storage.record_entry(
+            ManifestEntry(
+                source=f"https://example.com/{checksum}",
+                checksum=checksum,
+                parser="web",
+                artifact_path=artifact.name,
+                processed_at=datetime.now(timezone.utc),
+            )
+        )
+    return storage
+
+
+@pytest.fixture
+def kb_storage(tmp_path):
+    return KnowledgeGraphStorage(tmp_path / "kb")
+
+
+@pytest.fixture
+def extractors():
+    people = Mock(spec=PersonExtractor)
+    people.extract_people.return_value = ["Jane Doe"]
+    orgs = Mock(spec=OrganizationExtractor)
+    orgs.extract_organizations.return_value = ["Acme Corp"]
+    concepts = Mock(spec=ConceptExtractor)
+    concepts.extract_concepts.return_value = ["leadership"]
+    associations = Mock(spec=AssociationExtractor)
+    associations.extract_associations.return_value = [
+        EntityAssociation(
+            source="Jane Doe",
+            target="Acme Corp",
+            relationship="works for",
+            evidence="Jane Doe works for Acme Corp.",
+            source_type="Person",
+            target_type="Organization",
+        )
+    ]
+    profiles = Mock(spec=ProfileExtractor)
+    profiles.extract_profiles.return_value = [
+        EntityProfile(name="Jane Doe", entity_type="Person", summary="An executive.")
+    ]
+    return {
+        "person_extractor": people,
+        "organization_extractor": orgs,
+        "concept_extractor": concepts,
+        "association_extractor": associations,
+        "profile_extractor": profiles,
+    }
+
+
+def _substantive(entry, content):
+    return {"status": "success", "is_substantive": True, "reason": "ok", "confidence": 0.9}
+
+
+def _pipeline(storage, kb_storage, extractors, tmp_path, assess=_substantive, **kwargs):
+    return ExtractionPipeline(
+        storage=storage,
+        kb_storage=kb_storage,
+        assess=assess,
+        checkpoint=ExtractionCheckpoint(tmp_path / "checkpoint.json"),
+        **extractors,
+        **kwargs,
+    )
+
+
+def test_processes_all_documents(storage, kb_storage, extractors, tmp_path):
+    pipeline = _pipeline(storage, kb_storage, extractors, tmp_path, llm_concurrency=3)
+
+    result = pipeline.run(list(storage.manifest().entries.values()))
+
+    assert result.processed == 4
+    assert not result.rate_limited
+    for entry in storage.manifest().entries.values():
+        assert entry.metadata["extraction_complete"] is True
+        assert kb_storage.get_extracted_people(entry.checksum).people == ["Jane Doe"]
+        assert kb_storage.get_extracted_associations(entry.checksum).associations[0].target == "Acme Corp"
+        assert kb_storage.get_extracted_profiles(entry.checksum).profiles[0].name == "Jane Doe"
+    # Entities from earlier stages are passed through as hints
+    _, people, orgs, concepts = extractors["association_extractor"].extract_associations.call_args.args
+    assert (people, orgs, concepts) == (["Jane Doe"], ["Acme Corp"], ["leadership"])
+
+
+def test_skipped_documents_are_not_extracted(storage, kb_storage, extractors, tmp_path):
+    def assess(entry, content):
+        substantive = entry.checksum != "doc1"
+        return {"status": "success", "is_substantive": substantive, "reason": "nav page"}
+
+    pipeline = _pipeline(storage, kb_storage, extractors, tmp_path, assess=assess)
+    result = pipeline.run(list(storage.manifest().entries.values()))
+
+    assert result.processed == 3
+    assert result.skipped == 1
+    entry = storage.manifest().get("doc1")
+    assert entry.metadata["extraction_skipped"] is True
+    assert entry.metadata["extraction_skipped_reason"] == "nav page"
+    assert kb_storage.get_extracted_people("doc1") is None
+
+
+def test_assessment_error_is_recorded(storage, kb_storage, extractors, tmp_path):
+    pipeline = _pipeline(
+        storage,
+        kb_storage,
+        extractors,
+        tmp_path,
+        assess=lambda entry, content: {"status": "error", "message": "boom"},
+    )
+    result = pipeline.run([storage.manifest().get("doc0")])
+
+    assert result.errors == 1
+    assert storage.manifest().get("doc0").metadata["extraction_error"] == "boom"
+
+
+def test_llm_concurrency_budget_is_respected(storage, kb_storage, extractors, tmp_path):
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def slow_people(text):
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.02)
+        with lock:
+            active -= 1
+        return ["Jane Doe"]
+
+    extractors["person_extractor"].extract_people.side_effect = slow_people
+    pipeline = _pipeline(
+        storage, kb_storage, extractors, tmp_path, llm_concurrency=2, documents_in_flight=4
+    )
+
+    result = pipeline.run(list(storage.manifest().entries.values()))
+
+    assert result.processed == 4
+    assert peak <= 2
+
+
+def test_rate_limit_resumes_mid_document(storage, kb_storage, extractors, tmp_path):
+    orgs = extractors["organization_extractor"].extract_organizations
+    orgs.side_effect = RateLimitError("429")
+    entries = [storage.manifest().get("doc0")]
+
+    first = _pipeline(storage, kb_storage, extractors, tmp_path).run(entries)
+
+    assert first.rate_limited
+    assert first.deferred == 1
+    assert "extraction_rate_limited_at" in storage.manifest().get("doc0").metadata
+    checkpoint = json.loads((tmp_path / "checkpoint.json").read_text())
+    assert checkpoint["documents"]["doc0"]["steps"] == ["assess", "people"]
+
+    # Second run: assessment and people come from the checkpoint
+    orgs.side_effect = None
+    orgs.return_value = ["Acme Corp"]
+    extractors["person_extractor"].extract_people.reset_mock()
+    assess = Mock(side_effect=_substantive)
+
+    second = _pipeline(storage, kb_storage, extractors, tmp_path, assess=assess).run(entries)
+
+    assert second.processed == 1
+    assess.assert_not_called()
+    extractors["person_extractor"].extract_people.assert_not_called()
+    assert kb_storage.get_extracted_people("doc0").people == ["Jane Doe"]
+    assert storage.manifest().get("doc0").metadata["extraction_complete"] is True
+
+
+def test_rate_limit_stops_feeding_new_documents(storage, kb_storage, extractors, tmp_path):
+    extractors["person_extractor"].extract_people.side_effect = RateLimitError("429")
+    pipeline = _pipeline(
+        storage, kb_storage, extractors, tmp_path, llm_concurrency=1, documents_in_flight=1
+    )
+
+    result = pipeline.run(list(storage.manifest().entries.values()))
+
+    assert result.rate_limited
+    assert result.processed == 0
+    assert extractors["person_extractor"].extract_people.call_count == 1
+
+
+def test_persist_error_stops_and_joins_workers(storage, kb_storage, extractors, tmp_path, monkeypatch):
+    pipeline = _pipeline(
+        storage, kb_storage, extractors, tmp_path, llm_concurrency=2, documents_in_flight=1
+    )
+    monkeypatch.setattr(pipeline, "_persist", Mock(side_effect=OSError("disk full")))
+
+    with pytest.raises(OSError, match="disk full"):
+        pipeline.run(list(storage.manifest().entries.values()))
+
+    assert pipeline._persist.call_count == 1
+    assert not [thread for thread in threading.enumerate() if thread.name.startswith("extraction-")]
+
+
+def test_checkpoint_prune_persisted(tmp_path):
+    checkpoint = ExtractionCheckpoint(tmp_path / "checkpoint.json")
+    checkpoint.complete_step("a", "assess", {"is_substantive": True})
+    checkpoint.complete_step("a", "persist")
+    checkpoint.complete_step("b", "assess", {"is_substantive": True})
+
+    assert checkpoint.prune_persisted() == 1
+
+    reloaded = ExtractionCheckpoint(tmp_path / "checkpoint.json")
+    assert reloaded.completed_steps("a") == []
+    assert reloaded.completed_steps("b") == ["assess"]
+    assert reloaded.output("b", "assess") == {"is_substantive": True}
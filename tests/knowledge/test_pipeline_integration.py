@@ -14,6 +14,8 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+from src.integrations.github.standin import GitHubStandIn
+from src.integrations.github.storage import GitHubStorageClient
 from src.knowledge.pipeline import (
     PipelineConfig,
     PipelinePoliteness,
@@ -21,7 +23,7 @@ from src.knowledge.pipeline import (
 )
 from src.knowledge.pipeline.config import get_check_interval
 from src.knowledge.pipeline.monitor import MonitorResult
-from src.knowledge.pipeline.crawler import CrawlerResult
+from src.knowledge.pipeline.crawler import AcquisitionResult, CrawlerResult
 from src.knowledge.pipeline.runner import PipelineResult
 from src.knowledge.storage import SourceEntry, SourceRegistry
 
@@ -357,3 +359,56 @@ class TestPipelineErrorHandling:
         # Should handle gracefully
         result = run_pipeline(config)
         assert result.completed_at is not None
+
+
+class TestGitHubPersistence:
+    """Registry and content writes are grouped into few commits on GitHub."""
+
+    @pytest.fixture
+    def github(self):
+        with GitHubStandIn() as server:
+            yield server
+
+    @pytest.fixture
+    def github_client(self, github):
+        return GitHubStorageClient(token="t", repository=github.repository, api_url=github.api_url)
+
+    def test_monitor_updates_land_in_one_commit(self, temp_kb, temp_evidence, github, github_client):
+        def fake_monitor(registry, **kwargs):
+            for n in range(3):
+                registry.save_source(_make_source_entry(f"Source {n}", f"https://example.com/{n}"))
+            return MonitorResult()
+
+        config = PipelineConfig(
+            mode="check", kb_root=temp_kb, evidence_root=temp_evidence, github_client=github_client
+        )
+        with patch("src.knowledge.pipeline.runner.run_monitor", side_effect=fake_monitor):
+            run_pipeline(config)
+
+        assert github.stats()["commits"] == 1
+
+    def test_each_source_is_acquired_in_one_commit_per_branch(
+        self, temp_kb, temp_evidence, github, github_client
+    ):
+        sources = [_make_source_entry(f"Source {n}", f"https://example.com/{n}") for n in range(2)]
+
+        def fake_acquire(source, storage, delay_seconds, config):
+            for page in ("index", "about"):
+                github_client.commit_to_pr_branch(f"evidence/{source.url[-1]}/{page}.md", page, "Add page")
+            return AcquisitionResult(source_url=source.url, success=True, content_hash="h", pages_acquired=2)
+
+        config = PipelineConfig(
+            mode="acquire",
+            politeness=PipelinePoliteness(min_domain_interval=timedelta(0), crawler_delay_seconds=0),
+            kb_root=temp_kb,
+            evidence_root=temp_evidence,
+            github_client=github_client,
+        )
+        with patch("src.knowledge.pipeline.monitor.get_sources_pending_initial", return_value=sources), \
+                patch("src.knowledge.pipeline.crawler.acquire_single_page", side_effect=fake_acquire), \
+                patch.object(github_client, "create_content_pr", return_value=(1, "url")):
+            result = run_pipeline(config)
+
+        assert len(result.crawler.successful) == 2
+        # Per source: both pages on the PR branch, the registry entry on main
+        assert github.stats()["commits"] == 4
@@ -0,0 +1,204 @@
+"""Tests for heuristic document triage."""
+
+import json
+from unittest.mock import Mock
+
+import pytest
+
+from src.integrations.github.models import ChatCompletionResponse, ChatMessage, Choice, GitHubModelsClient
+from src.knowledge.triage import (
+    CorpusDocument,
+    ParagraphFrequency,
+    assess_with_model,
+    calibrate,
+    compute_features,
+    iter_parsed_documents,
+    strip_front_matter,
+    triage_document,
+)
+
+
+ARTICLE = """---
+source: "https://example.com/news/article"
+checksum: abc123
+---
+
+Head Coach Sean Payton said the Denver Broncos spent the week preparing for the Los Angeles Chargers.
+Quarterback Bo Nix threw for 302 yards and four touchdowns in the 34-26 win over the Cincinnati Bengals.
+"We attack adversity," tight end Evan Engram said on Sunday after practice at the team facility.
+The Broncos placed center Luke Wattenberg on injured reserve and waived running back Cody Schrader.
+Denver clinched its 16th AFC West division title in franchise history and its first since 2015.
+Guard Ben Powers remained a full participant in practice, while John Franklin-Myers was limited.
+The team will host the Chargers in the regular-season finale on Sunday at Empower Field at Mile High.
+Cornerback Pat Surtain II discussed how the defense is preparing to face quarterback Trey Lance.
+Safety Brandon Jones said the locker room expects a playoff atmosphere for the final home game.
+"""
+
+NAV_PAGE = """Home
+Schedule
+Tickets
+[News](https://example.com/news)
+[Photos](https://example.com/photos)
+[Video](https://example.com/video)
+[Shop](https://example.com/shop)
+[Team](https://example.com/team)
+"""
+
+ERROR_PAGE = """Page Not Found
+Sorry, the page you are looking for is no longer available.
+"""
+
+
+def _response(content: str) -> ChatCompletionResponse:
+    return ChatCompletionResponse(
+        id="resp",
+        model="gpt-4o-mini",
+        choices=(Choice(index=0, message=ChatMessage(role="assistant", content=content)),),
+    )
+
+
+class TestStripFrontMatter:
+    def test_removes_header_from_every_segment(self):
+        text = "---\na: 1\n---\n\nFirst\n\n---\nb: 2\n---\n\nSecond"
+        stripped = strip_front_matter(text)
+        assert "a: 1" not in stripped
+        assert "b: 2" not in stripped
+        assert "First" in stripped and "Second" in stripped
+
+    def test_leaves_plain_text_untouched(self):
+        assert strip_front_matter("Just text.") == "Just text."
+
+
+class TestComputeFeatures:
+    def test_article_features(self):
+        features = compute_features(ARTICLE)
+        assert features.sentence_count == 9
+        assert features.word_count > 100
+        assert features.link_density == 0.0
+        assert features.unique_ratio == 1.0
+        assert 0.05 < features.proper_noun_density < 0.5
+        assert features.error_phrases == []
+
+    def test_link_density_for_navigation(self):
+        features = compute_features(NAV_PAGE)
+        assert features.link_density > 0.5
+        assert features.sentence_count == 0
+
+    def test_error_phrases_detected(self):
+        features = compute_features(ERROR_PAGE)
+        assert "page not found" in features.error_phrases
+        assert "no longer available" in features.error_phrases
+
+    def test_boilerplate_reduces_unique_ratio(self):
+        footer = "Copyright Example Team. All rights reserved worldwide."
+        texts = [f"Unique story number {i} about the team.\n{footer}" for i in range(10)]
+        frequency = ParagraphFrequency.from_texts(texts)
+
+        features = compute_features(texts[0], frequency)
+
+        assert 0.0 < features.unique_ratio < 1.0
+
+    def test_small_sources_have_no_boilerplate(self):
+        footer = "Copyright Example Team."
+        frequency = ParagraphFrequency.from_texts([f"Story {i}\n{footer}" for i in range(3)])
+        assert not frequency.is_boilerplate(footer)
+
+
+class TestTriageDocument:
+    def test_article_is_accepted(self):
+        decision = triage_document(ARTICLE)
+        assert decision.verdict == "accept"
+        assert decision.is_substantive is True
+        assert decision.confidence > 0.7
+
+    def test_navigation_is_skipped(self):
+        decision = triage_document(NAV_PAGE)
+        assert decision.verdict == "skip"
+        assert decision.is_substantive is False
+
+    def test_error_page_is_skipped(self):
+        decision = triage_document(ERROR_PAGE)
+        assert decision.verdict == "skip"
+        assert "error page" in decision.reason
+
+    def test_short_teaser_is_uncertain(self):
+        text = (
+            "On this episode, quarterback Bo Nix talks about the team's focus heading into Week 18. "
+            "Cornerback Pat Surtain II discusses preparing for the Chargers."
+        )
+        decision = triage_document(text)
+        assert decision.verdict == "uncertain"
+        assert decision.is_substantive is None
+
+    def test_thresholds_are_configurable(self):
+        decision = triage_document(ARTICLE, skip_below=0.0, accept_above=1.01)
+        assert decision.verdict == "uncertain"
+
+
+class TestAssessWithModel:
+    def test_parses_json_response(self):
+        client = Mock(spec=GitHubModelsClient)
+        client.chat_completion.return_value = _response(
+            json.dumps({"is_substantive": True, "reason": "Article", "confidence": 0.9})
+        )
+
+        result = assess_with_model(client, "x" * 5000)
+
+        assert result == {"is_substantive": True, "reason": "Article", "confidence": 0.9}
+        user_prompt = client.chat_completion.call_args.kwargs["messages"][1]["content"]
+        assert user_prompt.count("x") == 3000
+
+    def test_falls_back_on_non_json(self):
+        client = Mock(spec=GitHubModelsClient)
+        client.chat_completion.return_value = _response("I think false")
+
+        result = assess_with_model(client, "text")
+
+        assert result["is_substantive"] is False
+        assert result["confidence"] == 0.7
+
+    def test_raises_without_choices(self):
+        client = Mock(spec=GitHubModelsClient)
+        client.chat_completion.return_value = ChatCompletionResponse(id="r", model="m", choices=())
+
+        with pytest.raises(ValueError):
+            assess_with_model(client, "text")
+
+
+class TestCalibration:
+    def test_iter_parsed_documents(self, tmp_path):
+        doc_dir = tmp_path / "2026" / "doc-1"
+        doc_dir.mkdir(parents=True)
+        (doc_dir / "index.md").write_text(
+            '---\nsource: "https://example.com/a"\nchecksum: c1\n---\n\n# Segments\n'
+        )
+        (doc_dir / "segment-001.md").write_text("---\npage: 1\n---\n\nBody one.")
+        (doc_dir / "segment-002.md").write_text("---\npage: 2\n---\n\nBody two.")
+
+        documents = list(iter_parsed_documents(tmp_path))
+
+        assert len(documents) == 1
+        assert documents[0].checksum == "c1"
+        assert documents[0].source == "https://example.com/a"
+        assert "Body one." in documents[0].text and "Body two." in documents[0].text
+
+    def test_agreement_rate(self):
+        documents = [
+            CorpusDocument("article", "https://example.com/a", ARTICLE),
+            CorpusDocument("nav", "https://example.com/n", NAV_PAGE),
+            CorpusDocument("error", "https://example.com/e", ERROR_PAGE),
+        ]
+        labels = {"article": True, "nav": False, "error": True}
+
+        report = calibrate(documents, labels)
+
+        assert report["documents"] == 3
+        assert report["verdicts"] == {"skip": 2, "accept": 1, "uncertain": 0}
+        assert report["model_calls_avoided"] == 1.0
+        assert report["labelled_decisions"] == 3
+        assert report["agreement_rate"] == pytest.approx(2 / 3)
+        assert [item["checksum"] for item in report["disagreements"]] == ["error"]
+
+    def test_agreement_rate_without_labels(self):
+        report = calibrate([CorpusDocument("article", "https://example.com/a", ARTICLE)])
+        assert report["agreement_rate"] is None
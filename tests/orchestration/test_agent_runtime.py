@@ -2,16 +2,26 @@
 
 from __future__ import annotations
 
+import threading
 from dataclasses import dataclass
 from typing import Callable, Sequence
 
 import pytest
 
 from src.orchestration.agent import AgentRuntime, AgentRuntimeError, EvaluationResult
+from src.orchestration.memory import MissionMemory
 from src.orchestration.missions import Mission
 from src.orchestration.safety import ActionRisk, ApprovalDecision, SafetyValidator
 from src.orchestration.tools import ToolDefinition, ToolRegistry
-from src.orchestration.types import AgentStep, ExecutionContext, MissionStatus
+from src.orchestration.types import (
+    AgentState,
+    AgentStep,
+    ExecutionContext,
+    MissionStatus,
+    Thought,
+    ThoughtType,
+    ToolCall,
+)
 from tests.orchestration.utils import MockPlanner, PlanStep
 
 
@@ -205,3 +215,401 @@ def test_agent_runtime_surfaces_validation_errors():
     assert not result.success
     assert result.error is not None
     assert "Argument validation failed for 'needs_int'" in result.error
+
+
+def test_agent_runtime_caches_reads_until_a_mutation_touches_them():
+    calls: list[tuple[str, int]] = []
+
+    def read(args):
+        calls.append(("get", args["issue_number"]))
+        return {"issue": args["issue_number"], "version": len(calls)}
+
+    registry = ToolRegistry()
+    registry.register_tool(
+        ToolDefinition(
+            name="get_issue",
+            description="Read an issue.",
+            parameters={"type": "object", "properties": {"issue_number": {"type": "integer"}}},
+            handler=read,
+            cache_scope="issues",
+        )
+    )
+    registry.register_tool(
+        ToolDefinition(
+            name="label_issue",
+            description="Label an issue.",
+            parameters={"type": "object", "properties": {"issue_number": {"type": "integer"}}},
+            handler=lambda args: "labelled",
+            risk_level=ActionRisk.REVIEW,
+            cache_scope="issues",
+        )
+    )
+    steps = [
+        PlanStep("Read 1", "get_issue", {"issue_number": 1}),
+        PlanStep("Read 2", "get_issue", {"issue_number": 2}),
+        PlanStep("Read 1 again", "get_issue", {"issue_number": 1}),
+        PlanStep("Label 2", "label_issue", {"issue_number": 2}),
+        PlanStep("Read 1 after label", "get_issue", {"issue_number": 1}),
+        PlanStep("Read 2 after label", "get_issue", {"issue_number": 2}),
+    ]
+    mission = Mission(id="cache", goal="Read", max_steps=10, allowed_tools=("get_issue", "label_issue"))
+    safety = SafetyValidator()
+    runtime = AgentRuntime(
+        planner=MockPlanner(steps=steps),
+        tools=registry,
+        safety=safety,
+        evaluator=PredicateEvaluator(predicate=lambda steps: True),
+    )
+
+    outcome = runtime.execute_mission(mission, ExecutionContext())
+
+    assert calls == [("get", 1), ("get", 2), ("get", 2)]
+    assert outcome.steps[2].result == outcome.steps[0].result
+    assert outcome.tool_cache == {"hits": 2, "misses": 3, "invalidations": 1, "entries": 2}
+
+    uncached = AgentRuntime(
+        planner=MockPlanner(steps=steps[:3]),
+        tools=registry,
+        safety=safety,
+        evaluator=PredicateEvaluator(predicate=lambda steps: True),
+        cache_reads=False,
+    )
+    assert uncached.execute_mission(mission, ExecutionContext()).tool_cache is None
+    assert len(calls) == 6
+
+
+def test_tool_result_cache_invalidation_is_conservative():
+    from src.orchestration.tools import ToolResultCache
+    from src.orchestration.types import ToolResult
+
+    def tool(name: str, risk: ActionRisk = ActionRisk.SAFE, scope: str | None = "discussions") -> ToolDefinition:
+        return ToolDefinition(name=name, description="", parameters={}, handler=lambda args: None,
+                              risk_level=risk, cache_scope=scope)
+
+    get, listing = tool("get_discussion"), tool("list_discussions")
+    cache = ToolResultCache()
+    cache.record(get, {"discussion_number": 3, "repository": "o/r"}, ToolResult(success=True, output="d3"))
+    cache.record(get, {"discussion_number": 4, "repository": "o/other"}, ToolResult(success=True, output="d4"))
+    cache.record(listing, {"repository": "o/r", "limit": None}, ToolResult(success=True, output=[]))
+    cache.record(get, {"discussion_number": 5}, ToolResult(success=False, error="boom"))
+
+    assert cache.get(listing, {"repository": "o/r"}) is not None  # None-valued arguments are dropped
+    assert cache.get(get, {"discussion_number": 5}) is None  # Failures are not cached
+
+    # Identified by node id, not number: every discussion read in o/r may be stale
+    cache.record(tool("update_discussion", ActionRisk.REVIEW), {"discussion_id": "D_1", "repository": "o/r"},
+                 ToolResult(success=True))
+    assert cache.get(get, {"discussion_number": 3, "repository": "o/r"}) is None
+    assert cache.get(get, {"discussion_number": 4, "repository": "o/other"}) is not None
+
+    # Unscoped reads are neither cached nor treated as mutations
+    cache.record(tool("expand_result", scope=None), {"handle": "res-1"}, ToolResult(success=True, output={}))
+    assert cache.get(get, {"discussion_number": 4, "repository": "o/other"}) is not None
+    assert cache.get(tool("expand_result", scope=None), {"handle": "res-1"}) is None
+
+    # Unscoped mutations clear everything
+    cache.record(tool("sync_entity", ActionRisk.REVIEW, scope=None), {}, ToolResult(success=True))
+    assert cache.stats()["entries"] == 0
+
+
+class BatchPlanner:
+    """Planner that requests several tool calls in a single turn, then finishes."""
+
+    def __init__(self, calls: Sequence[ToolCall]) -> None:
+        self._calls = tuple(calls)
+        self.turns = 0
+
+    def plan_next(self, state: AgentState) -> Thought:
+        del state
+        self.turns += 1
+        if self.turns > 1:
+            return Thought(content="Done", type=ThoughtType.FINISH)
+        return Thought(
+            content="Look everything up",
+            type=ThoughtType.ACTION,
+            tool_call=self._calls[0],
+            additional_tool_calls=self._calls[1:],
+        )
+
+
+def _batch_registry(events: list[str], barrier: threading.Barrier) -> ToolRegistry:
+    def read(args):
+        events.append(f"start {args['name']}")
+        if args.get("together"):
+            barrier.wait()  # Only passes when both reads run at the same time
+        events.append(f"end {args['name']}")
+        return args["name"]
+
+    def write(args):
+        events.append(f"write {args['name']}")
+        return "written"
+
+    registry = ToolRegistry()
+    registry.register_tool(
+        ToolDefinition(
+            name="read",
+            description="Read something.",
+            parameters={"type": "object", "properties": {"name": {"type": "string"}}},
+            handler=read,
+        )
+    )
+    registry.register_tool(
+        ToolDefinition(
+            name="write",
+            description="Write something.",
+            parameters={"type": "object", "properties": {"name": {"type": "string"}}},
+            handler=write,
+            risk_level=ActionRisk.REVIEW,
+        )
+    )
+    return registry
+
+
+def test_agent_runtime_runs_reads_from_one_turn_concurrently_and_mutations_in_order():
+    events: list[str] = []
+    registry = _batch_registry(events, threading.Barrier(2, timeout=5))
+    calls = [
+        ToolCall("read", {"name": "a", "together": True}),
+        ToolCall("read", {"name": "b", "together": True}),
+        ToolCall("write", {"name": "w"}),
+        ToolCall("read", {"name": "c"}),
+    ]
+    planner = BatchPlanner(calls)
+    safety = SafetyValidator()
+    runtime = AgentRuntime(
+        planner=planner,
+        tools=registry,
+        safety=safety,
+        evaluator=PredicateEvaluator(predicate=lambda steps: True),
+    )
+
+    mission = Mission(id="batch", goal="Read", max_steps=10, allowed_tools=("read", "write"))
+    outcome = runtime.execute_mission(mission, ExecutionContext())
+
+    assert outcome.status is MissionStatus.SUCCEEDED
+    assert planner.turns == 2
+    assert [step.thought.tool_call for step in outcome.steps] == calls
+    assert [step.result.output for step in outcome.steps if step.result] == ["a", "b", "written", "c"]
+    assert events.index("write w") > max(events.index("end a"), events.index("end b"))
+    assert events[-2:] == ["start c", "end c"]
+    assert [entry.definition.name for entry in safety.iter_audit_log()] == ["read", "read", "write", "read"]
+
+
+def test_agent_runtime_stops_a_turn_at_a_blocked_call_and_respects_step_budget():
+    events: list[str] = []
+    registry = _batch_registry(events, threading.Barrier(1))
+
+    def deny_callback(tool_call, mission, context, risk):  # type: ignore[unused-argument]
+        return ApprovalDecision.denied(risk=risk, reason="Approval required")
+
+    safety = SafetyValidator(risk_overrides={"write": ActionRisk.REVIEW}, approval_callback=deny_callback)
+    runtime = AgentRuntime(
+        planner=BatchPlanner(
+            [ToolCall("read", {"name": "a"}), ToolCall("write", {"name": "w"}), ToolCall("read", {"name": "b"})]
+        ),
+        tools=registry,
+        safety=safety,
+        evaluator=PredicateEvaluator(predicate=lambda steps: True),
+    )
+    mission = Mission(id="blocked", goal="Read", max_steps=10, allowed_tools=("read", "write"))
+
+    outcome = runtime.execute_mission(mission, ExecutionContext())
+
+    assert outcome.status is MissionStatus.BLOCKED
+    assert len(outcome.steps) == 2
+    assert events == ["start a", "end a"]
+
+    events.clear()
+    limited = AgentRuntime(
+        planner=BatchPlanner([ToolCall("read", {"name": n}) for n in "abc"]),
+        tools=registry,
+        safety=SafetyValidator(),
+        evaluator=PredicateEvaluator(predicate=lambda steps: False),
+    )
+    mission = Mission(id="budget", goal="Read", max_steps=2, allowed_tools=("read",))
+    outcome = limited.execute_mission(mission, ExecutionContext())
+
+    assert len(outcome.steps) == 2
+    assert sorted(events) == ["end a", "end b", "start a", "start b"]
+
+
+class FailingAfter(MockPlanner):
+    """Planner that raises once its scripted steps run out, like a rate-limited LLM."""
+
+    def plan_next(self, state: AgentState) -> Thought:
+        if not self._queue:
+            raise RuntimeError("rate limited")
+        return super().plan_next(state)
+
+
+def test_agent_runtime_resumes_from_checkpoint_without_repeating_mutations():
+    calls: list[str] = []
+    registry = ToolRegistry()
+    registry.register_tool(
+        ToolDefinition(
+            name="read",
+            description="Read.",
+            parameters={"type": "object", "properties": {"n": {"type": "integer"}}},
+            handler=lambda args: calls.append(f"read {args['n']}") or args["n"],
+        )
+    )
+    registry.register_tool(
+        ToolDefinition(
+            name="comment",
+            description="Comment.",
+            parameters={"type": "object", "properties": {"body": {"type": "string"}}},
+            handler=lambda args: calls.append(f"comment {args['body']}") or "posted",
+            risk_level=ActionRisk.REVIEW,
+        )
+    )
+    mission = Mission(id="resume", goal="Comment", max_steps=10, allowed_tools=("read", "comment"))
+    script = [
+        PlanStep("Read", "read", {"n": 1}),
+        PlanStep("Comment", "comment", {"body": "hi"}),
+    ]
+    memory = MissionMemory()
+
+    def runtime(planner):
+        return AgentRuntime(
+            planner=planner,
+            tools=registry,
+            safety=SafetyValidator(),
+            evaluator=PredicateEvaluator(predicate=lambda steps: len(steps) == 3),
+            checkpoints=memory,
+        )
+
+    with pytest.raises(RuntimeError, match="rate limited"):
+        runtime(FailingAfter(steps=script)).execute_mission(
+            mission, ExecutionContext(inputs={"issue": 7}), execution_id="exec-1"
+        )
+    checkpoint = memory.load_checkpoint("exec-1")
+    assert checkpoint is not None and checkpoint.status == "running"
+    assert len(checkpoint.steps) == 2
+    assert checkpoint.context().inputs == {"issue": 7}
+    assert calls == ["read 1", "comment hi"]
+
+    # The resumed planner asks for the same comment; it is replayed, not posted twice
+    resumed = runtime(
+        MockPlanner(steps=[PlanStep("Comment again", "comment", {"body": "hi"})])
+    ).execute_mission(mission, checkpoint.context(), execution_id="exec-1")
+
+    assert resumed.status is MissionStatus.SUCCEEDED
+    assert resumed.execution_id == "exec-1"
+    assert len(resumed.steps) == 3
+    assert resumed.steps[2].result is not None and resumed.steps[2].result.output == "posted"
+    assert calls == ["read 1", "comment hi"]
+    assert memory.load_checkpoint("exec-1").status == "succeeded"
+
+
+def _label_registry(labels: set[str], calls: list[str]) -> ToolRegistry:
+    registry = ToolRegistry()
+    for name, apply in (("add_label", labels.add), ("remove_label", labels.discard)):
+        registry.register_tool(
+            ToolDefinition(
+                name=name,
+                description=name,
+                parameters={"type": "object", "properties": {"label": {"type": "string"}}},
+                handler=lambda args, name=name, apply=apply: calls.append(f"{name} {args['label']}")
+                or apply(args["label"]),
+                risk_level=ActionRisk.REVIEW,
+            )
+        )
+    return registry
+
+
+def test_agent_runtime_resume_replays_each_recorded_occurrence_once():
+    labels: set[str] = set()
+    calls: list[str] = []
+    registry = _label_registry(labels, calls)
+    mission = Mission(id="relabel", goal="Relabel", max_steps=10, allowed_tools=("add_label", "remove_label"))
+    memory = MissionMemory()
+
+    def runtime(planner):
+        return AgentRuntime(
+            planner=planner,
+            tools=registry,
+            safety=SafetyValidator(),
+            evaluator=PredicateEvaluator(predicate=lambda steps: True),
+            checkpoints=memory,
+        )
+
+    add = PlanStep("Add", "add_label", {"label": "X"})
+    remove = PlanStep("Remove", "remove_label", {"label": "X"})
+    with pytest.raises(RuntimeError, match="rate limited"):
+        runtime(FailingAfter(steps=[add, remove])).execute_mission(mission, ExecutionContext(), execution_id="exec-1")
+    assert calls == ["add_label X", "remove_label X"] and labels == set()
+
+    # Replanned from the start: the first add and the remove are replayed, the second add runs
+    resumed = runtime(MockPlanner(steps=[add, remove, add])).execute_mission(
+        mission, ExecutionContext(), execution_id="exec-1"
+    )
+
+    assert resumed.status is MissionStatus.SUCCEEDED
+    assert calls == ["add_label X", "remove_label X", "add_label X"]
+    assert labels == {"X"}
+
+
+def test_agent_runtime_reports_interrupted_mutation_instead_of_repeating_it():
+    class Crash(BaseException):
+        """Stands in for the process dying while a handler runs."""
+
+    calls: list[str] = []
+
+    def crash(args):
+        calls.append(f"add_label {args['label']}")
+        raise Crash()
+
+    registry = ToolRegistry()
+    registry.register_tool(
+        ToolDefinition(
+            name="add_label",
+            description="add_label",
+            parameters={"type": "object", "properties": {"label": {"type": "string"}}},
+            handler=crash,
+            risk_level=ActionRisk.REVIEW,
+        )
+    )
+    mission = Mission(id="relabel", goal="Relabel", max_steps=10, allowed_tools=("add_label",))
+    memory = MissionMemory()
+    add = PlanStep("Add", "add_label", {"label": "X"})
+
+    with pytest.raises(Crash):
+        AgentRuntime(
+            planner=MockPlanner(steps=[add]),
+            tools=registry,
+            safety=SafetyValidator(),
+            evaluator=PredicateEvaluator(predicate=lambda steps: True),
+            checkpoints=memory,
+        ).execute_mission(mission, ExecutionContext(), execution_id="exec-1")
+    checkpoint = memory.load_checkpoint("exec-1")
+    assert checkpoint.steps == () and len(checkpoint.interrupted_mutations) == 1
+
+    resumed = AgentRuntime(
+        planner=MockPlanner(steps=[add]),
+        tools=registry,
+        safety=SafetyValidator(),
+        evaluator=PredicateEvaluator(predicate=lambda steps: True),
+        checkpoints=memory,
+    ).execute_mission(mission, ExecutionContext(), execution_id="exec-1")
+
+    assert calls == ["add_label X"]
+    result = resumed.steps[0].result
+    assert result is not None and not result.success
+    assert "stopped before recording its result" in (result.error or "")
+
+
+def test_agent_runtime_rejects_checkpoint_of_another_mission():
+    registry = ToolRegistry()
+    registry.register_tool(make_echo_tool())
+    memory = MissionMemory()
+    runtime = AgentRuntime(
+        planner=MockPlanner(steps=[]),
+        tools=registry,
+        safety=SafetyValidator(),
+        evaluator=PredicateEvaluator(predicate=lambda steps: True),
+        checkpoints=memory,
+    )
+    runtime.execute_mission(Mission(id="one", goal="g", max_steps=1), ExecutionContext(), execution_id="x")
+
+    with pytest.raises(AgentRuntimeError, match="belongs to mission 'one'"):
+        runtime.execute_mission(Mission(id="two", goal="g", max_steps=1), ExecutionContext(), execution_id="x")
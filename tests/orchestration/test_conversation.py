@@ -0,0 +1,102 @@
+"""Tests for the incremental, token-budgeted planner conversation."""
+
+from __future__ import annotations
+
+import json
+
+from src.orchestration.conversation import ConversationBuilder
+from src.orchestration.missions import Mission
+from src.orchestration.types import (
+    AgentState,
+    AgentStep,
+    ExecutionContext,
+    Thought,
+    ThoughtType,
+    ToolCall,
+    ToolResult,
+)
+
+USER = {"role": "user", "content": "What's your next action?"}
+
+
+class CountingOutput:
+    """Tool output that counts how often it is serialized."""
+
+    def __init__(self, text: str) -> None:
+        self.text = text
+        self.serialized = 0
+
+    def __str__(self) -> str:
+        self.serialized += 1
+        return self.text
+
+
+def _step(number: int, output: object) -> AgentStep:
+    return AgentStep(
+        thought=Thought(
+            content=f"Read {number}",
+            type=ThoughtType.ACTION,
+            tool_call=ToolCall(name="read", arguments={"n": number}),
+        ),
+        result=ToolResult(success=True, output=output),
+    )
+
+
+def _state(steps: list[AgentStep]) -> AgentState:
+    mission = Mission(id="m", goal="Read things", max_steps=50)
+    return AgentState(mission=mission, context=ExecutionContext(), steps=tuple(steps))
+
+
+def _tool_contents(messages: list[dict]) -> list[str]:
+    return [message["content"] for message in messages if message["role"] == "tool"]
+
+
+def test_each_step_is_serialized_once_per_mission() -> None:
+    builder = ConversationBuilder()
+    outputs = [CountingOutput(f"output {n}") for n in range(5)]
+    steps: list[AgentStep] = []
+    for number, output in enumerate(outputs, 1):
+        steps.append(_step(number, output))
+        state = _state(steps)
+        builder.progress_lines(state)
+        messages = builder.build("system", state, USER)
+
+    # Once for the tool message, once for the progress note
+    assert [output.serialized for output in outputs] == [2] * 5
+    assert _tool_contents(messages) == [json.dumps(f"output {n}") for n in range(5)]
+    assert messages[-1] == USER
+
+
+def test_old_outputs_are_compacted_to_fit_the_budget() -> None:
+    builder = ConversationBuilder(token_budget=3_000, keep_recent=2, preview_chars=50)
+    steps = [_step(n, "x" * 4_000) for n in range(1, 6)]
+
+    messages = builder.build("system", _state(steps), USER)
+
+    contents = _tool_contents(messages)
+    assert len(contents) == 5
+    assert all(contents[n].endswith(f"[{4_002 - 50} more characters omitted]") for n in (0, 1, 2))
+    assert contents[3] == contents[4] == json.dumps("x" * 4_000)
+    # Tool messages still answer the assistant call they belong to
+    assert [m["tool_call_id"] for m in messages if m["role"] == "tool"] == [f"call_{n}" for n in range(1, 6)]
+
+
+def test_oldest_steps_are_omitted_when_compaction_is_not_enough() -> None:
+    builder = ConversationBuilder(token_budget=100, keep_recent=1, preview_chars=50)
+    steps = [_step(n, "y" * 1_000) for n in range(1, 11)]
+
+    messages = builder.build("system", _state(steps), USER)
+
+    notes = [m for m in messages if m["role"] == "user" and "omitted" in m["content"]]
+    assert len(notes) == 1
+    assert len(_tool_contents(messages)) < 10
+    assert _tool_contents(messages)[-1] == json.dumps("y" * 1_000)
+
+
+def test_a_new_history_resets_the_cache() -> None:
+    builder = ConversationBuilder()
+    builder.build("system", _state([_step(1, "first run")]), USER)
+
+    messages = builder.build("system", _state([_step(1, "second run")]), USER)
+
+    assert _tool_contents(messages) == [json.dumps("second run")]
@@ -1,5 +1,6 @@
 """Tests for the deployment infrastructure."""
 
+import threading
 import time
 from unittest.mock import Mock, MagicMock
 
@@ -10,6 +11,7 @@ from src.orchestration.deployment import (
     CircuitBreaker,
     CircuitBreakerState,
     MissionPriority,
+    MissionQueue,
     QueuedMission,
 )
 from src.orchestration.missions import Mission
@@ -73,6 +75,47 @@ def test_circuit_breaker_recovery():
     assert breaker.state == CircuitBreakerState.HALF_OPEN
 
 
+def test_circuit_breaker_half_open_admits_one_probe():
+    """Test HALF_OPEN lets a single mission through until its outcome is known."""
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=0)
+    breaker.record_failure()
+
+    admitted = []
+    workers = [threading.Thread(target=lambda: admitted.append(breaker.can_execute())) for _ in range(4)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    assert sorted(admitted) == [False, False, False, True]
+
+    # A failed probe reopens the breaker; the next probe waits for the timeout
+    breaker.record_failure()
+    assert breaker.state == CircuitBreakerState.OPEN
+    assert breaker.can_execute() is True
+    assert breaker.can_execute() is False
+
+    breaker.record_success()
+    assert breaker.can_execute() is True
+    assert breaker.can_execute() is True
+
+
+def test_circuit_breaker_unused_probe_is_released_by_its_owner():
+    """Test a worker that found no mission hands the probe slot back."""
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=0)
+    breaker.record_failure()
+    assert breaker.can_execute() is True
+
+    # Another thread cannot release a probe it does not hold
+    other = threading.Thread(target=breaker.release_probe)
+    other.start()
+    other.join()
+    assert breaker.can_execute() is False
+
+    breaker.release_probe()
+    assert breaker.state == CircuitBreakerState.HALF_OPEN
+    assert breaker.can_execute() is True
+
+
 def test_circuit_breaker_manual_reset():
     """Test manual circuit breaker reset."""
     breaker = CircuitBreaker(failure_threshold=2)
@@ -310,3 +353,150 @@ def test_deployment_reset_circuit_breaker():
     # Reset
     deployment.reset_circuit_breaker()
     assert deployment._circuit_breaker.state == CircuitBreakerState.CLOSED
+
+
+def _queued(mission_type: str, priority: MissionPriority = MissionPriority.NORMAL, name: str = "") -> QueuedMission:
+    mission = Mission(id=mission_type, goal="Test goal", max_steps=5)
+    return QueuedMission(
+        priority=priority.value,
+        timestamp=time.time(),
+        mission=mission,
+        context=ExecutionContext(),
+        mission_id=name or mission_type,
+    )
+
+
+def test_mission_queue_weighted_fair_dequeue():
+    """Lower priorities still progress in proportion to their weight."""
+    queue = MissionQueue(100)
+    for n in range(10):
+        queue.put(_queued("triage", MissionPriority.CRITICAL, f"critical-{n}"))
+        queue.put(_queued("triage", MissionPriority.LOW, f"low-{n}"))
+
+    taken = [queue.get(timeout=0).mission_id for _ in range(9)]
+
+    assert sum(name.startswith("critical") for name in taken) == 8
+    assert sum(name.startswith("low") for name in taken) == 1
+    assert taken[0] == "critical-0"
+    assert queue.depths()["LOW"] == 9
+    assert queue.wait_latency()["CRITICAL"]["count"] == 8
+
+
+def test_mission_queue_respects_type_concurrency():
+    """A capped mission type waits while others of its type are running."""
+    queue = MissionQueue(10, type_limits={"synthesis": 1})
+    queue.put(_queued("synthesis", name="synthesis-1"))
+    queue.put(_queued("synthesis", name="synthesis-2"))
+    queue.put(_queued("triage", name="triage-1"))
+
+    first = queue.get(timeout=0)
+    assert first.mission_id == "synthesis-1"
+    assert queue.get(timeout=0).mission_id == "triage-1"
+    assert queue.get(timeout=0) is None
+
+    queue.task_done(first)
+    assert queue.get(timeout=0).mission_id == "synthesis-2"
+
+
+def test_mission_queue_put_applies_backpressure():
+    """A full queue makes producers wait for room instead of dropping work."""
+    queue = MissionQueue(1)
+    assert queue.put(_queued("triage", name="first")) is True
+    assert queue.put(_queued("triage", name="rejected"), timeout=0) is False
+
+    accepted = []
+    producer = threading.Thread(
+        target=lambda: accepted.append(queue.put(_queued("triage", name="second"), timeout=5))
+    )
+    producer.start()
+    assert queue.get(timeout=1).mission_id == "first"
+    producer.join(timeout=5)
+
+    assert accepted == [True]
+    assert queue.get(timeout=0).mission_id == "second"
+
+
+def test_deployment_runs_missions_on_parallel_workers():
+    """Workers execute missions concurrently, each with its own runtime."""
+    barrier = threading.Barrier(3, timeout=5)
+    runtimes = []
+
+    def make_runtime():
+        runtime = Mock()
+
+        def execute(mission, context):
+            barrier.wait()  # Only passes when three missions run at once
+            return MissionOutcome(status=MissionStatus.SUCCEEDED, steps=[], summary="ok")
+
+        runtime.execute_mission.side_effect = execute
+        runtimes.append(runtime)
+        return runtime
+
+    monitor = Mock()
+    deployment = AgentDeployment(
+        runtime=make_runtime(),
+        monitor=monitor,
+        workers=3,
+        runtime_factory=make_runtime,
+    )
+    for n in range(3):
+        deployment.enqueue_mission(_queued("triage").mission, ExecutionContext(), mission_id=f"m{n}")
+
+    runner = threading.Thread(target=deployment.run_continuously)
+    runner.start()
+    deadline = time.time() + 5
+    while monitor.record_mission.call_count < 3 and time.time() < deadline:
+        time.sleep(0.01)
+    deployment.shutdown()
+    runner.join(timeout=5)
+
+    assert monitor.record_mission.call_count == 3
+    assert len(runtimes) == 3
+    assert all(runtime.execute_mission.call_count == 1 for runtime in runtimes)
+    assert deployment._circuit_breaker.state == CircuitBreakerState.CLOSED
+    assert not runner.is_alive()
+
+
+def test_deployment_requires_runtime_factory_for_multiple_workers():
+    """Runtimes hold per-mission planner state and cannot be shared across workers."""
+    with pytest.raises(ValueError, match="runtime_factory"):
+        AgentDeployment(runtime=Mock(), monitor=Mock(), workers=2)
+
+
+def test_deployment_publishes_metrics(tmp_path):
+    """Queue depth, active missions and outcomes are served while running."""
+    from urllib.request import urlopen
+
+    from src.metrics import MISSIONS, QUEUE_DEPTH
+    from src.orchestration.monitoring import AgentMonitor
+
+    runtime = Mock()
+    runtime.execute_mission.return_value = MissionOutcome(status=MissionStatus.SUCCEEDED, steps=[], summary="ok")
+    runtime.planner.prompt_token_usage = []
+    monitor = AgentMonitor(db_path=tmp_path / "agent_metrics.db")
+    before = MISSIONS.value(mission_type="metrics-probe", status="succeeded")
+    deployment = AgentDeployment(runtime=runtime, monitor=monitor, metrics_port=0)
+
+    for n in range(2):
+        deployment.enqueue_mission(_queued("metrics-probe").mission, ExecutionContext(), mission_id=f"m{n}")
+    assert QUEUE_DEPTH.value(priority="normal") == 2
+
+    runner = threading.Thread(target=deployment.run_continuously)
+    runner.start()
+    deadline = time.time() + 5
+    while (
+        MISSIONS.value(mission_type="metrics-probe", status="succeeded") < before + 2
+        or deployment.get_status()["active_missions"]
+    ) and time.time() < deadline:
+        time.sleep(0.01)
+    with urlopen(deployment.get_status()["metrics_url"], timeout=5) as response:
+        body = response.read().decode("utf-8")
+    deployment.shutdown()
+    runner.join(timeout=5)
+    final_status = deployment.get_status()
+    monitor.close()
+
+    assert 'speculum_agent_queue_depth{priority="normal"} 0' in body
+    assert "speculum_agent_active_missions 0" in body
+    assert 'speculum_agent_missions_total{mission_type="metrics-probe",status="succeeded"}' in body
+    assert final_status["metrics_url"] is None
@@ -14,6 +14,7 @@ from src.integrations.github.models import (
     GitHubModelsClient,
     FunctionCall,
     ToolCall as GitHubModelsToolCall,
+    Usage,
 )
 from src.orchestration.llm import LLMPlanner, LLMPlannerError
 from src.orchestration.missions import Mission
@@ -286,6 +287,121 @@ def test_plan_next_validates_tool_allowed(mock_models_client, tool_registry):
         planner.plan_next(state)
 
 
+def test_plan_next_returns_every_tool_call(mock_models_client, tool_registry, simple_mission):
+    """LLMPlanner keeps all tool calls from a single response, in order."""
+    mock_models_client.chat_completion.return_value = ChatCompletionResponse(
+        id="test",
+        model="gpt-4o-mini",
+        choices=(
+            Choice(
+                index=0,
+                message=ChatMessage(
+                    role="assistant",
+                    content=None,
+                    tool_calls=tuple(
+                        GitHubModelsToolCall(
+                            id=f"call_{number}",
+                            type="function",
+                            function=FunctionCall(
+                                name="get_issue_details",
+                                arguments=json.dumps({"issue_number": number}),
+                            ),
+                        )
+                        for number in (1, 2, 3)
+                    ),
+                ),
+            ),
+        ),
+    )
+    planner = LLMPlanner(models_client=mock_models_client, tool_registry=tool_registry)
+    state = AgentState(mission=simple_mission, context=ExecutionContext(), steps=tuple())
+
+    thought = planner.plan_next(state)
+
+    assert thought.type == ThoughtType.ACTION
+    assert thought.content == "Calling get_issue_details"
+    assert [call.arguments["issue_number"] for call in thought.tool_calls] == [1, 2, 3]
+    assert thought.tool_call == thought.tool_calls[0]
+
+
+def test_plan_next_tracks_prompt_tokens_and_compacts_history(mock_models_client, tool_registry, simple_mission):
+    """LLMPlanner reports prompt tokens per turn and keeps history within budget."""
+    mock_models_client.chat_completion.side_effect = [
+        ChatCompletionResponse(
+            id="test",
+            model="gpt-4o-mini",
+            choices=(Choice(index=0, message=ChatMessage(role="assistant", content="FINISH: done")),),
+            usage=Usage(prompt_tokens=1234, completion_tokens=5, total_tokens=1239),
+        ),
+        ChatCompletionResponse(
+            id="test",
+            model="gpt-4o-mini",
+            choices=(Choice(index=0, message=ChatMessage(role="assistant", content="FINISH: done")),),
+        ),
+    ]
+    planner = LLMPlanner(models_client=mock_models_client, tool_registry=tool_registry, token_budget=3_000)
+    big_output = {"body": "z" * 2_000}
+    steps = tuple(
+        AgentStep(
+            thought=Thought(
+                content="Fetching issue",
+                type=ThoughtType.ACTION,
+                tool_call=ToolCall(name="get_issue_details", arguments={"issue_number": n}),
+            ),
+            result=ToolResult(success=True, output=big_output),
+        )
+        for n in range(6)
+    )
+    state = AgentState(mission=simple_mission, context=ExecutionContext(), steps=steps)
+
+    planner.plan_next(state)
+    planner.plan_next(state)
+
+    messages = mock_models_client.chat_completion.call_args[1]["messages"]
+    tool_contents = [m["content"] for m in messages if m["role"] == "tool"]
+    compacted = [c for c in tool_contents if c.endswith("more characters omitted]")]
+    assert compacted and tool_contents[-1] == json.dumps(big_output)
+    assert planner.prompt_token_usage[0] == 1234
+    # Without reported usage the planner falls back to an estimate
+    assert 0 < planner.prompt_token_usage[1] < 3_000
+
+
+def test_system_prompt_includes_similar_past_missions(tool_registry, simple_mission):
+    """Similar successful executions from memory are offered as examples."""
+    from src.orchestration.memory import MissionMemory
+    from src.orchestration.types import MissionOutcome, MissionStatus
+
+    with MissionMemory() as memory:
+        memory.record_execution(
+            mission_id="test_mission",
+            mission_goal="Classify and label issue #7",
+            outcome=MissionOutcome(
+                status=MissionStatus.SUCCEEDED,
+                steps=(
+                    AgentStep(
+                        thought=Thought(
+                            content="Label",
+                            type=ThoughtType.ACTION,
+                            tool_call=ToolCall(name="add_label", arguments={"label": "bug"}),
+                        ),
+                        result=ToolResult(success=True),
+                    ),
+                ),
+            ),
+        )
+        planner = LLMPlanner(
+            models_client=MagicMock(spec=GitHubModelsClient),
+            tool_registry=tool_registry,
+            memory=memory,
+        )
+        state = AgentState(mission=simple_mission, context=ExecutionContext(), steps=tuple())
+
+        prompt = planner._build_system_prompt(state)
+
+    assert "Similar successful missions" in prompt
+    assert "- Classify and label issue #7: add_label (1 steps)" in prompt
+
+
 def test_plan_next_handles_invalid_json_arguments(mock_models_client, tool_registry, simple_mission):
     """LLMPlanner raises error on malformed tool arguments."""
     # Mock LLM response with invalid JSON
@@ -467,3 +467,148 @@ def test_success_pattern_ordering(memory_db):
     # Pattern A should come first (higher success rate: 0.8 vs 0.5)
     assert len(patterns) == 2
     assert patterns[0].success_rate > patterns[1].success_rate
+
+
+def test_checkpoint_round_trip(file_memory_db):
+    """Checkpoint steps persist incrementally and expose completed mutations."""
+    from src.orchestration.memory import idempotency_key
+    from src.orchestration.missions import Mission
+    from src.orchestration.types import ExecutionContext
+
+    mission = Mission(id="triage", goal="Label the issue", max_steps=5)
+    checkpoint = file_memory_db.start_checkpoint("exec-1", mission, ExecutionContext(inputs={"issue": 3}))
+    assert checkpoint.steps == () and checkpoint.status == "running"
+
+    label = ToolCall(name="add_label", arguments={"label": "bug"})
+    file_memory_db.append_checkpoint_step(
+        "exec-1",
+        1,
+        AgentStep(
+            thought=Thought(content="Read", type=ThoughtType.ACTION, tool_call=ToolCall(name="get_issue", arguments={})),
+            result=ToolResult(success=True, output={"title": "Crash"}),
+        ),
+    )
+    file_memory_db.append_checkpoint_step(
+        "exec-1",
+        2,
+        AgentStep(
+            thought=Thought(content="Label", type=ThoughtType.ACTION, tool_call=label),
+            result=ToolResult(success=True, output="labelled"),
+        ),
+        idempotency_key=idempotency_key(label),
+    )
+
+    loaded = file_memory_db.load_checkpoint("exec-1")
+    assert loaded.inputs == {"issue": 3}
+    assert [step.result.output for step in loaded.steps] == [{"title": "Crash"}, "labelled"]
+    assert loaded.completed_mutations == {idempotency_key(label): ToolResult(success=True, output="labelled")}
+    assert loaded.resumable
+
+    file_memory_db.finish_checkpoint("exec-1", MissionStatus.SUCCEEDED)
+    assert not file_memory_db.load_checkpoint("exec-1").resumable
+    assert file_memory_db.load_checkpoint("missing") is None
+
+    file_memory_db.clear_all()
+    assert file_memory_db.load_checkpoint("exec-1") is None
+
+
+def test_checkpoint_intents_mark_unrecorded_mutations(file_memory_db):
+    """An intent stays pending until the step with the same key is appended."""
+    from src.orchestration.memory import idempotency_key
+    from src.orchestration.missions import Mission
+    from src.orchestration.types import ExecutionContext
+
+    file_memory_db.start_checkpoint("exec-1", Mission(id="triage", goal="Label", max_steps=5), ExecutionContext())
+    label = ToolCall(name="add_label", arguments={"label": "bug"})
+    first, second = idempotency_key(label, 1), idempotency_key(label, 2)
+    assert first != second
+
+    file_memory_db.begin_checkpoint_mutation("exec-1", first)
+    file_memory_db.begin_checkpoint_mutation("exec-1", second)
+    file_memory_db.append_checkpoint_step(
+        "exec-1",
+        1,
+        AgentStep(
+            thought=Thought(content="Label", type=ThoughtType.ACTION, tool_call=label),
+            result=ToolResult(success=True, output="labelled"),
+        ),
+        idempotency_key=first,
+    )
+
+    loaded = file_memory_db.load_checkpoint("exec-1")
+    assert set(loaded.completed_mutations) == {first}
+    assert loaded.interrupted_mutations == frozenset({second})
+
+
+def _record(memory, mission_id, goal, tools, status=MissionStatus.SUCCEEDED):
+    steps = tuple(
+        AgentStep(
+            thought=Thought(content=f"Call {tool}", type=ThoughtType.ACTION, tool_call=ToolCall(name=tool, arguments={})),
+            result=ToolResult(success=True, output={"payload": "x" * 100}),
+        )
+        for tool in tools
+    )
+    return memory.record_execution(
+        mission_id=mission_id,
+        mission_goal=goal,
+        outcome=MissionOutcome(status=status, steps=steps, summary=f"{goal} done"),
+    )
+
+
+def test_search_similar_ranks_by_goal_and_tools(memory_db):
+    """Similarity search favours executions sharing goal words, tools and mission type."""
+    _record(memory_db, "triage", "Label the new crash report issue", ["get_issue_details", "add_label"])
+    _record(memory_db, "synthesis", "Synthesize person profiles from sources", ["list_pending_entities"])
+    _record(memory_db, "triage", "Label a feature request issue", ["get_issue_details", "add_label"], MissionStatus.FAILED)
+
+    results = memory_db.search_similar("Label crash issue", tools=["add_label"])
+
+    assert [r.mission_goal for r in results][:2] == [
+        "Label the new crash report issue",
+        "Label a feature request issue",
+    ]
+    assert results[0].score > results[1].score > 0
+    assert results[0].tool_sequence == ("get_issue_details", "add_label")
+    assert results[0].summary == "Label the new crash report issue done"
+
+    succeeded = memory_db.search_similar("label issue", status_filter=MissionStatus.SUCCEEDED)
+    assert [r.status for r in succeeded] == [MissionStatus.SUCCEEDED]
+    assert memory_db.search_similar("profiles", mission_id="synthesis")[0].mission_id == "synthesis"
+    assert memory_db.search_similar("zzz unknown words") == []
+
+
+def test_list_summaries_projects_without_steps(memory_db):
+    """Summaries come from indexed columns, filtered and newest first."""
+    _record(memory_db, "triage", "First", ["get_issue_details"])
+    _record(memory_db, "triage", "Second", ["get_issue_details", "add_label"], MissionStatus.FAILED)
+    _record(memory_db, "other", "Third", [])
+
+    summaries = memory_db.list_summaries("triage")
+
+    assert {s.mission_goal for s in summaries} == {"First", "Second"}
+    assert memory_db.list_summaries(status_filter=MissionStatus.FAILED)[0].tool_sequence == (
+        "get_issue_details",
+        "add_label",
+    )
+    assert len(memory_db.list_summaries(limit=1)) == 1
+
+
+def test_index_is_backfilled_for_existing_databases():
+    """Executions stored before the index existed become searchable on open."""
+    import sqlite3
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = Path(tmpdir) / "memory.db"
+        with MissionMemory(db_path) as memory:
+            _record(memory, "triage", "Label crash issue", ["get_issue_details", "add_label"])
+        conn = sqlite3.connect(str(db_path))
+        conn.execute("UPDATE mission_executions SET tool_sequence = NULL")
+        for table in ("memory_terms", "memory_documents", "memory_term_stats"):
+            conn.execute(f"DELETE FROM {table}")
+        conn.commit()
+        conn.close()
+
+        with MissionMemory(db_path) as memory:
+            assert memory._conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+            assert memory.search_similar("crash")[0].tool_sequence == ("get_issue_details", "add_label")
+            assert memory.extract_patterns(min_occurrences=1)[0].tool_sequence == ("get_issue_details", "add_label")
@@ -220,3 +220,123 @@ def test_context_manager():
         
         # Connection should be closed after context exit
         assert monitor._connection is None
+
+
+def test_record_mission_stores_step_token_usage():
+    """Per-turn prompt tokens are stored and summed into token_usage."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        with AgentMonitor(db_path=Path(tmpdir) / "test_metrics.db") as monitor:
+            outcome = MissionOutcome(status=MissionStatus.SUCCEEDED, steps=[], summary="Success")
+            monitor.record_mission(
+                outcome=outcome,
+                mission_id="test_001",
+                mission_type="test_mission",
+                duration=1.0,
+                step_token_usage=(120, 340, 560),
+            )
+
+            assert monitor.get_step_token_usage("test_001") == [120, 340, 560]
+            assert monitor.get_step_token_usage("unknown") == []
+            assert monitor.generate_report()["costs"]["total_tokens"] == 1020
+
+
+class _Clock:
+    """Settable UTC clock for the monitor."""
+
+    def __init__(self, now: datetime) -> None:
+        self.now = now
+
+    def __call__(self) -> datetime:
+        return self.now
+
+
+def _record(monitor: AgentMonitor, mission_id: str, status: MissionStatus, duration: float = 1.0,
+            mission_type: str = "test_mission") -> None:
+    monitor.record_mission(
+        outcome=MissionOutcome(status=status, steps=[], summary=f"{status.value} summary"),
+        mission_id=mission_id,
+        mission_type=mission_type,
+        duration=duration,
+        token_usage=10,
+    )
+
+
+def test_health_and_report_read_rollup_windows(tmp_path):
+    """Counts come from minute and hour buckets inside the window."""
+    clock = _Clock(datetime(2026, 3, 1, 8, 0))
+    with AgentMonitor(db_path=tmp_path / "metrics.db", clock=clock) as monitor:
+        _record(monitor, "old", MissionStatus.FAILED, duration=9.0)
+        clock.now = datetime(2026, 3, 1, 12, 40)
+        _record(monitor, "edge", MissionStatus.SUCCEEDED, duration=3.0)
+        clock.now = datetime(2026, 3, 2, 9, 15)
+        _record(monitor, "recent", MissionStatus.FAILED, duration=5.0, mission_type="other")
+
+        # Window starts at 12:30 on the first day: "old" is outside it
+        health = monitor.check_health(lookback_hours=20.75)
+        assert (health.total_missions, health.success_count, health.failure_count) == (2, 1, 1)
+        assert health.avg_duration == pytest.approx(4.0)
+        assert health.recent_errors == ["failed summary"]
+
+        report = monitor.generate_report(period=timedelta(days=2))
+        assert report["summary"]["total_missions"] == 3
+        assert report["performance"]["avg_duration_seconds"] == pytest.approx(17.0 / 3)
+        assert report["costs"]["total_tokens"] == 30
+        assert report["mission_types"] == {"test_mission": 2, "other": 1}
+
+
+def test_old_windows_widen_to_the_hour_after_minute_rollups_expire(tmp_path):
+    clock = _Clock(datetime(2026, 3, 1, 12, 10))
+    with AgentMonitor(db_path=tmp_path / "metrics.db", clock=clock,
+                      minute_retention=timedelta(hours=1)) as monitor:
+        _record(monitor, "early", MissionStatus.SUCCEEDED)
+        clock.now = datetime(2026, 3, 1, 15, 0)
+        monitor.prune()
+
+        # Window starts at 12:30, after the mission; only hour buckets remain
+        assert monitor.check_health(lookback_hours=2.5).total_missions == 1
+        assert monitor.check_health(lookback_hours=2).total_missions == 0
+
+
+def test_prune_removes_expired_raw_rows_but_keeps_rollups(tmp_path):
+    clock = _Clock(datetime(2026, 1, 1, 9, 0))
+    with AgentMonitor(db_path=tmp_path / "metrics.db", clock=clock,
+                      raw_retention=timedelta(days=7)) as monitor:
+        monitor.record_mission(
+            outcome=MissionOutcome(status=MissionStatus.SUCCEEDED, steps=[], summary="ok"),
+            mission_id="expired",
+            mission_type="test_mission",
+            duration=1.0,
+            step_token_usage=(5, 6),
+        )
+        clock.now = datetime(2026, 1, 10, 9, 0)
+        _record(monitor, "kept", MissionStatus.SUCCEEDED)
+
+        # Recording more than an hour after the last prune prunes again
+        assert [row["mission_id"] for row in monitor.get_recent_missions()] == ["kept"]
+        assert monitor.get_step_token_usage("expired") == []
+        assert monitor.generate_report(period=timedelta(days=30))["summary"]["total_missions"] == 2
+
+        clock.now = datetime(2027, 6, 1)
+        deleted = monitor.prune()
+        # Two hour buckets and the minute bucket of "kept"
+        assert deleted["mission_rollups"] == 3
+        assert monitor.generate_report(period=timedelta(days=800))["summary"]["total_missions"] == 0
+
+
+def test_rollups_are_backfilled_for_existing_databases(tmp_path):
+    db_path = tmp_path / "metrics.db"
+    clock = _Clock(datetime(2026, 3, 1, 12, 0))
+    with AgentMonitor(db_path=db_path, clock=clock) as monitor:
+        _record(monitor, "a", MissionStatus.SUCCEEDED, duration=2.0)
+        _record(monitor, "b", MissionStatus.BLOCKED, duration=4.0)
+
+    # Simulate a database written before rollups existed
+    conn = sqlite3.connect(str(db_path))
+    conn.execute("DROP TABLE mission_rollups")
+    conn.commit()
+    conn.close()
+
+    with AgentMonitor(db_path=db_path, clock=clock) as monitor:
+        health = monitor.check_health(lookback_hours=1)
+        assert (health.total_missions, health.success_count, health.blocked_count) == (2, 1, 1)
+        assert health.avg_duration == pytest.approx(3.0)
@@ -0,0 +1,182 @@
+"""Tests for the out-of-line tool result store and the expand_result tool."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from src.orchestration.memory import MissionMemory
+from src.orchestration.missions import Mission
+from src.orchestration.results import ResultStore, ResultStoreError, summarize_payload
+from src.orchestration.toolkit import register_result_tools
+from src.orchestration.tools import ToolDefinition, ToolRegistry, ToolRegistryError
+from src.orchestration.types import AgentStep, MissionOutcome, MissionStatus, Thought, ThoughtType, ToolCall
+
+
+def _entities(count: int) -> dict:
+    return {
+        "entity_type": "Person",
+        "count": count,
+        "pending": [
+            {"name": f"Person {index}", "source_checksum": f"{index:064x}", "notes": "x" * 120}
+            for index in range(count)
+        ],
+    }
+
+
+@pytest.fixture
+def store(tmp_path: Path) -> ResultStore:
+    return ResultStore(tmp_path / "results", inline_chars=2_000)
+
+
+def test_small_outputs_stay_inline(store: ResultStore) -> None:
+    output = {"count": 1, "pending": ["a"]}
+
+    assert store.offload(output) is output
+    assert store.offload(None) is None
+    assert not store.root.exists()
+
+
+def test_large_outputs_become_summary_and_handle(store: ResultStore) -> None:
+    payload = _entities(200)
+
+    compact = store.offload(payload)
+
+    assert compact["result_handle"].startswith("res-")
+    assert compact["size_chars"] > 2_000
+    assert len(json.dumps(compact)) <= 2_000
+    summary = compact["summary"]
+    assert summary["keys"] == {"entity_type": "Person", "count": 200, "pending": "list(200 items)"}
+    assert len(summary["previews"]["pending"]) == 3
+    assert store.load(compact["result_handle"]) == payload
+
+
+def test_identical_payloads_share_one_file(store: ResultStore) -> None:
+    first = store.put(_entities(50))
+    second = store.put(_entities(50))
+
+    assert first == second
+    assert len(list(store.root.rglob("*.json"))) == 1
+    assert store.put(_entities(51)) != first
+
+
+def test_expand_pages_through_nested_lists(store: ResultStore) -> None:
+    handle = store.put(_entities(30))
+
+    first = store.expand(handle, "pending", limit=5)
+    assert first["total"] == 30
+    assert [item["name"] for item in first["items"]] == [f"Person {index}" for index in range(5)]
+    assert first["next_offset"] == 5
+
+    last = store.expand(handle, "pending", offset=28, limit=5)
+    assert [item["name"] for item in last["items"]] == ["Person 28", "Person 29"]
+    assert last["next_offset"] is None
+
+    assert store.expand(handle, "pending.3.name")["text"] == "Person 3"
+    assert store.expand(handle, "count")["value"] == 30
+
+
+def test_expand_keeps_pages_within_the_inline_budget(store: ResultStore) -> None:
+    handle = store.put(_entities(100))
+
+    page = store.expand(handle, "pending", limit=100)
+
+    assert len(json.dumps(page)) < 2 * 2_000
+    assert page["next_offset"] == len(page["items"])
+
+
+def test_expand_summarizes_items_larger_than_a_page(store: ResultStore) -> None:
+    handle = store.put({"documents": ["y" * 5_000, "short"]})
+
+    page = store.expand(handle, "documents")
+
+    assert page["items"][0]["expand_path"] == "documents.0"
+    assert page["items"][1] == "short"
+    text = store.expand(handle, "documents.0", offset=4_000)
+    assert text["text"] == "y" * 1_000
+    assert text["next_offset"] is None
+
+
+def test_expand_rejects_bad_handles_and_paths(store: ResultStore) -> None:
+    handle = store.put(_entities(5))
+
+    with pytest.raises(ResultStoreError):
+        store.expand("../../etc/passwd")
+    with pytest.raises(ResultStoreError):
+        store.expand("res-" + "0" * 20)
+    with pytest.raises(ResultStoreError):
+        store.expand(handle, "pending.99")
+
+
+def test_summarize_text_payload() -> None:
+    summary = summarize_payload("z" * 1_000)
+
+    assert summary["type"] == "text"
+    assert summary["length"] == 1_000
+
+
+def test_registry_offloads_large_outputs_and_expand_reads_them(store: ResultStore) -> None:
+    registry = ToolRegistry(result_store=store)
+    registry.register_tool(
+        ToolDefinition(
+            name="list_pending_entities",
+            description="test tool",
+            parameters={"type": "object", "properties": {}},
+            handler=lambda args: _entities(500),
+        )
+    )
+    register_result_tools(registry)
+
+    result = registry.execute_tool("list_pending_entities", {})
+    handle = result.output["result_handle"]
+    page = registry.execute_tool("expand_result", {"handle": handle, "path": "pending", "offset": 10, "limit": 2})
+    missing = registry.execute_tool("expand_result", {"handle": "res-" + "f" * 20})
+
+    assert result.success
+    assert [item["name"] for item in page.output["items"]] == ["Person 10", "Person 11"]
+    assert not missing.success and "Unknown result handle" in missing.error
+
+
+def test_register_result_tools_requires_a_store() -> None:
+    with pytest.raises(ToolRegistryError):
+        register_result_tools(ToolRegistry())
+
+
+def test_expand_result_is_allowed_for_restricted_missions() -> None:
+    mission = Mission(id="triage", goal="Triage", max_steps=5, allowed_tools=["get_issue_details"])
+
+    assert mission.is_tool_allowed("expand_result")
+
+
+def test_memory_rows_stay_small_with_offloaded_outputs(store: ResultStore, tmp_path: Path) -> None:
+    registry = ToolRegistry(result_store=store)
+    registry.register_tool(
+        ToolDefinition(
+            name="get_source_associations",
+            description="test tool",
+            parameters={"type": "object", "properties": {}},
+            handler=lambda args: _entities(5_000),
+        )
+    )
+    result = registry.execute_tool("get_source_associations", {})
+    step = AgentStep(
+        thought=Thought(
+            content="Reading associations",
+            type=ThoughtType.ACTION,
+            tool_call=ToolCall(name="get_source_associations", arguments={}),
+        ),
+        result=result,
+    )
+
+    with MissionMemory(tmp_path / "memory.db") as memory:
+        memory.record_execution(
+            "synthesis",
+            "Resolve entities",
+            MissionOutcome(status=MissionStatus.SUCCEEDED, steps=[step], summary="done"),
+        )
+        (stored,) = memory._conn.execute("SELECT result_output FROM execution_steps").fetchone()  # noqa: SLF001
+
+    assert len(stored) <= store.inline_chars
+    assert store.load(json.loads(stored)["result_handle"])["count"] == 5_000
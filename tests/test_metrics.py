@@ -0,0 +1,112 @@
+"""Tests for the metrics registry and its Prometheus exports."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from urllib.request import urlopen
+
+import pytest
+
+from src import metrics
+from src.metrics import MetricsError, MetricsRegistry, MetricsServer
+
+
+def test_counter_and_gauge_render_in_text_format() -> None:
+    registry = MetricsRegistry()
+    pages = registry.counter("pages_total", "Pages fetched.", labels=("outcome",))
+    depth = registry.gauge("queue_depth", "Queued items.")
+
+    pages.inc(outcome="ok")
+    pages.inc(2, outcome="ok")
+    pages.inc(outcome="error")
+    depth.set(5)
+    depth.dec()
+
+    text = registry.render()
+
+    assert "# HELP pages_total Pages fetched.\n# TYPE pages_total counter\n" in text
+    assert 'pages_total{outcome="ok"} 3\n' in text
+    assert 'pages_total{outcome="error"} 1\n' in text
+    assert "# TYPE queue_depth gauge\nqueue_depth 4\n" in text
+    assert pages.value(outcome="ok") == 3
+
+
+def test_histogram_buckets_are_cumulative() -> None:
+    registry = MetricsRegistry()
+    latency = registry.histogram("latency_seconds", "Latency.", labels=("endpoint",), buckets=(0.1, 1.0))
+
+    for value in (0.05, 0.5, 0.7, 3.0):
+        latency.observe(value, endpoint="search")
+
+    text = registry.render()
+    assert 'latency_seconds_bucket{endpoint="search",le="0.1"} 1\n' in text
+    assert 'latency_seconds_bucket{endpoint="search",le="1"} 3\n' in text
+    assert 'latency_seconds_bucket{endpoint="search",le="+Inf"} 4\n' in text
+    assert 'latency_seconds_count{endpoint="search"} 4\n' in text
+    snapshot = latency.snapshot(endpoint="search")
+    assert snapshot["count"] == 4
+    assert snapshot["sum"] == pytest.approx(4.25)
+
+
+def test_labels_must_match_declaration() -> None:
+    registry = MetricsRegistry()
+    counter = registry.counter("requests_total", "Requests.", labels=("endpoint", "status"))
+
+    with pytest.raises(MetricsError):
+        counter.inc(endpoint="search")
+    with pytest.raises(MetricsError):
+        counter.inc(endpoint="search", status=200, extra="x")
+
+
+def test_counter_rejects_negative_increments() -> None:
+    counter = MetricsRegistry().counter("events_total", "Events.")
+
+    with pytest.raises(MetricsError):
+        counter.inc(-1)
+
+
+def test_registry_returns_existing_instrument_and_rejects_type_clash() -> None:
+    registry = MetricsRegistry()
+    first = registry.counter("runs_total", "Runs.")
+
+    assert registry.counter("runs_total", "Runs.") is first
+    with pytest.raises(MetricsError):
+        registry.gauge("runs_total", "Runs.")
+
+
+def test_label_values_are_escaped() -> None:
+    registry = MetricsRegistry()
+    registry.counter("hits_total", "Hits.", labels=("path",)).inc(path='a"b\\c\n')
+
+    assert 'hits_total{path="a\\"b\\\\c\\n"} 1' in registry.render()
+
+
+def test_export_textfile_uses_env_and_is_atomic(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    registry = MetricsRegistry()
+    registry.gauge("last_run_timestamp_seconds", "Last run.").set(1700000000)
+
+    monkeypatch.delenv(metrics.METRICS_FILE_ENV, raising=False)
+    assert metrics.export_textfile(registry=registry) is None
+
+    target = tmp_path / "textfile" / "speculum.prom"
+    monkeypatch.setenv(metrics.METRICS_FILE_ENV, str(target))
+    written = metrics.export_textfile(registry=registry)
+
+    assert written == target
+    assert "last_run_timestamp_seconds 1700000000" in target.read_text()
+    assert [path.name for path in target.parent.iterdir()] == ["speculum.prom"]
+
+
+def test_metrics_server_serves_registry() -> None:
+    registry = MetricsRegistry()
+    registry.counter("served_total", "Served.").inc()
+    server = MetricsServer(registry, port=0)
+    try:
+        with urlopen(server.url, timeout=5) as response:
+            body = response.read().decode("utf-8")
+            content_type = response.headers["Content-Type"]
+    finally:
+        server.close()
+
+    assert "served_total 1" in body
+    assert content_type.startswith("text/plain; version=0.0.4")
@@ -0,0 +1,156 @@
+"""Tests for the timing span API and trace summaries."""
+
+from __future__ import annotations
+
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+
+from src import tracing
+from src.orchestration.tools import ToolDefinition, ToolRegistry
+
+
+@pytest.fixture
+def trace_file(tmp_path: Path) -> Iterator[Path]:
+    path = tmp_path / "trace.jsonl"
+    tracing.configure(path)
+    yield path
+    tracing.configure(None)
+
+
+def _names(path: Path) -> list[str]:
+    return [item["name"] for item in tracing.read_spans(path)]
+
+
+def test_disabled_tracer_records_nothing(tmp_path: Path) -> None:
+    tracing.configure(None)
+    with tracing.span("ignored") as current:
+        current.set(value=1)
+        assert tracing.current_span() is None
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_spans_nest_and_record_attributes(trace_file: Path) -> None:
+    with tracing.span("outer", mode="full"):
+        with tracing.span("inner") as inner:
+            inner.set(pages=3)
+
+    inner_span, outer_span = tracing.read_spans(trace_file)
+    assert (inner_span["name"], outer_span["name"]) == ("inner", "outer")
+    assert inner_span["parent_id"] == outer_span["span_id"]
+    assert inner_span["trace_id"] == outer_span["trace_id"]
+    assert outer_span["parent_id"] is None
+    assert inner_span["attributes"] == {"pages": 3}
+    assert outer_span["attributes"] == {"mode": "full"}
+    assert outer_span["duration"] >= inner_span["duration"]
+
+
+def test_span_records_error_and_reraises(trace_file: Path) -> None:
+    with pytest.raises(ValueError):
+        with tracing.span("failing"):
+            raise ValueError("boom")
+
+    (recorded,) = tracing.read_spans(trace_file)
+    assert recorded["error"] == "ValueError"
+
+
+def test_traced_decorator(trace_file: Path) -> None:
+    @tracing.traced("work")
+    def work(value: int) -> int:
+        return value * 2
+
+    assert work(4) == 8
+    assert _names(trace_file) == ["work"]
+
+
+def test_bind_carries_parent_into_worker_threads(trace_file: Path) -> None:
+    barrier = threading.Barrier(2)
+
+    def child(index: int) -> None:
+        barrier.wait(timeout=5)
+        with tracing.span(f"child-{index}"):
+            pass
+
+    with tracing.span("root"):
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            list(pool.map(tracing.bind(child), range(2)))
+
+    spans = {item["name"]: item for item in tracing.read_spans(trace_file)}
+    assert spans["child-0"]["parent_id"] == spans["root"]["span_id"]
+    assert spans["child-1"]["parent_id"] == spans["root"]["span_id"]
+
+
+def test_tool_handlers_are_traced(trace_file: Path) -> None:
+    registry = ToolRegistry()
+    registry.register_tool(
+        ToolDefinition(
+            name="lookup",
+            description="test tool",
+            parameters={"type": "object", "properties": {"id": {"type": "integer"}}},
+            handler=lambda args: {"found": args["id"]},
+        )
+    )
+
+    registry.execute_tool("lookup", {"id": 7})
+
+    assert _names(trace_file) == ["tool.lookup"]
+
+
+def _span(name: str, span_id: str, parent: str | None, start: float, duration: float, trace: str = "t1") -> dict:
+    return {
+        "name": name,
+        "trace_id": trace,
+        "span_id": span_id,
+        "parent_id": parent,
+        "start": start,
+        "duration": duration,
+        "thread": "MainThread",
+        "pid": 1,
+        "attributes": {},
+        "error": None,
+    }
+
+
+def test_summarize_ranks_by_self_time() -> None:
+    spans = [
+        _span("github.GET /repos/{owner}/{repo}", "2", "1", 100.1, 2.0),
+        _span("github.GET /repos/{owner}/{repo}", "3", "1", 102.2, 1.0),
+        _span("parsing.render_page", "4", "1", 103.5, 4.0),
+        _span("pipeline.run", "1", None, 100.0, 10.0),
+        _span("pipeline.run", "9", None, 200.0, 1.0, trace="t2"),
+    ]
+
+    first, second = tracing.summarize(spans, top=2)
+
+    assert (first.trace_id, first.root, first.span_count) == ("t1", "pipeline.run", 4)
+    assert first.duration == pytest.approx(10.0)
+    assert [stats.name for stats in first.sinks] == ["parsing.render_page", "github.GET /repos/{owner}/{repo}"]
+    github = first.sinks[1]
+    assert (github.count, github.total, github.max) == (2, pytest.approx(3.0), pytest.approx(2.0))
+    # pipeline.run spent 10s, 7s of it in children
+    assert tracing.summarize(spans, top=3)[0].sinks[2].self_time == pytest.approx(3.0)
+    assert second.trace_id == "t2"
+
+
+def test_chrome_trace_export(tmp_path: Path) -> None:
+    spans = [_span("pipeline.run", "1", None, 1.5, 0.25)]
+
+    path = tracing.write_chrome_trace(spans, tmp_path / "out" / "trace.json")
+
+    exported = json.loads(path.read_text())
+    (event,) = [event for event in exported["traceEvents"] if event["ph"] == "X"]
+    assert event["name"] == "pipeline.run"
+    assert event["cat"] == "pipeline"
+    assert (event["ts"], event["dur"]) == (1_500_000, 250_000)
+    assert event["args"]["trace_id"] == "t1"
+
+
+def test_read_spans_skips_malformed_lines(tmp_path: Path) -> None:
+    path = tmp_path / "trace.jsonl"
+    path.write_text(json.dumps(_span("a", "1", None, 0, 1)) + "\n{not json\n\n")
+
+    assert [item["name"] for item in tracing.read_spans(path)] == ["a"]